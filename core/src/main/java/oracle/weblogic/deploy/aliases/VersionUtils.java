@@ -1,10 +1,13 @@
 /*
- * Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
+ * Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
  * The Universal Permissive License (UPL), Version 1.0
  */
 package oracle.weblogic.deploy.aliases;
 
 import java.util.Arrays;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentMap;
+import java.util.concurrent.atomic.AtomicLong;
 import java.util.regex.Matcher;
 import java.util.regex.Pattern;
 
@@ -37,6 +40,15 @@ public final class VersionUtils {
     private static final int VERSION_SIZE = 1;
     private static final int VERSION_INDEX = 0;
 
+    // The alias files use a small number of distinct range strings thousands of times, so keep the parsed form
+    // of each range and, for each version, the result of testing the version against the range.
+    //
+    private static final ConcurrentMap<String, ParsedRange> PARSED_RANGES = new ConcurrentHashMap<>();
+    private static final ConcurrentMap<String, ConcurrentMap<String, Boolean>> RANGE_DECISIONS =
+        new ConcurrentHashMap<>();
+    private static final AtomicLong RANGE_DECISION_HITS = new AtomicLong();
+    private static final AtomicLong RANGE_DECISION_MISSES = new AtomicLong();
+
     private VersionUtils() {
         // hide the constructor on this utility class
     }
@@ -165,47 +177,66 @@ public final class VersionUtils {
             throw iae;
         }
 
-        String[] versions = getLowerAndUpperVersionStrings(range);
-        LOGGER.finest("WLSDPLY-08201", range, Arrays.asList(versions));
-        boolean result = false;
-        switch (versions.length) {
-            case RANGE_SIZE:
-                String lowerVersion = versions[RANGE_LOW_INDEX];
-                String upperVersion = versions[RANGE_HIGH_INDEX];
-                boolean inclusiveStart = range.startsWith("[");
-                boolean inclusiveEnd = range.endsWith("]");
-
-                int lowerCompare = compareVersions(version, lowerVersion);
-                LOGGER.finest("WLSDPLY-08202", version, lowerVersion, lowerCompare);
-                if (lowerCompare > 0 || (lowerCompare == 0 && inclusiveStart)) {
-                    if (!StringUtils.isEmpty(upperVersion)) {
-                        int upperCompare = compareVersions(version, upperVersion);
-                        LOGGER.finest("WLSDPLY-08203", version, upperVersion, upperCompare);
-                        if (upperCompare < 0 || (upperCompare == 0 && inclusiveEnd)) {
-                            result = true;
-                        }
-                    } else {
-                        LOGGER.finest("WLSDPLY-08204", range);
-                        result = true;
-                    }
-                }
-                break;
-
-            case VERSION_SIZE:
-                String singleVersion = versions[VERSION_INDEX];
-                result = (compareVersions(version, singleVersion) == 0);
-                LOGGER.finest("WLSDPLY-08205", version, singleVersion, result);
-                break;
+        ConcurrentMap<String, Boolean> decisions = RANGE_DECISIONS.get(version);
+        if (decisions == null) {
+            decisions = new ConcurrentHashMap<>();
+            ConcurrentMap<String, Boolean> existing = RANGE_DECISIONS.putIfAbsent(version, decisions);
+            if (existing != null) {
+                decisions = existing;
+            }
+        }
 
-            default:
-                VersionException ve = new VersionException("WLSDPLY-08206", range, Arrays.asList(versions));
-                LOGGER.throwing(CLASS, METHOD, ve);
-                throw ve;
+        Boolean decision = range == null ? null : decisions.get(range);
+        boolean result;
+        if (decision != null) {
+            RANGE_DECISION_HITS.incrementAndGet();
+            result = decision;
+        } else {
+            RANGE_DECISION_MISSES.incrementAndGet();
+            result = getParsedRange(range).includes(version);
+            decisions.put(range, result);
         }
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
     }
 
+    /**
+     * Get the number of distinct version ranges that have been parsed and cached.
+     *
+     * @return the number of cached version ranges
+     */
+    public static int getCachedRangeCount() {
+        return PARSED_RANGES.size();
+    }
+
+    /**
+     * Get the number of isVersionInRange() calls answered from the cache of previous results.
+     *
+     * @return the number of cache hits
+     */
+    public static long getRangeDecisionHits() {
+        return RANGE_DECISION_HITS.get();
+    }
+
+    /**
+     * Get the number of isVersionInRange() calls that had to compare the version to the range.
+     *
+     * @return the number of cache misses
+     */
+    public static long getRangeDecisionMisses() {
+        return RANGE_DECISION_MISSES.get();
+    }
+
+    /**
+     * Clear the cached version ranges and range results, and reset the hit and miss counts.
+     */
+    public static void clearVersionRangeCache() {
+        PARSED_RANGES.clear();
+        RANGE_DECISIONS.clear();
+        RANGE_DECISION_HITS.set(0);
+        RANGE_DECISION_MISSES.set(0);
+    }
+
     /**
      * Get the version range message to use for validation.
      *
@@ -318,29 +349,7 @@ public final class VersionUtils {
             throw iae;
         }
 
-        Matcher rangeMatcher = VERSION_RANGE_REGEX.matcher(range);
-        Matcher versionMatcher = VERSION_REGEX.matcher(range);
-
-        String[] result;
-        if (rangeMatcher.matches()) {
-            String lowerVersion = rangeMatcher.group(RANGE_LOW_GROUP);
-            String upperVersion = rangeMatcher.group(RANGE_HIGH_GROUP);
-
-            if (StringUtils.isEmpty(upperVersion)) {
-                upperVersion = null;
-            }
-            result = new String[RANGE_SIZE];
-            result[RANGE_LOW_INDEX] = lowerVersion;
-            result[RANGE_HIGH_INDEX] = upperVersion;
-        } else if (versionMatcher.matches()) {
-            String version = versionMatcher.group(VERSION_GROUP);
-            result = new String[VERSION_SIZE];
-            result[VERSION_INDEX] = version;
-        } else {
-            VersionException ve = new VersionException("WLSDPLY-08216", range);
-            LOGGER.throwing(CLASS, METHOD, ve);
-            throw ve;
-        }
+        String[] result = getParsedRange(range).getVersions();
         LOGGER.exiting(CLASS, METHOD, Arrays.toString(result));
         return result;
     }
@@ -388,4 +397,122 @@ public final class VersionUtils {
         }
         return result;
     }
+
+    private static ParsedRange getParsedRange(String range) throws VersionException {
+        final String METHOD = "getParsedRange";
+
+        if (StringUtils.isEmpty(range)) {
+            String message = ExceptionHelper.getMessage("WLSDPLY-08215");
+            IllegalArgumentException iae = new IllegalArgumentException(message);
+            LOGGER.throwing(CLASS, METHOD, iae);
+            throw iae;
+        }
+
+        ParsedRange result = PARSED_RANGES.get(range);
+        if (result == null) {
+            result = parseRange(range);
+            ParsedRange existing = PARSED_RANGES.putIfAbsent(range, result);
+            if (existing != null) {
+                result = existing;
+            }
+        }
+        return result;
+    }
+
+    private static ParsedRange parseRange(String range) throws VersionException {
+        final String METHOD = "parseRange";
+
+        Matcher rangeMatcher = VERSION_RANGE_REGEX.matcher(range);
+        Matcher versionMatcher = VERSION_REGEX.matcher(range);
+
+        ParsedRange result;
+        if (rangeMatcher.matches()) {
+            String lowerVersion = rangeMatcher.group(RANGE_LOW_GROUP);
+            String upperVersion = rangeMatcher.group(RANGE_HIGH_GROUP);
+
+            if (StringUtils.isEmpty(upperVersion)) {
+                upperVersion = null;
+            }
+            result = new ParsedRange(range, lowerVersion, upperVersion);
+        } else if (versionMatcher.matches()) {
+            result = new ParsedRange(range, versionMatcher.group(VERSION_GROUP));
+        } else {
+            VersionException ve = new VersionException("WLSDPLY-08216", range);
+            LOGGER.throwing(CLASS, METHOD, ve);
+            throw ve;
+        }
+        return result;
+    }
+
+    /**
+     * The immutable, parsed form of a version range string.  A range holds either a lower and an optional upper
+     * version, or a single version.
+     */
+    private static final class ParsedRange {
+        private final String range;
+        private final String[] versions;
+        private final boolean inclusiveStart;
+        private final boolean inclusiveEnd;
+
+        ParsedRange(String range, String lowerVersion, String upperVersion) {
+            this.range = range;
+            this.versions = new String[RANGE_SIZE];
+            this.versions[RANGE_LOW_INDEX] = lowerVersion;
+            this.versions[RANGE_HIGH_INDEX] = upperVersion;
+            this.inclusiveStart = range.startsWith("[");
+            this.inclusiveEnd = range.endsWith("]");
+        }
+
+        ParsedRange(String range, String version) {
+            this.range = range;
+            this.versions = new String[VERSION_SIZE];
+            this.versions[VERSION_INDEX] = version;
+            this.inclusiveStart = true;
+            this.inclusiveEnd = true;
+        }
+
+        String[] getVersions() {
+            return versions.clone();
+        }
+
+        boolean includes(String version) throws VersionException {
+            final String METHOD = "includes";
+
+            LOGGER.finest("WLSDPLY-08201", range, Arrays.asList(versions));
+            boolean result = false;
+            switch (versions.length) {
+                case RANGE_SIZE:
+                    String lowerVersion = versions[RANGE_LOW_INDEX];
+                    String upperVersion = versions[RANGE_HIGH_INDEX];
+
+                    int lowerCompare = compareVersions(version, lowerVersion);
+                    LOGGER.finest("WLSDPLY-08202", version, lowerVersion, lowerCompare);
+                    if (lowerCompare > 0 || (lowerCompare == 0 && inclusiveStart)) {
+                        if (!StringUtils.isEmpty(upperVersion)) {
+                            int upperCompare = compareVersions(version, upperVersion);
+                            LOGGER.finest("WLSDPLY-08203", version, upperVersion, upperCompare);
+                            if (upperCompare < 0 || (upperCompare == 0 && inclusiveEnd)) {
+                                result = true;
+                            }
+                        } else {
+                            LOGGER.finest("WLSDPLY-08204", range);
+                            result = true;
+                        }
+                    }
+                    break;
+
+                case VERSION_SIZE:
+                    String singleVersion = versions[VERSION_INDEX];
+                    result = (compareVersions(version, singleVersion) == 0);
+                    LOGGER.finest("WLSDPLY-08205", version, singleVersion, result);
+                    break;
+
+                default:
+                    VersionException ve = new VersionException("WLSDPLY-08206", range, Arrays.asList(versions));
+                    LOGGER.throwing(CLASS, METHOD, ve);
+                    throw ve;
+            }
+            return result;
+        }
+    }
 }
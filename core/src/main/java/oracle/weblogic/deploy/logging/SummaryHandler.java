@@ -6,6 +6,7 @@ package oracle.weblogic.deploy.logging;
 
 import java.util.ArrayList;
 import java.util.List;
+import java.util.Map;
 import java.util.Properties;
 import java.util.logging.ConsoleHandler;
 import java.util.logging.Formatter;
@@ -106,6 +107,7 @@ public class SummaryHandler extends Handler implements WLSDeployLogEndHandler {
         for (LevelHandler handler : handlers) {
             handler.push();
         }
+        summaryReports(topTarget);
         summaryTail(topTarget);
         LOGGER.exiting(CLASS, METHOD);
     }
@@ -139,6 +141,16 @@ public class SummaryHandler extends Handler implements WLSDeployLogEndHandler {
                 WebLogicDeployToolingVersion.getVersion(), context.getVersion(), context.getWlstMode()));
     }
 
+    void summaryReports(Handler handler) {
+        for (Map.Entry<String, List<String>> report : context.getSummaryReports().entrySet()) {
+            StringBuilder buffer = new StringBuilder();
+            for (String line : report.getValue()) {
+                buffer.append(System.lineSeparator()).append("    ").append(line);
+            }
+            handler.publish(getLogRecord(report.getKey(), buffer));
+        }
+    }
+
     void summaryTail(Handler handler) {
         StringBuffer buffer = new StringBuffer();
         java.util.Formatter fmt = new java.util.Formatter(buffer);
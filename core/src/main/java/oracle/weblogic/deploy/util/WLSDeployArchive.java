@@ -902,6 +902,49 @@ public class WLSDeployArchive {
         getZipFile().removeZipEntries(WLSDPLY_ARCHIVE_BINARY_DIR + ZIP_SEP);
     }
 
+    /**
+     * Start collecting the added binaries instead of rewriting the archive file for each binary.  This method is
+     * intended to be invoked by discovery, which adds many binaries to the archive.  The archive paths are returned
+     * by the add methods as usual, but the binaries are only written to the archive by commitBatch().
+     */
+    public void startBatch() {
+        final String METHOD = "startBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        getZipFile().startBatch();
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Write the binaries added since startBatch() was called to the archive file.
+     *
+     * @return the number of archive entries written
+     * @throws WLSDeployArchiveIOException if an error occurs while writing the archive file
+     */
+    public int commitBatch() throws WLSDeployArchiveIOException {
+        final String METHOD = "commitBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        int entryCount = getZipFile().commitBatch();
+        LOGGER.exiting(CLASS, METHOD, entryCount);
+        return entryCount;
+    }
+
+    /**
+     * Forget the binaries added since startBatch() was called without writing them to the archive file.  This
+     * method is intended to be invoked when discovery fails, so that the archive is left as it was.
+     *
+     * @return the number of archive entries discarded
+     */
+    public int discardBatch() {
+        final String METHOD = "discardBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        int entryCount = getZipFile().discardBatch();
+        LOGGER.exiting(CLASS, METHOD, entryCount);
+        return entryCount;
+    }
+
     /**
      * Closes the underlying zip file and any open streams.
      */
@@ -1047,7 +1090,7 @@ public class WLSDeployArchive {
                     LOGGER.warning("WLSDPLY-01413", e, getArchiveFileName(), e.getLocalizedMessage());
                 }
             }
-            if (tmpFile != null && !tmpFile.delete()) {
+            if (tmpFile != null && !getZipFile().deleteAfterBatch(tmpFile) && !tmpFile.delete()) {
                 tmpFile.deleteOnExit();
             }
         }
@@ -1210,6 +1253,14 @@ public class WLSDeployArchive {
         throws WLSDeployArchiveIOException {
 
         String newName = null;
+        if (getZipFile().isBatchOpen()) {
+            // the file is read when the batch is committed
+            LOGGER.finer("WLSDPLY-01418", preferredName, itemToAdd);
+            newName = getZipFile().addZipEntry(preferredName, itemToAdd, true);
+            LOGGER.finer("WLSDPLY-01419", newName, itemToAdd);
+            return newName;
+        }
+
         FileInputStream inputStream = null;
         try {
             inputStream = getFileInputStream(itemToAdd, preferredName, getArchiveFileName(), callingMethod);
@@ -4,6 +4,11 @@
  */
 package oracle.weblogic.deploy.util;
 
+import java.util.Collections;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+
 /**
  * Context information from the tool model context for use in java programs without introducing jython
  */
@@ -29,6 +34,7 @@ public class WLSDeployContext {
     private String version;
     private WLSTMode wlstMode;
     private String programName;
+    private Map<String, List<String>> summaryReports = new LinkedHashMap<>();
 
     /**
      * The context members are encapsulated within this instance through the constructor.
@@ -70,4 +76,23 @@ public class WLSDeployContext {
         return wlstMode;
     }
 
+    /**
+     * Add a report to display in the summary at the end of the tool.
+     *
+     * @param titleKey the key of the report title message, which has the report lines as its only argument
+     * @param lines the lines of the report
+     */
+    public void addSummaryReport(String titleKey, List<String> lines) {
+        summaryReports.put(titleKey, lines);
+    }
+
+    /**
+     * Get the reports to display in the summary at the end of the tool, in the order they were added.
+     *
+     * @return map of the report title message keys to the report lines
+     */
+    public Map<String, List<String>> getSummaryReports() {
+        return Collections.unmodifiableMap(summaryReports);
+    }
+
 }
\ No newline at end of file
@@ -1,5 +1,5 @@
 /*
- * Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
+ * Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
  * The Universal Permissive License (UPL), Version 1.0
  */
 package oracle.weblogic.deploy.util;
@@ -13,6 +13,7 @@ import java.nio.file.Files;
 import java.nio.file.Path;
 import java.util.ArrayList;
 import java.util.Enumeration;
+import java.util.HashMap;
 import java.util.Iterator;
 import java.util.LinkedHashMap;
 import java.util.List;
@@ -52,6 +53,16 @@ public class WLSDeployZipFile {
     private ZipFile openZipFile;
     private boolean newFile;
 
+    // the entries added since startBatch() was called, and the source file of each entry (null for directories)
+    private LinkedHashMap<String, File> batchEntries;
+    // the names of the batch entries under each parent entry, so that a rename only looks at its siblings
+    private Map<String, List<String>> batchEntriesByParent;
+    private List<File> batchTemporaryFiles;
+
+    // the entry added for each source file and directory, by parent entry, so that a file added again under the
+    // same parent entry is not added twice, with or without a batch
+    private final Map<File, Map<String, String>> sourceEntries = new HashMap<>();
+
     //////////////////////////////////////////////////////////////////////////////////////////////////
     // Public APIs                                                                                  //
     //////////////////////////////////////////////////////////////////////////////////////////////////
@@ -277,6 +288,7 @@ public class WLSDeployZipFile {
             LOGGER.finer("WLSDPLY-01500", getFileName(), key);
             map.remove(key);
             saveChangesToZip(map, null);
+            sourceEntries.clear();
             removedEntry = true;
         } else {
             LOGGER.finer("WLSDPLY-01502", getFileName(), key);
@@ -311,6 +323,7 @@ public class WLSDeployZipFile {
                     entriesMap.remove(matchingKey);
                 }
                 saveChangesToZip(entriesMap, null);
+                sourceEntries.clear();
                 removedEntry = true;
             } else {
                 LOGGER.finer("WLSDPLY-01506", getFileName(), key);
@@ -367,7 +380,7 @@ public class WLSDeployZipFile {
 
         boolean addedEntry = true;
         LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
-        if (zipEntriesMap.containsKey(key)) {
+        if (zipEntriesMap.containsKey(key) || isBatchEntry(key)) {
             LOGGER.finer("WLSDPLY-01509", getFileName(), key);
             addedEntry = false;
         }
@@ -383,6 +396,64 @@ public class WLSDeployZipFile {
         return addedEntry;
     }
 
+    /**
+     * Add the provided file as an entry, optionally renaming it to prevent conflicts.  While a batch is open, the
+     * entry is only recorded, and the file is read when the batch is committed.  A file that was already added
+     * under the same parent entry is not added again, and the name of the existing entry is returned.
+     *
+     * @param entryName the name of the entry to add
+     * @param file      the file to read the entry content from
+     * @param rename    whether or not to rename the entry if it conflicts with an existing entry
+     * @return the entry name used to store the entry or null if the add failed due to an entry name conflict
+     * @throws WLSDeployArchiveIOException if an IOException occurred while adding the entry
+     */
+    public String addZipEntry(String entryName, File file, boolean rename) throws WLSDeployArchiveIOException {
+        final String METHOD = "addZipEntry";
+
+        LOGGER.entering(CLASS, METHOD, entryName, file, rename);
+        String newEntryName = findSourceEntry(entryName, file);
+        if (newEntryName != null) {
+            LOGGER.finer("WLSDPLY-01542", file.getAbsolutePath(), newEntryName);
+            LOGGER.exiting(CLASS, METHOD, newEntryName);
+            return newEntryName;
+        }
+
+        if (!isBatchOpen()) {
+            FileInputStream inputStream = null;
+            try {
+                inputStream = new FileInputStream(file);
+                newEntryName = addZipEntry(entryName, inputStream, rename);
+            } catch (IOException ioe) {
+                WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01425", ioe,
+                    getFileName(), file.getAbsolutePath(), entryName, ioe.getLocalizedMessage());
+                LOGGER.throwing(CLASS, METHOD, wdaioe);
+                throw wdaioe;
+            } finally {
+                if (inputStream != null) {
+                    closeFileInputStream(inputStream, file.getPath());
+                }
+            }
+        } else {
+            newEntryName = entryName;
+            if (rename && isRenameNecessary(newEntryName)) {
+                LOGGER.finer("WLSDPLY-01507", entryName);
+                newEntryName = getNextUniqueEntryName(entryName);
+                LOGGER.finer("WLSDPLY-01508", entryName, newEntryName);
+            }
+            if (getZipFileEntries(getFile()).containsKey(newEntryName) || isBatchEntry(newEntryName)) {
+                LOGGER.finer("WLSDPLY-01509", getFileName(), newEntryName);
+                newEntryName = null;
+            } else {
+                putBatchEntry(newEntryName, file);
+            }
+        }
+        if (newEntryName != null) {
+            putSourceEntry(newEntryName, file);
+        }
+        LOGGER.exiting(CLASS, METHOD, newEntryName);
+        return newEntryName;
+    }
+
     /**
      * Add the provided directory entry to the unsaved changes list, optionally renaming it to prevent conflicts.
      *
@@ -434,12 +505,14 @@ public class WLSDeployZipFile {
 
         boolean addedEntry = true;
         LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
-        if (zipEntriesMap.containsKey(key)) {
+        if (zipEntriesMap.containsKey(key) || isBatchEntry(key)) {
             LOGGER.finer("WLSDPLY-01509", getFileName(), key);
             addedEntry = false;
         }
         // still true so ok to proceed
-        if (addedEntry) {
+        if (addedEntry && isBatchOpen()) {
+            putBatchEntry(key, null);
+        } else if (addedEntry) {
             LOGGER.finer("WLSDPLY-01510", getFileName(), key);
             LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
             newEntries.put(key, null);
@@ -482,6 +555,12 @@ public class WLSDeployZipFile {
         if (!newEntryName.endsWith(ZIP_SEP)) {
             newEntryName += ZIP_SEP;
         }
+        String sourceEntryName = findSourceEntry(newEntryName, directory);
+        if (sourceEntryName != null) {
+            LOGGER.finer("WLSDPLY-01542", directory.getAbsolutePath(), sourceEntryName);
+            LOGGER.exiting(CLASS, METHOD, sourceEntryName);
+            return sourceEntryName;
+        }
         if (isRenameNecessary(newEntryName)) {
             LOGGER.finer("WLSDPLY-01507", entryName);
             newEntryName = getNextUniqueEntryName(newEntryName);
@@ -495,14 +574,21 @@ public class WLSDeployZipFile {
         if (!rootEntryName.endsWith(ZIP_SEP)) {
             rootEntryName += ZIP_SEP;
         }
-        LinkedHashMap<String, ZipEntry> existingEntries = getZipFileEntries(getFile());
-        LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
-        try {
-            addDirectoryToUnsavedMap(newEntries, directory, rootEntryName);
-            saveChangesToZip(existingEntries, newEntries);
-        } finally {
-            cleanupUnsavedEntries(newEntries);
+        if (isBatchOpen()) {
+            // the root entry holds the directory itself, so that the renames of the same name see it
+            putBatchEntry(rootEntryName, directory);
+            addDirectoryToBatch(directory, rootEntryName);
+        } else {
+            LinkedHashMap<String, ZipEntry> existingEntries = getZipFileEntries(getFile());
+            LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
+            try {
+                addDirectoryToUnsavedMap(newEntries, directory, rootEntryName);
+                saveChangesToZip(existingEntries, newEntries);
+            } finally {
+                cleanupUnsavedEntries(newEntries);
+            }
         }
+        putSourceEntry(newEntryName, directory);
         LOGGER.exiting(CLASS, METHOD, newEntryName);
         return newEntryName;
     }
@@ -523,6 +609,7 @@ public class WLSDeployZipFile {
         LinkedHashMap<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
         if (zipEntriesMap.containsKey(key)) {
             zipEntriesMap.remove(key);
+            sourceEntries.clear();
         }
 
         LinkedHashMap<String, InputStream> entryToPut = new LinkedHashMap<>();
@@ -537,6 +624,116 @@ public class WLSDeployZipFile {
         LOGGER.exiting(CLASS, METHOD);
     }
 
+    /**
+     * Start collecting the added entries in memory instead of rewriting the zip file for each added entry.
+     * The entry names are chosen when the entries are added, so the callers get the same names as without a batch.
+     * The entries are written to the zip file by commitBatch(), and they are not visible to the methods that read
+     * the zip file until then.
+     */
+    public void startBatch() {
+        final String METHOD = "startBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        if (!isBatchOpen()) {
+            batchEntries = new LinkedHashMap<>();
+            batchEntriesByParent = new HashMap<>();
+            batchTemporaryFiles = new ArrayList<>();
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Is a batch open?
+     *
+     * @return true if the added entries are collected until commitBatch() is called
+     */
+    public boolean isBatchOpen() {
+        return batchEntries != null;
+    }
+
+    /**
+     * Write the entries added since startBatch() was called to the zip file with a single rewrite of the file,
+     * and stop collecting entries.
+     *
+     * @return the number of entries written
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the files or writing the zip file
+     */
+    public int commitBatch() throws WLSDeployArchiveIOException {
+        final String METHOD = "commitBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        if (!isBatchOpen()) {
+            LOGGER.exiting(CLASS, METHOD, 0);
+            return 0;
+        }
+        LinkedHashMap<String, File> newEntries = batchEntries;
+        List<File> temporaryFiles = batchTemporaryFiles;
+        batchEntries = null;
+        batchEntriesByParent = null;
+        batchTemporaryFiles = null;
+        closeOpenZipFile();
+
+        LinkedHashMap<String, File> entriesToWrite = new LinkedHashMap<>();
+        for (Map.Entry<String, File> newEntry : newEntries.entrySet()) {
+            // skip the records of the directories added by addDirectoryZipEntries(), they are not written as entries
+            if (newEntry.getValue() == null || !newEntry.getKey().endsWith(ZIP_SEP)) {
+                entriesToWrite.put(newEntry.getKey(), newEntry.getValue());
+            }
+        }
+        try {
+            if (!entriesToWrite.isEmpty()) {
+                LOGGER.fine("WLSDPLY-01543", entriesToWrite.size(), getFileName());
+                saveChangesToZip(getZipFileEntries(getFile()), entriesToWrite);
+            }
+        } finally {
+            deleteTemporaryFiles(temporaryFiles);
+        }
+        LOGGER.exiting(CLASS, METHOD, entriesToWrite.size());
+        return entriesToWrite.size();
+    }
+
+    /**
+     * Forget the entries added since startBatch() was called without writing them to the zip file, and stop
+     * collecting entries.  The zip file is left as it was when the batch was started.
+     *
+     * @return the number of entries discarded
+     */
+    public int discardBatch() {
+        final String METHOD = "discardBatch";
+
+        LOGGER.entering(CLASS, METHOD);
+        if (!isBatchOpen()) {
+            LOGGER.exiting(CLASS, METHOD, 0);
+            return 0;
+        }
+        int entryCount = batchEntries.size();
+        List<File> temporaryFiles = batchTemporaryFiles;
+        batchEntries = null;
+        batchEntriesByParent = null;
+        batchTemporaryFiles = null;
+        // the index of the added source files names the discarded entries
+        sourceEntries.clear();
+
+        LOGGER.fine("WLSDPLY-01544", entryCount, getFileName());
+        deleteTemporaryFiles(temporaryFiles);
+        LOGGER.exiting(CLASS, METHOD, entryCount);
+        return entryCount;
+    }
+
+    /**
+     * Delete the temporary file after the open batch is committed, because the file is only read then.
+     *
+     * @param temporaryFile the temporary file that was added as an entry
+     * @return true if the file will be deleted by commitBatch(), false if no batch is open
+     */
+    boolean deleteAfterBatch(File temporaryFile) {
+        if (!isBatchOpen()) {
+            return false;
+        }
+        batchTemporaryFiles.add(temporaryFile);
+        return true;
+    }
+
     /**
      * Closes the open zip file from the last call, if any, which in turn closes all open input streams into the zip.
      */
@@ -654,7 +851,7 @@ public class WLSDeployZipFile {
         return savedZipEntries;
     }
 
-    private void saveChangesToZip(Map<String, ZipEntry> updatedZipEntries, Map<String, InputStream> newEntries)
+    private void saveChangesToZip(Map<String, ZipEntry> updatedZipEntries, Map<String, ?> newEntries)
         throws WLSDeployArchiveIOException {
         final String METHOD = "saveChangesToZip";
 
@@ -714,9 +911,9 @@ public class WLSDeployZipFile {
                 }
 
                 if (newEntries != null && !newEntries.isEmpty()) {
-                    for (Map.Entry<String, InputStream> entry : newEntries.entrySet()) {
+                    for (Map.Entry<String, ?> entry : newEntries.entrySet()) {
                         String newKey = entry.getKey();
-                        inputStream = entry.getValue();
+                        inputStream = openNewEntry(newKey, entry.getValue());
                         ZipEntry ze = new ZipEntry(newKey);
                         sanitizeZipEntry(ze);
 
@@ -870,7 +1067,7 @@ public class WLSDeployZipFile {
 
         boolean renameNeeded = false;
         Map<String, ZipEntry> zipEntryMap = getZipFileEntries(getFile());
-        if (zipEntryMap.containsKey(entryName)) {
+        if (zipEntryMap.containsKey(entryName) || isBatchEntry(entryName)) {
             LOGGER.finest("WLSDPLY-01534", entryName);
             renameNeeded = true;
         }
@@ -896,9 +1093,16 @@ public class WLSDeployZipFile {
         }
         LOGGER.finer("WLSDPLY-01535", entryName, entryNameBase, entryNameExtension);
         ArrayList<String> matchingSavedEntries = new ArrayList<>();
-        Map<String, ZipEntry> zipEntriesMap = getZipFileEntries(getFile());
+        List<String> zipEntryKeys = new ArrayList<>(getZipFileEntries(getFile()).keySet());
+        if (isBatchOpen()) {
+            // a renamed entry has the same parent entry as the original name
+            List<String> siblingEntries = batchEntriesByParent.get(getParentEntryName(entryName));
+            if (siblingEntries != null) {
+                zipEntryKeys.addAll(siblingEntries);
+            }
+        }
 
-        for (String zipEntryKey : zipEntriesMap.keySet()) {
+        for (String zipEntryKey : zipEntryKeys) {
             if (zipEntryKey.startsWith(entryNameBase) && entryReallyMatches(zipEntryKey, entryNameBase,
                 entryNameExtension)) {
                 LOGGER.finer("WLSDPLY-01536", entryName, zipEntryKey);
@@ -1009,6 +1213,85 @@ public class WLSDeployZipFile {
         return Integer.parseInt(numberStr);
     }
 
+    private static void deleteTemporaryFiles(List<File> temporaryFiles) {
+        for (File temporaryFile : temporaryFiles) {
+            if (!temporaryFile.delete()) {
+                temporaryFile.deleteOnExit();
+            }
+        }
+    }
+
+    private boolean isBatchEntry(String key) {
+        return isBatchOpen() && batchEntries.containsKey(key);
+    }
+
+    private void putBatchEntry(String entryName, File file) {
+        batchEntries.put(entryName, file);
+        String parentEntry = getParentEntryName(entryName);
+        List<String> siblingEntries = batchEntriesByParent.get(parentEntry);
+        if (siblingEntries == null) {
+            siblingEntries = new ArrayList<>();
+            batchEntriesByParent.put(parentEntry, siblingEntries);
+        }
+        siblingEntries.add(entryName);
+    }
+
+    private String findSourceEntry(String entryName, File file) {
+        Map<String, String> entriesByParent = sourceEntries.get(file);
+        if (entriesByParent == null) {
+            return null;
+        }
+        return entriesByParent.get(getParentEntryName(entryName));
+    }
+
+    private void putSourceEntry(String entryName, File file) {
+        Map<String, String> entriesByParent = sourceEntries.get(file);
+        if (entriesByParent == null) {
+            entriesByParent = new HashMap<>();
+            sourceEntries.put(file, entriesByParent);
+        }
+        entriesByParent.put(getParentEntryName(entryName), entryName);
+    }
+
+    private static String getParentEntryName(String entryName) {
+        String name = entryName;
+        if (name.endsWith(ZIP_SEP)) {
+            name = name.substring(0, name.length() - 1);
+        }
+        return name.substring(0, name.lastIndexOf(ZIP_SEP_CHAR) + 1);
+    }
+
+    private void addDirectoryToBatch(File directory, String directoryEntryName) {
+        File[] dirEntries = directory.listFiles();
+        if (dirEntries != null) {
+            for (File dirEntry : dirEntries) {
+                String newEntryName = directoryEntryName + dirEntry.getName();
+                if (dirEntry.isDirectory()) {
+                    addDirectoryToBatch(dirEntry, newEntryName + ZIP_SEP);
+                } else {
+                    putBatchEntry(newEntryName, dirEntry);
+                }
+            }
+        }
+    }
+
+    private InputStream openNewEntry(String key, Object source) throws WLSDeployArchiveIOException {
+        final String METHOD = "openNewEntry";
+
+        if (!(source instanceof File)) {
+            return (InputStream) source;
+        }
+        File file = (File) source;
+        try {
+            return new FileInputStream(file);
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01425", ioe,
+                getFileName(), file.getAbsolutePath(), key, ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        }
+    }
+
     private void addDirectoryToUnsavedMap(Map<String, InputStream> unsavedChanges,
         File directory, String directoryEntryName) throws WLSDeployArchiveIOException {
         final String METHOD = "addDirectoryToUnsavedMap";
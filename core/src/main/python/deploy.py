@@ -33,6 +33,7 @@ from wlsdeploy.exception.expection_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.deploy import deployer_utils
 from wlsdeploy.tool.deploy import model_deployer
+from wlsdeploy.tool.deploy import model_diff
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.tool.util import filter_helper
 from wlsdeploy.tool.util.wlst_helper import WlstHelper
@@ -312,6 +313,7 @@ def __deploy_online(model, model_context, aliases):
         raise ex
 
     model_deployer.deploy_applications(model, model_context, aliases, wlst_mode=__wlst_mode)
+    deployer_utils.log_skipped_set_count()
 
     try:
         __wlst_helper.disconnect()
@@ -472,9 +474,13 @@ def main(args):
         # if any filters were applied, re-validate the model
         validate_model(model_dictionary, model_context, aliases)
 
+    model_dictionary = model_diff.get_changed_model(model_dictionary, variable_map, model_context, aliases, "deploy")
+
     try:
         model = Model(model_dictionary)
         __deploy(model, model_context, aliases)
+        __wlst_helper.log_cd_counts()
+        aliases.log_cache_statistics()
     except DeployException, ex:
         __logger.severe('WLSDPLY-09015', _program_name, ex.getLocalizedMessage(), error=ex,
                         class_name=_class_name, method_name=_method_name)
@@ -9,6 +9,7 @@ import sys
 
 from java.io import File
 from java.io import IOException
+from java.lang import Exception as JException
 from java.lang import IllegalArgumentException
 from java.lang import IllegalStateException
 from java.lang import String
@@ -34,10 +35,15 @@ from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.create.domain_typedef import DomainTypedef
+from wlsdeploy.tool.discover import discover_timer
 from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover.config_xml_reader import ConfigXmlReader
 from wlsdeploy.tool.discover.deployments_discoverer import DeploymentsDiscoverer
 from wlsdeploy.tool.discover.domain_info_discoverer import DomainInfoDiscoverer
+from wlsdeploy.tool.discover.incremental_discoverer import IncrementalDiscoverer
 from wlsdeploy.tool.discover.multi_tenant_discoverer import MultiTenantDiscoverer
+from wlsdeploy.tool.discover.parallel_discoverer import ParallelDiscoverer
+from wlsdeploy.tool.discover.path_filter import PathFilter
 from wlsdeploy.tool.discover.resources_discoverer import ResourcesDiscoverer
 from wlsdeploy.tool.discover.topology_discoverer import TopologyDiscoverer
 from wlsdeploy.tool.util import filter_helper
@@ -61,6 +67,14 @@ _class_name = 'discover'
 __logger = PlatformLogger(discoverer.get_discover_logger_name())
 __wlst_mode = WlstModes.OFFLINE
 
+# the phases of the timing report, besides the domainInfo section
+_CONNECT_PHASE = 'connect'
+_SECTIONS_PHASE = 'sections'
+_DISCONNECT_PHASE = 'disconnect'
+_ARCHIVE_PHASE = 'archive'
+_CUSTOMIZE_PHASE = 'customize'
+_PERSIST_PHASE = 'persist'
+
 __required_arguments = [
     CommandLineArgUtil.ORACLE_HOME_SWITCH,
     CommandLineArgUtil.DOMAIN_HOME_SWITCH,
@@ -75,7 +89,12 @@ __optional_arguments = [
     CommandLineArgUtil.ADMIN_URL_SWITCH,
     CommandLineArgUtil.ADMIN_USER_SWITCH,
     CommandLineArgUtil.ADMIN_PASS_SWITCH,
-    CommandLineArgUtil.TARGET_MODE_SWITCH
+    CommandLineArgUtil.TARGET_MODE_SWITCH,
+    CommandLineArgUtil.DISCOVER_CONNECTIONS_SWITCH,
+    CommandLineArgUtil.USE_CONFIG_XML_SWITCH,
+    CommandLineArgUtil.PREVIOUS_DISCOVERY_SWITCH,
+    CommandLineArgUtil.DISCOVER_PATHS_SWITCH,
+    CommandLineArgUtil.TIMING_REPORT_FILE_SWITCH
 ]
 
 
@@ -212,18 +231,67 @@ def __discover(model_context, aliases):
     _method_name = '__discover'
     model = Model()
     base_location = LocationContext()
-    __connect_to_domain(model_context)
+    discoverer.clear_mbi_attributes_cache()
+    # the binaries are collected while the domain is walked, and written to the archive file once at the end
+    model_context.get_archive_file().startBatch()
+    discovered = False
+    try:
+        discover_timer.start_phase(_CONNECT_PHASE)
+        __connect_to_domain(model_context, aliases)
+        discover_timer.end_phase(_CONNECT_PHASE)
+        # discovery does not change the domain, so the WLST read calls can be cached until it is done
+        wlst_helper.start_session_cache()
+        try:
+            __discover_domain(model, model_context, base_location, aliases)
+        finally:
+            wlst_helper.end_session_cache()
+        wlst_helper.log_cd_counts()
+        discover_timer.start_phase(_DISCONNECT_PHASE)
+        __disconnect_domain(model_context)
+        discover_timer.end_phase(_DISCONNECT_PHASE)
+        discovered = True
+    finally:
+        # the binaries of a failed discovery are not written, and the archive file is left as it was
+        if not discovered:
+            __discard_archive_batch(model_context)
+
+    discover_timer.start_phase(_ARCHIVE_PHASE)
+    __commit_archive_batch(model_context)
+    discover_timer.end_phase(_ARCHIVE_PHASE)
+    return model
+
+
+def __discover_domain(model, model_context, base_location, aliases):
+    """
+    Discover the model sections of the connected domain, limited to the model paths if any were requested.
+    :param model: the model object to populate
+    :param model_context: the model context object
+    :param base_location: the domain location
+    :param aliases: the aliases to use
+    :raises DiscoverException: if an error occurs during discovery
+    """
+    _method_name = '__discover_domain'
     try:
         _add_domain_name(base_location, aliases)
-        DomainInfoDiscoverer(model_context, model.get_model_domain_info(), base_location, wlst_mode=__wlst_mode,
-                             aliases=aliases).discover()
-        TopologyDiscoverer(model_context, model.get_model_topology(), base_location, wlst_mode=__wlst_mode,
-                           aliases=aliases).discover()
-        ResourcesDiscoverer(model_context, model.get_model_resources(), base_location, wlst_mode=__wlst_mode,
-                            aliases=aliases).discover()
-        DeploymentsDiscoverer(model_context, model.get_model_app_deployments(), base_location, wlst_mode=__wlst_mode,
-                              aliases=aliases).discover()
-        __discover_multi_tenant(model, model_context, base_location, aliases)
+        path_filter = None
+        try:
+            if model_context.get_discover_paths() is not None:
+                path_filter = PathFilter(model_context.get_discover_paths(), base_location, aliases)
+                discoverer.set_discover_filter(path_filter)
+            if path_filter is None or path_filter.includes_section(model_constants.DOMAIN_INFO):
+                discover_timer.start_phase(model_constants.DOMAIN_INFO)
+                DomainInfoDiscoverer(model_context, model.get_model_domain_info(), base_location,
+                                     wlst_mode=__wlst_mode, aliases=aliases).discover()
+                discover_timer.end_phase(model_constants.DOMAIN_INFO)
+            discover_timer.start_phase(_SECTIONS_PHASE)
+            if model_context.get_previous_discovery_file() is not None:
+                IncrementalDiscoverer(model_context, base_location, aliases, __wlst_mode,
+                                      __discover_domain_sections).discover(model)
+            else:
+                __discover_domain_sections(model, model_context, base_location, aliases)
+            discover_timer.end_phase(_SECTIONS_PHASE)
+        finally:
+            discoverer.set_discover_filter(None)
     except AliasException, ae:
         wls_version = WebLogicHelper(__logger).get_actual_weblogic_version()
         wlst_mode = WlstModes.from_value(__wlst_mode)
@@ -232,9 +300,49 @@ def __discover(model_context, aliases):
                                                         ae.getLocalizedMessage(), error=ae)
         __logger.throwing(ex, class_name=_class_name, method_name=_method_name)
         raise ex
+    return
 
-    __disconnect_domain()
-    return model
+
+def __discover_domain_sections(model, model_context, base_location, aliases):
+    """
+    Discover the topology, resources and deployments sections of the model, over several connections if requested.
+    :param model: the model object to populate
+    :param model_context: the model context object
+    :param base_location: the domain location
+    :param aliases: the aliases to use
+    :raises DiscoverException: if an error occurs during discovery
+    """
+    _method_name = '__discover_domain_sections'
+    connection_count = model_context.get_discover_connections()
+    if __wlst_mode == WlstModes.ONLINE and connection_count > 1:
+        ParallelDiscoverer(model_context, base_location, aliases, connection_count,
+                           __discover_sections).discover(model)
+    else:
+        if connection_count > 1:
+            __logger.warning('WLSDPLY-06804', CommandLineArgUtil.DISCOVER_CONNECTIONS_SWITCH,
+                             class_name=_class_name, method_name=_method_name)
+        __discover_sections(model, model_context, base_location, aliases)
+    return
+
+
+def __discover_sections(model, model_context, base_location, aliases):
+    """
+    Discover the topology, resources and deployments sections of the model.  When the domain is discovered
+    over several connections, this is called on each connection, with the aliases for that connection.
+    :param model: the model object to populate
+    :param model_context: the model context object
+    :param base_location: the domain location
+    :param aliases: the aliases to use
+    :raises DiscoverException: if an error occurs during discovery
+    """
+    TopologyDiscoverer(model_context, model.get_model_topology(), base_location, wlst_mode=__wlst_mode,
+                       aliases=aliases).discover()
+    ResourcesDiscoverer(model_context, model.get_model_resources(), base_location, wlst_mode=__wlst_mode,
+                        aliases=aliases).discover()
+    DeploymentsDiscoverer(model_context, model.get_model_app_deployments(), base_location, wlst_mode=__wlst_mode,
+                          aliases=aliases).discover()
+    __discover_multi_tenant(model, model_context, base_location, aliases)
+    return
 
 
 def _add_domain_name(location, aliases):
@@ -266,16 +374,23 @@ def __discover_multi_tenant(model, model_context, base_location, aliases):
     return
 
 
-def __connect_to_domain(model_context):
+def __connect_to_domain(model_context, aliases):
     """
     Connects WLST to the domain by either connecting to the Admin Server or reading the domain from disk.
     :param model_context: the model context
+    :param aliases: the aliases, used to read the domain from config.xml
     :raises DiscoverException: if a WLST error occurs while connecting to or reading the domain
     """
     _method_name = '__connect_to_domain'
 
     __logger.entering(class_name=_class_name, method_name=_method_name)
-    if __wlst_mode == WlstModes.ONLINE:
+    if __wlst_mode == WlstModes.OFFLINE and model_context.is_using_config_xml():
+        # config.xml only has the attributes that were set, so the values that WLST offline computes are missing
+        __logger.warning('WLSDPLY-06904', CommandLineArgUtil.USE_CONFIG_XML_SWITCH, class_name=_class_name,
+                         method_name=_method_name)
+        config_wlst = ConfigXmlReader(model_context.get_domain_home(), aliases).read()
+        wlst_helper.set_thread_wlst(config_wlst)
+    elif __wlst_mode == WlstModes.ONLINE:
         try:
             wlst_helper.connect(model_context.get_admin_user(), model_context.get_admin_password(),
                                 model_context.get_admin_url())
@@ -325,6 +440,48 @@ def __clear_archive_file(model_context):
     return
 
 
+def __commit_archive_batch(model_context):
+    """
+    Write the binaries collected during discovery to the archive file.
+    :param model_context: the model context
+    :raises DiscoverException: if an error occurs while writing the archive file
+    """
+    _method_name = '__commit_archive_batch'
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+
+    try:
+        entry_count = model_context.get_archive_file().commitBatch()
+    except WLSDeployArchiveIOException, wioe:
+        de = exception_helper.create_discover_exception('WLSDPLY-06003', wioe.getLocalizedMessage())
+        __logger.throwing(class_name=_class_name, method_name=_method_name, error=de)
+        raise de
+
+    __logger.exiting(class_name=_class_name, method_name=_method_name, result=entry_count)
+    return
+
+
+def __discard_archive_batch(model_context):
+    """
+    Forget the binaries collected during a discovery that failed.  This is called while the discovery error
+    is raised, so a failure is only logged, and the discovery error is the one reported.
+    :param model_context: the model context
+    """
+    _method_name = '__discard_archive_batch'
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+
+    entry_count = 0
+    try:
+        entry_count = model_context.get_archive_file().discardBatch()
+    except JException, je:
+        __logger.warning('WLSDPLY-06027', je.getLocalizedMessage(), error=je,
+                         class_name=_class_name, method_name=_method_name)
+    except Exception, e:
+        __logger.warning('WLSDPLY-06027', str(e), class_name=_class_name, method_name=_method_name)
+
+    __logger.exiting(class_name=_class_name, method_name=_method_name, result=entry_count)
+    return
+
+
 def __close_archive(model_context):
     """
     Close the archive object
@@ -339,15 +496,18 @@ def __close_archive(model_context):
     return
 
 
-def __disconnect_domain():
+def __disconnect_domain(model_context):
     """
     Disconnects WLST from the domain by either disconnecting from the Admin Server or closing the domain read from disk.
+    :param model_context: the model context
     :raises DiscoverException: if a WLST error occurred while disconnecting or closing the domain
     """
     _method_name = '__disconnect_domain'
 
     __logger.entering(class_name=_class_name, method_name=_method_name)
-    if __wlst_mode == WlstModes.ONLINE:
+    if __wlst_mode == WlstModes.OFFLINE and model_context.is_using_config_xml():
+        wlst_helper.set_thread_wlst(None)
+    elif __wlst_mode == WlstModes.ONLINE:
         try:
             wlst_helper.disconnect()
         except PyWLSTException, wlst_ex:
@@ -371,6 +531,7 @@ def __disconnect_domain():
 def __persist_model(model, model_context):
     """
     Save the model to the specified model file name or to the archive if the file name was not specified.
+    The sections are removed from the model, and each one is released once it is written.
     :param model: the model to save
     :param model_context: the model context
     :raises DiscoverException: if an error occurs while create a temporary file for the model
@@ -396,8 +557,11 @@ def __persist_model(model, model_context):
     else:
         model_file = FileUtils.getCanonicalFile(File(model_file_name))
 
+    # the model gives up its sections and each one is released once it is written, so the model is empty after it
+    # is persisted
+    __logger.info('WLSDPLY-06024', model_file_name, class_name=_class_name, method_name=_method_name)
     try:
-        model_translator.PythonToFile(model.get_model()).write_to_file(model_file.getAbsolutePath())
+        model_translator.PythonToFile(model.release_model(), True).write_to_file(model_file.getAbsolutePath())
     except TranslateException, ex:
         # Jython 2.2.1 does not support finally so use this like a finally block...
         if add_to_archive and not model_file.delete():
@@ -461,9 +625,32 @@ def __log_and_exit(model_context, exit_code, class_name, method_name):
     """
     __logger.exiting(result=exit_code, class_name=class_name, method_name=method_name)
 
+    if model_context is not None:
+        __report_timing(model_context)
     tool_exit.end(model_context, exit_code)
 
 
+def __report_timing(model_context):
+    """
+    Add the timing report of the discovery to the summary at the end of the tool, and write it to the timing
+    report file, if one was specified.  The discovery does not fail if the report file cannot be written.
+    :param model_context: the model context
+    """
+    _method_name = '__report_timing'
+    lines = discover_timer.get_summary_lines()
+    if len(lines) > 0:
+        tool_exit.add_summary_report('WLSDPLY-06025', lines)
+
+    report_file = model_context.get_timing_report_file()
+    if report_file is not None:
+        try:
+            discover_timer.write_report(report_file)
+        except DiscoverException, de:
+            __logger.warning('WLSDPLY-06026', report_file, de.getLocalizedMessage(),
+                             class_name=_class_name, method_name=_method_name)
+    return
+
+
 def main(args):
     """
     The main entry point for the discoverDomain tool.
@@ -508,10 +695,15 @@ def main(args):
                         error=ex, class_name=_class_name, method_name=_method_name)
         __log_and_exit(model_context, CommandLineArgUtil.PROG_ERROR_EXIT_CODE, _class_name, _method_name)
         
+    discover_timer.start_phase(_CUSTOMIZE_PHASE)
     model = __check_and_customize_model(model, model_context, aliases)
+    discover_timer.end_phase(_CUSTOMIZE_PHASE)
+    aliases.log_cache_statistics()
     
     try:
+        discover_timer.start_phase(_PERSIST_PHASE)
         __persist_model(model, model_context)
+        discover_timer.end_phase(_PERSIST_PHASE)
 
     except TranslateException, ex:
         __logger.severe('WLSDPLY-20024', _program_name, model_context.get_archive_file_name(), ex.getLocalizedMessage(),
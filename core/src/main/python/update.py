@@ -36,6 +36,7 @@ from wlsdeploy.tool.create.domain_typedef import DomainTypedef
 from wlsdeploy.tool.create.domain_typedef import UPDATE_DOMAIN
 from wlsdeploy.tool.deploy import deployer_utils
 from wlsdeploy.tool.deploy import model_deployer
+from wlsdeploy.tool.deploy import model_diff
 from wlsdeploy.tool.deploy.topology_updater import TopologyUpdater
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.tool.util import filter_helper
@@ -328,6 +329,7 @@ def __update_online(model, model_context, aliases):
         raise ex
 
     model_deployer.deploy_applications(model, model_context, aliases, wlst_mode=__wlst_mode)
+    deployer_utils.log_skipped_set_count()
 
     try:
         __wlst_helper.disconnect()
@@ -491,9 +493,12 @@ def main(args):
         # if any filters were applied, re-validate the model
         validate_model(model_dictionary, model_context, aliases)
 
+    model_dictionary = model_diff.get_changed_model(model_dictionary, variable_map, model_context, aliases, "update")
+
     try:
         model = Model(model_dictionary)
         __update(model, model_context, aliases)
+        __wlst_helper.log_cd_counts()
     except DeployException, ex:
         __logger.severe('WLSDPLY-09015', _program_name, ex.getLocalizedMessage(), error=ex,
                         class_name=_class_name, method_name=_method_name)
@@ -0,0 +1,317 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+The persistent cache of WLS version and WLST mode specific alias category dictionaries.
+"""
+import os
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from java.io import IOException
+from java.lang import Boolean
+from java.lang import String
+from java.lang import System
+from java.security import MessageDigest
+from javax.xml.bind import DatatypeConverter
+
+from oracle.weblogic.deploy.util import FileUtils
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'AliasCache'
+_logger = PlatformLogger('wlsdeploy.aliases')
+
+# Set this system property to true (e.g., -Dwlsdeploy.aliases.cache.disabled=true in WLSDEPLOY_PROPERTIES)
+# to turn off the persistent alias cache.
+CACHE_DISABLED_PROPERTY = 'wlsdeploy.aliases.cache.disabled'
+# Set this system property to override the default $WLSDEPLOY_HOME/cache/aliases cache directory.
+CACHE_DIRECTORY_PROPERTY = 'wlsdeploy.aliases.cache.dir'
+
+_cache_format_version = '2'
+_cache_file_extension = '.cache'
+
+# The content digest only changes when the installation changes so compute it once per process.
+_content_digest = None
+
+
+class AliasCache(object):
+    """
+    Persistent, on-disk cache of the fully resolved alias category dictionaries.
+
+    Each category is stored in its own file whose name includes the WLS version, the WLST mode, and a
+    digest of the tool version and the content of all of the category module files shipped with the tool
+    so that upgrading the tool or modifying any alias file automatically invalidates all previously cached
+    entries.  The format version is changed when the shape of the cached dictionaries changes.
+    Any problem reading or writing the cache is logged and the caller falls back to loading the
+    category from its JSON file.
+    """
+
+    def __init__(self, wlst_mode, wls_version, category_file_paths, enabled=True):
+        """
+        Initialize the cache for the specified WLS version and WLST mode.
+        :param wlst_mode: the WLST mode of the alias dictionaries
+        :param wls_version: the WLS version of the alias dictionaries
+        :param category_file_paths: the resource paths of all category module files used to compute the digest
+        :param enabled: whether or not the caller wants to use the cache
+        """
+        _method_name = '__init__'
+
+        self._wlst_mode = WlstModes.from_value(wlst_mode)
+        self._wls_version = str(wls_version)
+        self._category_file_paths = category_file_paths
+        self._cache_dir = None
+
+        if enabled and not Boolean.getBoolean(CACHE_DISABLED_PROPERTY):
+            self._cache_dir = _get_cache_directory()
+        if self._cache_dir is None:
+            _logger.finer('WLSDPLY-08600', class_name=_class_name, method_name=_method_name)
+        return
+
+    def is_enabled(self):
+        """
+        Is the persistent cache usable for this run?
+        :return: True if the cache is enabled, False otherwise
+        """
+        return self._cache_dir is not None
+
+    def load(self, category_name):
+        """
+        Load the cached, resolved dictionary for the specified category.
+        :param category_name: the model category name
+        :return: a tuple of a flag indicating whether the category was found in the cache, the category
+                 dictionary (which may be None if the category is not relevant to the WLS version), and
+                 the version range of the category if it was not relevant to the WLS version
+        """
+        _method_name = 'load'
+
+        if not self.is_enabled():
+            return False, None, None
+
+        cache_file_name = self.__get_cache_file_name(category_name)
+        if cache_file_name is None or not os.path.isfile(cache_file_name):
+            _logger.finer('WLSDPLY-08601', category_name, cache_file_name,
+                          class_name=_class_name, method_name=_method_name)
+            return False, None, None
+
+        cache_file = None
+        try:
+            try:
+                cache_file = open(cache_file_name, 'rb')
+                cache_entry = pickle.load(cache_file)
+            except Exception, ex:
+                _logger.fine('WLSDPLY-08602', category_name, cache_file_name, str(ex),
+                             class_name=_class_name, method_name=_method_name)
+                cache_entry = None
+        finally:
+            if cache_file is not None:
+                cache_file.close()
+
+        if not self.__is_valid_entry(category_name, cache_entry):
+            _logger.fine('WLSDPLY-08603', category_name, cache_file_name,
+                         class_name=_class_name, method_name=_method_name)
+            _remove_file(cache_file_name)
+            return False, None, None
+
+        _logger.fine('WLSDPLY-08604', category_name, self._wls_version, self._wlst_mode, cache_file_name,
+                     class_name=_class_name, method_name=_method_name)
+        return True, cache_entry['category'], cache_entry['unresolved']
+
+    def store(self, category_name, category_dict, unresolved_version_range):
+        """
+        Store the resolved dictionary for the specified category.  Any cached files for the same category,
+        WLS version, and WLST mode that were created from different alias file content are removed.
+        :param category_name: the model category name
+        :param category_dict: the resolved category dictionary, or None if it is not relevant to the WLS version
+        :param unresolved_version_range: the version range of the category if it is not relevant, or None
+        """
+        _method_name = 'store'
+
+        if not self.is_enabled():
+            return
+
+        cache_file_name = self.__get_cache_file_name(category_name)
+        if cache_file_name is None:
+            return
+
+        cache_entry = {
+            'format': _cache_format_version,
+            'tool_version': _get_tool_version(),
+            'category_name': category_name,
+            'wls_version': self._wls_version,
+            'wlst_mode': self._wlst_mode,
+            'category': category_dict,
+            'unresolved': unresolved_version_range
+        }
+
+        # write to a temporary file and rename it so that a concurrent run never sees a partial file
+        temp_file_name = '%s.%s.tmp' % (cache_file_name, System.nanoTime())
+        temp_file = None
+        try:
+            temp_file = open(temp_file_name, 'wb')
+            pickle.dump(cache_entry, temp_file, 1)
+            temp_file.close()
+            temp_file = None
+            if os.path.exists(cache_file_name):
+                os.remove(cache_file_name)
+            os.rename(temp_file_name, cache_file_name)
+        except Exception, ex:
+            _logger.fine('WLSDPLY-08605', category_name, cache_file_name, str(ex),
+                         class_name=_class_name, method_name=_method_name)
+            if temp_file is not None:
+                temp_file.close()
+            _remove_file(temp_file_name)
+            return
+
+        _logger.fine('WLSDPLY-08606', category_name, self._wls_version, self._wlst_mode, cache_file_name,
+                     class_name=_class_name, method_name=_method_name)
+        self.__remove_stale_files(category_name, cache_file_name)
+        return
+
+    def __get_cache_file_name(self, category_name):
+        """
+        Get the cache file name for the specified category.
+        :param category_name: the model category name
+        :return: the absolute cache file name, or None if the content digest could not be computed
+        """
+        digest = _get_content_digest(self._category_file_paths)
+        if digest is None:
+            return None
+        file_name = '%s_%s_%s_%s%s' % (self.__get_file_prefix(category_name), self._wlst_mode,
+                                       self._wls_version, digest, _cache_file_extension)
+        return os.path.join(self._cache_dir, file_name)
+
+    def __get_file_prefix(self, category_name):
+        return '%s_%s' % (category_name, _cache_format_version)
+
+    def __is_valid_entry(self, category_name, cache_entry):
+        """
+        Does the loaded cache entry match the category, WLS version, and WLST mode requested?
+        :param category_name: the model category name
+        :param cache_entry: the cache entry loaded from disk
+        :return: True if the entry is usable, False otherwise
+        """
+        if type(cache_entry) is not dict:
+            return False
+        for key in ['format', 'tool_version', 'category_name', 'wls_version', 'wlst_mode', 'category', 'unresolved']:
+            if key not in cache_entry:
+                return False
+        return cache_entry['format'] == _cache_format_version and \
+            cache_entry['tool_version'] == _get_tool_version() and \
+            cache_entry['category_name'] == category_name and \
+            cache_entry['wls_version'] == self._wls_version and \
+            cache_entry['wlst_mode'] == self._wlst_mode
+
+    def __remove_stale_files(self, category_name, current_file_name):
+        """
+        Remove the cache files for this category, WLS version, and WLST mode that were built from other content.
+        :param category_name: the model category name
+        :param current_file_name: the cache file that was just written
+        """
+        _method_name = '__remove_stale_files'
+
+        prefix = '%s_%s_%s_' % (self.__get_file_prefix(category_name), self._wlst_mode, self._wls_version)
+        current_base_name = os.path.basename(current_file_name)
+        try:
+            file_names = os.listdir(self._cache_dir)
+        except OSError, ose:
+            _logger.finer('WLSDPLY-08607', self._cache_dir, str(ose), class_name=_class_name, method_name=_method_name)
+            return
+
+        for file_name in file_names:
+            if file_name.startswith(prefix) and file_name.endswith(_cache_file_extension) and \
+                    file_name != current_base_name:
+                _logger.finer('WLSDPLY-08608', file_name, class_name=_class_name, method_name=_method_name)
+                _remove_file(os.path.join(self._cache_dir, file_name))
+        return
+
+
+def _get_cache_directory():
+    """
+    Get the directory to use for the cache, creating it if needed.
+    :return: the directory name, or None if no usable directory is available
+    """
+    _method_name = '_get_cache_directory'
+
+    cache_dir = System.getProperty(CACHE_DIRECTORY_PROPERTY)
+    if cache_dir is None or len(cache_dir) == 0:
+        wlsdeploy_home = os.environ.get('WLSDEPLOY_HOME')
+        if wlsdeploy_home is None or len(wlsdeploy_home) == 0:
+            return None
+        cache_dir = os.path.join(wlsdeploy_home, 'cache', 'aliases')
+
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+    except OSError, ose:
+        _logger.fine('WLSDPLY-08607', cache_dir, str(ose), class_name=_class_name, method_name=_method_name)
+        return None
+
+    if not os.access(cache_dir, os.W_OK):
+        _logger.fine('WLSDPLY-08609', cache_dir, class_name=_class_name, method_name=_method_name)
+        return None
+    return cache_dir
+
+
+def _get_content_digest(category_file_paths):
+    """
+    Compute the digest of the tool version and the content of all the category module files.
+    :param category_file_paths: the resource paths of the category module files
+    :return: the file system safe digest string, or None if any of the files could not be read
+    """
+    global _content_digest
+    _method_name = '_get_content_digest'
+
+    if _content_digest is None:
+        message_digest = MessageDigest.getInstance('MD5')
+        message_digest.update(String(_get_tool_version()).getBytes('UTF-8'))
+        file_paths = list(category_file_paths)
+        file_paths.sort()
+        for file_path in file_paths:
+            input_stream = FileUtils.getResourceAsStream(file_path)
+            if input_stream is None:
+                _logger.fine('WLSDPLY-08610', file_path, None, class_name=_class_name, method_name=_method_name)
+                return None
+            try:
+                try:
+                    message_digest.update(FileUtils.readInputStreamToByteArray(input_stream))
+                except IOException, ioe:
+                    _logger.fine('WLSDPLY-08610', file_path, ioe.getLocalizedMessage(),
+                                 class_name=_class_name, method_name=_method_name)
+                    return None
+            finally:
+                input_stream.close()
+
+        digest = DatatypeConverter.printHexBinary(message_digest.digest())
+        _content_digest = str(digest).lower()
+        _logger.finer('WLSDPLY-08611', _content_digest, class_name=_class_name, method_name=_method_name)
+    return _content_digest
+
+
+def _get_tool_version():
+    """
+    Get the version of the tool, which is part of the cache key because the resolved dictionaries are built by
+    the tool code as well as from the alias files.
+    :return: the tool version
+    """
+    return str(WebLogicDeployToolingVersion.getVersion())
+
+
+def _remove_file(file_name):
+    """
+    Remove the specified file, ignoring any errors.
+    :param file_name: the file to remove
+    """
+    _method_name = '_remove_file'
+
+    try:
+        if os.path.exists(file_name):
+            os.remove(file_name)
+    except OSError, ose:
+        _logger.finer('WLSDPLY-08612', file_name, str(ose), class_name=_class_name, method_name=_method_name)
+    return
@@ -12,6 +12,7 @@ from oracle.weblogic.deploy.util import FileUtils
 
 import wlsdeploy.aliases.alias_utils as alias_utils
 from wlsdeploy.aliases import password_utils
+from wlsdeploy.aliases.alias_cache import AliasCache
 from wlsdeploy.aliases.alias_constants import ChildFoldersTypes
 from wlsdeploy.aliases.location_context import LocationContext
 from wlsdeploy.aliases.validation_codes import ValidationCodes
@@ -19,6 +20,7 @@ from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util.lru_cache import LruCache
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
 from wlsdeploy.aliases.alias_constants import ATTRIBUTES
@@ -56,6 +58,15 @@ from wlsdeploy.aliases.alias_constants import WLST_TYPE
 _class_name = 'AliasEntries'
 _logger = PlatformLogger('wlsdeploy.aliases')
 
+# the maximum number of resolved folder dictionaries and paths to keep for each AliasEntries object
+_resolved_cache_max_size = 2000
+_not_cached = object()
+
+# The raw category dictionaries parsed from the category module files are the same for all WLS versions and
+# WLST modes so each file is parsed once per run and every use gets its own clone of the parsed dictionary.
+_raw_category_cache = dict()
+_raw_category_parse_counts = {'parsed': 0, 'reused': 0}
+
 
 class AliasEntries(object):
     """
@@ -183,13 +194,16 @@ class AliasEntries(object):
 
     __domain_name_token = 'DOMAIN'
 
-    def __init__(self, wlst_mode=WlstModes.OFFLINE, wls_version=None):
+    def __init__(self, wlst_mode=WlstModes.OFFLINE, wls_version=None, use_cache=True):
         """
         The initialization method called when the object is constructed.
         :param wlst_mode: the WLST mode being used, the default is OFFLINE
         :param wls_version: the WLS version to use, the default is the version of WLST being used to run the program.
+        :param use_cache: whether to use the persistent alias cache, if it is available, the default is True
         """
         self._category_dict = {}
+        self._attribute_views = {}
+        self._resolved_cache = LruCache(_resolved_cache_max_size)
         self._wlst_mode = wlst_mode
         if wls_version is None:
             self._wls_helper = WebLogicHelper(_logger)
@@ -198,6 +212,10 @@ class AliasEntries(object):
             self._wls_helper = WebLogicHelper(_logger, wls_version)
             self._wls_version = wls_version
 
+        category_file_paths = list()
+        for category_file in self.__model_categories_map.values():
+            category_file_paths.append('%s%s.json' % (self.__category_modules_dir_name, category_file))
+        self._alias_cache = AliasCache(self._wlst_mode, self._wls_version, category_file_paths, use_cache)
         return
 
     def get_dictionary_for_location(self, location, resolve=True):
@@ -207,7 +225,7 @@ class AliasEntries(object):
         :param location: the location context that identifies the folder in question and the name
                          tokens to use to convert the WLST paths to concrete values
         :return: the alias dictionary for the specified location, or None if the dictionary is not relevant
-                 to the current WLS version
+                 to the current WLS version.  The dictionary is cached and shared so it must not be modified.
         :raises AliasException: if an error occurs while loading or processing the aliases for the specified location
         """
         _method_name = 'get_dictionary_for_location'
@@ -371,8 +389,7 @@ class AliasEntries(object):
         _method_name = 'get_wlst_attribute_path_for_location'
 
         _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
-        tokenized_path = self.__get_path_for_location(location, WLST_ATTRIBUTES_PATH)
-        result = alias_utils.replace_tokens_in_path(location, tokenized_path)
+        result = self.__get_resolved_path_for_location(location, WLST_ATTRIBUTES_PATH)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
         return result
 
@@ -387,8 +404,7 @@ class AliasEntries(object):
         _method_name = 'get_wlst_subfolders_path_for_location'
 
         _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
-        tokenized_path = self.__get_path_for_location(location, WLST_SUBFOLDERS_PATH)
-        result = alias_utils.replace_tokens_in_path(location, tokenized_path)
+        result = self.__get_resolved_path_for_location(location, WLST_SUBFOLDERS_PATH)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
         return result
 
@@ -403,8 +419,7 @@ class AliasEntries(object):
         _method_name = 'get_wlst_list_path_for_location'
 
         _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
-        tokenized_path = self.__get_path_for_location(location, WLST_LIST_PATH)
-        result = alias_utils.replace_tokens_in_path(location, tokenized_path)
+        result = self.__get_resolved_path_for_location(location, WLST_LIST_PATH)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
         return result
 
@@ -419,8 +434,7 @@ class AliasEntries(object):
         _method_name = 'get_wlst_list_path_for_location'
 
         _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
-        tokenized_path = self.__get_path_for_location(location, WLST_CREATE_PATH)
-        result = alias_utils.replace_tokens_in_path(location, tokenized_path)
+        result = self.__get_resolved_path_for_location(location, WLST_CREATE_PATH)
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
         return result
 
@@ -670,7 +684,8 @@ class AliasEntries(object):
     def get_alias_attribute_entries_by_location(self, location):
         """
         Get the attribute entries for the specified location.  Note that since this method does not resolve
-        the paths, the wlst_path attribute is removed for the returned attribute entries.
+        the paths, the wlst_path attribute is removed for the returned attribute entries.  The returned
+        dictionary and its entries are shared, read-only views.
         :param location: the location
         :return: the dictionary of attribute entries, keyed by the model attribute names
         :raises AliasException: if an error occurs
@@ -679,16 +694,8 @@ class AliasEntries(object):
 
         _logger.entering(str(location), class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
-        model_attr_dict = dict()
         if folder_dict is not None and ATTRIBUTES in folder_dict:
-            attrs = folder_dict[ATTRIBUTES]
-            for attr_name in attrs:
-                attr = copy.deepcopy(attrs[attr_name])
-                if WLST_PATH in attr:
-                    del attr[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08107', attr_name, location.get_folder_path(), WLST_PATH)
-                model_attr_dict[attr_name] = attr
+            model_attr_dict, wlst_attr_dict = self.__get_attribute_views(location, folder_dict)
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08108', location.get_folder_path(), ATTRIBUTES)
             _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
@@ -702,7 +709,7 @@ class AliasEntries(object):
         Get a single alias attribute entry from the specified location by its model name.
         :param location: the location
         :param model_attribute_name: the model name for the attribute
-        :return: the alias entry for the specified attribute
+        :return: the read-only alias entry for the specified attribute
         :raises AliasException: if an error occurs
         """
         _method_name = 'get_alias_attribute_entry_by_model_name'
@@ -710,14 +717,8 @@ class AliasEntries(object):
         _logger.entering(str(location), model_attribute_name, class_name=_class_name, method_name=_method_name)
         folder_dict = self.__get_dictionary_for_location(location, False)
         if folder_dict is not None and ATTRIBUTES in folder_dict:
-            if model_attribute_name in folder_dict[ATTRIBUTES]:
-                model_attr_dict = copy.deepcopy(folder_dict[ATTRIBUTES][model_attribute_name])
-                if WLST_PATH in model_attr_dict:
-                    del model_attr_dict[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08107', model_attribute_name, location.get_folder_path(), WLST_PATH)
-            else:
-                model_attr_dict = None
+            model_attr_views, wlst_attr_views = self.__get_attribute_views(location, folder_dict)
+            model_attr_dict = dictionary_utils.get_element(model_attr_views, model_attribute_name)
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08109', model_attribute_name,
                                                          location.get_folder_path(), ATTRIBUTES)
@@ -732,7 +733,7 @@ class AliasEntries(object):
         Get a single alias attribute entry from the specified location by its WLST name.
         :param location: the location
         :param wlst_attribute_name: the WLST name for the attribute
-        :return: the alias entry for the specified attribute
+        :return: the read-only alias entry for the specified attribute
         :raises AliasException: if an error occurs
         """
         _method_name = 'get_alias_attribute_entry_by_wlst_name'
@@ -742,12 +743,9 @@ class AliasEntries(object):
         if self._is_wlst_attribute_skipped(folder_dict, wlst_attribute_name):
             result = None
         elif folder_dict is not None and WLST_NAMES_MAP in folder_dict:
-            if wlst_attribute_name in folder_dict[WLST_NAMES_MAP]:
-                result = copy.deepcopy(folder_dict[WLST_NAMES_MAP][wlst_attribute_name])
-                if WLST_PATH in result:
-                    del result[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08110', wlst_attribute_name, location.get_folder_path(), WLST_PATH)
+            model_attr_views, wlst_attr_views = self.__get_attribute_views(location, folder_dict)
+            if wlst_attribute_name in wlst_attr_views:
+                result = wlst_attr_views[wlst_attribute_name]
             else:
                 if wlst_attribute_name not in self.IGNORE_FOR_MODEL_LIST:
                     ex = exception_helper.create_alias_exception('WLSDPLY-08111', location.get_folder_path(),
@@ -878,6 +876,43 @@ class AliasEntries(object):
     #                         Private helper methods                          #
     ###########################################################################
 
+    def get_resolved_cache_statistics(self):
+        """
+        Get the usage statistics of the cache of folder dictionaries and WLST paths with resolved name tokens.
+        :return: a dictionary with the hits, misses, evictions, size, and max_size of the cache
+        """
+        return self._resolved_cache.get_statistics()
+
+    def get_model_category_names(self):
+        """
+        Get the names of all the model categories, which includes the domain category.
+        :return: the list of category names
+        """
+        return list(self.__model_categories_map.keys())
+
+    def get_raw_category_dictionary(self, model_category_name=None):
+        """
+        Get the alias dictionary for the category as it was loaded from its file, with any contained categories
+        loaded into its folders.  No WLS version or WLST mode context is applied to the dictionary.
+        :param model_category_name: the category name, or None for the domain category
+        :return: a copy of the raw category dictionary that the caller is free to modify
+        :raises AliasException: if the category does not exist or an error occurs loading it
+        """
+        _method_name = 'get_raw_category_dictionary'
+
+        _logger.entering(model_category_name, class_name=_class_name, method_name=_method_name)
+        if model_category_name is None:
+            model_category_name = self.__domain_category
+        if model_category_name not in self.__model_categories_map:
+            ex = exception_helper.create_alias_exception('WLSDPLY-08116', model_category_name)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        raw_category_dict = self.__load_category_file(self.__model_categories_map[model_category_name])
+        self.__load_contains_categories(model_category_name, raw_category_dict)
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return raw_category_dict
+
     def _unit_test_only_get_category_map_files(self):
         """
         Internal method used to get the category files for unit testing.
@@ -935,7 +970,11 @@ class AliasEntries(object):
                 path_name += '/' + location_subfolder
 
             if resolve_path_tokens:
-                resolved_dict = alias_utils.resolve_path_tokens(location, path_name, child_dict)
+                cache_key = _get_resolved_cache_key(location)
+                resolved_dict = self._resolved_cache.get(cache_key, _not_cached)
+                if resolved_dict is _not_cached:
+                    resolved_dict = alias_utils.resolve_path_tokens(location, path_name, child_dict)
+                    self._resolved_cache.put(cache_key, resolved_dict)
             else:
                 resolved_dict = child_dict
         else:
@@ -944,6 +983,55 @@ class AliasEntries(object):
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return resolved_dict
 
+    def __get_resolved_path_for_location(self, location, path_type):
+        """
+        Get the WLST path of the specified type for the location with all the name tokens replaced.
+        The resolved paths are kept in the resolved cache to avoid repeating the token replacement.
+        :param location: the location
+        :param path_type: the path type
+        :return: the resolved path
+        :raises: AliasException: if an error occurs because the alias data is missing required fields
+                                 or the location is missing required name tokens
+        """
+        cache_key = _get_resolved_cache_key(location, path_type)
+        result = self._resolved_cache.get(cache_key, _not_cached)
+        if result is _not_cached:
+            tokenized_path = self.__get_path_for_location(location, path_type)
+            result = alias_utils.replace_tokens_in_path(location, tokenized_path)
+            self._resolved_cache.put(cache_key, result)
+        return result
+
+    def __get_attribute_views(self, location, folder_dict):
+        """
+        Get the read-only views of the attribute entries for the folder, without their wlst_path values.
+        The views are built the first time that the folder is requested and are shared by all callers.
+        :param location: the location of the folder
+        :param folder_dict: the folder dictionary with unresolved path tokens
+        :return: the read-only dictionary of views keyed by model attribute name and the dictionary of
+                 the same views keyed by WLST attribute name
+        """
+        _method_name = '__get_attribute_views'
+
+        folder_path = location.get_folder_path()
+        if folder_path in self._attribute_views:
+            return self._attribute_views[folder_path]
+
+        model_attr_views = dict()
+        wlst_attr_views = dict()
+        if ATTRIBUTES in folder_dict:
+            for attr_name, attr_dict in folder_dict[ATTRIBUTES].iteritems():
+                if WLST_PATH not in attr_dict:
+                    _logger.warning('WLSDPLY-08107', attr_name, folder_path, WLST_PATH,
+                                    class_name=_class_name, method_name=_method_name)
+                attr_view = _create_read_only_view(attr_dict, [WLST_PATH])
+                model_attr_views[attr_name] = attr_view
+                if WLST_NAME in attr_dict:
+                    wlst_attr_views[attr_dict[WLST_NAME]] = attr_view
+
+        result = (ReadOnlyDict(model_attr_views), ReadOnlyDict(wlst_attr_views))
+        self._attribute_views[folder_path] = result
+        return result
+
     def __get_category_dictionary(self, model_category_name):
         """
         Get the category dictionary from the cache, loading it first if required.  The dictionary
@@ -958,13 +1046,23 @@ class AliasEntries(object):
 
     def __load_category(self, model_category_name):
         """
-        Load the category and apply WLS version and WLST mode context to it.
+        Load the category and apply WLS version and WLST mode context to it.  The resolved category is
+        read from the persistent alias cache, if possible, and saved to it after it is loaded from its file.
         :param model_category_name: the category name
         :raises: AliasException: if an error occurs
         """
         _method_name = '__load_category'
 
         _logger.entering(model_category_name, class_name=_class_name, method_name=_method_name)
+        found, cached_category_dict, unresolved_version_range = self._alias_cache.load(model_category_name)
+        if found:
+            _set_folder_resolver(cached_category_dict, self.__apply_wlst_context_changes)
+            self._category_dict[model_category_name] = cached_category_dict
+            if unresolved_version_range is not None:
+                _add_to_unresolved_folders(model_category_name, self._category_dict, unresolved_version_range)
+            _logger.exiting(class_name=_class_name, method_name=_method_name)
+            return
+
         model_category_file = self.__model_categories_map[model_category_name]
         raw_category_dict = self.__load_category_file(model_category_file)
         _logger.fine('WLSDPLY-08118', model_category_name, class_name=_class_name, method_name=_method_name)
@@ -976,12 +1074,22 @@ class AliasEntries(object):
         # process the folder recursively and resolve everything based on WLS version and WLST mode.
         self._category_dict[model_category_name] = \
             self.__apply_wlst_context_changes(model_category_name, raw_category_dict, self._category_dict)
+        _logger.fine('WLSDPLY-08137', model_category_name, _raw_category_parse_counts['parsed'],
+                     _raw_category_parse_counts['reused'], class_name=_class_name, method_name=_method_name)
+
+        unresolved_version_range = None
+        if UNRESOLVED_FOLDERS_MAP in self._category_dict:
+            unresolved_version_range = \
+                dictionary_utils.get_element(self._category_dict[UNRESOLVED_FOLDERS_MAP], model_category_name)
+        self._alias_cache.store(model_category_name, self._category_dict[model_category_name],
+                                unresolved_version_range)
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return
 
     def __load_category_file(self, category_base_file_name):
         """
-        Load the category from its data file.
+        Load the category from its data file.  Each data file is only parsed once and the caller
+        gets a clone of the parsed dictionary that it is free to modify.
         :param category_base_file_name: the data file base name
         :return: the raw dictionary loaded from the data file
         :raises: AliasException: if an error occurs
@@ -989,6 +1097,12 @@ class AliasEntries(object):
         _method_name = '__load_category_file'
 
         _logger.entering(category_base_file_name, class_name=_class_name, method_name=_method_name)
+        if category_base_file_name in _raw_category_cache:
+            _raw_category_parse_counts['reused'] += 1
+            result = _clone_raw_dictionary(_raw_category_cache[category_base_file_name])
+            _logger.exiting(class_name=_class_name, method_name=_method_name)
+            return result
+
         category_file_name = '%s.json' % category_base_file_name
         category_file_path = '%s%s' % (self.__category_modules_dir_name, category_file_name)
 
@@ -1001,14 +1115,20 @@ class AliasEntries(object):
             raise ex
 
         try:
-            json_translator = JsonStreamTranslator(category_file_name, category_input_stream)
-            result = json_translator.parse()
-        except JsonException, jex:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08121', category_file_path,
-                                                         jex.getLocalizedMessage(), error=jex)
-            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
-            raise ex
+            try:
+                json_translator = JsonStreamTranslator(category_file_name, category_input_stream)
+                parsed_dict = json_translator.parse()
+            except JsonException, jex:
+                ex = exception_helper.create_alias_exception('WLSDPLY-08121', category_file_path,
+                                                             jex.getLocalizedMessage(), error=jex)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+        finally:
+            category_input_stream.close()
 
+        _raw_category_parse_counts['parsed'] += 1
+        _raw_category_cache[category_base_file_name] = parsed_dict
+        result = _clone_raw_dictionary(parsed_dict)
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return result
 
@@ -1073,9 +1193,11 @@ class AliasEntries(object):
     def __apply_wlst_context_changes(self, path_name, alias_dict, parent_dict):
         """
         Apply the WLS version and WLST mode changes to the alias dictionary so that the resulting
-        dictionary is specific to the current WLST context.
+        dictionary is specific to the current WLST context.  The subfolders of the resulting dictionary
+        are resolved by calling this method again when they are first accessed.
         :param path_name: the model folder path name for the alias dictionary
         :param alias_dict: the folder alias dictionary
+        :param parent_dict: the parent folder alias dictionary
         :return: the filtered alias dictionary or None if folder is not relevant to the current WLS version
         :raises: AliasException: if an error occurs
         """
@@ -1090,11 +1212,14 @@ class AliasEntries(object):
 
         result = dict()
         if FOLDERS in alias_dict:
-            result_folders = dict()
+            #
+            # The subfolders are not resolved until they are first accessed so that the time and memory
+            # used are proportional to the folders actually used and not to the size of the category.
+            #
+            result_folders = LazyFolderDictionary(self.__apply_wlst_context_changes)
             folders = alias_dict[FOLDERS]
             for folder in folders:
-                folder_dict = self.__apply_wlst_context_changes(path_name + '/' + folder, folders[folder], alias_dict)
-                result_folders[folder] = folder_dict
+                result_folders.add_unresolved_folder(folder, path_name + '/' + folder, folders[folder], alias_dict)
             result[FOLDERS] = result_folders
 
         if FLATTENED_FOLDER_DATA in alias_dict:
@@ -1498,3 +1623,229 @@ def _add_to_unresolved_folders(path_name, parent_dict, unresolved):
         parent_dict[UNRESOLVED_FOLDERS_MAP] = dict()
     alias_dict_folder_name = alias_utils.compute_folder_name_from_path(path_name)
     parent_dict[UNRESOLVED_FOLDERS_MAP][alias_dict_folder_name] = unresolved
+
+
+class LazyFolderDictionary(dict):
+    """
+    The folders dictionary of a resolved alias folder.  Each subfolder is stored in its raw form and
+    the WLS version and WLST mode context is applied to it the first time its value is accessed.
+    The keys are always available so checking whether a subfolder exists never resolves it.
+    Copying or comparing the dictionary resolves all of its subfolders.  Pickling it keeps the unresolved
+    subfolders in their raw form, and the resolver of an unpickled dictionary is set with set_resolver().
+    """
+
+    def __init__(self, resolver):
+        """
+        Create an empty folders dictionary.
+        :param resolver: the function called with the path name, raw folder dictionary and raw parent
+                         dictionary to resolve a subfolder
+        """
+        dict.__init__(self)
+        self._resolver = resolver
+
+    def add_unresolved_folder(self, folder_name, path_name, raw_folder_dict, raw_parent_dict):
+        """
+        Add a subfolder that will be resolved when it is first accessed.
+        :param folder_name: the model folder name
+        :param path_name: the model folder path name of the subfolder
+        :param raw_folder_dict: the raw alias dictionary of the subfolder
+        :param raw_parent_dict: the raw alias dictionary of the parent folder
+        """
+        dict.__setitem__(self, folder_name, _UnresolvedFolder(path_name, raw_folder_dict, raw_parent_dict))
+
+    def set_resolver(self, resolver):
+        """
+        Set the resolver of this dictionary and of the subfolders that are already resolved.
+        :param resolver: the function that resolves a subfolder
+        """
+        self._resolver = resolver
+        for value in dict.values(self):
+            _set_folder_resolver(value, resolver)
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if isinstance(value, _UnresolvedFolder):
+            value = self._resolver(value.path_name, value.raw_folder_dict, value.raw_parent_dict)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def itervalues(self):
+        return iter(self.values())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def iteritems(self):
+        return iter(self.items())
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __copy__(self):
+        return dict(self.items())
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self.items()), memo)
+
+    def __reduce__(self):
+        # the resolver is a bound method that cannot be pickled, and the subfolders are pickled as they are
+        return _new_lazy_folder_dictionary, (dict(dict.items(self)),)
+
+
+class _UnresolvedFolder(object):
+    """
+    The raw data needed to resolve a subfolder in a LazyFolderDictionary.
+    """
+
+    def __init__(self, path_name, raw_folder_dict, raw_parent_dict):
+        self.path_name = path_name
+        self.raw_folder_dict = raw_folder_dict
+        self.raw_parent_dict = raw_parent_dict
+
+
+def _new_lazy_folder_dictionary(items):
+    """
+    Create an unpickled folders dictionary, which has no resolver until set_resolver() is called.
+    :param items: the dictionary of the resolved and unresolved subfolders
+    :return: the folders dictionary
+    """
+    result = LazyFolderDictionary(None)
+    dict.update(result, items)
+    return result
+
+
+def _set_folder_resolver(folder_dict, resolver):
+    """
+    Set the resolver of the lazy folders dictionaries in a resolved folder dictionary loaded from the cache.
+    :param folder_dict: the resolved folder dictionary, an unresolved folder, or None
+    :param resolver: the function that resolves a subfolder
+    """
+    if isinstance(folder_dict, dict) and FOLDERS in folder_dict:
+        folders = dict.__getitem__(folder_dict, FOLDERS)
+        if isinstance(folders, LazyFolderDictionary):
+            folders.set_resolver(resolver)
+    return
+
+
+def _clone_raw_dictionary(raw_dict):
+    """
+    Make a structural copy of a raw category dictionary.  Only the dictionaries and lists are copied since
+    the values parsed from the JSON files are all immutable, which is much faster than copy.deepcopy().
+    :param raw_dict: the raw dictionary
+    :return: the copy of the dictionary
+    """
+    result = dict()
+    for key, value in raw_dict.iteritems():
+        if isinstance(value, dict):
+            value = _clone_raw_dictionary(value)
+        elif isinstance(value, list):
+            value = _clone_raw_list(value)
+        result[key] = value
+    return result
+
+
+def _clone_raw_list(raw_list):
+    """
+    Make a structural copy of a list in a raw category dictionary.
+    :param raw_list: the raw list
+    :return: the copy of the list
+    """
+    result = list()
+    for value in raw_list:
+        if isinstance(value, dict):
+            value = _clone_raw_dictionary(value)
+        elif isinstance(value, list):
+            value = _clone_raw_list(value)
+        result.append(value)
+    return result
+
+
+def _get_resolved_cache_key(location, path_type=None):
+    """
+    Get the key to use for the resolved cache for the location.  The key includes all the name
+    tokens of the location so that the same folder with different names gets different entries.
+    :param location: the location
+    :param path_type: the WLST path type, or None for the resolved folder dictionary
+    :return: the hashable cache key
+    """
+    return location.get_cache_key(), path_type
+
+
+def _create_read_only_view(alias_dict, excluded_keys=None):
+    """
+    Create a read-only copy of the alias dictionary, including any nested dictionaries.
+    :param alias_dict: the alias dictionary
+    :param excluded_keys: the top-level keys to leave out of the copy
+    :return: the read-only dictionary
+    """
+    view = dict()
+    for key, value in alias_dict.iteritems():
+        if excluded_keys is not None and key in excluded_keys:
+            continue
+        if isinstance(value, dict):
+            value = _create_read_only_view(value)
+        view[key] = value
+    return ReadOnlyDict(view)
+
+
+class ReadOnlyDict(dict):
+    """
+    A dictionary that cannot be modified after it is constructed.  It is used to share alias entries
+    with all callers without copying them, so any attempt to modify it raises an AliasException.
+    Copying it with the copy module produces a regular, modifiable dictionary.
+    """
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self._read_only = True
+
+    def __setitem__(self, key, value):
+        self.__check_writable('__setitem__', key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.__check_writable('__delitem__', key)
+        dict.__delitem__(self, key)
+
+    def clear(self):
+        self.__check_writable('clear')
+        dict.clear(self)
+
+    def pop(self, key, *args):
+        self.__check_writable('pop', key)
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self.__check_writable('popitem')
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self.__check_writable('setdefault', key)
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self.__check_writable('update')
+        dict.update(self, *args, **kwargs)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+
+    def __check_writable(self, method_name, key=None):
+        if getattr(self, '_read_only', False):
+            ex = exception_helper.create_alias_exception('WLSDPLY-08136', method_name, key)
+            _logger.throwing(ex, class_name='ReadOnlyDict', method_name=method_name)
+            raise ex
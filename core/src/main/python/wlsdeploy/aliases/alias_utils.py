@@ -31,6 +31,7 @@ from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.aliases.alias_constants import ATTRIBUTES
 from wlsdeploy.aliases.alias_constants import COMMA_DELIMITED_STRING
 from wlsdeploy.aliases.alias_constants import DELIMITED_STRING
+from wlsdeploy.aliases.alias_constants import FOLDERS
 from wlsdeploy.aliases.alias_constants import JARRAY
 from wlsdeploy.aliases.alias_constants import JAVA_LANG_BOOLEAN
 from wlsdeploy.aliases.alias_constants import LIST
@@ -303,8 +304,14 @@ def resolve_path_tokens(location, path_name, folder_dict):
 
     #
     # Now that we have the target dictionary, we need to make a copy of it and replace the path tokens.
+    # The subfolder paths are never resolved here so the subfolders are shared rather than copied.
     #
-    resolved_dict = copy.deepcopy(folder_dict)
+    resolved_dict = dict()
+    for key, value in folder_dict.iteritems():
+        if key == FOLDERS:
+            resolved_dict[key] = value
+        else:
+            resolved_dict[key] = copy.deepcopy(value)
     if WLST_PATHS in resolved_dict:
         wlst_paths_dict = resolved_dict[WLST_PATHS]
         for path_key in wlst_paths_dict:
@@ -0,0 +1,387 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+An index of the raw alias data that answers folder and attribute questions for any WLS version.
+"""
+from oracle.weblogic.deploy.aliases import VersionException
+from oracle.weblogic.deploy.aliases import VersionUtils
+
+from wlsdeploy.aliases import alias_utils
+from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.validation_codes import ValidationCodes
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+from wlsdeploy.aliases.alias_constants import ATTRIBUTES
+from wlsdeploy.aliases.alias_constants import FOLDER_PARAMS
+from wlsdeploy.aliases.alias_constants import FOLDERS
+from wlsdeploy.aliases.alias_constants import VERSION
+from wlsdeploy.aliases.alias_constants import WLST_MODE
+from wlsdeploy.aliases.alias_constants import WLST_NAME
+
+_class_name = 'AliasVersionIndex'
+_logger = PlatformLogger('wlsdeploy.aliases')
+
+_domain_folder_path = '/'
+
+# The index does not depend on the WLS version so share one per WLST mode.
+_indexes = dict()
+
+
+def get_alias_version_index(wlst_mode=WlstModes.OFFLINE):
+    """
+    Get the shared alias version index for the WLST mode, creating it if needed.
+    :param wlst_mode: the WLST mode
+    :return: the AliasVersionIndex for the WLST mode
+    """
+    if wlst_mode not in _indexes:
+        _indexes[wlst_mode] = AliasVersionIndex(wlst_mode)
+    return _indexes[wlst_mode]
+
+
+class AliasVersionIndex(object):
+    """
+    The version ranges, WLST modes, and WLST names of the alias folders and attributes, indexed by model
+    folder path.  Unlike AliasEntries, which resolves the aliases for a single WLS version, the index keeps
+    the raw version data so that it can answer questions for any WLS version without reloading the aliases.
+    Each category is indexed from its raw dictionary the first time one of its folders is requested.
+    """
+
+    def __init__(self, wlst_mode=WlstModes.OFFLINE, alias_entries=None):
+        """
+        Create the index.
+        :param wlst_mode: the WLST mode used to match the folders and attributes
+        :param alias_entries: the AliasEntries used to load the raw category dictionaries, or None to create one
+        """
+        self._wlst_mode = wlst_mode
+        self._mode_name = WlstModes.from_value(wlst_mode).lower()
+        if alias_entries is None:
+            alias_entries = AliasEntries(wlst_mode, use_cache=False)
+        self._alias_entries = alias_entries
+        self._category_names = alias_entries.get_model_category_names()
+        self._folders = dict()
+        self._indexed_categories = dict()
+        return
+
+    def get_wlst_mode(self):
+        """
+        Get the WLST mode of the index.
+        :return: the WLST mode
+        """
+        return self._wlst_mode
+
+    def is_valid_model_folder_name(self, location, model_folder_name, wls_version):
+        """
+        Is the model folder name valid in the location for the WLS version?  The location itself is assumed to be
+        valid for the version, since the caller normally checks each folder as it descends into the model.
+        :param location: the location of the parent folder
+        :param model_folder_name: the model folder name
+        :param wls_version: the WLS version
+        :return: a tuple of the ValidationCodes value and the folder's version range, or None if it has no range
+        :raises: AliasException: if an error occurs
+        """
+        _method_name = 'is_valid_model_folder_name'
+
+        _logger.entering(str(location), model_folder_name, wls_version,
+                         class_name=_class_name, method_name=_method_name)
+        folder = self.__get_folder(_get_folder_path(location, model_folder_name))
+        if folder is None:
+            result = ValidationCodes.INVALID
+            version_range = None
+        else:
+            version_range = folder.get_version_range(self._mode_name)
+            if folder.is_valid(wls_version, self._mode_name):
+                result = ValidationCodes.VALID
+            else:
+                result = ValidationCodes.VERSION_INVALID
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
+        return result, version_range
+
+    def is_valid_model_attribute_name(self, location, model_attribute_name, wls_version):
+        """
+        Is the model attribute name valid in the location for the WLS version?
+        :param location: the location of the folder
+        :param model_attribute_name: the model attribute name
+        :param wls_version: the WLS version
+        :return: a tuple of the ValidationCodes value and the attribute's version ranges for the WLST mode,
+                 or None if the attribute is not valid in the WLST mode
+        :raises: AliasException: if an error occurs
+        """
+        _method_name = 'is_valid_model_attribute_name'
+
+        _logger.entering(str(location), model_attribute_name, wls_version,
+                         class_name=_class_name, method_name=_method_name)
+        folder = self.__get_folder(location.get_folder_path())
+        if folder is None or not folder.has_attribute(model_attribute_name):
+            result = ValidationCodes.INVALID
+            version_range = None
+        else:
+            version_range = folder.get_attribute_version_range(model_attribute_name, self._mode_name)
+            if folder.get_attribute_entry(model_attribute_name, wls_version, self._mode_name) is not None:
+                result = ValidationCodes.VALID
+            else:
+                result = ValidationCodes.VERSION_INVALID
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
+        return result, version_range
+
+    def get_wlst_attribute_name(self, location, model_attribute_name, wls_version):
+        """
+        Get the WLST attribute name for the model attribute in the WLS version.
+        :param location: the location of the folder
+        :param model_attribute_name: the model attribute name
+        :param wls_version: the WLS version
+        :return: the WLST attribute name, or None if the attribute is not valid for the WLS version
+        :raises: AliasException: if an error occurs
+        """
+        folder = self.__get_folder(location.get_folder_path())
+        if folder is None:
+            return None
+
+        entry = folder.get_attribute_entry(model_attribute_name, wls_version, self._mode_name)
+        if entry is None:
+            return None
+        return self.__resolve_curly_braces(entry[_WLST_NAME_INDEX])
+
+    def get_model_attribute_names(self, location, wls_version):
+        """
+        Get the model attribute names that are valid in the location for the WLS version.
+        :param location: the location of the folder
+        :param wls_version: the WLS version
+        :return: the list of model attribute names
+        :raises: AliasException: if an error occurs
+        """
+        result = list()
+        folder = self.__get_folder(location.get_folder_path())
+        if folder is not None:
+            for attribute_name in folder.get_attribute_names():
+                if folder.get_attribute_entry(attribute_name, wls_version, self._mode_name) is not None:
+                    result.append(attribute_name)
+        return result
+
+    def get_model_subfolder_names(self, location, wls_version):
+        """
+        Get the model subfolder names that are valid in the location for the WLS version.
+        :param location: the location of the folder
+        :param wls_version: the WLS version
+        :return: the list of model subfolder names
+        :raises: AliasException: if an error occurs
+        """
+        result = list()
+        folder_path = location.get_folder_path()
+        folder = self.__get_folder(folder_path)
+        if folder is not None:
+            for subfolder_name in folder.get_subfolder_names():
+                subfolder = self.__get_folder(_append_folder_path(folder_path, subfolder_name))
+                if subfolder.is_valid(wls_version, self._mode_name):
+                    result.append(subfolder_name)
+        return result
+
+    def __get_folder(self, folder_path):
+        """
+        Get the indexed folder for the model folder path, indexing its category if needed.
+        :param folder_path: the model folder path
+        :return: the indexed folder, or None if there is no such folder
+        :raises: AliasException: if an error occurs loading the category
+        """
+        if folder_path == _domain_folder_path:
+            category_name = None
+        else:
+            category_name = folder_path.split('/')[1]
+            if category_name not in self._category_names:
+                return None
+
+        if category_name not in self._indexed_categories:
+            self.__index_category(category_name)
+        if folder_path in self._folders:
+            return self._folders[folder_path]
+        return None
+
+    def __index_category(self, category_name):
+        """
+        Index all the folders in the category.
+        :param category_name: the category name, or None for the domain category
+        :raises: AliasException: if an error occurs loading the category
+        """
+        _method_name = '__index_category'
+
+        raw_category_dict = self._alias_entries.get_raw_category_dictionary(category_name)
+        if category_name is None:
+            # the domain category's folders are the other categories, so only index its attributes
+            self._folders[_domain_folder_path] = _IndexedFolder(_domain_folder_path, raw_category_dict, [])
+        else:
+            self.__index_folder('/' + category_name, raw_category_dict)
+        self._indexed_categories[category_name] = True
+        _logger.fine('WLSDPLY-08700', category_name, WlstModes.from_value(self._wlst_mode), len(self._folders),
+                     class_name=_class_name, method_name=_method_name)
+        return
+
+    def __index_folder(self, folder_path, raw_folder_dict):
+        """
+        Index the folder and, recursively, its subfolders.
+        :param folder_path: the model folder path
+        :param raw_folder_dict: the raw folder dictionary
+        """
+        subfolder_names = list()
+        if FOLDERS in raw_folder_dict:
+            raw_subfolders = raw_folder_dict[FOLDERS]
+            for subfolder_name in raw_subfolders:
+                subfolder_names.append(subfolder_name)
+                self.__index_folder(_append_folder_path(folder_path, subfolder_name), raw_subfolders[subfolder_name])
+        self._folders[folder_path] = _IndexedFolder(folder_path, raw_folder_dict, subfolder_names)
+        return
+
+    def __resolve_curly_braces(self, value):
+        if value is not None and '${' in value:
+            return alias_utils.parse_curly_braces(value)[self._wlst_mode]
+        return value
+
+
+# indexes into the attribute entry tuples
+_VERSION_INDEX = 0
+_MODE_INDEX = 1
+_WLST_NAME_INDEX = 2
+
+
+class _IndexedFolder(object):
+    """
+    The version ranges and WLST modes of a single alias folder and its attributes.
+    """
+
+    def __init__(self, folder_path, raw_folder_dict, subfolder_names):
+        self._folder_path = folder_path
+        self._subfolder_names = subfolder_names
+
+        # The folder is valid if any of its conditions matches.  A folder with folder_params has one
+        # condition for each set of parameters, which may override the folder's version and mode.
+        folder_version = alias_utils.get_dictionary_version(raw_folder_dict)
+        folder_mode = alias_utils.get_dictionary_mode(raw_folder_dict)
+        self._conditions = list()
+        if FOLDER_PARAMS in raw_folder_dict and raw_folder_dict[FOLDER_PARAMS]:
+            for folder_set in raw_folder_dict[FOLDER_PARAMS]:
+                version = folder_version
+                mode = folder_mode
+                if VERSION in folder_set:
+                    version = folder_set[VERSION]
+                if WLST_MODE in folder_set:
+                    mode = folder_set[WLST_MODE]
+                self._conditions.append((version, mode))
+        else:
+            self._conditions.append((folder_version, folder_mode))
+
+        self._attributes = dict()
+        if ATTRIBUTES in raw_folder_dict:
+            for attribute_name, attribute_list in raw_folder_dict[ATTRIBUTES].iteritems():
+                entries = list()
+                for attribute_dict in attribute_list:
+                    wlst_name = None
+                    if WLST_NAME in attribute_dict:
+                        wlst_name = attribute_dict[WLST_NAME]
+                    entries.append((alias_utils.get_dictionary_version(attribute_dict),
+                                    alias_utils.get_dictionary_mode(attribute_dict), wlst_name))
+                self._attributes[attribute_name] = entries
+        return
+
+    def get_subfolder_names(self):
+        return self._subfolder_names
+
+    def get_attribute_names(self):
+        return self._attributes.keys()
+
+    def has_attribute(self, attribute_name):
+        return attribute_name in self._attributes
+
+    def is_valid(self, wls_version, mode_name):
+        """
+        Is the folder valid for the WLS version and WLST mode?
+        :param wls_version: the WLS version
+        :param mode_name: the lower-case WLST mode name
+        :return: True if the folder is valid, False otherwise
+        :raises: AliasException: if a version range is not valid
+        """
+        for version_range, mode in self._conditions:
+            if _mode_matches(mode, mode_name) and \
+                    _version_in_range(wls_version, version_range, self._folder_path, None):
+                return True
+        return False
+
+    def get_version_range(self, mode_name):
+        """
+        Get the version ranges of the folder for the WLST mode.
+        :param mode_name: the lower-case WLST mode name
+        :return: the comma-separated version ranges, or None if the folder has no ranges for the mode
+        """
+        ranges = list()
+        for version_range, mode in self._conditions:
+            if _mode_matches(mode, mode_name) and version_range is not None:
+                ranges.append(version_range)
+        return _join_ranges(ranges)
+
+    def get_attribute_entry(self, attribute_name, wls_version, mode_name):
+        """
+        Get the attribute entry that matches the WLS version and WLST mode.
+        :param attribute_name: the model attribute name
+        :param wls_version: the WLS version
+        :param mode_name: the lower-case WLST mode name
+        :return: the matching (version range, mode, WLST name) entry, or None if there is no match
+        :raises: AliasException: if a version range is not valid
+        """
+        if attribute_name not in self._attributes:
+            return None
+        for entry in self._attributes[attribute_name]:
+            if _mode_matches(entry[_MODE_INDEX], mode_name) and \
+                    _version_in_range(wls_version, entry[_VERSION_INDEX], self._folder_path, attribute_name):
+                return entry
+        return None
+
+    def get_attribute_version_range(self, attribute_name, mode_name):
+        """
+        Get the version ranges of the attribute for the WLST mode.
+        :param attribute_name: the model attribute name
+        :param mode_name: the lower-case WLST mode name
+        :return: the comma-separated version ranges, or None if the attribute has no ranges for the mode
+        """
+        ranges = list()
+        for entry in self._attributes[attribute_name]:
+            if _mode_matches(entry[_MODE_INDEX], mode_name) and entry[_VERSION_INDEX] is not None:
+                ranges.append(entry[_VERSION_INDEX])
+        return _join_ranges(ranges)
+
+
+def _get_folder_path(location, model_folder_name):
+    return _append_folder_path(location.get_folder_path(), model_folder_name)
+
+
+def _append_folder_path(folder_path, model_folder_name):
+    if folder_path == _domain_folder_path:
+        return _domain_folder_path + model_folder_name
+    return folder_path + '/' + model_folder_name
+
+
+def _mode_matches(mode, mode_name):
+    return mode is None or mode == 'both' or mode == mode_name
+
+
+def _version_in_range(wls_version, version_range, folder_path, attribute_name):
+    """
+    Is the WLS version in the version range?  A missing version range matches all versions.
+    :raises: AliasException: if the version range is not valid
+    """
+    _method_name = '_version_in_range'
+
+    if version_range is None:
+        return True
+    try:
+        return VersionUtils.isVersionInRange(wls_version, version_range)
+    except VersionException, ve:
+        ex = exception_helper.create_alias_exception('WLSDPLY-08701', version_range, folder_path, attribute_name,
+                                                     ve.getLocalizedMessage(), error=ve)
+        _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+        raise ex
+
+
+def _join_ranges(ranges):
+    if len(ranges) == 0:
+        return None
+    return ', '.join(ranges)
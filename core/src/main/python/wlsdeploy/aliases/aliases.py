@@ -11,6 +11,7 @@ from oracle.weblogic.deploy.encrypt import EncryptionUtils
 
 from wlsdeploy.aliases.alias_constants import ChildFoldersTypes
 from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.attribute_profile import AttributeProfile
 from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
@@ -23,7 +24,9 @@ from wlsdeploy.util.weblogic_helper import WebLogicHelper
 from wlsdeploy.aliases.alias_constants import ACCESS
 from wlsdeploy.aliases.alias_constants import ALIAS_LIST_TYPES
 from wlsdeploy.aliases.alias_constants import ALIAS_MAP_TYPES
+from wlsdeploy.aliases.alias_constants import ALIAS_PRIMITIVE_DATA_TYPES
 from wlsdeploy.aliases.alias_constants import ATTRIBUTES
+from wlsdeploy.aliases.alias_constants import CREDENTIAL
 from wlsdeploy.aliases.alias_constants import DEFAULT
 from wlsdeploy.aliases.alias_constants import FLATTENED_FOLDER_DATA
 from wlsdeploy.aliases.alias_constants import FOLDERS
@@ -33,14 +36,11 @@ from wlsdeploy.aliases.alias_constants import GET_METHOD
 from wlsdeploy.aliases.alias_constants import JARRAY
 from wlsdeploy.aliases.alias_constants import LIST
 from wlsdeploy.aliases.alias_constants import LSA
-from wlsdeploy.aliases.alias_constants import MBEAN
 from wlsdeploy.aliases.alias_constants import MERGE
 from wlsdeploy.aliases.alias_constants import MODEL_NAME
 from wlsdeploy.aliases.alias_constants import PASSWORD
 from wlsdeploy.aliases.alias_constants import PASSWORD_TOKEN
-from wlsdeploy.aliases.alias_constants import PREFERRED_MODEL_TYPE
 from wlsdeploy.aliases.alias_constants import PROPERTIES
-from wlsdeploy.aliases.alias_constants import RESTART_REQUIRED
 from wlsdeploy.aliases.alias_constants import SET_MBEAN_TYPE
 from wlsdeploy.aliases.alias_constants import SET_METHOD
 from wlsdeploy.aliases.alias_constants import STRING
@@ -74,6 +74,7 @@ class Aliases(object):
             self._wls_version = wls_version
 
         self._alias_entries = AliasEntries(wlst_mode, self._wls_version)
+        self._attribute_profiles = dict()
         return
 
     ###########################################################################
@@ -646,6 +647,30 @@ class Aliases(object):
     #                  Model attribute-related methods                        #
     ###########################################################################
 
+    def get_model_attribute_profile(self, location):
+        """
+        Get the classification of all the model attributes in the current location.  The profile is computed
+        once per folder and shared, so callers that need several of the attribute name lists or maps for a
+        location should use it rather than calling the individual methods below.
+        :param location: the location
+        :return: the AttributeProfile for the location's folder
+        :raises: AliasException: if an error occurs
+        """
+        _method_name = 'get_model_attribute_profile'
+
+        folder_path = location.get_folder_path()
+        profile = self._attribute_profiles.get(folder_path)
+        if profile is None:
+            module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
+            if ATTRIBUTES not in module_folder:
+                ex = exception_helper.create_alias_exception('WLSDPLY-08400', folder_path)
+                self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
+                raise ex
+
+            profile = AttributeProfile(folder_path, module_folder[ATTRIBUTES])
+            self._attribute_profiles[folder_path] = profile
+        return profile
+
     def get_model_password_type_attribute_names(self, location):
         """
         Get the attributes in the current location whose types are passwords.
@@ -653,19 +678,7 @@ class Aliases(object):
         :return: list of the attribute names
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_password_type_attribute_names'
-
-        password_attribute_names = []
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if WLST_TYPE in value and value[WLST_TYPE] == 'password':
-                password_attribute_names.append(key)
-        return password_attribute_names
+        return list(self.get_model_attribute_profile(location).password_attribute_names)
 
     def get_model_restart_required_attribute_names(self, location):
         """
@@ -673,24 +686,7 @@ class Aliases(object):
         :return: list[string] Model attribute names at specified location
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_restart_required_attribute_names'
-
-        restart_attribute_names = []
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if RESTART_REQUIRED in value:
-                restart_required_value = value[RESTART_REQUIRED]
-                if "true" == restart_required_value.lower():
-                    restart_attribute_names.append(key)
-
-        return restart_attribute_names
+        return list(self.get_model_attribute_profile(location).restart_required_attribute_names)
 
     def get_model_get_required_attribute_names(self, location):
         """
@@ -699,21 +695,7 @@ class Aliases(object):
         :return: list[string]: the list of attribute names
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_get_required_attribute_names'
-
-        wlst_attribute_names = []
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_METHOD in value and value[GET_METHOD] == GET:
-                wlst_attribute_names.append(key)
-
-        return wlst_attribute_names
+        return list(self.get_model_attribute_profile(location).get_required_attribute_names)
 
     def get_model_lsa_required_attribute_names(self, location):
         """
@@ -722,21 +704,7 @@ class Aliases(object):
         :return: the list of attribute names
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_lsa_required_attribute_names'
-
-        lsa_required_attribute_names = []
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_METHOD in value and LSA in value[GET_METHOD]:
-                lsa_required_attribute_names.append(key)
-
-        return lsa_required_attribute_names
+        return list(self.get_model_attribute_profile(location).lsa_required_attribute_names)
 
     def get_model_get_returns_mbean_attribute_names_and_types(self, location):
         """
@@ -745,23 +713,7 @@ class Aliases(object):
         :return: dictionary: a dictionary with the attribute names as keys and the MBean types as values
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_get_returns_mbean_attribute_names_and_types'
-
-        model_attribute_names = dict()
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if GET_MBEAN_TYPE in value:
-                model_attribute_names[key] = value[GET_MBEAN_TYPE]
-            else:
-                model_attribute_names[key] = None
-
-        return model_attribute_names
+        return dict(self.get_model_attribute_profile(location).get_returns_mbean_attribute_types)
 
     def get_model_mbean_set_method_attribute_names_and_types(self, location):
         """
@@ -770,33 +722,9 @@ class Aliases(object):
         :return: a dictionary keyed by model attribute names with the set_method and set_mbean_type fields set
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_mbean_set_method_attribute_names_and_types'
-
         model_attributes_dict = dict()
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if SET_METHOD in value and value[SET_METHOD].startswith(MBEAN):
-                attr_dict = dict()
-
-                attr_set_method_name = None
-                set_method_value_components = value[SET_METHOD].split('.')
-                if len(set_method_value_components) == 2:
-                    attr_set_method_name = set_method_value_components[1]
-
-                attr_dict[SET_METHOD] = attr_set_method_name
-                if SET_MBEAN_TYPE in value:
-                    attr_dict[SET_MBEAN_TYPE] = value[SET_MBEAN_TYPE]
-                else:
-                    attr_dict[SET_MBEAN_TYPE] = None
-
-                model_attributes_dict[key] = attr_dict
-
+        for key, value in self.get_model_attribute_profile(location).mbean_set_method_attributes.iteritems():
+            model_attributes_dict[key] = dict(value)
         return model_attributes_dict
 
     def get_model_merge_required_attribute_names(self, location):
@@ -806,25 +734,7 @@ class Aliases(object):
         :return: a list of the model attribute names
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_merge_required_attribute_names'
-
-        model_attribute_names = list()
-
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if WLST_TYPE in value and (value[WLST_TYPE] in ALIAS_LIST_TYPES or value[WLST_TYPE] in ALIAS_MAP_TYPES):
-                merge = True
-                if MERGE in value:
-                    merge = alias_utils.convert_boolean(value[MERGE])
-                if merge:
-                    model_attribute_names.append(key)
-
-        return model_attribute_names
+        return list(self.get_model_attribute_profile(location).merge_required_attribute_names)
 
     def get_model_password_attribute_names(self, location):
         """
@@ -832,21 +742,7 @@ class Aliases(object):
         :param location: current location context
         :return: list of password attributes
         """
-        _method_name = 'get_model_password_attribute_names'
-
-        model_attribute_names = list()
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if WLST_TYPE in value and value[WLST_TYPE] == PASSWORD:
-                model_attribute_names.append(key)
-
-        return model_attribute_names
+        return list(self.get_model_attribute_profile(location).password_attribute_names)
 
     def get_model_uses_path_tokens_attribute_names(self, location):
         """
@@ -855,21 +751,7 @@ class Aliases(object):
         :return: a list of the model attribute names
         :raises: AliasException: if an error occurs
         """
-        _method_name = 'get_model_uses_path_tokens_attribute_names'
-
-        model_attribute_names = list()
-        module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
-
-        if ATTRIBUTES not in module_folder:
-            ex = exception_helper.create_alias_exception('WLSDPLY-08400', location.get_folder_path())
-            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
-            raise ex
-
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if USES_PATH_TOKENS in value and alias_utils.convert_boolean(value[USES_PATH_TOKENS]):
-                model_attribute_names.append(key)
-
-        return model_attribute_names
+        return list(self.get_model_attribute_profile(location).uses_path_tokens_attribute_names)
 
     def get_model_attribute_name_and_value(self, location, wlst_attribute_name, wlst_attribute_value):
         """
@@ -976,8 +858,7 @@ class Aliases(object):
         _method_name = 'get_model_attribute_names'
 
         self._logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
-        attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
-        result = list(attributes_dict.keys())
+        result = list(self.get_model_attribute_profile(location).attribute_names)
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
         return result
 
@@ -991,16 +872,7 @@ class Aliases(object):
         _method_name = 'get_model_attribute_names_and_types'
 
         self._logger.entering(str(location), class_name=self._class_name, method_name=_method_name)
-        result = {}
-        attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
-        for key, value in attributes_dict.iteritems():
-            if PREFERRED_MODEL_TYPE in value:
-                result[key] = value[PREFERRED_MODEL_TYPE]
-            elif WLST_TYPE in value:
-                result[key] = value[WLST_TYPE]
-            else:
-                result[key] = None
-
+        result = dict(self.get_model_attribute_profile(location).attribute_types)
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
         return result
 
@@ -1014,12 +886,15 @@ class Aliases(object):
     def attribute_values_are_equal(self, location, model_attribute_name, model_attribute_value, wlst_attribute_value):
         """
         Returns whether or not the model and WLST values for a given model attribute,
-        should be considered equal.
+        should be considered equal, so that setting the model value would not change the attribute.
 
-        :param location:
-        :param model_attribute_name:
-        :param model_attribute_value:
-        :param wlst_attribute_value:
+        Only attributes of the simple types are compared, after converting both values to the WLST type.
+        Passwords, credentials, lists, properties and references to other MBeans are never considered equal,
+        and neither are the attributes that must be read with get, because their lsa value is not reliable.
+        :param location: the location
+        :param model_attribute_name: the model attribute name
+        :param model_attribute_value: the model attribute value
+        :param wlst_attribute_value: the current WLST value, as returned by get or lsa
         :return: boolean
         :raises: AliasException: if an error occurs
         """
@@ -1035,12 +910,25 @@ class Aliases(object):
             self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
             raise ex
 
-        for key, value in module_folder[ATTRIBUTES].iteritems():
-            if key == model_attribute_name:
-                attribute_info = module_folder[ATTRIBUTES][key]
-                if attribute_info and VALUE in attribute_info and DEFAULT in attribute_info[VALUE]:
-                    result = (model_attribute_value == wlst_attribute_value and
-                              model_attribute_value == attribute_info[VALUE][DEFAULT])
+        if model_attribute_name not in module_folder[ATTRIBUTES] or wlst_attribute_value is None:
+            return result
+
+        attribute_info = module_folder[ATTRIBUTES][model_attribute_name]
+        if not attribute_info or SET_METHOD in attribute_info or SET_MBEAN_TYPE in attribute_info:
+            return result
+
+        if GET_METHOD in attribute_info and attribute_info[GET_METHOD] == GET:
+            return result
+
+        data_type = attribute_info[WLST_TYPE]
+        if data_type not in ALIAS_PRIMITIVE_DATA_TYPES or data_type in [CREDENTIAL, PASSWORD]:
+            return result
+
+        wlst_name, wlst_value = self.get_wlst_attribute_name_and_value(location, model_attribute_name,
+                                                                       model_attribute_value)
+        if wlst_name is not None and wlst_value is not None:
+            current_value = alias_utils.convert_to_type(data_type, wlst_attribute_value)
+            result = current_value is not None and str(wlst_value) == str(current_value)
 
         return result
 
@@ -1133,6 +1021,28 @@ class Aliases(object):
         """
         return self._alias_entries.IGNORE_FOR_MODEL_LIST
 
+    ###########################################################################
+    #                       Cache statistics methods                          #
+    ###########################################################################
+
+    def get_resolved_cache_statistics(self):
+        """
+        Get the usage statistics of the cache of folder dictionaries and WLST paths with resolved name tokens.
+        :return: a dictionary with the hits, misses, evictions, size, and max_size of the cache
+        """
+        return self._alias_entries.get_resolved_cache_statistics()
+
+    def log_cache_statistics(self):
+        """
+        Log the usage statistics of the alias caches.
+        """
+        _method_name = 'log_cache_statistics'
+
+        stats = self.get_resolved_cache_statistics()
+        self._logger.fine('WLSDPLY-08411', stats['hits'], stats['misses'], stats['evictions'], stats['size'],
+                          stats['max_size'], class_name=self._class_name, method_name=_method_name)
+        return
+
     ####################################################################################
     #
     # Private methods, private inner classes and static methods only, beyond here please
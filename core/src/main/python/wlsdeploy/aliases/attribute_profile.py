@@ -0,0 +1,140 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+The per-folder classification of the model attributes used by the tools.
+"""
+from wlsdeploy.aliases import alias_utils
+from wlsdeploy.aliases.alias_entries import ReadOnlyDict
+
+from wlsdeploy.aliases.alias_constants import ALIAS_LIST_TYPES
+from wlsdeploy.aliases.alias_constants import ALIAS_MAP_TYPES
+from wlsdeploy.aliases.alias_constants import DEFAULT
+from wlsdeploy.aliases.alias_constants import GET
+from wlsdeploy.aliases.alias_constants import GET_MBEAN_TYPE
+from wlsdeploy.aliases.alias_constants import GET_METHOD
+from wlsdeploy.aliases.alias_constants import LSA
+from wlsdeploy.aliases.alias_constants import MBEAN
+from wlsdeploy.aliases.alias_constants import MERGE
+from wlsdeploy.aliases.alias_constants import PASSWORD
+from wlsdeploy.aliases.alias_constants import PREFERRED_MODEL_TYPE
+from wlsdeploy.aliases.alias_constants import RESTART_REQUIRED
+from wlsdeploy.aliases.alias_constants import SET_MBEAN_TYPE
+from wlsdeploy.aliases.alias_constants import SET_METHOD
+from wlsdeploy.aliases.alias_constants import USES_PATH_TOKENS
+from wlsdeploy.aliases.alias_constants import VALUE
+from wlsdeploy.aliases.alias_constants import WLST_TYPE
+
+
+class AttributeProfile(object):
+    """
+    The classification of all the model attributes of a single alias folder for the WLS version and WLST mode
+    of the aliases that built it.  The profile is computed in a single pass over the folder's attributes and is
+    shared by all callers, so the name lists are tuples and the maps are read-only dictionaries.
+
+    The fields are:
+        attribute_names                    - all model attribute names
+        attribute_types                    - model attribute name to the preferred model type or WLST type
+        uses_path_tokens_attribute_names   - attributes whose values are file system paths
+        restart_required_attribute_names   - attributes that require a restart when changed
+        merge_required_attribute_names     - list and map attributes whose values are merged with existing values
+        get_required_attribute_names       - attributes whose values must be read with get
+        lsa_required_attribute_names       - attributes whose values must be read with lsa
+        password_attribute_names           - attributes with the password type
+        mbean_set_method_attributes        - attribute name to a map of the set_method and set_mbean_type values
+                                             for attributes whose set method requires an MBean
+        get_returns_mbean_attribute_types  - attribute name to get_mbean_type value, or None
+        default_values                     - attribute name to the alias default value, with 'None' as None
+    """
+
+    def __init__(self, folder_path, attributes_dict):
+        """
+        Build the profile from the attribute entries of the folder.
+        :param folder_path: the model folder path of the folder
+        :param attributes_dict: the folder's attribute entries keyed by model attribute name
+        """
+        self.folder_path = folder_path
+
+        attribute_names = []
+        attribute_types = dict()
+        uses_path_tokens_attribute_names = []
+        restart_required_attribute_names = []
+        merge_required_attribute_names = []
+        get_required_attribute_names = []
+        lsa_required_attribute_names = []
+        password_attribute_names = []
+        mbean_set_method_attributes = dict()
+        get_returns_mbean_attribute_types = dict()
+        default_values = dict()
+
+        for key, value in attributes_dict.iteritems():
+            attribute_names.append(key)
+
+            wlst_type = None
+            if WLST_TYPE in value:
+                wlst_type = value[WLST_TYPE]
+
+            if PREFERRED_MODEL_TYPE in value:
+                attribute_types[key] = value[PREFERRED_MODEL_TYPE]
+            else:
+                attribute_types[key] = wlst_type
+
+            if USES_PATH_TOKENS in value and alias_utils.convert_boolean(value[USES_PATH_TOKENS]):
+                uses_path_tokens_attribute_names.append(key)
+
+            if RESTART_REQUIRED in value and 'true' == value[RESTART_REQUIRED].lower():
+                restart_required_attribute_names.append(key)
+
+            if wlst_type in ALIAS_LIST_TYPES or wlst_type in ALIAS_MAP_TYPES:
+                merge = True
+                if MERGE in value:
+                    merge = alias_utils.convert_boolean(value[MERGE])
+                if merge:
+                    merge_required_attribute_names.append(key)
+
+            if GET_METHOD in value:
+                if value[GET_METHOD] == GET:
+                    get_required_attribute_names.append(key)
+                if LSA in value[GET_METHOD]:
+                    lsa_required_attribute_names.append(key)
+
+            if wlst_type == PASSWORD:
+                password_attribute_names.append(key)
+
+            if SET_METHOD in value and value[SET_METHOD].startswith(MBEAN):
+                attr_set_method_name = None
+                set_method_value_components = value[SET_METHOD].split('.')
+                if len(set_method_value_components) == 2:
+                    attr_set_method_name = set_method_value_components[1]
+
+                set_mbean_type = None
+                if SET_MBEAN_TYPE in value:
+                    set_mbean_type = value[SET_MBEAN_TYPE]
+                mbean_set_method_attributes[key] = \
+                    ReadOnlyDict({SET_METHOD: attr_set_method_name, SET_MBEAN_TYPE: set_mbean_type})
+
+            if GET_MBEAN_TYPE in value:
+                get_returns_mbean_attribute_types[key] = value[GET_MBEAN_TYPE]
+            else:
+                get_returns_mbean_attribute_types[key] = None
+
+            default_value = None
+            if VALUE in value and DEFAULT in value[VALUE] and value[VALUE][DEFAULT] != 'None':
+                default_value = value[VALUE][DEFAULT]
+            default_values[key] = default_value
+
+        self.attribute_names = tuple(attribute_names)
+        self.attribute_types = ReadOnlyDict(attribute_types)
+        self.uses_path_tokens_attribute_names = tuple(uses_path_tokens_attribute_names)
+        self.restart_required_attribute_names = tuple(restart_required_attribute_names)
+        self.merge_required_attribute_names = tuple(merge_required_attribute_names)
+        self.get_required_attribute_names = tuple(get_required_attribute_names)
+        self.lsa_required_attribute_names = tuple(lsa_required_attribute_names)
+        self.password_attribute_names = tuple(password_attribute_names)
+        self.mbean_set_method_attributes = ReadOnlyDict(mbean_set_method_attributes)
+        self.get_returns_mbean_attribute_types = ReadOnlyDict(get_returns_mbean_attribute_types)
+        self.default_values = ReadOnlyDict(default_values)
+        return
+
+    def __str__(self):
+        return 'AttributeProfile(%s, attributes=%s)' % (self.folder_path, len(self.attribute_names))
@@ -1,13 +1,73 @@
 """
-Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 
+# The folder paths are shared by all locations, so that equal paths are the same string object.
+_folder_paths = dict()
+
+
+def _intern_folder_path(folder_path):
+    """
+    Get the shared copy of the folder path string.
+    :param folder_path: the folder path
+    :return: the shared folder path string
+    """
+    return _folder_paths.setdefault(folder_path, folder_path)
+
+
+class _FolderNode(object):
+    """
+    An immutable node in the list of model folders of a location.  Each node points to its parent node,
+    so appending a folder creates a single node and copies of a location share all of their nodes.
+    """
+    __slots__ = ['parent', 'folder', 'depth', 'path', '_folders']
+
+    def __init__(self, parent=None, folder=None):
+        self.parent = parent
+        self.folder = folder
+        self._folders = None
+        if parent is None:
+            self.depth = 0
+            self.path = _intern_folder_path('/')
+        else:
+            self.depth = parent.depth + 1
+            if parent.depth == 0:
+                self.path = _intern_folder_path('/' + folder)
+            else:
+                self.path = _intern_folder_path(parent.path + '/' + folder)
+        return
+
+    def get_folders(self):
+        """
+        Get the model folders from the root to this node.  The tuple is built the first time it is requested.
+        :return: the tuple of model folder names
+        """
+        if self._folders is None:
+            folders = list()
+            node = self
+            while node.depth > 0:
+                folders.append(node.folder)
+                node = node.parent
+            folders.reverse()
+            self._folders = tuple(folders)
+        return self._folders
+
+
+_root_node = _FolderNode()
+
 
 class LocationContext(object):
     """
     Class that serves as the navigation context during model processing.
+
+    The model folders are held in a shared, immutable list of nodes and the name tokens are copied only when
+    a copy of the location changes them, so copying a location is cheap.  Locations can be compared and used
+    as dictionary keys.  The hash is computed from the folders and name tokens the first time it is needed,
+    so a location must not be changed while it is used as a key; use a copy of the location instead.
     """
+    __slots__ = ['_node', '_name_tokens', '_tokens_shared', '_cache_key', '_hash']
+
     def __init__(self, another_location=None):
         """
         Creates a new instance of the object that serves as the
@@ -17,12 +77,20 @@ class LocationContext(object):
         stored in the list.
         :param another_location: list of folder names that are part of the model
         """
+        self._cache_key = None
+        self._hash = None
         if another_location is None:
-            self._model_folders = list()
+            self._node = _root_node
             self._name_tokens = dict()
+            self._tokens_shared = False
         else:
-            self._model_folders = another_location.get_model_folders()
-            self._name_tokens = another_location.get_name_tokens()
+            # share the folder nodes and the name tokens until one of the locations changes its tokens
+            self._node = another_location._node
+            self._name_tokens = another_location._name_tokens
+            self._tokens_shared = True
+            another_location._tokens_shared = True
+            self._cache_key = another_location._cache_key
+            self._hash = another_location._hash
         return
 
     def append_location(self, *args, **kwargs):
@@ -33,11 +101,13 @@ class LocationContext(object):
         :return: self, for method chaining
         """
         if len(args) != 0:
-            self._model_folders.extend(args)
+            for folder in args:
+                self._node = _FolderNode(self._node, folder)
+            self.__clear_key()
 
         if len(kwargs) != 0:
             for key in kwargs:
-                self._name_tokens[key] = kwargs[key]
+                self.add_name_token(key, kwargs[key])
         return self
 
     def pop_location(self, index=None):
@@ -45,11 +115,22 @@ class LocationContext(object):
         Pops (or removes) a location from the exising location context
         :param index: integer Index of list item to pop
         :return: The ``model_folder`` of list item at ``index``
+        :raises: IndexError: if the location is empty or the index is out of range
         """
-        if index is None:
-            retval = self._model_folders.pop()
+        if self._node.depth == 0:
+            raise IndexError('pop from empty list')
+
+        if index is None or index == -1 or index == self._node.depth - 1:
+            retval = self._node.folder
+            self._node = self._node.parent
         else:
-            retval = self._model_folders.pop(index)
+            folders = list(self._node.get_folders())
+            retval = folders.pop(index)
+            node = _root_node
+            for folder in folders:
+                node = _FolderNode(node, folder)
+            self._node = node
+        self.__clear_key()
         return retval
 
     def add_name_token(self, token, value):
@@ -59,7 +140,9 @@ class LocationContext(object):
         :param value: string Value to use for NV pair
         :return: self, for method chaining
         """
+        self.__unshare_tokens()
         self._name_tokens[token] = value
+        self.__clear_key()
         return self
 
     def remove_name_token(self, token):
@@ -69,7 +152,9 @@ class LocationContext(object):
         :return: self, for method chaining
         """
         if token in self._name_tokens:
+            self.__unshare_tokens()
             del self._name_tokens[token]
+            self.__clear_key()
         return self
 
     def get_name_for_token(self, token_name):
@@ -91,7 +176,7 @@ class LocationContext(object):
 
         :return: new Python list built from ``self._model_folders``
         """
-        return list(self._model_folders)
+        return list(self._node.get_folders())
 
     def get_current_model_folder(self):
         """
@@ -100,9 +185,8 @@ class LocationContext(object):
         :return: return the current model folder name
         """
         model_folder = "Domain"
-        model_folder_list = self.get_model_folders()
-        if model_folder_list:
-            model_folder = model_folder_list[-1]
+        if self._node.depth > 0:
+            model_folder = self._node.folder
         return model_folder
 
     def get_parent_folder_path(self):
@@ -111,14 +195,8 @@ class LocationContext(object):
         :return: return the parent folder path
         """
         result = None
-        model_folder_list = self.get_model_folders()
-        if model_folder_list:
-            result = ''
-            if len(model_folder_list) > 1:
-                for folder in model_folder_list[-2]:
-                    result += '/' + folder
-            if len(result) == 0:
-                result = '/'
+        if self._node.depth > 0:
+            result = self._node.parent.path
         return result
 
     def get_name_tokens(self):
@@ -136,22 +214,57 @@ class LocationContext(object):
         Get the string that represents the model path specified by the model folders in this location
         :return: the string that represents the model path
         """
-        result = ''
-        for folder in self._model_folders:
-            result += '/' + folder
-        if len(result) == 0:
-            result = '/'
-        return result
+        return self._node.path
+
+    def get_cache_key(self):
+        """
+        Get an immutable key made from the folder path and the name tokens of this location.
+        Unlike the location itself, the key is not affected by later changes to the location.
+        :return: the hashable key
+        """
+        if self._cache_key is None:
+            name_tokens = self._name_tokens.items()
+            name_tokens.sort()
+            self._cache_key = (self._node.path, tuple(name_tokens))
+        return self._cache_key
 
     def is_empty(self):
         """
         Is the location empty?
         :return: True if there are no folders, False otherwise
         """
-        return len(self._model_folders) == 0
+        return self._node.depth == 0
+
+    def __clear_key(self):
+        self._cache_key = None
+        self._hash = None
+        return
+
+    def __unshare_tokens(self):
+        if self._tokens_shared:
+            self._name_tokens = dict(self._name_tokens)
+            self._tokens_shared = False
+        return
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, LocationContext):
+            return False
+        if self._node is not other._node and self._node.get_folders() != other._node.get_folders():
+            return False
+        return self._name_tokens is other._name_tokens or self._name_tokens == other._name_tokens
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self.get_cache_key())
+        return self._hash
 
     def __str__(self):
-        location_model_folders = 'model_folders = %s' % (str(self._model_folders))
+        location_model_folders = 'model_folders = %s' % (str(self.get_model_folders()))
         tmp = ''
         for key, value in self._name_tokens.iteritems():
             tmp += "'%s': '%s'," % (key, value)
@@ -161,4 +274,4 @@ class LocationContext(object):
         return '%s, %s' % (location_model_folders, location_name_tokens)
 
     def __len__(self):
-        return len(self._model_folders)
+        return self._node.depth
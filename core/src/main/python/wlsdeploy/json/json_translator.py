@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 
 This model provider translation classes that convert between JSON and Python Dictionaries.
@@ -97,9 +97,16 @@ class PythonToJson(object):
     # 4 spaces of indent
     _indent_unit = '    '
 
-    def __init__(self, dictionary):
+    def __init__(self, dictionary, release_sections=False):
+        """
+        Create the writer.
+        :param dictionary: the Python dictionary to write
+        :param release_sections: if True, each top-level entry is removed from the dictionary once it is written,
+                                 so that its memory can be reclaimed while the rest of the dictionary is written
+        """
         # Fix error handling for None
         self._dictionary = dictionary
+        self._release_sections = release_sections
         self._logger = PlatformLogger('wlsdeploy.json')
         return
 
@@ -124,8 +131,9 @@ class PythonToJson(object):
         writer = None
         try:
             fos = JFileOutputStream(json_file, False)
-            writer = JPrintWriter(fos, True)
-            self._write_dictionary_to_json_file(self._dictionary, writer)
+            # the writer is flushed by each section and when it is closed, not by each line
+            writer = JPrintWriter(fos, False)
+            self._write_dictionary_to_json_file(self._dictionary, writer, release=self._release_sections)
 
         except JFileNotFoundException, fnfe:
             json_ex = exception_helper.create_json_exception('WLSDPLY-18010', file_name,
@@ -144,13 +152,15 @@ class PythonToJson(object):
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=json_file)
         return json_file
 
-    def _write_dictionary_to_json_file(self, dictionary, writer, indent=''):
+    def _write_dictionary_to_json_file(self, dictionary, writer, indent='', release=False):
         """
         Write the python dictionary in json syntax using the provided writer stream.
         :param dictionary: python dictionary to convert to json syntax
         :param writer: where to write the dictionary into json syntax
         :param indent: current string indention of the json syntax. If not provided, indent is an empty string
+        :param release: if True, remove each entry from the dictionary once it is written
         """
+        _method_name = '_write_dictionary_to_json_file'
         _start_dict = '{'
         _end_dict = '}'
 
@@ -162,7 +172,8 @@ class PythonToJson(object):
         end_indent = indent
 
         indent += self._indent_unit
-        for key, value in dictionary.iteritems():
+        for key in dictionary.keys():
+            value = dictionary[key]
             writer.println(end_line)
             end_line = ','
             writer.write(indent + '"' + _quote_embedded_quotes(key) + '" : ')
@@ -170,6 +181,11 @@ class PythonToJson(object):
                 self._write_dictionary_to_json_file(value, writer, indent)
             else:
                 writer.write(_format_json_value(value))
+
+            if release:
+                writer.flush()
+                del dictionary[key]
+                self._logger.fine('WLSDPLY-18028', key, class_name=self._class_name, method_name=_method_name)
         writer.println()
         writer.write(end_indent + _end_dict)
 
@@ -228,10 +228,11 @@ class Creator(object):
         """
         _method_name = '_set_attributes'
 
-        model_attribute_names = self.alias_helper.get_model_attribute_names_and_types(location)
-        password_attribute_names = self.alias_helper.get_model_password_type_attribute_names(location)
-        set_method_map = self.alias_helper.get_model_mbean_set_method_attribute_names_and_types(location)
-        uses_path_tokens_attribute_names = self.alias_helper.get_model_uses_path_tokens_attribute_names(location)
+        attribute_profile = self.alias_helper.get_model_attribute_profile(location)
+        model_attribute_names = attribute_profile.attribute_types
+        password_attribute_names = attribute_profile.password_attribute_names
+        set_method_map = attribute_profile.mbean_set_method_attributes
+        uses_path_tokens_attribute_names = attribute_profile.uses_path_tokens_attribute_names
         model_folder_path = self.alias_helper.get_model_folder_path(location)
         pwd = self.wlst_helper.get_pwd()
 
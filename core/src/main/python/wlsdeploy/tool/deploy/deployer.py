@@ -6,6 +6,7 @@ import javaos as os
 
 from array import array
 from java.lang import Class
+from oracle.weblogic.deploy.exception import BundleAwareException
 from oracle.weblogic.deploy.util import PyWLSTException
 
 from wlsdeploy.aliases.wlst_modes import WlstModes
@@ -153,19 +154,58 @@ class Deployer(object):
     def set_attributes(self, location, model_nodes, excludes=None):
         """
         Set all the attributes in the model_nodes list. Exclude items that are sub-folders.
+        Online, the sets of the location are collected and applied together, with one call for the MBean.
         :param location: the location of the attributes to be set
         :param model_nodes: a map of model nodes with attributes to be set
         :param excludes: a list of items that should not be set
         :raise: DeployException: if an error condition is encountered
         """
-        _method_name = 'set_attributes'
-        attribute_names = self.alias_helper.get_model_attribute_names(location)
-        uses_path_tokens_attribute_names = self.alias_helper.get_model_uses_path_tokens_attribute_names(location)
-        restart_attribute_names = self.alias_helper.get_model_restart_required_attribute_names(location)
-        merge_attribute_names = self.alias_helper.get_model_merge_required_attribute_names(location)
-        lsa_required_attribute_names = self.aliases.get_model_lsa_required_attribute_names(location)
-        set_method_map = self.alias_helper.get_model_mbean_set_method_attribute_names_and_types(location)
+        batch_started = self.wlst_helper.start_set_batch()
+        completed = False
+        try:
+            self.__set_attributes(location, model_nodes, excludes)
+            completed = True
+        finally:
+            if batch_started:
+                if completed:
+                    self.wlst_helper.end_set_batch()
+                else:
+                    self.__end_set_batch_after_error(location)
+        return
+
+    def __end_set_batch_after_error(self, location):
+        """
+        Apply the sets collected before an error, as they would have been without the batch.  This is called
+        while the error is raised, so a failed set is only logged, and the original error is the one raised.
+        :param location: the location of the attributes being set
+        """
+        _method_name = '__end_set_batch_after_error'
+        try:
+            self.wlst_helper.end_set_batch()
+        except BundleAwareException, ex:
+            self.logger.warning('WLSDPLY-09209', self.alias_helper.get_model_folder_path(location),
+                                ex.getLocalizedMessage(), error=ex, class_name=self._class_name,
+                                method_name=_method_name)
+        return
 
+    def __set_attributes(self, location, model_nodes, excludes):
+        """
+        Set all the attributes in the model_nodes list, except the excluded items and the sub-folders.
+        :param location: the location of the attributes to be set
+        :param model_nodes: a map of model nodes with attributes to be set
+        :param excludes: a list of items that should not be set, or None
+        :raise: DeployException: if an error condition is encountered
+        """
+        _method_name = 'set_attributes'
+        attribute_profile = self.alias_helper.get_model_attribute_profile(location)
+        attribute_names = attribute_profile.attribute_names
+        uses_path_tokens_attribute_names = attribute_profile.uses_path_tokens_attribute_names
+        restart_attribute_names = attribute_profile.restart_required_attribute_names
+        merge_attribute_names = attribute_profile.merge_required_attribute_names
+        lsa_required_attribute_names = attribute_profile.lsa_required_attribute_names
+        set_method_map = attribute_profile.mbean_set_method_attributes
+
+        current_values = None
         for key in model_nodes:
             key_excluded = (excludes is not None) and (key in excludes)
             if key in attribute_names and not key_excluded:
@@ -173,12 +213,16 @@ class Deployer(object):
                 if key in uses_path_tokens_attribute_names:
                     self._extract_from_archive_if_needed(location, key, value)
 
+                if current_values is None:
+                    current_values = self._get_current_attribute_values(location)
+
                 wlst_merge_value = None
                 if key in merge_attribute_names:
-                    wlst_merge_value = self._get_existing_wlst_value(location, key, lsa_required_attribute_names)
+                    wlst_merge_value = self._get_existing_wlst_value(location, key, lsa_required_attribute_names,
+                                                                     current_values)
 
-                if not self._skip_setting_attribute(key, value, wlst_merge_value, restart_attribute_names) and \
-                        (not self.set_special_attribute(location, key, value, wlst_merge_value, set_method_map)):
+                if not self._skip_setting_attribute(location, key, value, current_values, restart_attribute_names) \
+                        and (not self.set_special_attribute(location, key, value, wlst_merge_value, set_method_map)):
                     try:
                         self.attribute_setter.set_attribute(location, key, value, wlst_merge_value)
                     except PyWLSTException, pwe:
@@ -189,31 +233,62 @@ class Deployer(object):
                         raise ex
         return
 
-    def _skip_setting_attribute(self, key, value, wlst_merge_value, restart_attribute_names):
+    def _skip_setting_attribute(self, location, key, value, current_values, restart_attribute_names):
         """
-        For the case where a change to an attribute will require restart, verify that the new value is different
-        from the current value in WLST.
+        Verify that the new value is different from the current value in WLST.  Setting an attribute to its current
+        value costs a round trip online, and marks an attribute that requires a restart as changed.
+        :param location: the location of the attribute
         :param key: the attribute key
         :param value: the attribute value from the model
-        :param wlst_merge_value: the WLST value to check for merge
+        :param current_values: the current values at the location, by WLST attribute name
         :param restart_attribute_names: a list of attribute names that require system restart
         :return: True if the attribute does not need to be set
         """
         _method_name = '_skip_setting_attribute'
-        self.logger.entering(str(key), str(value), str(wlst_merge_value), str(restart_attribute_names),
-                             class_name=self._class_name, method_name=_method_name)
 
-        # Needs implementation. Return true if model key in restart attribute_names,
-        # and WLST helper determines that set is required,
-        # based on model key, model value, and the WLST merge value
+        wlst_key = self.alias_helper.get_wlst_attribute_name(location, key)
+        if wlst_key is None or wlst_key not in current_values:
+            return False
 
-        return False
+        if not self.alias_helper.attribute_values_are_equal(location, key, value, current_values[wlst_key]):
+            return False
+
+        path = self.alias_helper.get_model_folder_path(location)
+        if key in restart_attribute_names:
+            self.logger.fine('WLSDPLY-09206', key, path, class_name=self._class_name, method_name=_method_name)
+        else:
+            self.logger.finer('WLSDPLY-09205', key, path, class_name=self._class_name, method_name=_method_name)
+        deployer_utils.count_skipped_set()
+        return True
+
+    def _get_current_attribute_values(self, location):
+        """
+        Read the current values of all the attributes at the location with a single lsa, so that each attribute
+        can be compared with the model without its own round trip.  This is only done online, where each set is
+        a round trip, and the current WLST directory must be the attributes path of the location.
+        :param location: the location of the attributes
+        :return: the current values, by WLST attribute name, or an empty dictionary if they were not read
+        """
+        _method_name = '_get_current_attribute_values'
+
+        if self.wlst_mode != WlstModes.ONLINE:
+            return dict()
+
+        try:
+            return self.wlst_helper.lsa()
+        except BundleAwareException, ex:
+            path = self.alias_helper.get_model_folder_path(location)
+            self.logger.fine('WLSDPLY-09208', path, ex.getLocalizedMessage(), class_name=self._class_name,
+                             method_name=_method_name)
+            return dict()
 
-    def _get_existing_wlst_value(self, location, key, lsa_required_attribute_names):
+    def _get_existing_wlst_value(self, location, key, lsa_required_attribute_names, current_values=None):
         """
         Returns the existing value for the specified attribute key in the specified location.
         :param location: the location to be checked
         :param key: the attribute key
+        :param lsa_required_attribute_names: the names of the attributes that are read with lsa
+        :param current_values: the lsa values already read at the location, by WLST attribute name, or None
         :return: The value of the attribute in WLST
         """
         _method_name = '_get_existing_wlst_value'
@@ -223,7 +298,9 @@ class Deployer(object):
             return None
 
         if key in lsa_required_attribute_names:
-            attribute_map = self.wlst_helper.lsa()
+            attribute_map = current_values
+            if attribute_map is None or wlst_key not in attribute_map:
+                attribute_map = self.wlst_helper.lsa()
             if wlst_key in attribute_map:
                 wlst_value = attribute_map[wlst_key]
             else:
@@ -25,6 +25,35 @@ _class_name = "deployer_utils"
 _logger = platform_logger.PlatformLogger('wlsdeploy.deploy.utils')
 _wlst_helper = WlstHelper(_logger, ExceptionType.DEPLOY)
 
+# the number of attributes that were not set because they already had the value in the model
+_skipped_set_count = 0
+
+
+def count_skipped_set():
+    """
+    Count an attribute that was not set because it already had the value in the model.
+    """
+    global _skipped_set_count
+    _skipped_set_count += 1
+    return
+
+
+def get_skipped_set_count():
+    """
+    Get the number of attributes that were not set because they already had the values in the model.
+    :return: the number of skipped sets
+    """
+    return _skipped_set_count
+
+
+def log_skipped_set_count():
+    """
+    Log the number of attributes that were not set because they already had the values in the model.
+    """
+    _method_name = 'log_skipped_set_count'
+    _logger.info('WLSDPLY-09207', _skipped_set_count, class_name=_class_name, method_name=_method_name)
+    return
+
 
 def set_attribute(location, model_key, model_value, alias_helper, use_raw_value=False):
     """
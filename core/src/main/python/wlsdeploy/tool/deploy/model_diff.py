@@ -0,0 +1,256 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+The structural diff of the previous model and the new model, used by deployApps and updateDomain with the
+-prev_model_file argument to deploy only the parts of the model that changed since the previous model was deployed.
+"""
+from java.io import File
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import TranslateException
+from oracle.weblogic.deploy.util import VariableException
+from oracle.weblogic.deploy.util import WLSDeployArchive
+
+from wlsdeploy.aliases import model_constants
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.deploy import deployer_utils
+from wlsdeploy.tool.util import filter_helper
+from wlsdeploy.tool.util.alias_helper import AliasHelper
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util import variables
+from wlsdeploy.util.model_translator import FileToPython
+
+_class_name = 'ModelDiff'
+_logger = PlatformLogger('wlsdeploy.deploy')
+
+# the sections that are deployed by location; the domainInfo section is always deployed whole
+DEPLOYED_SECTIONS = [model_constants.TOPOLOGY, model_constants.RESOURCES, model_constants.APP_DEPLOYMENTS]
+
+
+class ModelDiff(object):
+    """
+    The differences between the previous model and the new model, as lists of the model paths that were added,
+    changed and removed, such as resources:/JDBCSystemResource/ds1/JdbcResource/JDBCDriverParams/URL.
+    An added or removed folder is a single path, without the folders and attributes below it.
+    Both models are compared after variable substitution, so a changed variable value is a changed attribute.
+    """
+
+    def __init__(self, previous_dictionary, new_dictionary):
+        """
+        Compare the models.
+        :param previous_dictionary: the previous model dictionary
+        :param new_dictionary: the new model dictionary
+        """
+        self._added = list()
+        self._changed = list()
+        self._removed = list()
+        # the (section, top-level folder, instance name) of the changes, for finding the changed locations quickly
+        self._changed_keys = dict()
+        for section in DEPLOYED_SECTIONS:
+            self.__compare(dictionary_utils.get_dictionary_element(previous_dictionary, section),
+                           dictionary_utils.get_dictionary_element(new_dictionary, section), section, list())
+        return
+
+    def get_added(self):
+        """
+        Get the model paths of the folders and attributes that were added.
+        :return: the list of model paths
+        """
+        return list(self._added)
+
+    def get_changed(self):
+        """
+        Get the model paths of the attributes whose values changed.
+        :return: the list of model paths
+        """
+        return list(self._changed)
+
+    def get_removed(self):
+        """
+        Get the model paths of the folders and attributes that were removed.
+        :return: the list of model paths
+        """
+        return list(self._removed)
+
+    def has_changes(self, section, segments):
+        """
+        Was anything added or changed at or below the model location of the segments?
+        Only the first three segments, the top-level folder, the instance name and the next folder, are checked.
+        :param section: the model section name
+        :param segments: the model path segments of the location
+        :return: True if a folder or attribute was added or changed at or below the location
+        """
+        return _get_key(section, segments) in self._changed_keys
+
+    def get_changed_model(self, new_dictionary, model_context, aliases):
+        """
+        Get the parts of the new model to deploy.  The domainInfo section is kept whole.  The attributes in the other
+        sections are kept if they were added or changed.  The instances of the top-level folders that can have more
+        than one instance, and the other top-level folders, are kept whole if anything was added or changed in
+        them, or if they use a file in the archive, which may have changed even though the model did not.
+        Nothing is removed from the domain, so the removed paths are only logged.
+        :param new_dictionary: the new model dictionary
+        :param model_context: the model context
+        :param aliases: the aliases
+        :return: the model dictionary to deploy
+        """
+        _method_name = 'get_changed_model'
+        alias_helper = AliasHelper(aliases, _logger, ExceptionType.DEPLOY)
+        base_location = LocationContext()
+        base_location.add_name_token(deployer_utils.get_domain_token(alias_helper), model_context.get_domain_name())
+
+        for model_path in self._removed:
+            _logger.info('WLSDPLY-09756', model_path, class_name=_class_name, method_name=_method_name)
+
+        result = OrderedDict()
+        for section in new_dictionary:
+            section_dict = new_dictionary[section]
+            if section not in DEPLOYED_SECTIONS or not isinstance(section_dict, dict):
+                result[section] = section_dict
+                continue
+
+            changed_section = OrderedDict()
+            for key in section_dict:
+                value = section_dict[key]
+                if not isinstance(value, dict):
+                    if self.has_changes(section, [key]):
+                        changed_section[key] = value
+                    continue
+
+                location = LocationContext(base_location).append_location(key)
+                if alias_helper.supports_multiple_mbean_instances(location):
+                    changed_instances = OrderedDict()
+                    for name in value:
+                        if self.has_changes(section, [key, name]) or _uses_archive_file(value[name]):
+                            changed_instances[name] = value[name]
+                    _logger.info('WLSDPLY-09757', len(changed_instances), len(value), key,
+                                 class_name=_class_name, method_name=_method_name)
+                    if len(changed_instances) > 0:
+                        changed_section[key] = changed_instances
+                elif self.has_changes(section, [key]) or _uses_archive_file(value):
+                    changed_section[key] = value
+
+            if len(changed_section) > 0:
+                result[section] = changed_section
+        return result
+
+    def __compare(self, previous, new, section, segments):
+        """
+        Compare the folders of the previous and new models, and add their differences to the lists.
+        :param previous: the previous folder dictionary
+        :param new: the new folder dictionary
+        :param section: the model section name
+        :param segments: the model path segments of the folder
+        """
+        for key in new:
+            key_segments = list(segments)
+            key_segments.append(key)
+            new_value = new[key]
+            if key not in previous:
+                self.__add_change(self._added, section, key_segments)
+                continue
+
+            previous_value = previous[key]
+            if isinstance(new_value, dict) and isinstance(previous_value, dict):
+                self.__compare(previous_value, new_value, section, key_segments)
+            elif isinstance(new_value, dict) or isinstance(previous_value, dict) or new_value != previous_value:
+                self.__add_change(self._changed, section, key_segments)
+
+        for key in previous:
+            if key not in new:
+                key_segments = list(segments)
+                key_segments.append(key)
+                self._removed.append(_get_model_path(section, key_segments))
+        return
+
+    def __add_change(self, changes, section, segments):
+        """
+        Add the change to the list, and mark the top-level folder and instance that contain it as changed.
+        :param changes: the list of added or changed paths
+        :param section: the model section name
+        :param segments: the model path segments of the change
+        """
+        changes.append(_get_model_path(section, segments))
+        for depth in range(1, min(len(segments), 3) + 1):
+            self._changed_keys[_get_key(section, segments[:depth])] = True
+        return
+
+
+def get_changed_model(model_dictionary, variable_map, model_context, aliases, tool_type):
+    """
+    If a previous model file was specified, compare the new model with the previous model and get the parts
+    of the new model that changed.  The previous model gets the same variable substitution and filters as the
+    new model.  If the previous model cannot be read, the whole new model is deployed.
+    :param model_dictionary: the new model dictionary, after variable substitution and filters
+    :param variable_map: the variables used for the new model
+    :param model_context: the model context
+    :param aliases: the aliases
+    :param tool_type: the tool type of the model filters, such as deploy or update
+    :return: the model dictionary to deploy
+    """
+    _method_name = 'get_changed_model'
+    previous_model_file = model_context.get_previous_model_file()
+    if previous_model_file is None:
+        return model_dictionary
+
+    if not File(previous_model_file).isFile():
+        _logger.warning('WLSDPLY-09752', previous_model_file, class_name=_class_name, method_name=_method_name)
+        return model_dictionary
+
+    try:
+        previous_dictionary = FileToPython(previous_model_file, True).parse()
+    except TranslateException, te:
+        _logger.warning('WLSDPLY-09750', previous_model_file, te.getLocalizedMessage(),
+                        class_name=_class_name, method_name=_method_name)
+        return model_dictionary
+
+    try:
+        variables.substitute(previous_dictionary, variable_map, model_context)
+    except VariableException, ve:
+        _logger.warning('WLSDPLY-09751', previous_model_file, ve.getLocalizedMessage(),
+                        class_name=_class_name, method_name=_method_name)
+        return model_dictionary
+    filter_helper.apply_filters(previous_dictionary, tool_type)
+
+    model_diff = ModelDiff(previous_dictionary, model_dictionary)
+    _logger.info('WLSDPLY-09753', previous_model_file, len(model_diff.get_added()), len(model_diff.get_changed()),
+                 len(model_diff.get_removed()), class_name=_class_name, method_name=_method_name)
+    for model_path in model_diff.get_added():
+        _logger.fine('WLSDPLY-09754', model_path, class_name=_class_name, method_name=_method_name)
+    for model_path in model_diff.get_changed():
+        _logger.fine('WLSDPLY-09755', model_path, class_name=_class_name, method_name=_method_name)
+    return model_diff.get_changed_model(model_dictionary, model_context, aliases)
+
+
+def _get_model_path(section, segments):
+    return section + ':/' + '/'.join(segments)
+
+
+def _get_key(section, segments):
+    """
+    Get the key of a location in the changed keys, from the section and up to three path segments.
+    :param section: the model section name
+    :param segments: the model path segments
+    :return: the key
+    """
+    key = [section]
+    key.extend(segments[:3])
+    return tuple(key)
+
+
+def _uses_archive_file(folder):
+    """
+    Does any attribute in the folder or below it refer to a file in the archive?
+    :param folder: the model folder dictionary
+    :return: True if an attribute value is a path into the archive
+    """
+    for key in folder:
+        value = folder[key]
+        if isinstance(value, dict):
+            if _uses_archive_file(value):
+                return True
+        elif type(value) is str and WLSDeployArchive.isPathIntoArchive(value):
+            return True
+    return False
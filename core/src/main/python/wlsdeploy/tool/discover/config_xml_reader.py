@@ -0,0 +1,610 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Read an offline domain directly from config/config.xml and its JDBC, JMS, WLDF and Coherence module descriptors,
+instead of reading the domain with WLST offline.
+
+Reading config.xml is a lossy mode, which is only used for an offline domain when -use_config_xml is specified,
+and which is rejected with -admin_url.  The model discovered from config.xml differs from the model discovered
+with WLST offline in these ways:
+- config.xml only stores the attributes that were set.  WLST offline shows the other attributes with their default
+  values, which discovery leaves out of the model when they match the alias defaults.  An attribute whose WLST
+  offline default differs from its alias default, such as a value that WLST computes from other attributes, is in
+  the WLST offline model but not in the config.xml model.  The schema defaults and the computed values are not
+  filled in, since that needs the MBeans of the WebLogic Server installation, which this mode avoids loading.
+- Only the module descriptors of the system resources, at the top level and in resource groups and resource group
+  templates, are read.  The other files that config.xml refers to, such as Coherence cache configuration files,
+  custom resource descriptors and deployment plans, are collected into the archive by discovery, as they are when
+  the domain is read with WLST offline, but their content is not part of the model.
+- The folder tree of config.xml and the module descriptors is kept in memory for the whole discovery, because
+  discovery moves around the tree in the same way as it does in WLST offline.  The XML is streamed, and only the
+  folders and attribute values are kept.
+"""
+import jarray
+
+from java.io import File
+from java.io import FileInputStream
+from java.io import IOException
+from java.lang import String
+from java.security import MessageDigest
+from java.util import HashMap
+from javax.xml.stream import XMLInputFactory
+from javax.xml.stream import XMLStreamConstants
+from javax.xml.stream import XMLStreamException
+
+from oracle.weblogic.deploy.aliases import AliasException
+
+from wlsdeploy.aliases.alias_constants import SECURITY_PROVIDER_NAME_MAP
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'ConfigXmlReader'
+_logger = PlatformLogger('wlsdeploy.discover')
+
+_XSI_NAMESPACE = 'http://www.w3.org/2001/XMLSchema-instance'
+_NAME_ELEMENT = 'name'
+_DESCRIPTOR_FILE_ELEMENT = 'descriptorfilename'
+_NO_NAME = 'NO_NAME_'
+
+# the WLST offline folder that holds the module descriptor of each type of system resource
+_MODULE_FOLDERS = {
+    'jdbcsystemresource': 'JdbcResource',
+    'jmssystemresource': 'JmsResource',
+    'wldfsystemresource': 'WLDFResource',
+    'coherenceclustersystemresource': 'CoherenceResource'
+}
+
+
+class ConfigXmlReader(object):
+    """
+    Parse config.xml and the module descriptors that it references into the folder tree that WLST offline
+    would show for the domain.  The element names are matched to the WLST folder and attribute names of the aliases,
+    so that the tree can be discovered through the aliases in the same way as a domain read by WLST offline.
+    """
+
+    def __init__(self, domain_home, aliases):
+        """
+        Create the reader.
+        :param domain_home: the domain home directory
+        :param aliases: the aliases for the WLS version of the domain
+        """
+        self._domain_home = domain_home
+        self._aliases = aliases
+        self._folder_names = dict()
+        self._attribute_names = dict()
+        self._provider_interfaces = dict()
+        self._input_factory = XMLInputFactory.newInstance()
+        return
+
+    def read(self):
+        """
+        Read the domain configuration.
+        :return: the ConfigXmlWlst for the domain
+        :raises DiscoverException: if the configuration cannot be read
+        """
+        _method_name = 'read'
+        _logger.entering(self._domain_home, class_name=_class_name, method_name=_method_name)
+
+        if len(self._folder_names) == 0:
+            self.__load_alias_names()
+        config_dir = File(self._domain_home, 'config')
+        domain_node = self.__parse(File(config_dir, 'config.xml'), self.__read_elements)
+        self.__read_module_descriptors(domain_node, config_dir)
+
+        domain_name = domain_node.get_attribute(_NAME_ELEMENT)
+        _logger.info('WLSDPLY-06900', domain_name, config_dir.getPath(), class_name=_class_name,
+                     method_name=_method_name)
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return ConfigXmlWlst(domain_node, domain_name)
+
+    def read_fingerprints(self):
+        """
+        Compute a digest of each named top-level element of config.xml, such as a server or a data source.
+        The digest of a system resource also covers the bytes of its module descriptor file.
+        :return: a dictionary of the hex digests, keyed by the WLST folder name and then by the element name
+        :raises DiscoverException: if the configuration cannot be read
+        """
+        _method_name = 'read_fingerprints'
+        _logger.entering(self._domain_home, class_name=_class_name, method_name=_method_name)
+
+        if len(self._folder_names) == 0:
+            self.__load_alias_names()
+        config_dir = File(self._domain_home, 'config')
+        fingerprints = self.__parse(File(config_dir, 'config.xml'), self.__read_fingerprints)
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return fingerprints
+
+    def __read_module_descriptors(self, node, config_dir):
+        """
+        Add the module descriptors of the system resources below the node, which are in the domain and in its
+        resource groups and resource group templates, as the module folders of the resources.
+        :param node: the folder node
+        :param config_dir: the config directory of the domain
+        :raises DiscoverException: if a module descriptor cannot be read
+        """
+        for child_type in node.get_child_types():
+            module_folder = _MODULE_FOLDERS.get(_normalize(child_type))
+            for child in node.get_children(child_type):
+                descriptor_file = None
+                if module_folder is not None:
+                    descriptor_file = child.get_attribute(_DESCRIPTOR_FILE_ELEMENT)
+                if descriptor_file is None:
+                    self.__read_module_descriptors(child, config_dir)
+                    continue
+
+                module_node = self.__parse(File(config_dir, descriptor_file), self.__read_elements)
+                module_node.name = module_node.get_attribute(_NAME_ELEMENT)
+                if module_node.name is None:
+                    module_node.name = _NO_NAME + '0'
+                child.add_child(module_folder, module_node)
+        return
+
+    def __parse(self, xml_file, read_function):
+        """
+        Stream the XML file through the read function.
+        :param xml_file: the XML file
+        :param read_function: the function that reads the elements from the XMLStreamReader
+        :return: the result of the read function
+        :raises DiscoverException: if the file cannot be parsed
+        """
+        _method_name = '__parse'
+        _logger.finer('WLSDPLY-06901', xml_file.getPath(), class_name=_class_name, method_name=_method_name)
+
+        stream = None
+        reader = None
+        try:
+            try:
+                stream = FileInputStream(xml_file)
+                reader = self._input_factory.createXMLStreamReader(stream)
+                return read_function(reader)
+            except (IOException, XMLStreamException), e:
+                ex = exception_helper.create_discover_exception('WLSDPLY-06902', xml_file.getPath(),
+                                                                e.getLocalizedMessage(), error=e)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+        finally:
+            if reader is not None:
+                reader.close()
+            if stream is not None:
+                stream.close()
+
+    def __read_elements(self, reader):
+        """
+        Build the elements read from the stream.  An element with child elements is a folder, and an element with
+        only text is an attribute of its parent folder.
+        :param reader: the XMLStreamReader
+        :return: the node of the root element
+        """
+        stack = list()
+        root = None
+        while reader.hasNext():
+            event = reader.next()
+            if event == XMLStreamConstants.START_ELEMENT:
+                element = _Element(reader.getLocalName())
+                element.nil = reader.getAttributeValue(_XSI_NAMESPACE, 'nil') == 'true'
+                element.xsi_type = reader.getAttributeValue(_XSI_NAMESPACE, 'type')
+                element.name_attribute = reader.getAttributeValue(None, _NAME_ELEMENT)
+                if len(stack) > 0:
+                    stack[-1].elements.append(element)
+                stack.append(element)
+            elif event == XMLStreamConstants.CHARACTERS or event == XMLStreamConstants.CDATA:
+                if len(stack) > 0:
+                    stack[-1].text.append(reader.getText())
+            elif event == XMLStreamConstants.END_ELEMENT:
+                element = stack.pop()
+                if len(element.elements) > 0 or element.name_attribute is not None or len(stack) == 0:
+                    element.node = self.__create_node(element)
+                    element.elements = None
+                if len(stack) == 0:
+                    root = element.node
+        return root
+
+    def __read_fingerprints(self, reader):
+        """
+        Digest the elements, attributes and text below each top-level element.  The name and the descriptor file name
+        of the element are collected on the way.
+        :param reader: the XMLStreamReader
+        :return: the dictionary of the digests
+        """
+        fingerprints = dict()
+        depth = 0
+        digest = None
+        folder_name = None
+        field_name = None
+        fields = dict()
+        while reader.hasNext():
+            event = reader.next()
+            if event == XMLStreamConstants.START_ELEMENT:
+                depth += 1
+                local_name = reader.getLocalName()
+                if depth == 2:
+                    digest = MessageDigest.getInstance('MD5')
+                    folder_name = self.__get_folder_name(local_name)
+                    fields = dict()
+                    name_attribute = reader.getAttributeValue(None, _NAME_ELEMENT)
+                    if name_attribute is not None:
+                        fields[_NAME_ELEMENT] = name_attribute
+                elif depth == 3:
+                    field_name = _normalize(local_name)
+                if digest is not None:
+                    _update_digest(digest, '<' + local_name)
+                    for index in range(reader.getAttributeCount()):
+                        _update_digest(digest, ' %s=%s' % (reader.getAttributeLocalName(index),
+                                                           reader.getAttributeValue(index)))
+                    _update_digest(digest, '>')
+            elif event == XMLStreamConstants.CHARACTERS or event == XMLStreamConstants.CDATA:
+                if digest is not None:
+                    text = reader.getText()
+                    _update_digest(digest, text.strip())
+                    if depth == 3 and (field_name == _NAME_ELEMENT or field_name == _DESCRIPTOR_FILE_ELEMENT):
+                        fields[field_name] = fields.get(field_name, '') + text
+            elif event == XMLStreamConstants.END_ELEMENT:
+                if digest is not None:
+                    _update_digest(digest, '</>')
+                if depth == 2 and digest is not None:
+                    name = fields.get(_NAME_ELEMENT)
+                    if name is not None:
+                        descriptor_file = fields.get(_DESCRIPTOR_FILE_ELEMENT)
+                        if descriptor_file is not None:
+                            self.__digest_file(digest, File(File(self._domain_home, 'config'),
+                                                            descriptor_file.strip()))
+                        if folder_name not in fingerprints:
+                            fingerprints[folder_name] = dict()
+                        fingerprints[folder_name][name.strip()] = _to_hex(digest.digest())
+                    digest = None
+                depth -= 1
+        return fingerprints
+
+    def __digest_file(self, digest, descriptor_file):
+        """
+        Add the bytes of the module descriptor file to the digest.
+        :param digest: the MessageDigest
+        :param descriptor_file: the descriptor file
+        :raises IOException: if the file cannot be read
+        """
+        stream = FileInputStream(descriptor_file)
+        try:
+            buffer = jarray.zeros(8192, 'b')
+            count = stream.read(buffer)
+            while count > 0:
+                digest.update(buffer, 0, count)
+                count = stream.read(buffer)
+        finally:
+            stream.close()
+        return
+
+    def __create_node(self, element):
+        """
+        Create the folder node for the element from its child elements.
+        :param element: the element
+        :return: the new node
+        """
+        node = _ConfigNode(self.__get_provider_interface(element.xsi_type))
+        if element.name_attribute is not None:
+            # the entities of JMS modules have their name as an XML attribute
+            node.set_attribute(self.__get_attribute_name(_NAME_ELEMENT), element.name_attribute)
+        counts = dict()
+        for child in element.elements:
+            if child.node is not None:
+                node_type = self.__get_folder_name(child.name)
+                name = child.node.get_attribute(_NAME_ELEMENT)
+                if name is None:
+                    count = counts.get(node_type, 0)
+                    counts[node_type] = count + 1
+                    name = _NO_NAME + str(count)
+                child.node.name = name
+                node.add_child(node_type, child.node)
+            elif child.nil:
+                node.set_attribute(self.__get_attribute_name(child.name), None)
+            else:
+                # repeated elements are the values of an array attribute
+                node.add_attribute_value(self.__get_attribute_name(child.name), ''.join(child.text).strip())
+        return node
+
+    def __get_folder_name(self, element_name):
+        key = _normalize(element_name)
+        if key in self._folder_names:
+            return self._folder_names[key]
+        return _to_camel_case(element_name)
+
+    def __get_attribute_name(self, element_name):
+        key = _normalize(element_name)
+        if key in self._attribute_names:
+            return self._attribute_names[key]
+        return _to_camel_case(element_name)
+
+    def __get_provider_interface(self, xsi_type):
+        """
+        Get the MBean interface of a security provider from the schema type of its element.
+        :param xsi_type: the xsi:type of the element, such as wls:default-authenticatorType
+        :return: the MBean interface name, or None if the element is not a known security provider
+        """
+        if xsi_type is None:
+            return None
+        type_name = xsi_type[xsi_type.find(':') + 1:]
+        if type_name.endswith('Type'):
+            type_name = type_name[:-len('Type')]
+        return self._provider_interfaces.get(_normalize(type_name))
+
+    def __load_alias_names(self):
+        """
+        Collect the WLST offline folder and attribute names from the aliases, keyed by their normalized names,
+        so that the XML element names can be translated into WLST names.
+        """
+        _method_name = '__load_alias_names'
+        for provider_name, provider_class in SECURITY_PROVIDER_NAME_MAP.iteritems():
+            self._provider_interfaces[_normalize(provider_name)] = provider_class + 'MBean'
+        self.__add_alias_names(LocationContext())
+        _logger.finer('WLSDPLY-06903', len(self._folder_names), len(self._attribute_names),
+                      class_name=_class_name, method_name=_method_name)
+        return
+
+    def __add_alias_names(self, location):
+        try:
+            for model_name in self._aliases.get_model_attribute_names(location):
+                wlst_name = self._aliases.get_wlst_attribute_name(location, model_name)
+                if wlst_name is not None:
+                    self._attribute_names.setdefault(_normalize(wlst_name), wlst_name)
+            subfolder_names = self._aliases.get_model_subfolder_names(location)
+        except AliasException:
+            return
+
+        for subfolder_name in subfolder_names:
+            location.append_location(subfolder_name)
+            try:
+                name_token = self._aliases.get_name_token(location)
+                if name_token is not None:
+                    location.add_name_token(name_token, _NO_NAME + '0')
+                wlst_type = self._aliases.get_wlst_mbean_type(location)
+                if wlst_type is not None:
+                    self._folder_names.setdefault(_normalize(wlst_type), wlst_type)
+                self.__add_alias_names(location)
+            except AliasException:
+                pass
+            location.pop_location()
+        return
+
+
+class ConfigXmlWlst(object):
+    """
+    The WLST offline functions used by discovery, answered from the configuration read by ConfigXmlReader.
+    It is installed with wlst_helper.set_thread_wlst(), so discovery runs unchanged on top of it.
+    """
+
+    connected = 'false'
+
+    def __init__(self, domain_node, domain_name):
+        self._root = domain_node
+        self._domain_name = domain_name
+        self._path = list()
+        self.WLSTException = ConfigXmlWlstException
+        return
+
+    def cd(self, path):
+        self._path = self.__resolve_path(path)
+        return self.__get_folder(self._path)
+
+    def ls(self, path=None, returnMap='false', returnType='a'):
+        if path == 'a' or path == 'c':
+            folder_path = self._path
+        else:
+            folder_path = self.__resolve_path(path)
+        node = self.__get_folder(folder_path)
+        if returnMap != 'true':
+            return None
+
+        if len(folder_path) % 2 == 1:
+            # a type folder contains the named MBeans of the type
+            if returnType == 'c':
+                return node.get_child_names(folder_path[-1])
+            return HashMap()
+
+        if returnType == 'c':
+            return node.get_child_types()
+        return node.get_attributes()
+
+    def get(self, attribute):
+        if len(self._path) % 2 == 1:
+            return None
+        return self.__get_folder(self._path).get_attribute(_normalize(attribute))
+
+    def pwd(self):
+        if len(self._path) == 0:
+            return '/' + self._domain_name
+        return '/' + self._domain_name + '/' + '/'.join(self._path)
+
+    def __resolve_path(self, path):
+        """
+        Resolve the absolute or relative path, with the folder types matched to the configuration.
+        :param path: the path
+        :return: the list of folder types and names from the domain root
+        :raises ConfigXmlWlstException: if the path does not exist
+        """
+        if path is None:
+            return list(self._path)
+        if path.startswith('/'):
+            result = list()
+        else:
+            result = list(self._path)
+
+        for part in path.split('/'):
+            if len(part) == 0 or part == '.':
+                continue
+            if part == '..':
+                if len(result) > 0:
+                    result.pop()
+                continue
+
+            node = self.__get_folder(result)
+            if len(result) % 2 == 0:
+                node_type = node.get_child_type(part)
+                if node_type is None:
+                    raise ConfigXmlWlstException('No folder ' + part + ' in /' + '/'.join(result))
+                result.append(node_type)
+            elif node.get_child(result[-1], part) is None:
+                raise ConfigXmlWlstException('No ' + result[-1] + ' named ' + part + ' in /' + '/'.join(result))
+            else:
+                result.append(part)
+        return result
+
+    def __get_folder(self, folder_path):
+        """
+        Get the node for the path.  The node of a type folder is its parent node.
+        :param folder_path: the resolved path
+        :return: the node
+        """
+        node = self._root
+        for index in range(1, len(folder_path), 2):
+            node = node.get_child(folder_path[index - 1], folder_path[index])
+        return node
+
+
+class ConfigXmlWlstException(Exception):
+    """
+    The error raised by ConfigXmlWlst for a path that does not exist in the configuration.
+    """
+
+    def getLocalizedMessage(self):
+        return str(self)
+
+
+class _ConfigNode(object):
+    """
+    A configuration folder with its attributes and its child folders, grouped by type in document order.
+    """
+
+    def __init__(self, interface_name=None):
+        self.name = None
+        self._interface_name = interface_name
+        self._attributes = dict()
+        self._attribute_names = dict()
+        self._child_types = list()
+        self._children = dict()
+        return
+
+    def set_attribute(self, attribute_name, value):
+        self._attribute_names[_normalize(attribute_name)] = attribute_name
+        self._attributes[attribute_name] = value
+        return
+
+    def add_attribute_value(self, attribute_name, value):
+        if attribute_name in self._attributes and self._attributes[attribute_name] is not None:
+            value = self._attributes[attribute_name] + ',' + value
+        self.set_attribute(attribute_name, value)
+        return
+
+    def get_attribute(self, normalized_name):
+        if normalized_name in self._attribute_names:
+            return self._attributes[self._attribute_names[normalized_name]]
+        return None
+
+    def get_attributes(self):
+        result = HashMap()
+        for attribute_name, value in self._attributes.iteritems():
+            result.put(attribute_name, value)
+        return result
+
+    def add_child(self, node_type, node):
+        if node_type not in self._children:
+            self._child_types.append(node_type)
+            self._children[node_type] = list()
+        self._children[node_type].append(node)
+        return
+
+    def get_children(self, normalized_type):
+        node_type = self.get_child_type(normalized_type)
+        if node_type is None:
+            return list()
+        return self._children[node_type]
+
+    def get_child_type(self, node_type):
+        key = _normalize(node_type)
+        for child_type in self._child_types:
+            if _normalize(child_type) == key:
+                return child_type
+        return None
+
+    def get_child_types(self):
+        return list(self._child_types)
+
+    def get_child_names(self, node_type):
+        result = list()
+        for child in self._children[node_type]:
+            result.append(child.name)
+        return result
+
+    def get_child(self, node_type, name):
+        for child in self._children[node_type]:
+            if child.name == name:
+                return child
+        return None
+
+    def getClass(self):
+        # discovery finds the type of a security provider from the MBean interface of the WLST object
+        return _ConfigNodeClass(self._interface_name)
+
+
+class _ConfigNodeClass(object):
+    """
+    Stand-in for the class of a WLST offline object, which only reports the MBean interface of a security provider.
+    """
+
+    def __init__(self, interface_name):
+        self._interface_name = interface_name
+        return
+
+    def getInterfaces(self):
+        if self._interface_name is None:
+            return list()
+        return [self._interface_name]
+
+
+class _Element(object):
+    """
+    An XML element while it is being read.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.text = list()
+        self.elements = list()
+        self.node = None
+        self.nil = False
+        self.xsi_type = None
+        self.name_attribute = None
+        return
+
+
+def _normalize(name):
+    """
+    Get the key used to match XML and WLST names, such as jdbc-driver-params and JDBCDriverParams.
+    :param name: the name
+    :return: the lower case name without separators
+    """
+    return name.replace('-', '').replace('_', '').lower()
+
+
+def _update_digest(digest, text):
+    digest.update(String(text).getBytes('UTF-8'))
+
+
+def _to_hex(digest_bytes):
+    result = ''
+    for digest_byte in digest_bytes:
+        result += '%02x' % (digest_byte & 0xff)
+    return result
+
+
+def _to_camel_case(element_name):
+    """
+    Convert an XML element name that is not in the aliases to a WLST name, such as listen-port to ListenPort.
+    :param element_name: the element name
+    :return: the WLST name
+    """
+    result = ''
+    for part in element_name.split('-'):
+        if len(part) > 0:
+            result += part[0].upper() + part[1:]
+    return result
@@ -0,0 +1,296 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+The timing report of the discoverDomain tool.  For each phase of the discovery and for each top-level model folder,
+it records the wall time, the WLST calls by type and the MBeans visited.  The discoverers only mark the top-level
+folder they are in and count the MBeans, and the WLST calls are counted by wlst_helper, so the report is always on.
+"""
+import threading
+
+from java.lang import System
+from java.lang import ThreadLocal
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.json.json_translator import PythonToJson
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import wlst_helper
+
+_class_name = 'discover_timer'
+_logger = PlatformLogger('wlsdeploy.discover')
+
+# the folder name used for the attributes of the domain MBean itself
+DOMAIN_ATTRIBUTES = '/'
+
+# the keys of the report entries
+TIME = 'time_ms'
+MBEANS = 'mbeans'
+WLST_CALLS = 'wlst_calls'
+PHASES = 'phases'
+FOLDERS = 'folders'
+
+_LINE_FORMAT = '%-36s %10s %8s %8s %8s %8s %8s %8s'
+
+_lock = threading.Lock()
+# the timing of each thread, and the open phases and recorded entries of the whole run
+_thread_timing = ThreadLocal()
+_all_thread_timings = list()
+_open_phases = dict()
+_phases = OrderedDict()
+_folders = OrderedDict()
+
+
+def reset():
+    """
+    Forget the phases and folders recorded so far, to start a new report.
+    """
+    _lock.acquire()
+    try:
+        _open_phases.clear()
+        _phases.clear()
+        _folders.clear()
+    finally:
+        _lock.release()
+    return
+
+
+def start_phase(phase):
+    """
+    Start timing a phase of the discovery.  The WLST calls and MBeans of a phase are counted across all the threads,
+    including the threads of the additional connections.
+    :param phase: the phase name
+    """
+    _lock.acquire()
+    try:
+        _open_phases[phase] = _Snapshot(_get_total_mbean_count(), wlst_helper.get_call_counts(True))
+    finally:
+        _lock.release()
+    return
+
+
+def end_phase(phase):
+    """
+    Stop timing a phase of the discovery, and add it to the report.  The top-level folder of the current thread,
+    if any, is ended too.
+    :param phase: the phase name
+    """
+    _method_name = 'end_phase'
+    end_folder()
+    _lock.acquire()
+    try:
+        if phase in _open_phases:
+            start = _open_phases[phase]
+            del _open_phases[phase]
+            entry = start.get_entry(_get_total_mbean_count(), wlst_helper.get_call_counts(True))
+            _add_entry(_phases, phase, entry)
+            _logger.fine('WLSDPLY-06950', phase, entry[TIME], entry[MBEANS], class_name=_class_name,
+                         method_name=_method_name)
+    finally:
+        _lock.release()
+    return
+
+
+def enter_folder(folder):
+    """
+    Mark the top-level model folder that the current thread is discovering.  The previous folder of the thread,
+    if it is a different folder, is ended and added to the report.  This is called for each top-level location,
+    so it does nothing else when the folder has not changed.
+    :param folder: the top-level model folder name, or DOMAIN_ATTRIBUTES for the domain attributes
+    """
+    timing = _get_thread_timing()
+    if timing.folder != folder:
+        _end_folder(timing)
+        timing.folder = folder
+        timing.folder_start = _Snapshot(timing.mbeans, wlst_helper.get_call_counts())
+    return
+
+
+def end_folder():
+    """
+    End the top-level model folder of the current thread, if any, and add it to the report.
+    """
+    _end_folder(_get_thread_timing())
+    return
+
+
+def count_mbean():
+    """
+    Count an MBean visited by the current thread.
+    """
+    _get_thread_timing().mbeans += 1
+    return
+
+
+def get_report():
+    """
+    Get the report of the phases and top-level folders.  The times and counts of a folder that was discovered by
+    several threads are added up, so the folder times can add up to more than the time of their phase.
+    :return: a dictionary with the phases and folders, each a dictionary of names to entries
+    """
+    report = OrderedDict()
+    _lock.acquire()
+    try:
+        report[PHASES] = _copy_entries(_phases)
+        report[FOLDERS] = _copy_entries(_folders)
+    finally:
+        _lock.release()
+    return report
+
+
+def get_summary_lines():
+    """
+    Format the report as the lines of a table, for the summary at the end of the tool.
+    :return: the list of lines, or an empty list if nothing was recorded
+    """
+    report = get_report()
+    lines = list()
+    if len(report[PHASES]) == 0 and len(report[FOLDERS]) == 0:
+        return lines
+
+    header = ['', TIME, MBEANS]
+    header.extend(wlst_helper.COUNTED_CALLS)
+    lines.append(_LINE_FORMAT % tuple(header))
+    for section in [PHASES, FOLDERS]:
+        for name in report[section].keys():
+            entry = report[section][name]
+            line = ['%s:%s' % (section[:-1], name), entry[TIME], entry[MBEANS]]
+            for call_type in wlst_helper.COUNTED_CALLS:
+                line.append(entry[WLST_CALLS][call_type])
+            lines.append(_LINE_FORMAT % tuple(line))
+    return lines
+
+
+def write_report(file_name):
+    """
+    Write the report to a JSON file.
+    :param file_name: the name of the file
+    :raises DiscoverException: if the file cannot be written
+    """
+    _method_name = 'write_report'
+    try:
+        PythonToJson(get_report()).write_to_json_file(file_name)
+    except JsonException, je:
+        ex = exception_helper.create_discover_exception('WLSDPLY-06951', file_name, je.getLocalizedMessage(),
+                                                        error=je)
+        _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+        raise ex
+    _logger.info('WLSDPLY-06952', file_name, class_name=_class_name, method_name=_method_name)
+    return
+
+
+def _end_folder(timing):
+    """
+    End the top-level model folder of the thread timing, if any, and add it to the report.
+    :param timing: the timing of the current thread
+    """
+    if timing.folder is not None:
+        entry = timing.folder_start.get_entry(timing.mbeans, wlst_helper.get_call_counts())
+        _lock.acquire()
+        try:
+            _add_entry(_folders, timing.folder, entry)
+        finally:
+            _lock.release()
+        timing.folder = None
+        timing.folder_start = None
+    return
+
+
+def _get_thread_timing():
+    """
+    Get the timing of the current thread, registering it the first time the thread uses it.
+    :return: the timing of the current thread
+    """
+    timing = _thread_timing.get()
+    if timing is None:
+        timing = _ThreadTiming()
+        _lock.acquire()
+        try:
+            _all_thread_timings.append(timing)
+        finally:
+            _lock.release()
+        _thread_timing.set(timing)
+    return timing
+
+
+def _get_total_mbean_count():
+    """
+    Get the number of MBeans visited by all the threads.  The caller holds the lock.
+    :return: the number of MBeans visited
+    """
+    count = 0
+    for timing in _all_thread_timings:
+        count += timing.mbeans
+    return count
+
+
+def _add_entry(entries, name, entry):
+    """
+    Add the entry to the named entry, if there is one, or add it as the named entry.  The caller holds the lock.
+    :param entries: the dictionary of entries
+    :param name: the phase or folder name
+    :param entry: the entry to add
+    """
+    if name not in entries:
+        entries[name] = entry
+        return
+    total = entries[name]
+    total[TIME] += entry[TIME]
+    total[MBEANS] += entry[MBEANS]
+    for call_type in wlst_helper.COUNTED_CALLS:
+        total[WLST_CALLS][call_type] += entry[WLST_CALLS][call_type]
+    return
+
+
+def _copy_entries(entries):
+    result = OrderedDict()
+    for name in entries.keys():
+        entry = entries[name]
+        copy = OrderedDict()
+        copy[TIME] = entry[TIME]
+        copy[MBEANS] = entry[MBEANS]
+        copy[WLST_CALLS] = OrderedDict()
+        for call_type in wlst_helper.COUNTED_CALLS:
+            copy[WLST_CALLS][call_type] = entry[WLST_CALLS][call_type]
+        result[name] = copy
+    return result
+
+
+class _ThreadTiming(object):
+    """
+    The top-level folder that one thread is discovering, and the number of MBeans the thread visited.
+    """
+
+    def __init__(self):
+        self.folder = None
+        self.folder_start = None
+        self.mbeans = 0
+        return
+
+
+class _Snapshot(object):
+    """
+    The start time and the counts at the start of a phase or folder.
+    """
+
+    def __init__(self, mbeans, call_counts):
+        self._millis = System.currentTimeMillis()
+        self._mbeans = mbeans
+        self._call_counts = call_counts
+        return
+
+    def get_entry(self, mbeans, call_counts):
+        """
+        Get the report entry from the start of the phase or folder to now.
+        :param mbeans: the current MBean count
+        :param call_counts: the current WLST call counts
+        :return: the report entry
+        """
+        entry = OrderedDict()
+        entry[TIME] = System.currentTimeMillis() - self._millis
+        entry[MBEANS] = mbeans - self._mbeans
+        entry[WLST_CALLS] = OrderedDict()
+        for call_type in wlst_helper.COUNTED_CALLS:
+            entry[WLST_CALLS][call_type] = call_counts[call_type] - self._call_counts[call_type]
+        return entry
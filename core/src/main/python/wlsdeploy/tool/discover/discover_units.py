@@ -0,0 +1,186 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+The discover units are the instances of the top-level folders that can have more than one MBean, such as servers,
+data sources and applications.  Parts of the discovery can be limited to, or can skip, a set of units.
+"""
+from oracle.weblogic.deploy.discover import DiscoverException
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover.discoverer import Discoverer
+from wlsdeploy.tool.util.alias_helper import AliasHelper
+
+_class_name = 'discover_units'
+_logger = PlatformLogger(discoverer.get_discover_logger_name())
+
+# indexes into the unit tuples
+FOLDER = 0
+NAME_TOKEN = 1
+INSTANCE = 2
+
+
+def find_units(model_context, base_location, aliases, wlst_mode):
+    """
+    List the instances of the multiple-instance top-level folders.  The instances skipped by the discover filter
+    of the current thread are not listed.
+    :param model_context: the model context
+    :param base_location: the domain location, with the domain name token
+    :param aliases: the aliases
+    :param wlst_mode: the WLST mode
+    :return: a list of (model folder name, name token, instance name) tuples
+    """
+    _method_name = 'find_units'
+    alias_helper = AliasHelper(aliases, _logger, ExceptionType.DISCOVER)
+    discover_filter = discoverer.get_discover_filter()
+    units = list()
+    folder_names = list()
+    for folder_name in aliases.get_model_topology_top_level_folder_names() + \
+            aliases.get_model_resources_top_level_folder_names() + \
+            aliases.get_model_app_deployments_top_level_folder_names():
+        if folder_name not in folder_names:
+            folder_names.append(folder_name)
+
+    list_discoverer = Discoverer(model_context, base_location, wlst_mode, aliases)
+    for folder_name in folder_names:
+        location = LocationContext(base_location)
+        location.append_location(folder_name)
+        try:
+            if alias_helper.get_wlst_mbean_type(location) is None or \
+                    not alias_helper.supports_multiple_mbean_instances(location):
+                continue
+            name_token = alias_helper.get_name_token(location)
+        except DiscoverException, de:
+            _logger.finer('WLSDPLY-06920', folder_name, de.getLocalizedMessage(), class_name=_class_name,
+                          method_name=_method_name)
+            continue
+
+        names = list_discoverer._find_names_in_folder(location)
+        if names:
+            _logger.fine('WLSDPLY-06921', len(names), folder_name, class_name=_class_name, method_name=_method_name)
+            for name in names:
+                if discover_filter is not None:
+                    instance_location = LocationContext(location).add_name_token(name_token, name)
+                    if not discover_filter.includes_location(instance_location):
+                        continue
+                units.append((folder_name, name_token, name))
+    return units
+
+
+def merge_units(model, unit_model, units):
+    """
+    Replace the empty entries of the units in the model with the entries of the units in the unit model.
+    Entries that are missing from the unit model are removed, as they would be missing from a full discovery.
+    :param model: the model discovered without the units
+    :param unit_model: the model that holds the units
+    :param units: the units
+    """
+    _method_name = 'merge_units'
+    for section, unit_section in [(model.get_model_topology(), unit_model.get_model_topology()),
+                                  (model.get_model_resources(), unit_model.get_model_resources()),
+                                  (model.get_model_app_deployments(), unit_model.get_model_app_deployments())]:
+        for unit in units:
+            folder_name = unit[FOLDER]
+            instance = unit[INSTANCE]
+            if folder_name not in section or instance not in section[folder_name]:
+                continue
+
+            if folder_name in unit_section and instance in unit_section[folder_name]:
+                section[folder_name][instance] = unit_section[folder_name][instance]
+            else:
+                _logger.finer('WLSDPLY-06922', instance, folder_name, class_name=_class_name,
+                              method_name=_method_name)
+                del section[folder_name][instance]
+                if len(section[folder_name]) == 0:
+                    del section[folder_name]
+    return
+
+
+def combine_filters(first_filter, second_filter):
+    """
+    Get a discover filter that only discovers the locations discovered by both filters.
+    :param first_filter: the first filter, or None
+    :param second_filter: the second filter, or None
+    :return: the combined filter
+    """
+    if first_filter is None:
+        return second_filter
+    if second_filter is None:
+        return first_filter
+    return _CombinedFilter(first_filter, second_filter)
+
+
+class UnitFilter(object):
+    """
+    The discover filter that limits a thread to, or excludes a thread from, a set of units.
+    """
+
+    def __init__(self, units, include_units):
+        """
+        Create the filter.
+        :param units: the (model folder name, name token, instance name) units
+        :param include_units: True to discover only the units, False to discover everything except the units
+        """
+        self._include_units = include_units
+        self._instances = dict()
+        self._name_tokens = dict()
+        for unit in units:
+            folder_name = unit[FOLDER]
+            if folder_name not in self._instances:
+                self._instances[folder_name] = dict()
+                self._name_tokens[folder_name] = unit[NAME_TOKEN]
+            self._instances[folder_name][unit[INSTANCE]] = True
+        return
+
+    def includes_location(self, location):
+        """
+        Should the location be discovered by this thread?  Listing the instances of a folder is always allowed.
+        :param location: the location
+        :return: True if the location should be discovered, False otherwise
+        """
+        folders = location.get_model_folders()
+        if len(folders) == 0 or folders[0] not in self._instances:
+            return not self._include_units
+
+        instance = location.get_name_for_token(self._name_tokens[folders[0]])
+        if instance is None:
+            return True
+        return (instance in self._instances[folders[0]]) == self._include_units
+
+    def filter_names(self, location, names):
+        """
+        Remove the top-level instance names that this thread should not discover.  When units are excluded, all the
+        names are kept so that the model has an entry for each instance in the order of a full discovery.
+        :param location: the location of the names
+        :param names: the names found at the location
+        :return: the names to discover
+        """
+        folders = location.get_model_folders()
+        if not self._include_units or names is None or len(folders) != 1 or folders[0] not in self._instances:
+            return names
+
+        result = list()
+        for name in names:
+            if name in self._instances[folders[0]]:
+                result.append(name)
+        return result
+
+
+class _CombinedFilter(object):
+    """
+    The discover filter that applies two filters.
+    """
+
+    def __init__(self, first_filter, second_filter):
+        self._first_filter = first_filter
+        self._second_filter = second_filter
+        return
+
+    def includes_location(self, location):
+        return self._first_filter.includes_location(location) and self._second_filter.includes_location(location)
+
+    def filter_names(self, location, names):
+        return self._second_filter.filter_names(location, self._first_filter.filter_names(location, names))
@@ -4,6 +4,8 @@ The Universal Permissive License (UPL), Version 1.0
 """
 import javaos as os
 
+from java.lang import ThreadLocal
+
 from oracle.weblogic.deploy.aliases import AliasException
 from oracle.weblogic.deploy.discover import DiscoverException
 from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
@@ -16,8 +18,10 @@ from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.expection_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import discover_timer
 from wlsdeploy.tool.util.alias_helper import AliasHelper
 from wlsdeploy.tool.util.wlst_helper import WlstHelper
+from wlsdeploy.util import mbean_attributes
 from wlsdeploy.util import path_utils
 from wlsdeploy.util import wlst_helper
 from wlsdeploy.util.weblogic_helper import WebLogicHelper
@@ -27,6 +31,13 @@ _DISCOVER_LOGGER_NAME = 'wlsdeploy.discover'
 _class_name = 'Discoverer'
 _logger = PlatformLogger(_DISCOVER_LOGGER_NAME)
 
+# The filter that limits the locations discovered by the current thread, if any.
+_discover_filter = ThreadLocal()
+
+# The MBeanInfo attribute names of each online MBean type, keyed by the Type of the MBean ObjectName.
+# Every instance of a type has the same MBeanInfo, so it is read once for the whole discovery.
+_mbi_attributes_cache = dict()
+
 
 class Discoverer(object):
     """
@@ -66,8 +77,10 @@ class Discoverer(object):
         wlst_path = self._alias_helper.get_wlst_attributes_path(location)
         _logger.finer('WLSDPLY-06100', wlst_path, class_name=_class_name, method_name=_method_name)
 
+        self._mark_top_folder(location)
         if not self.wlst_cd(wlst_path, location):
             return
+        discover_timer.count_mbean()
 
         wlst_params = self._get_attributes_for_current_location(location)
         _logger.finest('WLSDPLY-06102', self._wlst_helper.get_pwd(), wlst_params, class_name=_class_name,
@@ -77,8 +90,15 @@ class Discoverer(object):
                        class_name=_class_name, method_name=_method_name)
         attr_dict = OrderedDict()
         if wlst_params:
+            bulk_names = list()
             for wlst_param in wlst_params:
                 if wlst_param in wlst_get_params:
+                    bulk_names.append(wlst_param)
+            bulk_values, failed_names = self._get_attributes_in_bulk(bulk_names)
+            for wlst_param in wlst_params:
+                if wlst_param in bulk_values:
+                    wlst_value = bulk_values[wlst_param]
+                elif wlst_param in wlst_get_params:
                     _logger.finest('WLSDPLY-06104', wlst_param, class_name=_class_name, method_name=_method_name)
                     try:
                         wlst_value = wlst_helper.get(wlst_param)
@@ -144,18 +164,25 @@ class Discoverer(object):
         path = self._alias_helper.get_wlst_attributes_path(location)
         try:
             lsa_attributes = wlst_helper.lsa(path)
-            mbi_attributes = _get_mbi_attribute_list(path)
+            mbi_attributes, mbi_attribute_names = _get_mbi_attributes(location, path, mbean_attributes.get_object_name())
             if mbi_attributes:
-                for lsa_attribute_name in lsa_attributes:
-                    if lsa_attribute_name in lsa_attributes and lsa_attribute_name not in mbi_attributes:
+                for lsa_attribute_name in lsa_attributes.keys():
+                    if lsa_attribute_name not in mbi_attribute_names:
                         _logger.finer('WLSDPLY-06142', lsa_attribute_name)
                         del lsa_attributes[lsa_attribute_name]
+                get_names = list()
                 for mbi_attribute_name in mbi_attributes:
-                    if mbi_attribute_name not in lsa_attributes and mbi_attribute_name in mbi_attributes:
-                        # don't count on the item in the get required list in caller, just get the value
-                        # and add it to our lsa list
-                        _logger.finer('WLSDPLY-06141', mbi_attribute_name, class_name=_class_name,
-                                      method_name=_method_name)
+                    if mbi_attribute_name not in lsa_attributes:
+                        get_names.append(mbi_attribute_name)
+                bulk_values, failed_names = self._get_attributes_in_bulk(get_names)
+                for mbi_attribute_name in get_names:
+                    # don't count on the item in the get required list in caller, just get the value
+                    # and add it to our lsa list
+                    _logger.finer('WLSDPLY-06141', mbi_attribute_name, class_name=_class_name,
+                                  method_name=_method_name)
+                    if mbi_attribute_name in bulk_values:
+                        lsa_attributes[mbi_attribute_name] = bulk_values[mbi_attribute_name]
+                    else:
                         lsa_attributes[mbi_attribute_name] = wlst_helper.get(mbi_attribute_name)
         except PyWLSTException, pe:
             name = location.get_model_folders()[-1]
@@ -163,6 +190,27 @@ class Discoverer(object):
                          method_name=_method_name)
         return lsa_attributes
 
+    def _get_attributes_in_bulk(self, attribute_names):
+        """
+        Read the attributes of the MBean at the current online location with a single getAttributes() call,
+        instead of calling wlst.get() for each attribute. Offline, or if the MBean cannot be read this way,
+        no values are returned, so the caller reads each attribute with wlst.get().
+        :param attribute_names: the WLST names of the attributes to read
+        :return: dictionary of the attribute values that were read, keyed by WLST name, and the list of
+                 the attribute names that could not be read
+        """
+        _method_name = '_get_attributes_in_bulk'
+        if self._wlst_mode == WlstModes.OFFLINE or len(attribute_names) < 2:
+            return dict(), attribute_names
+
+        connection = wlst_helper.get_mbean_server_connection()
+        object_name = None
+        if connection is not None:
+            object_name = mbean_attributes.get_object_name()
+        if object_name is None:
+            return dict(), attribute_names
+        return mbean_attributes.read_attributes(connection, object_name, attribute_names)
+
     def _is_defined_attribute(self, location, wlst_name):
         attribute = False
         try:
@@ -231,6 +279,11 @@ class Discoverer(object):
         """
         _method_name = '_find_names_in_folder'
         names = None
+        self._mark_top_folder(location)
+        discover_filter = _discover_filter.get()
+        if discover_filter is not None and not discover_filter.includes_location(location):
+            return names
+
         mbean_type = self._alias_helper.get_wlst_mbean_type(location)
         if mbean_type is None:
             _logger.fine('WLSDPLY-06110', location.get_model_folders()[-1], location.get_folder_path(),
@@ -241,6 +294,8 @@ class Discoverer(object):
             if wlst_helper.path_exists(folder_path):
                 self.wlst_cd(folder_path, location)
                 names = self._wlst_helper.lsc()
+                if discover_filter is not None:
+                    names = discover_filter.filter_names(location, names)
                 _logger.finest('WLSDPLY-06146', names, location, class_name=_class_name, method_name=_method_name)
         return names
 
@@ -517,9 +572,28 @@ class Discoverer(object):
         :param model_top_folder_name: to check for at top directory
         :return: True if the folder exists at the current location in the domain
         """
+        discover_timer.enter_folder(model_top_folder_name)
+        discover_filter = _discover_filter.get()
+        if discover_filter is not None:
+            location = LocationContext(self._base_location)
+            location.append_location(model_top_folder_name)
+            if not discover_filter.includes_location(location):
+                return False
         result = self._wlst_helper.lsc('/', log_throwing=False)
         return model_top_folder_name in result
 
+    def _mark_top_folder(self, location):
+        """
+        Mark the top-level model folder of the location as the folder being discovered, for the timing report.
+        :param location: context containing the current location information
+        """
+        model_folders = location.get_model_folders()
+        if len(model_folders) == 0:
+            discover_timer.enter_folder(discover_timer.DOMAIN_ATTRIBUTES)
+        else:
+            discover_timer.enter_folder(model_folders[0])
+        return
+
     def _subfolder_exists(self, model_folder_name, location):
         """
         Check to see if the folder represented by the model folder name exists at the current loction
@@ -629,6 +703,11 @@ class Discoverer(object):
         """
         _method_name = 'wlst_cd'
         result = None
+        discover_filter = _discover_filter.get()
+        if discover_filter is not None and not discover_filter.includes_location(location):
+            _logger.finest('WLSDPLY-06148', path, class_name=_class_name, method_name=_method_name)
+            return result
+
         try:
             result = wlst_helper.cd(path)
         except PyWLSTException, pe:
@@ -658,6 +737,28 @@ class Discoverer(object):
         return folder_name
 
 
+def set_discover_filter(discover_filter):
+    """
+    Limit the locations discovered by the current thread.  The filter must provide includes_location(location),
+    which returns False for the locations that should be skipped, and filter_names(location, names), which returns
+    the MBean names found at the location that should be discovered.
+    :param discover_filter: the filter, or None to discover all locations
+    """
+    if discover_filter is None:
+        _discover_filter.remove()
+    else:
+        _discover_filter.set(discover_filter)
+    return
+
+
+def get_discover_filter():
+    """
+    Get the filter that limits the locations discovered by the current thread.
+    :return: the filter, or None if all locations are discovered
+    """
+    return _discover_filter.get()
+
+
 def add_to_model_if_not_empty(dictionary, entry_name, entry_value):
     """
     Helper method for discover to add a non-empty value to the dictionary with the provided entry-name
@@ -685,9 +786,66 @@ def convert_to_absolute_path(relative_to, file_name):
     return file_name
 
 
+def clear_mbi_attributes_cache():
+    """
+    Forget the MBeanInfo attribute names read for each MBean type, for example before discovering another domain.
+    """
+    _mbi_attributes_cache.clear()
+    return
+
+
+def _get_mbi_attributes(location, path, object_name):
+    """
+    Get the MBeanInfo attribute names of the MBean type at the location.  The MBeanInfo is only read from the
+    server for the first MBean of each type.  The type is the Type key of the MBean ObjectName, which tells apart
+    the provider types that share a model folder, or the model folder path if there is no ObjectName.  A failed
+    read is not cached, so the next MBean of the type reads the MBeanInfo again.
+    :param location: the location of the MBean
+    :param path: the WLST attributes path of the MBean
+    :param object_name: the ObjectName of the MBean, or None if it is not known
+    :return: the list of attribute names, in MBeanInfo order, and a dictionary of the same names for lookups;
+             both are empty if the MBeanInfo cannot be read
+    """
+    _method_name = '_get_mbi_attributes'
+    type_key = None
+    if object_name is not None:
+        type_key = object_name.getKeyProperty('Type')
+    if type_key is None:
+        type_key = '/'.join(location.get_model_folders())
+    if type_key in _mbi_attributes_cache:
+        return _mbi_attributes_cache[type_key]
+
+    attribute_list = _get_mbi_attribute_list(path)
+    if attribute_list is None:
+        return list(), dict()
+
+    attribute_names = dict()
+    for attribute_name in attribute_list:
+        attribute_names[attribute_name] = True
+    _logger.finer('WLSDPLY-06152', len(attribute_list), type_key, class_name=_class_name, method_name=_method_name)
+    _mbi_attributes_cache[type_key] = (attribute_list, attribute_names)
+    return attribute_list, attribute_names
+
+
 def _get_mbi_attribute_list(path):
+    """
+    Read the names of the attributes in the MBeanInfo of the MBean at the path.
+    :param path: the WLST attributes path of the MBean
+    :return: the list of attribute names, or None if the MBeanInfo cannot be read
+    """
+    _method_name = '_get_mbi_attribute_list'
+    try:
+        mbean_info = wlst_helper.get_mbi(path)
+    except PyWLSTException, pe:
+        _logger.fine('WLSDPLY-06153', path, pe.getLocalizedMessage(), class_name=_class_name,
+                     method_name=_method_name)
+        return None
+    if mbean_info is None:
+        _logger.fine('WLSDPLY-06154', path, class_name=_class_name, method_name=_method_name)
+        return None
+
     attribute_list = []
-    for mbean_attribute_info in wlst_helper.get_mbi(path).getAttributes():
+    for mbean_attribute_info in mbean_info.getAttributes():
         if _is_attribute(mbean_attribute_info):
             attribute_list.append(mbean_attribute_info.getName())
     return attribute_list
@@ -0,0 +1,249 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Discovery that reuses the parts of a previous discovery that have not changed since it was made.
+"""
+from java.io import File
+
+from oracle.weblogic.deploy.util import WLSDeployArchive
+from oracle.weblogic.deploy.yaml import YamlException
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import discover_units
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover.config_xml_reader import ConfigXmlReader
+from wlsdeploy.tool.discover.discover_units import UnitFilter
+from wlsdeploy.tool.util.alias_helper import AliasHelper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model import Model
+from wlsdeploy.yaml.yaml_translator import PythonToYaml
+from wlsdeploy.yaml.yaml_translator import YamlToPython
+
+_class_name = 'IncrementalDiscoverer'
+_logger = PlatformLogger(discoverer.get_discover_logger_name())
+
+# the keys of the previous discovery file
+WLST_MODE = 'wlstMode'
+FINGERPRINTS = 'fingerprints'
+MODEL = 'model'
+
+
+class IncrementalDiscoverer(object):
+    """
+    Discover an offline domain, copying the units that have not changed from the previous discovery instead of
+    walking them.
+
+    The units are the instances of the top-level folders that can have more than one MBean, such as servers, data
+    sources and applications.  The fingerprint of a unit is the digest of its config.xml element and, for a system
+    resource, of its module descriptor file, so it covers the child MBeans of the unit.  There is no such digest
+    online, where the attributes of the unit MBean do not show the changes of its child MBeans, so the previous
+    discovery argument is rejected for an online domain.  The previous discovery file holds the fingerprints and
+    the discovered sections, and it is rewritten after each discovery.  Units that reference files in the archive
+    are always discovered, because the archive is written again by each discovery.
+
+    A discovery limited to model paths does not use the previous discovery file at all: its units may only hold
+    part of their folders, and the previous units may hold folders outside the paths.
+    """
+
+    def __init__(self, model_context, base_location, aliases, wlst_mode, discover_function):
+        """
+        Create the incremental discoverer.
+        :param model_context: the model context
+        :param base_location: the domain location, with the domain name token
+        :param aliases: the aliases
+        :param wlst_mode: the WLST mode, which is offline
+        :param discover_function: the function that discovers the model sections;
+                                  it is called with the model, model context, base location and aliases
+        """
+        self._model_context = model_context
+        self._base_location = base_location
+        self._aliases = aliases
+        self._alias_helper = AliasHelper(aliases, _logger, ExceptionType.DISCOVER)
+        self._wlst_mode = wlst_mode
+        self._discover_function = discover_function
+        self._discovery_file = model_context.get_previous_discovery_file()
+        return
+
+    def discover(self, model):
+        """
+        Discover the model sections, reusing the unchanged units of the previous discovery, and write the new
+        previous discovery file.
+        :param model: the model to populate
+        :raises DiscoverException: if an error occurs while discovering the domain
+        """
+        _method_name = 'discover'
+        _logger.entering(self._discovery_file, class_name=_class_name, method_name=_method_name)
+
+        if discoverer.get_discover_filter() is not None:
+            _logger.info('WLSDPLY-06938', self._discovery_file, CommandLineArgUtil.DISCOVER_PATHS_SWITCH,
+                         class_name=_class_name, method_name=_method_name)
+            self._discover_function(model, self._model_context, self._base_location, self._aliases)
+            _logger.exiting(class_name=_class_name, method_name=_method_name)
+            return
+
+        units = discover_units.find_units(self._model_context, self._base_location, self._aliases, self._wlst_mode)
+        fingerprints = self.__get_fingerprints(units)
+        previous_model, previous_fingerprints = self.__read_previous_discovery()
+        reused_units = list()
+        if previous_model is not None:
+            for unit in units:
+                if self.__is_unchanged(unit, fingerprints, previous_model, previous_fingerprints):
+                    reused_units.append(unit)
+        _logger.info('WLSDPLY-06930', len(reused_units), len(units), class_name=_class_name,
+                     method_name=_method_name)
+
+        if len(reused_units) == 0:
+            self._discover_function(model, self._model_context, self._base_location, self._aliases)
+        else:
+            outer_filter = discoverer.get_discover_filter()
+            discoverer.set_discover_filter(discover_units.combine_filters(outer_filter,
+                                                                          UnitFilter(reused_units, False)))
+            try:
+                self._discover_function(model, self._model_context, self._base_location, self._aliases)
+            finally:
+                discoverer.set_discover_filter(outer_filter)
+            discover_units.merge_units(model, previous_model, reused_units)
+
+        # the sections are saved before the model is customized for the output file
+        self.__write_discovery(model, fingerprints)
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return
+
+    def __get_fingerprints(self, units):
+        """
+        Compute the fingerprint of each unit.
+        :param units: the units
+        :return: a dictionary of the fingerprints, keyed by model folder name and then by instance name
+        :raises DiscoverException: if the offline configuration cannot be read
+        """
+        _method_name = '__get_fingerprints'
+        fingerprints = dict()
+        reader = ConfigXmlReader(self._model_context.get_domain_home(), self._aliases)
+        config_fingerprints = reader.read_fingerprints()
+
+        for unit in units:
+            location = self.__get_unit_location(unit)
+            wlst_type = self._alias_helper.get_wlst_mbean_type(location)
+            fingerprint = None
+            if wlst_type in config_fingerprints:
+                fingerprint = config_fingerprints[wlst_type].get(unit[discover_units.INSTANCE])
+
+            if fingerprint is None:
+                _logger.finer('WLSDPLY-06931', unit[discover_units.INSTANCE], unit[discover_units.FOLDER],
+                              class_name=_class_name, method_name=_method_name)
+            else:
+                if unit[discover_units.FOLDER] not in fingerprints:
+                    fingerprints[unit[discover_units.FOLDER]] = dict()
+                fingerprints[unit[discover_units.FOLDER]][unit[discover_units.INSTANCE]] = fingerprint
+        return fingerprints
+
+    def __is_unchanged(self, unit, fingerprints, previous_model, previous_fingerprints):
+        """
+        Can the previous discovery of the unit be reused?
+        :param unit: the unit
+        :param fingerprints: the new fingerprints
+        :param previous_model: the model of the previous discovery
+        :param previous_fingerprints: the fingerprints of the previous discovery
+        :return: True if the unit has not changed and can be copied from the previous model
+        """
+        folder_name = unit[discover_units.FOLDER]
+        instance = unit[discover_units.INSTANCE]
+        fingerprint = _get_entry(fingerprints, folder_name, instance)
+        if fingerprint is None or fingerprint != _get_entry(previous_fingerprints, folder_name, instance):
+            return False
+
+        for section in [previous_model.get_model_topology(), previous_model.get_model_resources(),
+                        previous_model.get_model_app_deployments()]:
+            entry = _get_entry(section, folder_name, instance)
+            if isinstance(entry, dict):
+                return not _has_archive_path(entry)
+        return False
+
+    def __read_previous_discovery(self):
+        """
+        Read the previous discovery file, if there is one and it was made in the same WLST mode.
+        :return: the previous model and the previous fingerprints, or None and None
+        """
+        _method_name = '__read_previous_discovery'
+        if not File(self._discovery_file).isFile():
+            _logger.info('WLSDPLY-06933', self._discovery_file, class_name=_class_name, method_name=_method_name)
+            return None, None
+
+        try:
+            discovery = YamlToPython(self._discovery_file, True).parse()
+        except YamlException, ye:
+            _logger.warning('WLSDPLY-06934', self._discovery_file, ye.getLocalizedMessage(),
+                            class_name=_class_name, method_name=_method_name)
+            return None, None
+
+        if discovery is None or discovery.get(WLST_MODE) != WlstModes.from_value(self._wlst_mode):
+            _logger.info('WLSDPLY-06935', self._discovery_file, WlstModes.from_value(self._wlst_mode),
+                         class_name=_class_name, method_name=_method_name)
+            return None, None
+
+        fingerprints = discovery.get(FINGERPRINTS)
+        if fingerprints is None:
+            fingerprints = dict()
+        return Model(discovery.get(MODEL)), fingerprints
+
+    def __write_discovery(self, model, fingerprints):
+        """
+        Write the fingerprints and the discovered sections to the previous discovery file.
+        :param model: the discovered model
+        :param fingerprints: the fingerprints of the units
+        :raises DiscoverException: if the file cannot be written
+        """
+        _method_name = '__write_discovery'
+        sections = dict()
+        sections['topology'] = model.get_model_topology()
+        sections['resources'] = model.get_model_resources()
+        sections['appDeployments'] = model.get_model_app_deployments()
+        discovery = dict()
+        discovery[WLST_MODE] = WlstModes.from_value(self._wlst_mode)
+        discovery[FINGERPRINTS] = fingerprints
+        discovery[MODEL] = sections
+        try:
+            PythonToYaml(discovery).write_to_yaml_file(self._discovery_file)
+        except YamlException, ye:
+            ex = exception_helper.create_discover_exception('WLSDPLY-06936', self._discovery_file,
+                                                            ye.getLocalizedMessage(), error=ye)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+        _logger.fine('WLSDPLY-06937', self._discovery_file, class_name=_class_name, method_name=_method_name)
+        return
+
+    def __get_unit_location(self, unit):
+        location = LocationContext(self._base_location)
+        location.append_location(unit[discover_units.FOLDER])
+        location.add_name_token(unit[discover_units.NAME_TOKEN], unit[discover_units.INSTANCE])
+        return location
+
+
+def _get_entry(dictionary, folder_name, instance):
+    if dictionary is None or folder_name not in dictionary or not isinstance(dictionary[folder_name], dict):
+        return None
+    return dictionary[folder_name].get(instance)
+
+
+def _has_archive_path(value):
+    """
+    Does the model value, or any value below it, reference a file in the archive?
+    :param value: the model value
+    :return: True if a file in the archive is referenced
+    """
+    if isinstance(value, dict):
+        for entry in value.values():
+            if _has_archive_path(entry):
+                return True
+    elif type(value) is list:
+        for entry in value:
+            if _has_archive_path(entry):
+                return True
+    elif type(value) is str:
+        return WLSDeployArchive.isPathIntoArchive(value)
+    return False
@@ -0,0 +1,251 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Online discovery that splits the work across several WLST connections to the admin server.
+"""
+import threading
+
+from java.lang import Throwable
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import discover_timer
+from wlsdeploy.tool.discover import discover_units
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover.discover_units import UnitFilter
+from wlsdeploy.util import wlst_helper
+from wlsdeploy.util.model import Model
+
+_class_name = 'ParallelDiscoverer'
+_logger = PlatformLogger(discoverer.get_discover_logger_name())
+
+
+class ParallelDiscoverer(object):
+    """
+    Discover the domain over several WLST connections to the admin server.
+
+    The instances of the top-level folders that can have more than one MBean, such as servers, data sources and
+    applications, are the units of work.  They are listed on the main connection and split across the connections.
+    Each additional connection is opened by a worker thread, in its own WLST interpreter, and the worker runs the
+    normal section discoverers, limited to its own instances.  The main thread runs the same discoverers on the
+    main connection at the same time, skipping the instances assigned to the workers.  Because the main thread
+    still lists every instance, its model holds an empty entry for each worker instance, in the same position as
+    a serial run.  The worker results replace those entries, so the model is identical to the serial model.
+    """
+
+    def __init__(self, model_context, base_location, aliases, connection_count, discover_function,
+                 wlst_factory=None):
+        """
+        Create the parallel discoverer.
+        :param model_context: the model context
+        :param base_location: the domain location, with the domain name token
+        :param aliases: the aliases used by the main thread
+        :param connection_count: the total number of connections to use, including the main connection
+        :param discover_function: the function that discovers the model sections split across the connections;
+                                  it is called with the model, model context, base location and aliases
+        :param wlst_factory: the function that creates the WLST of a worker thread, which defaults to a new
+                             WLST interpreter
+        """
+        self._model_context = model_context
+        self._base_location = base_location
+        self._aliases = aliases
+        self._connection_count = connection_count
+        self._discover_function = discover_function
+        self._wlst_factory = wlst_factory
+        if self._wlst_factory is None:
+            self._wlst_factory = _InterpreterWlst
+        return
+
+    def discover(self, model):
+        """
+        Discover the model sections, using the additional connections for the MBean instances.
+        :param model: the model to populate
+        :raises DiscoverException: if an error occurs while discovering the domain
+        """
+        _method_name = 'discover'
+        _logger.entering(self._connection_count, class_name=_class_name, method_name=_method_name)
+
+        # the instances skipped by the current filter, if any, are not split between the connections
+        outer_filter = discoverer.get_discover_filter()
+        units = discover_units.find_units(self._model_context, self._base_location, self._aliases, WlstModes.ONLINE)
+        assignments = list()
+        for index in range(self._connection_count):
+            assignments.append(list())
+        for index in range(len(units)):
+            assignments[index % self._connection_count].append(units[index])
+
+        # the first share of the instances stays on the main connection
+        workers = list()
+        worker_units = list()
+        for index in range(1, self._connection_count):
+            if len(assignments[index]) > 0:
+                workers.append(_DiscoverWorker(index, self._model_context, self._base_location,
+                                               assignments[index], outer_filter, self._discover_function,
+                                               self._wlst_factory))
+                worker_units.extend(assignments[index])
+
+        if len(workers) == 0:
+            self._discover_function(model, self._model_context, self._base_location, self._aliases)
+            _logger.exiting(class_name=_class_name, method_name=_method_name)
+            return
+
+        _logger.info('WLSDPLY-06800', len(workers) + 1, len(units), class_name=_class_name,
+                     method_name=_method_name)
+        archive_file = self._model_context.get_archive_file()
+        self._model_context.set_archive_file(_SynchronizedArchive(archive_file))
+        try:
+            for worker in workers:
+                worker.start()
+
+            discoverer.set_discover_filter(discover_units.combine_filters(outer_filter,
+                                                                          UnitFilter(worker_units, False)))
+            try:
+                self._discover_function(model, self._model_context, self._base_location, self._aliases)
+            finally:
+                discoverer.set_discover_filter(outer_filter)
+                for worker in workers:
+                    worker.join()
+
+            for worker in workers:
+                if worker.get_error() is None:
+                    discover_units.merge_units(model, worker.get_model(), worker.get_units())
+                else:
+                    # discover the instances of the failed worker on the main connection
+                    _logger.warning('WLSDPLY-06801', worker.get_index(), len(worker.get_units()),
+                                    _get_error_message(worker.get_error()),
+                                    class_name=_class_name, method_name=_method_name)
+                    discover_units.merge_units(model, self.__discover_units(worker.get_units(), outer_filter),
+                                               worker.get_units())
+        finally:
+            self._model_context.set_archive_file(archive_file)
+
+        _logger.info('WLSDPLY-06802', len(worker_units), class_name=_class_name, method_name=_method_name)
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return
+
+    def __discover_units(self, units, outer_filter):
+        """
+        Discover only the specified instances on the main connection.
+        :param units: the units to discover
+        :param outer_filter: the discover filter to restore afterwards
+        :return: the model containing the discovered units
+        """
+        model = Model()
+        discoverer.set_discover_filter(discover_units.combine_filters(outer_filter, UnitFilter(units, True)))
+        try:
+            self._discover_function(model, self._model_context, self._base_location, self._aliases)
+        finally:
+            discoverer.set_discover_filter(outer_filter)
+        return model
+
+
+class _DiscoverWorker(threading.Thread):
+    """
+    A thread that opens its own connection to the admin server and discovers the assigned instances.
+    """
+
+    def __init__(self, index, model_context, base_location, units, outer_filter, discover_function, wlst_factory):
+        threading.Thread.__init__(self, name='wdt-discover-%s' % index)
+        self._index = index
+        self._model_context = model_context
+        self._base_location = base_location
+        self._units = units
+        # the filter of the main thread also limits what is discovered below the assigned units
+        self._outer_filter = outer_filter
+        self._discover_function = discover_function
+        self._wlst_factory = wlst_factory
+        self._model = Model()
+        self._error = None
+        return
+
+    def get_index(self):
+        return self._index
+
+    def get_units(self):
+        return self._units
+
+    def get_model(self):
+        return self._model
+
+    def get_error(self):
+        return self._error
+
+    def run(self):
+        _method_name = 'run'
+        try:
+            wlst_helper.set_thread_wlst(self._wlst_factory())
+            try:
+                wlst_helper.connect(self._model_context.get_admin_user(), self._model_context.get_admin_password(),
+                                    self._model_context.get_admin_url())
+                _logger.info('WLSDPLY-06803', self._index, self._model_context.get_admin_url(), len(self._units),
+                             class_name=_class_name, method_name=_method_name)
+                try:
+                    aliases = Aliases(self._model_context, wlst_mode=WlstModes.ONLINE)
+                    discoverer.set_discover_filter(discover_units.combine_filters(self._outer_filter,
+                                                                                  UnitFilter(self._units, True)))
+                    wlst_helper.start_session_cache()
+                    self._discover_function(self._model, self._model_context, self._base_location, aliases)
+                finally:
+                    # the last folder of the worker is added to the timing report of the run
+                    discover_timer.end_folder()
+                    wlst_helper.end_session_cache()
+                    discoverer.set_discover_filter(None)
+                    wlst_helper.disconnect()
+            finally:
+                wlst_helper.set_thread_wlst(None)
+        except Throwable, t:
+            self._error = t
+        except Exception, e:
+            self._error = e
+        return
+
+
+class _InterpreterWlst(object):
+    """
+    The WLST functions and variables of a separate WLST interpreter, which has its own connection.
+    """
+
+    def __init__(self):
+        from weblogic.management.scripting.utils import WLSTInterpreter
+        self._interpreter = WLSTInterpreter()
+        return
+
+    def __getattr__(self, name):
+        value = self._interpreter.get(name)
+        if value is None:
+            raise AttributeError(name)
+        return value
+
+
+class _SynchronizedArchive(object):
+    """
+    Serialize the calls to the archive file, which is not thread-safe, while it is shared by the workers.
+    """
+
+    def __init__(self, archive_file):
+        self._archive_file = archive_file
+        self._lock = threading.RLock()
+        return
+
+    def __getattr__(self, name):
+        attribute = getattr(self._archive_file, name)
+        if not callable(attribute):
+            return attribute
+
+        lock = self._lock
+
+        def _synchronized_call(*args, **kwargs):
+            lock.acquire()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                lock.release()
+        return _synchronized_call
+
+
+def _get_error_message(error):
+    if isinstance(error, Throwable):
+        return error.getLocalizedMessage()
+    return str(error)
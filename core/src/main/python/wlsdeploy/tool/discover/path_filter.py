@@ -0,0 +1,229 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+The discover filter that limits the discovery to the model paths given with the -discover_paths argument.
+"""
+import fnmatch
+
+from oracle.weblogic.deploy.discover import DiscoverException
+
+from wlsdeploy.aliases import model_constants
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.exception.expection_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.util.alias_helper import AliasHelper
+
+_class_name = 'PathFilter'
+_logger = PlatformLogger(discoverer.get_discover_logger_name())
+
+# indexes into the path steps
+FOLDER = 0
+NAME_TOKEN = 1
+NAME_PATTERN = 2
+
+
+class PathFilter(object):
+    """
+    The discover filter that only discovers the model paths, the folders and names that lead to them, and
+    everything below them.  A path is a model section followed by folder names, and by the instance name after
+    each folder that can have more than one instance.  The instance names can be fnmatch patterns, for example
+    topology:/Server/ms* or resources:/JDBCSystemResource.  The paths are resolved against the aliases once, so that
+    matching a location does not call the aliases.
+    """
+
+    def __init__(self, model_paths, base_location, aliases):
+        """
+        Create the filter.
+        :param model_paths: the list of model paths
+        :param base_location: the domain location, with the domain name token
+        :param aliases: the aliases
+        :raises DiscoverException: if a path does not match the model folders of its section
+        """
+        self._alias_helper = AliasHelper(aliases, _logger, ExceptionType.DISCOVER)
+        self._section_folders = dict()
+        self._section_folders[model_constants.TOPOLOGY] = aliases.get_model_topology_top_level_folder_names()
+        self._section_folders[model_constants.RESOURCES] = aliases.get_model_resources_top_level_folder_names()
+        self._section_folders[model_constants.APP_DEPLOYMENTS] = \
+            aliases.get_model_app_deployments_top_level_folder_names()
+
+        # the sections that are discovered whole, and the (folder, name token, name pattern) steps of the other paths
+        self._whole_sections = list()
+        self._sections = list()
+        self._paths = list()
+        for model_path in model_paths:
+            section, steps = self.__resolve_path(model_path, base_location)
+            if section not in self._sections:
+                self._sections.append(section)
+            if len(steps) == 0:
+                self._whole_sections.append(section)
+            else:
+                self._paths.append(steps)
+        return
+
+    def includes_section(self, section):
+        """
+        Does the filter discover any part of the model section?
+        :param section: the model section name, such as domainInfo
+        :return: True if a path is in the section
+        """
+        return section in self._sections
+
+    def includes_location(self, location):
+        """
+        Should the location be discovered?  A location is discovered if it is on the way to a path or below a path.
+        The domain location holds the domain attributes, which are discovered with the whole topology section.
+        :param location: the location
+        :return: True if the location should be discovered, False otherwise
+        """
+        folders = location.get_model_folders()
+        if len(folders) == 0:
+            return model_constants.TOPOLOGY in self._whole_sections
+
+        for section in self._whole_sections:
+            if section in self._section_folders and folders[0] in self._section_folders[section]:
+                return True
+        for steps in self._paths:
+            if _matches(steps, location, folders):
+                return True
+        return False
+
+    def filter_names(self, location, names):
+        """
+        Remove the instance names that do not match the name patterns of the paths.
+        :param location: the location of the names
+        :param names: the names found at the location
+        :return: the names to discover
+        """
+        folders = location.get_model_folders()
+        if names is None or len(folders) == 0:
+            return names
+        for section in self._whole_sections:
+            if section in self._section_folders and folders[0] in self._section_folders[section]:
+                return names
+
+        patterns = list()
+        depth = len(folders) - 1
+        for steps in self._paths:
+            if _matches(steps, location, folders):
+                if len(steps) <= depth or steps[depth][NAME_PATTERN] is None:
+                    return names
+                patterns.append(steps[depth][NAME_PATTERN])
+
+        result = list()
+        for name in names:
+            for pattern in patterns:
+                if fnmatch.fnmatchcase(name, pattern):
+                    result.append(name)
+                    break
+        return result
+
+    def __resolve_path(self, model_path, base_location):
+        """
+        Split the model path into the section and the steps of the path.  The segment after a folder that can have
+        more than one instance is the name pattern of the folder.  The segments below an artificial type folder,
+        such as a security provider type, are not resolved, so everything below the folder is discovered.
+        :param model_path: the model path
+        :param base_location: the domain location
+        :return: the section name and the list of (folder, name token, name pattern) steps
+        :raises DiscoverException: if the path does not match the model folders of its section
+        """
+        _method_name = '__resolve_path'
+        section, segments = split_model_path(model_path)
+        steps = list()
+        if len(segments) == 0 or section == model_constants.DOMAIN_INFO:
+            # the domainInfo section is not discovered from MBean folders, so it is always discovered whole
+            return section, steps
+
+        if section not in self._section_folders or segments[0] not in self._section_folders[section]:
+            ex = exception_helper.create_discover_exception('WLSDPLY-06940', model_path, segments[0], section)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        location = LocationContext(base_location)
+        index = 0
+        while index < len(segments):
+            folder = segments[index]
+            if len(location.get_model_folders()) > 0 and folder not in self.__get_subfolder_names(model_path, location):
+                ex = exception_helper.create_discover_exception('WLSDPLY-06941', model_path, folder,
+                                                                '/'.join(location.get_model_folders()))
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+
+            location.append_location(folder)
+            try:
+                name_token = self._alias_helper.get_name_token(location)
+                name_pattern = None
+                if self._alias_helper.supports_multiple_mbean_instances(location) and index + 1 < len(segments):
+                    index += 1
+                    name_pattern = segments[index]
+                artificial_type = self._alias_helper.requires_artificial_type_subfolder_handling(location)
+            except DiscoverException, de:
+                ex = exception_helper.create_discover_exception('WLSDPLY-06942', model_path,
+                                                                de.getLocalizedMessage(), error=de)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+
+            steps.append((folder, name_token, name_pattern))
+            if artificial_type:
+                break
+            if name_token is not None:
+                # the aliases only need a name to resolve the subfolders, the pattern is not matched here
+                location.add_name_token(name_token, name_pattern or folder)
+            index += 1
+
+        _logger.fine('WLSDPLY-06943', model_path, len(steps), class_name=_class_name, method_name=_method_name)
+        return section, steps
+
+    def __get_subfolder_names(self, model_path, location):
+        """
+        Get the model subfolder names of the location.
+        :param model_path: the model path being resolved, for the error message
+        :param location: the location
+        :return: the list of model subfolder names
+        :raises DiscoverException: if the aliases cannot resolve the location
+        """
+        _method_name = '__get_subfolder_names'
+        try:
+            return self._alias_helper.get_model_subfolder_names(location)
+        except DiscoverException, de:
+            ex = exception_helper.create_discover_exception('WLSDPLY-06942', model_path,
+                                                            de.getLocalizedMessage(), error=de)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+
+def split_model_path(model_path):
+    """
+    Split a model path such as topology:/Server/ms1 into the section name and the path segments.
+    :param model_path: the model path
+    :return: the section name and the list of segments
+    """
+    section, path = model_path.split(':', 1)
+    segments = list()
+    for segment in path.split('/'):
+        if len(segment) > 0:
+            segments.append(segment)
+    return section, segments
+
+
+def _matches(steps, location, folders):
+    """
+    Is the location on the way to the path of the steps, or below it?
+    :param steps: the steps of the path
+    :param location: the location
+    :param folders: the model folders of the location
+    :return: True if the location and the path agree on each folder and name they both have
+    """
+    depth = min(len(steps), len(folders))
+    for index in range(depth):
+        folder, name_token, name_pattern = steps[index]
+        if folders[index] != folder:
+            return False
+        if name_pattern is not None:
+            name = location.get_name_for_token(name_token)
+            if name is not None and not fnmatch.fnmatchcase(name, name_pattern):
+                return False
+    return True
@@ -572,6 +572,46 @@ class AliasHelper(object):
         """
         return self.__aliases.get_model_app_deployments_top_level_folder_names()
 
+    def get_model_attribute_profile(self, location):
+        """
+        Get the classification of all the model attributes at the location.
+        :param location: the location
+        :return: the shared AttributeProfile for the location's folder
+        :raises: BundleAwareException of the specified type: if an error occurs
+        """
+        _method_name = 'get_model_attribute_profile'
+
+        try:
+            result = self.__aliases.get_model_attribute_profile(location)
+        except AliasException, ae:
+            ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19037',
+                                                   location.get_folder_path(), ae.getLocalizedMessage(), error=ae)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
+        return result
+
+    def attribute_values_are_equal(self, location, model_attribute_name, model_attribute_value, wlst_attribute_value):
+        """
+        Are the model value and the current WLST value of the attribute equal, so that setting it would not change it?
+        :param location: the location
+        :param model_attribute_name: the model attribute name
+        :param model_attribute_value: the model attribute value
+        :param wlst_attribute_value: the current WLST value
+        :return: True if the values are equal
+        :raises: BundleAwareException of the specified type: if an error occurs
+        """
+        _method_name = 'attribute_values_are_equal'
+
+        try:
+            result = self.__aliases.attribute_values_are_equal(location, model_attribute_name, model_attribute_value,
+                                                               wlst_attribute_value)
+        except AliasException, ae:
+            ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19038', model_attribute_name,
+                                                   location.get_folder_path(), ae.getLocalizedMessage(), error=ae)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
+        return result
+
     def get_model_attribute_names(self, location):
         """
         Get the model attribute names.
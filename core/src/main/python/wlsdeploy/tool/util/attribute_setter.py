@@ -6,12 +6,19 @@ from sets import Set
 
 from org.python.modules import jarray
 
+from java.lang import Boolean
 from java.util import List
 
 from javax.management import ObjectName
 
 from oracle.weblogic.deploy.aliases import TypeUtils
+from oracle.weblogic.deploy.encrypt import EncryptionUtils
 
+from wlsdeploy.aliases import alias_utils
+from wlsdeploy.aliases.alias_constants import BOOLEAN
+from wlsdeploy.aliases.alias_constants import DOUBLE
+from wlsdeploy.aliases.alias_constants import INTEGER
+from wlsdeploy.aliases.alias_constants import STRING
 from wlsdeploy.aliases.location_context import LocationContext
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
@@ -605,7 +612,10 @@ class AttributeSetter(object):
             self.__logger.info('WLSDPLY-20012', model_key, str(model_value),
                                class_name=self._class_name, method_name=_method_name)
         else:
-            self.__wlst_helper.set(wlst_param, wlst_value)
+            batch_value = None
+            if self.__wlst_helper.is_set_batch_started():
+                batch_value = self.__get_batch_value(location, model_key, wlst_value)
+            self.__wlst_helper.set(wlst_param, wlst_value, model_name=model_key, batch_value=batch_value)
         return
 
     def set_attribute_with_cmo(self, location, key, value, wlst_value=None, masked=False):
@@ -624,13 +634,52 @@ class AttributeSetter(object):
         else:
             attrib_path = self.__alias_helper.get_wlst_attributes_path(location)
             self.__wlst_helper.cd(attrib_path)
-            self.__wlst_helper.set_with_cmo(wlst_attr_name, wlst_attr_value, masked=masked)
+            batch_value = None
+            if self.__wlst_helper.is_set_batch_started() and not masked:
+                batch_value = self.__get_batch_value(location, key, wlst_attr_value)
+            self.__wlst_helper.set_with_cmo(wlst_attr_name, wlst_attr_value, masked=masked, model_name=key,
+                                            batch_value=batch_value)
         return
 
     #
     # internal lookup methods
     #
 
+    def __get_batch_value(self, location, model_key, wlst_value):
+        """
+        Get the value to use for a set that is collected into a batch and applied with setAttributes().
+        WLST converts the values to the attribute type and decrypts the passwords, but setAttributes() does not,
+        so only the string, integer, double and boolean values that need no conversion are collected, and the
+        string values of boolean attributes are converted here.  The other sets are applied one at a time.
+        :param location: the location
+        :param model_key: the model attribute name
+        :param wlst_value: the WLST value
+        :return: the value for setAttributes(), or None if the set cannot be collected
+        """
+        attribute_profile = self.__alias_helper.get_model_attribute_profile(location)
+        if model_key not in attribute_profile.attribute_types or \
+                model_key in attribute_profile.password_attribute_names or \
+                model_key in attribute_profile.mbean_set_method_attributes:
+            return None
+
+        attribute_type = attribute_profile.attribute_types[model_key]
+        value_type = type(wlst_value)
+        if attribute_type == BOOLEAN:
+            if value_type is str:
+                return Boolean(alias_utils.convert_boolean(wlst_value))
+            if isinstance(wlst_value, Boolean):
+                return wlst_value
+        elif attribute_type == STRING:
+            if value_type is str and not EncryptionUtils.isEncryptedString(wlst_value):
+                return wlst_value
+        elif attribute_type == INTEGER:
+            if value_type is int:
+                return wlst_value
+        elif attribute_type == DOUBLE:
+            if value_type is float:
+                return wlst_value
+        return None
+
     def __build_target_mbean_list(self, target_value, wlst_value, location, include_jms=False):
         """
         Construct the target MBean list.
@@ -2,12 +2,17 @@
 Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
+from java.lang import ThreadLocal
 from oracle.weblogic.deploy.util import PyWLSTException
 
 from wlsdeploy.exception import exception_helper
+from wlsdeploy.util import mbean_attributes
 from wlsdeploy.util import wlst_extended
 from wlsdeploy.util import wlst_helper
 
+# the online sets collected for the current MBean of each thread, if the thread started a batch
+_set_batch = ThreadLocal()
+
 
 class WlstHelper(object):
     """
@@ -98,17 +103,24 @@ class WlstHelper(object):
             raise ex
         return result
 
-    def set(self, attribute_name, attribute_value, masked=False):
+    def set(self, attribute_name, attribute_value, masked=False, model_name=None, batch_value=None):
         """
         Set the configuration for the indicated attribute to the provided value.
+        If a set batch was started and a batch value is provided, an online set is collected and applied later
+        with the other sets of the MBean.  Otherwise, the sets collected so far are applied before this one.
 
         :param attribute_name: attribute name at the current location
         :param attribute_value: to configure the attribute
         :param masked: whether the attribute value should be masked from the log file, default is False
+        :param model_name: the model attribute name, used to report an error in a batched set
+        :param batch_value: the value for setAttributes(), if the set can be collected into a batch
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'set'
 
+        if self.__add_to_set_batch(attribute_name, attribute_value, batch_value, masked, model_name, False):
+            return
+
         try:
             wlst_helper.set(attribute_name, attribute_value)
         except PyWLSTException, pwe:
@@ -121,16 +133,23 @@ class WlstHelper(object):
             raise ex
         return
 
-    def set_with_cmo(self, attribute_name, attribute_value, masked=False):
+    def set_with_cmo(self, attribute_name, attribute_value, masked=False, model_name=None, batch_value=None):
         """
         Set the specified attribute using the corresponding cmo set method (e.g., cmo.setListenPort()).
+        If a set batch was started and a batch value is provided, an online set is collected and applied later
+        with the other sets of the MBean.  Otherwise, the sets collected so far are applied before this one.
         :param attribute_name: the WLST attribute name
         :param attribute_value: the WLST value
         :param masked: whether or not to mask the attribute_value from the log files.
+        :param model_name: the model attribute name, used to report an error in a batched set
+        :param batch_value: the value for setAttributes(), if the set can be collected into a batch
         :raises: BundleAwareException of the specified type: if an error occurs
         """
         _method_name = 'set_with_cmo'
 
+        if self.__add_to_set_batch(attribute_name, attribute_value, batch_value, masked, model_name, True):
+            return
+
         try:
             wlst_helper.set_with_cmo(attribute_name, attribute_value, masked=masked)
         except PyWLSTException, pwe:
@@ -143,6 +162,44 @@ class WlstHelper(object):
             raise ex
         return
 
+    def log_cd_counts(self):
+        """
+        Log the number of cd calls that were skipped or made as shorter relative moves in this run.
+        """
+        wlst_helper.log_cd_counts()
+        return
+
+    def start_set_batch(self):
+        """
+        Start collecting the online sets of the current thread, so that the sets of each MBean are applied together
+        with a single setAttributes() call, instead of one remote call for each attribute.  The sets of an MBean are
+        applied when a set for another MBean is collected, before a set that cannot be collected, and when the batch
+        is ended.  Offline sets are local calls, so they are still applied immediately.
+        :return: True if a batch was started, False if the thread had already started a batch
+        """
+        if _set_batch.get() is not None:
+            return False
+        _set_batch.set(_SetBatch())
+        return True
+
+    def end_set_batch(self):
+        """
+        Apply the sets that were not flushed, and end the batch of the current thread.
+        :raises: BundleAwareException of the specified type: if a set fails, naming its model attribute
+        """
+        batch = _set_batch.get()
+        _set_batch.set(None)
+        if batch is not None:
+            self.__flush_set_batch(batch)
+        return
+
+    def is_set_batch_started(self):
+        """
+        Are the online sets of the current thread being collected into a batch?
+        :return: True if a batch was started and the tool is online
+        """
+        return _set_batch.get() is not None and wlst_helper.is_connected()
+
     def create(self, wlst_name, wlst_type, base_provider_type=None):
         """
         Create the mbean folder with the provided name at the current location.
@@ -902,3 +959,115 @@ class WlstHelper(object):
             self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
             raise ex
         return
+
+    def __add_to_set_batch(self, attribute_name, attribute_value, batch_value, masked, model_name, use_cmo):
+        """
+        Add the set to the batch of the current thread, if the thread started a batch and the tool is online.
+        The sets collected for the previous MBean are applied first, if the set is for another MBean or if it
+        cannot be collected, so that the sets are applied in order.
+        :param attribute_name: the WLST attribute name
+        :param attribute_value: the WLST value
+        :param batch_value: the value for setAttributes(), or None if the set cannot be collected
+        :param masked: whether the value should be masked from the log file
+        :param model_name: the model attribute name
+        :param use_cmo: True if the set is made with the cmo set method when it is applied one at a time
+        :return: True if the set was added to the batch, False if it should be applied now
+        :raises: BundleAwareException of the specified type: if the collected sets fail
+        """
+        batch = _set_batch.get()
+        if batch is None or not wlst_helper.is_connected():
+            return False
+
+        if batch_value is None or masked:
+            self.__flush_set_batch(batch)
+            return False
+
+        path = self.get_pwd()
+        if path != batch.path:
+            self.__flush_set_batch(batch)
+            batch.path = path
+            batch.object_name = mbean_attributes.get_object_name()
+
+        if batch.object_name is None:
+            return False
+        batch.sets.append(_BatchedSet(attribute_name, attribute_value, batch_value, masked, model_name, use_cmo))
+        return True
+
+    def __flush_set_batch(self, batch):
+        """
+        Apply the sets collected for the current MBean of the batch with a single setAttributes() call.
+        The sets that were not applied are made again one at a time, to report the error for the model attribute.
+        :param batch: the batch
+        :raises: BundleAwareException of the specified type: if a set fails
+        """
+        _method_name = '__flush_set_batch'
+
+        sets = batch.sets
+        path = batch.path
+        object_name = batch.object_name
+        batch.sets = list()
+        if len(sets) == 0:
+            return
+
+        attributes = list()
+        for batched_set in sets:
+            attributes.append((batched_set.attribute_name, batched_set.batch_value))
+        connection = wlst_helper.get_mbean_server_connection()
+        failed_names = mbean_attributes.write_attributes(connection, object_name, attributes)
+        self.__logger.finer('WLSDPLY-19146', len(sets) - len(failed_names), path, len(failed_names),
+                            class_name=self.__class_name, method_name=_method_name)
+        if len(failed_names) == 0:
+            return
+
+        current_path = self.get_pwd()
+        self.cd(path)
+        for batched_set in sets:
+            if batched_set.attribute_name in failed_names:
+                try:
+                    # the set is made again the way it was requested
+                    if batched_set.use_cmo:
+                        wlst_helper.set_with_cmo(batched_set.attribute_name, batched_set.attribute_value,
+                                                 masked=batched_set.masked)
+                    else:
+                        wlst_helper.set(batched_set.attribute_name, batched_set.attribute_value)
+                except PyWLSTException, pwe:
+                    log_value = batched_set.attribute_value
+                    if batched_set.masked:
+                        log_value = '<masked>'
+                    model_name = batched_set.model_name
+                    if model_name is None:
+                        model_name = batched_set.attribute_name
+                    ex = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-19147', model_name,
+                                                           batched_set.attribute_name, log_value, path,
+                                                           pwe.getLocalizedMessage(), error=pwe)
+                    self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+                    raise ex
+        self.cd(current_path)
+        return
+
+
+class _SetBatch(object):
+    """
+    The online sets collected for the current MBean, and the WLST path and ObjectName of the MBean.
+    """
+
+    def __init__(self):
+        self.path = None
+        self.object_name = None
+        self.sets = list()
+        return
+
+
+class _BatchedSet(object):
+    """
+    A set collected into a batch, with the value for setAttributes() and the way to make it one at a time.
+    """
+
+    def __init__(self, attribute_name, attribute_value, batch_value, masked, model_name, use_cmo):
+        self.attribute_name = attribute_name
+        self.attribute_value = attribute_value
+        self.batch_value = batch_value
+        self.masked = masked
+        self.model_name = model_name
+        self.use_cmo = use_cmo
+        return
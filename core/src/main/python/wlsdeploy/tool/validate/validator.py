@@ -70,18 +70,25 @@ class Validator(object):
             # WebLogic version is always the current version used to run WLST.
             self._wlst_mode = wlst_mode
             self._wls_version = self._wls_helper.get_actual_weblogic_version()
+            self._wls_versions = [self._wls_version]
         else:
             # In STANDALONE mode, the user can specify the target WLST mode and the target
             # WLS version using command-line args so get the value from the model_context.
             self._wlst_mode = model_context.get_target_wlst_mode()
             self._wls_version = model_context.get_target_wls_version()
+            self._wls_versions = model_context.get_target_wls_versions()
 
         if aliases is None:
-            self._aliases = Aliases(model_context=model_context)
+            self._aliases = Aliases(model_context=model_context, wlst_mode=self._wlst_mode,
+                                    wls_version=self._wls_version)
         else:
             self._aliases = aliases
         self._alias_helper = AliasHelper(self._aliases, self._logger, ExceptionType.VALIDATE)
 
+        # The first target version is validated with the aliases above.  Any additional target version is
+        # validated in the same way with the aliases of that version, and gets a validation result of its own.
+        self._other_wls_versions = list(self._wls_versions[1:])
+
         self._name_tokens_location = LocationContext()
         self._name_tokens_location.add_name_token('DOMAIN', domain_name)
 
@@ -219,6 +226,10 @@ class Validator(object):
         self._logger.info('WLSDPLY-05002', _ValidationModes.from_value(self._validation_mode), self._wls_version,
                           WlstModes.from_value(self._wlst_mode), class_name=_class_name, method_name=_method_name)
 
+        if len(self._other_wls_versions) > 0:
+            self._logger.info('WLSDPLY-05039', ', '.join(self._other_wls_versions),
+                              class_name=_class_name, method_name=_method_name)
+
         if self._model_file_name is not None:
             self._logger.info('WLSDPLY-05003', self._model_file_name, class_name=_class_name, method_name=_method_name)
 
@@ -276,9 +287,43 @@ class Validator(object):
                                           validation_result)
         self._validation_results.set_validation_result(validation_result)
 
+        self.__validate_other_versions(model_dict)
+
         self._logger.exiting(class_name=_class_name, method_name=_method_name)
         return
 
+    def __validate_other_versions(self, model_dict):
+        """
+        Validate the model sections for each additional target version, with the aliases of that version and the
+        same rules as the first version, so the problems of a version do not depend on the order of the versions.
+        The problems of each version are gathered in a validation result of its own.
+        :param model_dict: A Python dictionary of the model to be validated
+        """
+        primary_aliases = self._aliases
+        primary_alias_helper = self._alias_helper
+        try:
+            for other_version in self._other_wls_versions:
+                self._aliases = Aliases(model_context=self._model_context, wlst_mode=self._wlst_mode,
+                                        wls_version=other_version)
+                self._alias_helper = AliasHelper(self._aliases, self._logger, ExceptionType.VALIDATE)
+
+                validation_result = ValidationResult(validation_utils.format_message('WLSDPLY-05038', other_version))
+                self.__validate_domain_info_section(model.get_model_domain_info_key(), model_dict, validation_result)
+                self.__validate_model_section(model.get_model_topology_key(), model_dict,
+                                              self._aliases.get_model_topology_top_level_folder_names(),
+                                              validation_result)
+                self.__validate_model_section(model.get_model_resources_key(), model_dict,
+                                              self._aliases.get_model_resources_top_level_folder_names(),
+                                              validation_result)
+                self.__validate_model_section(model.get_model_deployments_key(), model_dict,
+                                              self._aliases.get_model_app_deployments_top_level_folder_names(),
+                                              validation_result)
+                self._validation_results.set_validation_result(validation_result)
+        finally:
+            self._aliases = primary_aliases
+            self._alias_helper = primary_alias_helper
+        return
+
     def __pre_validation_setup(self, model_dict, archive_file_name):
         """
         Performs pre-validation setup activities. These include things like:
@@ -452,11 +497,12 @@ class Validator(object):
             self._logger.finer('WLSDPLY-05011', section_dict_key, section_dict_value,
                                class_name=_class_name, method_name=_method_name)
 
-            valid_attr_infos = self._alias_helper.get_model_attribute_names_and_types(validation_location)
+            attribute_profile = self._alias_helper.get_model_attribute_profile(validation_location)
+            valid_attr_infos = attribute_profile.attribute_types
             self._logger.finer('WLSDPLY-05012', str(validation_location), str(valid_attr_infos),
                                class_name=_class_name, method_name=_method_name)
 
-            path_tokens_attr_keys = self._alias_helper.get_model_uses_path_tokens_attribute_names(validation_location)
+            path_tokens_attr_keys = attribute_profile.uses_path_tokens_attribute_names
             self._logger.finer('WLSDPLY-05013', str(validation_location), str(path_tokens_attr_keys),
                                class_name=_class_name, method_name=_method_name)
 
@@ -610,7 +656,8 @@ class Validator(object):
         _method_name = '__process_model_node'
 
         valid_folder_keys = self._alias_helper.get_model_subfolder_names(validation_location)
-        valid_attr_infos = self._alias_helper.get_model_attribute_names_and_types(validation_location)
+        attribute_profile = self._alias_helper.get_model_attribute_profile(validation_location)
+        valid_attr_infos = attribute_profile.attribute_types
         model_folder_path = self._alias_helper.get_model_folder_path(validation_location)
 
         self._logger.finest('5 model_node={0}', str(model_node), class_name=_class_name, method_name=_method_name)
@@ -641,7 +688,7 @@ class Validator(object):
                     # key is an ARTIFICIAL_TYPE folder
                     self._logger.finest('6 is_artificial_type_folder=True',
                                         class_name=_class_name, method_name=_method_name)
-                    valid_attr_infos = self._alias_helper.get_model_attribute_names_and_types(new_location)
+                    valid_attr_infos = self._alias_helper.get_model_attribute_profile(new_location).attribute_types
 
                     validation_result = self.__validate_attributes(value, valid_attr_infos,
                                                                    new_location, validation_result)
@@ -660,8 +707,7 @@ class Validator(object):
                                                                    validation_result)
 
                 else:
-                    path_tokens_attr_keys = \
-                        self._alias_helper.get_model_uses_path_tokens_attribute_names(validation_location)
+                    path_tokens_attr_keys = attribute_profile.uses_path_tokens_attribute_names
 
                     validation_result = self.__validate_attribute(key,
                                                                   value,
@@ -719,7 +765,8 @@ class Validator(object):
         self._logger.finest('attributes_dict={0}', str(attributes_dict),
                             class_name=_class_name, method_name=_method_name)
 
-        path_tokens_attr_keys = self._alias_helper.get_model_uses_path_tokens_attribute_names(validation_location)
+        path_tokens_attr_keys = \
+            self._alias_helper.get_model_attribute_profile(validation_location).uses_path_tokens_attribute_names
         self._logger.finer('WLSDPLY-05013', str(validation_location), str(path_tokens_attr_keys),
                            class_name=_class_name, method_name=_method_name)
 
@@ -1,10 +1,11 @@
 """
-Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 
 Module that handles command-line argument parsing and common validation.
 """
 import os
+import re
 import java.io.File as JFile
 import java.lang.IllegalArgumentException as JIllegalArgumentException
 import java.net.URI as JURI
@@ -20,6 +21,9 @@ from wlsdeploy.util.weblogic_helper import WebLogicHelper
 from wlsdeploy.aliases.model_constants import KNOWN_TOPLEVEL_MODEL_SECTIONS
 from wlsdeploy.tool.validate.usage_printer import MODEL_PATH_PATTERN
 
+# a model path whose instance names can be fnmatch patterns, such as topology:/Server/ms*
+DISCOVER_PATH_PATTERN = re.compile(r'^([a-zA-Z]+):((/[^/]+)*)/?$')
+
 
 class CommandLineArgUtil(object):
     """
@@ -62,6 +66,11 @@ class CommandLineArgUtil(object):
     ATTRIBUTES_ONLY_SWITCH     = '-attributes_only'
     FOLDERS_ONLY_SWITCH        = '-folders_only'
     RECURSIVE_SWITCH           = '-recursive'
+    DISCOVER_CONNECTIONS_SWITCH = '-discover_connections'
+    USE_CONFIG_XML_SWITCH      = '-use_config_xml'
+    PREVIOUS_DISCOVERY_SWITCH  = '-previous_discovery'
+    DISCOVER_PATHS_SWITCH      = '-discover_paths'
+    TIMING_REPORT_FILE_SWITCH  = '-timing_report_file'
     # overrides for the variable injector
     VARIABLE_INJECTOR_FILE_SWITCH   = '-variable_injector_file'
     VARIABLE_KEYWORDS_FILE_SWITCH   = '-variable_keywords_file'
@@ -315,6 +324,8 @@ class CommandLineArgUtil(object):
                     raise ex
             elif self.is_use_encryption_switch(key):
                 self._add_arg(key, True)
+            elif self.is_use_config_xml_switch(key):
+                self._add_arg(key, True)
             elif self.is_run_rcu_switch(key):
                 self._add_arg(key, True)
             elif self.is_target_version_switch(key):
@@ -335,6 +346,42 @@ class CommandLineArgUtil(object):
                     ex = self._get_out_of_args_exception(key)
                     self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
                     raise ex
+            elif self.is_discover_connections_switch(key):
+                idx += 1
+                if idx < args_len:
+                    self._validate_discover_connections_arg(args[idx])
+                    self._add_arg(key, args[idx])
+                else:
+                    ex = self._get_out_of_args_exception(key)
+                    self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+                    raise ex
+            elif self.is_previous_discovery_key(key):
+                idx += 1
+                if idx < args_len:
+                    full_path = self._validate_previous_discovery_arg(args[idx])
+                    self._add_arg(key, full_path, True)
+                else:
+                    ex = self._get_out_of_args_exception(key)
+                    self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+                    raise ex
+            elif self.is_discover_paths_key(key):
+                idx += 1
+                if idx < args_len:
+                    self._validate_discover_paths_arg(args[idx])
+                    self._add_arg(key, args[idx])
+                else:
+                    ex = self._get_out_of_args_exception(key)
+                    self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+                    raise ex
+            elif self.is_timing_report_file_key(key):
+                idx += 1
+                if idx < args_len:
+                    full_path = self._validate_timing_report_file_arg(args[idx])
+                    self._add_arg(key, full_path, True)
+                else:
+                    ex = self._get_out_of_args_exception(key)
+                    self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+                    raise ex
             elif self.is_attributes_only_switch(key):
                 self._add_arg(key, True)
             elif self.is_folders_only_switch(key):
@@ -375,6 +422,7 @@ class CommandLineArgUtil(object):
                 raise ex
             idx += 1
 
+        self._validate_offline_only_args()
         print_result = {'required': self._required_result, 'optional': self._optional_result}
         self._logger.exiting(class_name=self._class_name, method_name=method_name, result=print_result)
         return self._required_result, self._optional_result
@@ -851,6 +899,21 @@ class CommandLineArgUtil(object):
     def _validate_target_version_arg(self, value):
         method_name = '_validate_target_version_arg'
 
+        # The value may be a comma-separated list of versions, to validate the model for several versions at once.
+        #
+        if value is None or len(value) == 0:
+            ex = exception_helper.create_cla_exception('WLSDPLY-01627')
+            ex.setExitCode(self.ARG_VALIDATION_ERROR_EXIT_CODE)
+            self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+
+        for version in value.split(','):
+            self._validate_single_target_version_arg(version.strip())
+        return
+
+    def _validate_single_target_version_arg(self, value):
+        method_name = '_validate_single_target_version_arg'
+
         # Try our best to determine if this is a legitimate WLS version number.
         # At the end of the day, the user can still enter a non-existent version number
         # like 845.283.412 and this code will not invalidate it because we cannot
@@ -881,6 +944,128 @@ class CommandLineArgUtil(object):
     def is_target_mode_switch(self, key):
         return self.TARGET_MODE_SWITCH == key
 
+    def get_discover_connections_switch(self):
+        return self.DISCOVER_CONNECTIONS_SWITCH
+
+    def is_discover_connections_switch(self, key):
+        return self.DISCOVER_CONNECTIONS_SWITCH == key
+
+    def _validate_discover_connections_arg(self, value):
+        method_name = '_validate_discover_connections_arg'
+
+        try:
+            connections = int(value)
+        except ValueError:
+            connections = 0
+        if connections < 1:
+            ex = exception_helper.create_cla_exception('WLSDPLY-01637', value)
+            ex.setExitCode(self.ARG_VALIDATION_ERROR_EXIT_CODE)
+            self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return
+
+    def get_use_config_xml_switch(self):
+        return self.USE_CONFIG_XML_SWITCH
+
+    def is_use_config_xml_switch(self, key):
+        return self.USE_CONFIG_XML_SWITCH == key
+
+    def get_previous_discovery_key(self):
+        return self.PREVIOUS_DISCOVERY_SWITCH
+
+    def is_previous_discovery_key(self, key):
+        return self.PREVIOUS_DISCOVERY_SWITCH == key
+
+    def _validate_previous_discovery_arg(self, value):
+        method_name = '_validate_previous_discovery_arg'
+
+        try:
+            discovery = JFileUtils.validateFileName(value)
+        except JIllegalArgumentException, iae:
+            ex = exception_helper.create_cla_exception('WLSDPLY-01638', value, iae.getLocalizedMessage(), error=iae)
+            ex.setExitCode(self.ARG_VALIDATION_ERROR_EXIT_CODE)
+            self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return discovery.getAbsolutePath()
+
+    def _validate_offline_only_args(self):
+        """
+        The previous discovery is reused only for an offline domain, since there is no digest of the child MBeans
+        of a unit online, and config.xml is only read for an offline domain, so reject both with the admin URL
+        of an online discovery.
+        :raises CLAException: if the previous discovery file or the config.xml switch and the admin URL were specified
+        """
+        method_name = '_validate_offline_only_args'
+        if not self._is_arg_specified(self.ADMIN_URL_SWITCH):
+            return
+
+        for key in [self.PREVIOUS_DISCOVERY_SWITCH, self.USE_CONFIG_XML_SWITCH]:
+            if self._is_arg_specified(key):
+                ex = exception_helper.create_cla_exception('WLSDPLY-01641', key, self.ADMIN_URL_SWITCH)
+                ex.setExitCode(self.USAGE_ERROR_EXIT_CODE)
+                self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+                raise ex
+        return
+
+    def _is_arg_specified(self, key):
+        return key in self._required_result or key in self._optional_result
+
+    def get_discover_paths_key(self):
+        return self.DISCOVER_PATHS_SWITCH
+
+    def is_discover_paths_key(self, key):
+        return self.DISCOVER_PATHS_SWITCH == key
+
+    def _validate_discover_paths_arg(self, value):
+        method_name = '_validate_discover_paths_arg'
+
+        discover_paths = list()
+        if value is not None:
+            for discover_path in value.split(','):
+                if len(discover_path.strip()) > 0:
+                    discover_paths.append(discover_path.strip())
+        if len(discover_paths) == 0:
+            ex = exception_helper.create_cla_exception('WLSDPLY-01639', self.DISCOVER_PATHS_SWITCH)
+            ex.setExitCode(self.ARG_VALIDATION_ERROR_EXIT_CODE)
+            self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+
+        for discover_path in discover_paths:
+            matcher = DISCOVER_PATH_PATTERN.match(discover_path)
+            if not matcher:
+                ex = exception_helper.create_cla_exception('WLSDPLY-01633', self.DISCOVER_PATHS_SWITCH,
+                                                           discover_path)
+                ex.setExitCode(self.ARG_VALIDATION_ERROR_EXIT_CODE)
+                self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+                raise ex
+            section_name = matcher.group(1)
+            if section_name not in KNOWN_TOPLEVEL_MODEL_SECTIONS:
+                ex = exception_helper.create_cla_exception('WLSDPLY-01634', self.DISCOVER_PATHS_SWITCH,
+                                                           discover_path, section_name,
+                                                           KNOWN_TOPLEVEL_MODEL_SECTIONS)
+                ex.setExitCode(self.ARG_VALIDATION_ERROR_EXIT_CODE)
+                self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+                raise ex
+        return
+
+    def get_timing_report_file_key(self):
+        return self.TIMING_REPORT_FILE_SWITCH
+
+    def is_timing_report_file_key(self, key):
+        return self.TIMING_REPORT_FILE_SWITCH == key
+
+    def _validate_timing_report_file_arg(self, value):
+        method_name = '_validate_timing_report_file_arg'
+
+        try:
+            report_file = JFileUtils.validateFileName(value)
+        except JIllegalArgumentException, iae:
+            ex = exception_helper.create_cla_exception('WLSDPLY-01640', value, iae.getLocalizedMessage(), error=iae)
+            ex.setExitCode(self.ARG_VALIDATION_ERROR_EXIT_CODE)
+            self._logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return report_file.getAbsolutePath()
+
     def get_attributes_only_switch(self):
         return self.ATTRIBUTES_ONLY_SWITCH
 
@@ -0,0 +1,117 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+A bounded, least-recently-used cache that keeps hit and miss counts.
+"""
+
+# indexes into the linked list entries
+_PREVIOUS = 0
+_NEXT = 1
+_KEY = 2
+_VALUE = 3
+
+
+class LruCache(object):
+    """
+    A dictionary-like cache that holds at most max_size entries.  When the cache is full, adding a new
+    entry evicts the least recently used entry.  The entries are kept in a circular, doubly-linked list
+    so that lookups, additions, and evictions are all O(1).  Keys must be hashable.
+    """
+
+    def __init__(self, max_size=1000):
+        """
+        Create the cache.
+        :param max_size: the maximum number of entries to keep, must be greater than zero
+        """
+        if max_size < 1:
+            max_size = 1
+        self._max_size = max_size
+        self._entries = dict()
+        self._root = [None, None, None, None]
+        self._root[_PREVIOUS] = self._root
+        self._root[_NEXT] = self._root
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        return
+
+    def get(self, key, default=None):
+        """
+        Get the cached value for the key and mark it as the most recently used entry.
+        :param key: the key
+        :param default: the value to return if the key is not in the cache
+        :return: the cached value, or the default value if the key is not in the cache
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        self.__unlink(entry)
+        self.__link_first(entry)
+        return entry[_VALUE]
+
+    def put(self, key, value):
+        """
+        Add or replace the cached value for the key, evicting the least recently used entry if needed.
+        :param key: the key
+        :param value: the value
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[_VALUE] = value
+            self.__unlink(entry)
+            self.__link_first(entry)
+            return
+
+        if len(self._entries) >= self._max_size:
+            oldest = self._root[_PREVIOUS]
+            self.__unlink(oldest)
+            del self._entries[oldest[_KEY]]
+            self._evictions += 1
+
+        entry = [None, None, key, value]
+        self.__link_first(entry)
+        self._entries[key] = entry
+        return
+
+    def clear(self):
+        """
+        Remove all entries from the cache.  The hit and miss counts are not reset.
+        """
+        self._entries.clear()
+        self._root[_PREVIOUS] = self._root
+        self._root[_NEXT] = self._root
+        return
+
+    def get_statistics(self):
+        """
+        Get the usage statistics of the cache.
+        :return: a dictionary with the hits, misses, evictions, size, and max_size of the cache
+        """
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'size': len(self._entries),
+            'max_size': self._max_size
+        }
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __link_first(self, entry):
+        first = self._root[_NEXT]
+        entry[_PREVIOUS] = self._root
+        entry[_NEXT] = first
+        first[_PREVIOUS] = entry
+        self._root[_NEXT] = entry
+
+    def __unlink(self, entry):
+        entry[_PREVIOUS][_NEXT] = entry[_NEXT]
+        entry[_NEXT][_PREVIOUS] = entry[_PREVIOUS]
@@ -0,0 +1,115 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Read and set the attributes of an online MBean with a single MBeanServerConnection call, instead of one
+remote WLST call for each attribute.
+"""
+import jarray
+
+from java.lang import Exception as JException
+from java.lang import String
+from javax.management import Attribute
+from javax.management import AttributeList
+from oracle.weblogic.deploy.util import PyWLSTException
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import wlst_helper
+
+_class_name = 'mbean_attributes'
+_logger = PlatformLogger('wlsdeploy.wlst')
+
+
+def get_object_name():
+    """
+    Get the ObjectName of the MBean at the current online WLST location.
+    :return: the javax.management.ObjectName, or None if it cannot be found
+    """
+    _method_name = 'get_object_name'
+    try:
+        cmo = wlst_helper.get_cmo()
+    except PyWLSTException, pwe:
+        _logger.finest('WLSDPLY-00085', wlst_helper.get_pwd(), pwe.getLocalizedMessage(),
+                       class_name=_class_name, method_name=_method_name)
+        return None
+    if cmo is not None and hasattr(cmo, 'getObjectName'):
+        return cmo.getObjectName()
+    return None
+
+
+def read_attributes(connection, object_name, attribute_names):
+    """
+    Read several attributes of an MBean with one getAttributes() call.  The call leaves out the attributes
+    that could not be read, so their names are returned, for the caller to read them one at a time.
+    :param connection: the javax.management.MBeanServerConnection to read from
+    :param object_name: the javax.management.ObjectName of the MBean
+    :param attribute_names: the names of the attributes to read
+    :return: a dictionary of the attribute values, keyed by attribute name, and the list of the
+             attribute names that could not be read
+    """
+    _method_name = 'read_attributes'
+    values = dict()
+    if attribute_names is None or len(attribute_names) == 0:
+        return values, list()
+
+    try:
+        attribute_list = connection.getAttributes(object_name, jarray.array(attribute_names, String))
+        for attribute in attribute_list:
+            values[attribute.getName()] = attribute.getValue()
+    except JException, e:
+        # the whole call failed, for example because the MBean is gone or the connection dropped
+        _logger.fine('WLSDPLY-00086', object_name, len(attribute_names), e.getLocalizedMessage(),
+                     class_name=_class_name, method_name=_method_name)
+
+    failed_names = _get_missing_names(attribute_names, values)
+    _logger.finest('WLSDPLY-00087', len(values), object_name, failed_names, class_name=_class_name,
+                   method_name=_method_name)
+    return values, failed_names
+
+
+def write_attributes(connection, object_name, attributes):
+    """
+    Set several attributes of an MBean with one setAttributes() call.  The call only returns the attributes
+    that were set, so the names of the others are returned, for the caller to set them one at a time.
+    :param connection: the javax.management.MBeanServerConnection to write to
+    :param object_name: the javax.management.ObjectName of the MBean
+    :param attributes: the list of (attribute name, value) pairs to set, in order
+    :return: the list of the attribute names that were not set
+    """
+    _method_name = 'write_attributes'
+    if attributes is None or len(attributes) == 0:
+        return list()
+
+    attribute_list = AttributeList()
+    attribute_names = list()
+    for attribute_name, value in attributes:
+        attribute_list.add(Attribute(attribute_name, value))
+        attribute_names.append(attribute_name)
+
+    set_names = dict()
+    try:
+        for attribute in connection.setAttributes(object_name, attribute_list):
+            set_names[attribute.getName()] = True
+    except JException, e:
+        # the whole call failed, for example because the MBean is gone or the connection dropped
+        _logger.fine('WLSDPLY-00088', object_name, len(attributes), e.getLocalizedMessage(),
+                     class_name=_class_name, method_name=_method_name)
+
+    failed_names = _get_missing_names(attribute_names, set_names)
+    _logger.finest('WLSDPLY-00089', len(set_names), object_name, failed_names, class_name=_class_name,
+                   method_name=_method_name)
+    return failed_names
+
+
+def _get_missing_names(attribute_names, found_names):
+    """
+    Get the attribute names that are not in the dictionary of the names the call returned, once each and in order.
+    :param attribute_names: the names of the attributes that were requested
+    :param found_names: the dictionary keyed by the names the call returned
+    :return: the list of the missing names
+    """
+    missing_names = list()
+    for attribute_name in attribute_names:
+        if attribute_name not in found_names and attribute_name not in missing_names:
+            missing_names.append(attribute_name)
+    return missing_names
@@ -85,6 +85,19 @@ class Model(object):
             model['appDeployments'] = self._deployments
         return model
 
+    def release_model(self):
+        """
+        Get the model and remove its sections from this object, so that the caller holds the only references to
+        the sections and can release each one once it is used.  This object is empty afterwards.
+        :return: the model dictionary
+        """
+        model = self.get_model()
+        self._domain_info = OrderedDict()
+        self._topology = OrderedDict()
+        self._resources = OrderedDict()
+        self._deployments = OrderedDict()
+        return model
+
     def log_model(self, level, message, method_name, class_name='Model'):
         """
         Log the model.
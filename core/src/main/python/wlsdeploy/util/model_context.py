@@ -55,8 +55,14 @@ class ModelContext(object):
         self._encrypt_manual = False
         self._encrypt_one_pass = None
         self._use_encryption = False
+        self._use_config_xml = False
+        self._previous_discovery_file = None
+        self._discover_paths = None
+        self._timing_report_file = None
         self._wl_version = None
+        self._wl_versions = None
         self._wlst_mode = None
+        self._discover_connections = 1
         self._recursive = False
         self._attributes_only = False
         self._folders_only = False
@@ -141,11 +147,34 @@ class ModelContext(object):
         if CommandLineArgUtil.USE_ENCRYPTION_SWITCH in arg_map:
             self._use_encryption = arg_map[CommandLineArgUtil.USE_ENCRYPTION_SWITCH]
 
+        if CommandLineArgUtil.USE_CONFIG_XML_SWITCH in arg_map:
+            self._use_config_xml = arg_map[CommandLineArgUtil.USE_CONFIG_XML_SWITCH]
+
+        if CommandLineArgUtil.PREVIOUS_DISCOVERY_SWITCH in arg_map:
+            self._previous_discovery_file = arg_map[CommandLineArgUtil.PREVIOUS_DISCOVERY_SWITCH]
+
+        if CommandLineArgUtil.DISCOVER_PATHS_SWITCH in arg_map:
+            self._discover_paths = list()
+            for discover_path in arg_map[CommandLineArgUtil.DISCOVER_PATHS_SWITCH].split(','):
+                discover_path = discover_path.strip()
+                if len(discover_path) > 0:
+                    self._discover_paths.append(discover_path)
+
+        if CommandLineArgUtil.TIMING_REPORT_FILE_SWITCH in arg_map:
+            self._timing_report_file = arg_map[CommandLineArgUtil.TIMING_REPORT_FILE_SWITCH]
+
         if CommandLineArgUtil.ARCHIVE_FILE in arg_map:
             self._archive_file = arg_map[CommandLineArgUtil.ARCHIVE_FILE]
 
         if CommandLineArgUtil.TARGET_VERSION_SWITCH in arg_map:
-            self._wl_version = arg_map[CommandLineArgUtil.TARGET_VERSION_SWITCH]
+            # the first of a comma-separated list of versions is the primary target version
+            self._wl_versions = list()
+            for version in arg_map[CommandLineArgUtil.TARGET_VERSION_SWITCH].split(','):
+                version = version.strip()
+                if len(version) > 0 and version not in self._wl_versions:
+                    self._wl_versions.append(version)
+            if len(self._wl_versions) > 0:
+                self._wl_version = self._wl_versions[0]
 
         if CommandLineArgUtil.TARGET_MODE_SWITCH in arg_map:
             wlst_mode_string = arg_map[CommandLineArgUtil.TARGET_MODE_SWITCH]
@@ -154,8 +183,12 @@ class ModelContext(object):
             else:
                 self._wlst_mode = WlstModes.OFFLINE
 
+        if CommandLineArgUtil.DISCOVER_CONNECTIONS_SWITCH in arg_map:
+            self._discover_connections = int(arg_map[CommandLineArgUtil.DISCOVER_CONNECTIONS_SWITCH])
+
         if self._wl_version is None:
             self._wl_version = self._wls_helper.get_actual_weblogic_version()
+            self._wl_versions = [self._wl_version]
 
         if self._wlst_mode is None:
             self._wlst_mode = WlstModes.OFFLINE
@@ -271,6 +304,14 @@ class ModelContext(object):
         """
         return self._archive_file
 
+    def set_archive_file(self, archive_file):
+        """
+        Set the archive file.
+        :param archive_file: the archive file
+        """
+        self._archive_file = archive_file
+        return
+
     def get_model_file(self):
         """
         Get the model file.
@@ -386,6 +427,36 @@ class ModelContext(object):
         """
         return self._use_encryption
 
+    def is_using_config_xml(self):
+        """
+        Get whether or not an offline domain is read directly from its config.xml file instead of with WLST.
+        :return: whether or not the domain is read from config.xml
+        """
+        return self._use_config_xml
+
+    def get_previous_discovery_file(self):
+        """
+        Get the file that holds the result of the previous discovery of the domain.
+        :return: the previous discovery file name, or None if it was not specified
+        """
+        return self._previous_discovery_file
+
+    def get_discover_paths(self):
+        """
+        Get the model paths that limit the discovery of the domain.
+        :return: the list of model paths, or None if the whole domain is discovered
+        """
+        if self._discover_paths is None:
+            return None
+        return list(self._discover_paths)
+
+    def get_timing_report_file(self):
+        """
+        Get the file to which the timing report of the tool is written.
+        :return: the timing report file name, or None if it was not specified
+        """
+        return self._timing_report_file
+
     def get_target_wls_version(self):
         """
         Get the target WebLogic version.
@@ -393,6 +464,13 @@ class ModelContext(object):
         """
         return self._wl_version
 
+    def get_target_wls_versions(self):
+        """
+        Get all the target WebLogic versions, starting with the primary target version.
+        :return: the list of target WebLogic versions
+        """
+        return list(self._wl_versions)
+
     def get_target_wlst_mode(self):
         """
         Get the target WLST mode.
@@ -400,6 +478,13 @@ class ModelContext(object):
         """
         return self._wlst_mode
 
+    def get_discover_connections(self):
+        """
+        Get the number of connections to the admin server used to discover an online domain.
+        :return: the number of discover connections
+        """
+        return self._discover_connections
+
     def replace_tokens_in_path(self, attribute_name, resource_dict):
         """
         Replace any tokens in a path with the current values.
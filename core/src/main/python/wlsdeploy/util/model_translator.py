@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 import java.io.File as JFile
@@ -90,8 +90,14 @@ class PythonToFile(object):
 
     _class_name = 'PythonToFile'
 
-    def __init__(self, dictionary):
+    def __init__(self, dictionary, release_sections=False):
+        """
+        Create the writer.
+        :param dictionary: the Python dictionary to write
+        :param release_sections: if True, each top-level section is removed from the dictionary once it is written
+        """
         self.dictionary = dictionary
+        self.release_sections = release_sections
         self.logger = platform_logger.PlatformLogger('wlsdeploy.translator')
 
     def write_to_file(self, file_name):
@@ -124,7 +130,7 @@ class PythonToFile(object):
         from wlsdeploy.json.json_translator import PythonToJson as JPythonToJson
         self.logger.finer('WLSDPLY-01712', 'JSON', file_name, class_name=self._class_name, method_name=_method_name)
         try:
-            return JPythonToJson(self.dictionary).write_to_json_file(file_name)
+            return JPythonToJson(self.dictionary, self.release_sections).write_to_json_file(file_name)
         except JJsonException, je:
             translate_ex = exception_helper.create_translate_exception('WLSDPLY-01713', file_name,
                                                                        je.getLocalizedMessage(), error=je)
@@ -142,7 +148,7 @@ class PythonToFile(object):
         from wlsdeploy.yaml.yaml_translator import PythonToYaml as JPythonToYaml
         self.logger.finer('WLSDPLY-01712', 'YAML', file_name, class_name=self._class_name, method_name=_method_name)
         try:
-            return JPythonToYaml(self.dictionary).write_to_yaml_file(file_name)
+            return JPythonToYaml(self.dictionary, self.release_sections).write_to_yaml_file(file_name)
         except JYamlException, ye:
             translate_ex = exception_helper.create_translate_exception('WLSDPLY-01713', file_name,
                                                                        ye.getLocalizedMessage(), error=ye)
@@ -1,9 +1,22 @@
-
+from java.util import ArrayList
 from oracle.weblogic.deploy.util import WLSDeployExit
 from oracle.weblogic.deploy.util import WLSDeployContext
 import oracle.weblogic.deploy.util.WLSDeployContext.WLSTMode as mode
 
 from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.util import wlst_helper
+
+# the (title message key, lines) of the reports to add to the summary at the end of the tool
+_summary_reports = list()
+
+
+def add_summary_report(title_key, lines):
+    """
+    Add a report to the summary that is displayed at the end of the tool.
+    :param title_key: the key of the report title message, which has the report lines as its only argument
+    :param lines: the list of report lines
+    """
+    _summary_reports.append((title_key, lines))
 
 
 def end(model_context, exit_code):
@@ -20,4 +33,13 @@ def end(model_context, exit_code):
         version = model_context.get_target_wls_version()
         if model_context.get_target_wlst_mode() == WlstModes.ONLINE:
             wlst_mode = mode.ONLINE
-    WLSDeployExit.exit(WLSDeployContext(program, version, wlst_mode), exit_code)
\ No newline at end of file
+    context = WLSDeployContext(program, version, wlst_mode)
+    profile_lines = wlst_helper.get_profile_summary_lines()
+    if len(profile_lines) > 0:
+        add_summary_report('WLSDPLY-00083', profile_lines)
+    for title_key, lines in _summary_reports:
+        report_lines = ArrayList()
+        for line in lines:
+            report_lines.add(line)
+        context.addSummaryReport(title_key, report_lines)
+    WLSDeployExit.exit(context, exit_code)
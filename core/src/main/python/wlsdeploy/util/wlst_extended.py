@@ -7,6 +7,7 @@ import wlstModule as wlst
 
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import wlst_helper
 
 _logger = PlatformLogger('wlsdeploy.wlst')
 _class_name = 'wlst_extended'
@@ -29,11 +30,15 @@ def apply_jrf(jrf_target, domain_dir, should_update=False):
     _logger.finest('WLSDPLY-00073', jrf_target, domain_dir, class_name=_class_name, method_name=_method_name)
     applyJRF = _load_global('applyJRF')
     try:
-        applyJRF(jrf_target, domainDir=domain_dir, shouldUpdateDomain=should_update)
-    except (wlst.WLSTException, offlineWLSTException, Exception), e:
-        raise exception_helper.create_pywlst_exception('WLSDPLY-00071', jrf_target, domain_dir,
-                                                       _get_exception_mode(e),
-                                                       _format_exception(e), error=e)
+        try:
+            applyJRF(jrf_target, domainDir=domain_dir, shouldUpdateDomain=should_update)
+        except (wlst.WLSTException, offlineWLSTException, Exception), e:
+            raise exception_helper.create_pywlst_exception('WLSDPLY-00071', jrf_target, domain_dir,
+                                                           _get_exception_mode(e),
+                                                           _format_exception(e), error=e)
+    finally:
+        # applyJRF can change the WLST directory without going through wlst_helper.cd
+        wlst_helper.reset_current_directory()
     return
 
 
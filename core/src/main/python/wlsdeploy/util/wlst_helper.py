@@ -3,16 +3,184 @@ Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 import com.oracle.cie.domain.script.jython.WLSTException as offlineWLSTException
+from java.lang import ThreadLocal
+import threading
 
-import wlstModule as wlst
+import wlstModule
 
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import wlst_profiler
 from oracle.weblogic.deploy.util import PyWLSTException
 
 _logger = PlatformLogger('wlsdeploy.wlst')
 _class_name = 'wlst_helper'
 
+# The WLST functions used by the current thread, if it is not using the global WLST module.
+_thread_wlst = ThreadLocal()
+
+# The read-through cache of the current thread, if the thread started a read-only session.
+_session_cache = ThreadLocal()
+
+# The WLST calls counted for the timing reports of the tools, and the calls of each thread: the counts by call type
+# and the profile of the calls, if they are profiled.
+COUNTED_CALLS = ['cd', 'lsc', 'lsa', 'get', 'get_mbi']
+_thread_calls = ThreadLocal()
+_all_thread_calls = list()
+_thread_calls_lock = threading.Lock()
+
+# The current WLST directory of each thread, which cd uses to skip the calls to the current directory and to make
+# shorter relative moves, and the directories of all the threads for the counts of the run.
+_current_directory = ThreadLocal()
+_all_current_directories = list()
+_current_directories_lock = threading.Lock()
+
+# The public functions that do not call WLST, which are not wrapped when the WLST calls are profiled.
+NOT_PROFILED = ['set_thread_wlst', 'start_session_cache', 'end_session_cache', 'get_call_counts', 'get_cd_counts',
+                'log_cd_counts', 'get_profile_summary_lines', 'reset_current_directory', 'get_quoted_name_for_wlst']
+
+
+class _WlstFunctions(object):
+    """
+    Look up the WLST functions and variables in the WLST of the current thread.  Threads use the global
+    WLST module unless they have their own WLST, with its own connection, set by set_thread_wlst().
+    """
+    def __getattr__(self, name):
+        thread_wlst = _thread_wlst.get()
+        if thread_wlst is not None:
+            return getattr(thread_wlst, name)
+        return getattr(wlstModule, name)
+
+
+wlst = _WlstFunctions()
+
+
+def set_thread_wlst(thread_wlst):
+    """
+    Set the WLST used by the wlst_helper functions called from the current thread.
+    :param thread_wlst: an object with the WLST functions and variables as attributes, such as a wrapper
+                        around a separate WLST interpreter, or None to use the global WLST module
+    """
+    _method_name = 'set_thread_wlst'
+    _logger.finest('WLSDPLY-00074', thread_wlst, class_name=_class_name, method_name=_method_name)
+
+    if thread_wlst is None:
+        _thread_wlst.remove()
+    else:
+        _thread_wlst.set(thread_wlst)
+    _invalidate_session_cache()
+    reset_current_directory()
+    return
+
+
+def start_session_cache():
+    """
+    Start caching the results of lsc, lsa, path_exists and get_singleton_name for the current thread, keyed by the
+    absolute WLST path.  The domain must not be changed while the cache is in use, so this is only for read-only
+    sessions, such as discovery.
+    """
+    _method_name = 'start_session_cache'
+    _logger.finer('WLSDPLY-00075', class_name=_class_name, method_name=_method_name)
+    _session_cache.set(_SessionCache())
+    return
+
+
+def end_session_cache():
+    """
+    Stop the cache of the current thread and log how many calls were answered from it.
+    """
+    _method_name = 'end_session_cache'
+    cache = _session_cache.get()
+    if cache is not None:
+        _session_cache.remove()
+        for operation in _SessionCache.OPERATIONS:
+            hits = cache.hits[operation]
+            calls = hits + cache.misses[operation]
+            if calls > 0:
+                _logger.fine('WLSDPLY-00076', operation, hits, calls, (hits * 100) / calls,
+                             class_name=_class_name, method_name=_method_name)
+        _logger.info('WLSDPLY-00077', cache.get_hit_count(), cache.get_call_count(),
+                     class_name=_class_name, method_name=_method_name)
+    return
+
+
+def get_call_counts(all_threads=False):
+    """
+    Get the number of WLST calls made by the wlst_helper functions, for each type in COUNTED_CALLS.
+    The calls answered by the session cache are not counted, since they do not call WLST.
+    :param all_threads: if True, add up the calls of all the threads, otherwise count the current thread only
+    :return: a new dictionary of the call counts by call type
+    """
+    result = dict()
+    if all_threads:
+        for call_type in COUNTED_CALLS:
+            result[call_type] = 0
+        _thread_calls_lock.acquire()
+        try:
+            for calls in _all_thread_calls:
+                for call_type in COUNTED_CALLS:
+                    result[call_type] += calls.counts[call_type]
+        finally:
+            _thread_calls_lock.release()
+    else:
+        result.update(_get_thread_calls().counts)
+    return result
+
+
+def get_profile_summary_lines():
+    """
+    Get the profile of the WLST calls of all the threads, as the lines of a table for the summary at the end
+    of the tool.  Nothing is recorded unless the calls are profiled.
+    :return: the list of lines, or an empty list if no call was profiled
+    """
+    _thread_calls_lock.acquire()
+    try:
+        profiles = list()
+        for calls in _all_thread_calls:
+            profiles.append(calls.profile)
+    finally:
+        _thread_calls_lock.release()
+    return wlst_profiler.get_summary_lines(profiles)
+
+
+def get_cd_counts():
+    """
+    Get the number of cd calls requested from this module by all the threads in this run, and how many of them
+    were skipped because WLST was already in the directory, or were made as shorter relative moves.
+    :return: a new dictionary of the requested, skipped and relative counts
+    """
+    result = {'requested': 0, 'skipped': 0, 'relative': 0}
+    _current_directories_lock.acquire()
+    try:
+        for directory in _all_current_directories:
+            result['requested'] += directory.requested_count
+            result['skipped'] += directory.skipped_count
+            result['relative'] += directory.relative_count
+    finally:
+        _current_directories_lock.release()
+    return result
+
+
+def log_cd_counts():
+    """
+    Log the number of cd calls that were skipped or made as shorter relative moves in this run.
+    """
+    _method_name = 'log_cd_counts'
+    counts = get_cd_counts()
+    _logger.info('WLSDPLY-00078', counts['skipped'], counts['relative'], counts['requested'],
+                 class_name=_class_name, method_name=_method_name)
+    return
+
+
+def reset_current_directory():
+    """
+    Forget the current WLST directory of the current thread, so that the next cd is made even if it is to the
+    directory of the last cd.  This is needed after the WLST calls that can change the directory or the MBean tree
+    without going through cd.
+    """
+    _get_current_directory().clear()
+    return
+
 
 def assign(source_type, source_name, target_type, target_name):
     """
@@ -26,6 +194,8 @@ def assign(source_type, source_name, target_type, target_name):
     """
 
     _method_name = 'assign'
+    reset_current_directory()
+    _invalidate_session_cache()
     _logger.finest('WLSDPLY-00001', source_type, source_name, target_type, target_name, class_name=_class_name,
                    method_name=_method_name)
 
@@ -52,11 +222,30 @@ def cd(path):
     _method_name = 'cd'
     _logger.finest('WLSDPLY-00001', path, class_name=_class_name, method_name=_method_name)
 
+    directory = _get_current_directory()
+    directory.requested_count += 1
+    target_path = directory.resolve(path)
+    if target_path is not None and target_path == directory.path:
+        directory.skipped_count += 1
+        return directory.result
+
+    wlst_path = path
+    relative_path = directory.get_relative_path(target_path)
+    if relative_path is not None and path.startswith('/'):
+        _logger.finest('WLSDPLY-00079', path, relative_path, class_name=_class_name, method_name=_method_name)
+        directory.relative_count += 1
+        wlst_path = relative_path
+
+    _count_call('cd')
     try:
-        result = wlst.cd(path)
+        result = wlst.cd(wlst_path)
     except (wlst.WLSTException, offlineWLSTException), e:
+        directory.clear()
+        _invalidate_session_cache()
         raise exception_helper.create_pywlst_exception('WLSDPLY-00002', path, _get_exception_mode(e),
                                                        _format_exception(e), error=e)
+    directory.path = target_path
+    directory.result = result
     _logger.finest('WLSDPLY-00003', path, result, class_name=_class_name, method_name=_method_name)
     return result
 
@@ -72,6 +261,7 @@ def get(attribute):
     _method_name = 'get'
     _logger.finest('WLSDPLY-00004', attribute, class_name=_class_name, method_name=_method_name)
 
+    _count_call('get')
     try:
         result = wlst.get(attribute)
     except (wlst.WLSTException, offlineWLSTException), e:
@@ -92,6 +282,7 @@ def set(attribute, value):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'set'
+    _invalidate_session_cache()
     _logger.finest('WLSDPLY-00007', attribute, value, class_name=_class_name, method_name=_method_name)
     try:
         wlst.set(attribute, value)
@@ -112,6 +303,7 @@ def set_with_cmo(wlst_name, wlst_value, masked=False):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'set_with_cmo'
+    _invalidate_session_cache()
     value = wlst_value
     if masked:
         value = '<masked>'
@@ -155,6 +347,7 @@ def create(name, folder, base_provider_type=None):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'create'
+    _invalidate_session_cache()
     _logger.finest('WLSDPLY-00016', name, folder, base_provider_type, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -183,6 +376,8 @@ def delete(name, folder):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'delete'
+    reset_current_directory()
+    _invalidate_session_cache()
     _logger.finest('WLSDPLY-00019', name, folder, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -221,6 +416,7 @@ def set_server_groups(server, server_groups):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'set_server_groups'
+    reset_current_directory()
     _logger.entering(server_groups, server, class_name=_class_name, method_name=_method_name)
     try:
         wlst.setServerGroups(server, server_groups)
@@ -264,21 +460,7 @@ def lsa(path=None, log_throwing=True):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'lsa'
-    result = _ls(_method_name, 'a', path, log_throwing)
-    make_dict = dict()
-    if result and len(result) > 0:
-        for entry in result.entrySet():
-            key = entry.getKey()
-            value = entry.getValue()
-            if value and type(value) is str:
-                new_value = value.rstrip()
-                if new_value == 'null' or new_value == 'none':
-                    make_dict[key] = None
-                else:
-                    make_dict[key] = new_value
-            else:
-                make_dict[key] = value
-    return make_dict
+    return _ls(_method_name, 'a', path, log_throwing)
 
 
 def lsc(path=None, log_throwing=True):
@@ -304,12 +486,19 @@ def path_exists(path):
     _method_name = 'path_exists'
     _logger.finest('WLSDPLY-00025', path, class_name=_class_name, method_name=_method_name)
 
+    cache = _session_cache.get()
+    cache_key = _get_cache_key(cache, path)
+    if cache_key is not None and cache.contains(_method_name, cache_key):
+        return cache.get(_method_name, cache_key)
+
     exists = True
     try:
         wlst.ls(path)
     except (wlst.WLSTException, offlineWLSTException), e:
         _logger.finest('WLSDPLY-00026', path, e.getLocalizedMessage(), class_name=_class_name, method_name=_method_name)
         exists = False
+    if cache_key is not None:
+        cache.put(_method_name, cache_key, exists)
     _logger.finest('WLSDPLY-00027', path, exists, class_name=_class_name, method_name=_method_name)
     return exists
 
@@ -321,17 +510,30 @@ def _ls(method_name, ls_type, path=None, log_throwing=True):
     :param ls_type: the WLST return type requested
     :param path: the path (default is the current path)
     :param log_throwing: whether or not to log the throwing message if the path location is not found
-    :return: the result of the WLST ls(returnMap='true') call
+    :return: the result of the WLST ls(returnMap='true') call, with the attributes in a dictionary for lsa
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = method_name
     _logger.finest('WLSDPLY-00028', method_name, ls_type, path, class_name=_class_name, method_name=_method_name)
 
+    cache = _session_cache.get()
+    cache_key = None
+    if cache is not None:
+        if path is None:
+            cache_key = _get_current_directory().path
+            if cache_key is None:
+                cache_key = get_pwd()
+        else:
+            cache_key = _get_cache_key(cache, path)
+    if cache_key is not None and cache.contains(method_name, cache_key):
+        return _copy_ls_result(ls_type, cache.get(method_name, cache_key))
+
     if path is not None:
         # ls(path, returnMap='true') is busted in earlier versions of WLST so go ahead and
         # change directories to the specified path to workaround this
         current_path = get_pwd()
         cd(path)
+        _count_call(method_name)
         try:
             result = wlst.ls(ls_type, returnMap='true', returnType=ls_type)
         except (wlst.WLSTException, offlineWLSTException), e:
@@ -344,6 +546,7 @@ def _ls(method_name, ls_type, path=None, log_throwing=True):
         cd(current_path)
     else:
         current_path = get_pwd()
+        _count_call(method_name)
         try:
             result = wlst.ls(ls_type, returnMap='true', returnType=ls_type)
         except (wlst.WLSTException, offlineWLSTException), e:
@@ -351,8 +554,15 @@ def _ls(method_name, ls_type, path=None, log_throwing=True):
                                                            _get_exception_mode(e), _format_exception(e), error=e)
             _logger.throwing(class_name=_class_name, method_name=_method_name, error=pwe)
             raise pwe
+    if ls_type == 'a':
+        result = _get_attributes_dict(result)
     _logger.finest('WLSDPLY-00030', method_name, ls_type, current_path, result,
                    class_name=_class_name, method_name=_method_name)
+    if cache_key is not None:
+        # the cached folder list or attributes are copied for each caller, because callers change what they get
+        result = _copy_ls_result(ls_type, result)
+        cache.put(method_name, cache_key, result)
+        result = _copy_ls_result(ls_type, result)
     return result
 
 
@@ -369,6 +579,13 @@ def get_singleton_name(path=None):
     _method_name = 'get_singleton_name'
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
+    cache = _session_cache.get()
+    cache_key = _get_cache_key(cache, path)
+    if cache_key is not None and cache.contains(_method_name, cache_key):
+        mbean_name = cache.get(_method_name, cache_key)
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=mbean_name)
+        return mbean_name
+
     mbean_name = None
     if path is None or path_exists(path):
         print_path = path
@@ -385,6 +602,8 @@ def get_singleton_name(path=None):
         mbean_name = name_list[0]
         _logger.finest('WLSDPLY-00032', print_path, mbean_name, class_name=_class_name, method_name=_method_name)
 
+    if cache_key is not None:
+        cache.put(_method_name, cache_key, mbean_name)
     _logger.exiting(class_name=_class_name, method_name=_method_name, result=mbean_name)
     return mbean_name
 
@@ -440,6 +659,21 @@ def get_cmo():
     return wlst.cmo
 
 
+def get_mbean_server_connection():
+    """
+    Return the MBeanServerConnection that online WLST uses for the current MBean tree.
+    :return: javax.management.MBeanServerConnection for the current tree, or None if not connected
+    """
+    _method_name = 'get_mbean_server_connection'
+    _logger.entering(class_name=_class_name, method_name=_method_name)
+
+    result = None
+    if is_connected():
+        result = wlst.mbs
+    _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
+    return result
+
+
 def is_connected():
     """
     Determine if wlst is currently connected to the admin server - from the WlstContext
@@ -472,6 +706,7 @@ def read_template(template):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'read_template'
+    reset_current_directory()
     _logger.entering(template, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -490,6 +725,7 @@ def add_template(template):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'add_template'
+    reset_current_directory()
     _logger.entering(template, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -507,6 +743,7 @@ def close_template():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'close_template'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -526,6 +763,7 @@ def select_template(template):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'select_template'
+    reset_current_directory()
     _logger.entering(template, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -543,6 +781,7 @@ def load_templates():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'load_templates'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -561,6 +800,7 @@ def read_domain(domain_home):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'read_domain'
+    reset_current_directory()
     _logger.entering(domain_home, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -580,6 +820,7 @@ def write_domain(domain_home):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'write_domain'
+    reset_current_directory()
     _logger.entering(domain_home, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -604,6 +845,7 @@ def update_domain():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'update_domain'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -621,6 +863,7 @@ def close_domain():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'close_domain'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -653,6 +896,7 @@ def connect(username, password, url):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'connect'
+    reset_current_directory()
     _logger.entering(username, url, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -671,6 +915,7 @@ def disconnect():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'disconnect'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -688,6 +933,7 @@ def edit():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'edit'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -705,6 +951,7 @@ def start_edit():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'start_edit'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -722,6 +969,7 @@ def stop_edit():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'stop_edit'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -739,6 +987,7 @@ def undo():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'undo'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -756,6 +1005,7 @@ def save():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'save'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -773,6 +1023,7 @@ def activate():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'activate'
+    reset_current_directory()
     _logger.entering(class_name=_class_name, method_name=_method_name)
 
     try:
@@ -826,6 +1077,7 @@ def start_application(application_name, *args, **kwargs):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'start_application'
+    reset_current_directory()
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -849,6 +1101,7 @@ def stop_application(application_name, *args, **kwargs):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'stop_application'
+    reset_current_directory()
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -872,6 +1125,7 @@ def deploy_application(application_name, *args, **kwargs):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'deploy_application'
+    reset_current_directory()
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -895,6 +1149,7 @@ def undeploy_application(application_name, *args, **kwargs):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'undeploy_application'
+    reset_current_directory()
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -918,6 +1173,7 @@ def redeploy_application(application_name, *args, **kwargs):
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'redeploy_application'
+    reset_current_directory()
     _logger.entering(application_name, args, kwargs, class_name=_class_name, method_name=_method_name)
 
     try:
@@ -1016,6 +1272,7 @@ def server_config():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'server_config'
+    reset_current_directory()
     try:
         wlst.serverConfig()
     except wlst.WLSTException, e:
@@ -1032,6 +1289,7 @@ def domain_runtime():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'domain_runtime'
+    reset_current_directory()
     try:
         wlst.domainRuntime()
     except wlst.WLSTException, e:
@@ -1048,6 +1306,7 @@ def custom():
     :raises: PyWLSTException: if a WLST error occurs
     """
     _method_name = 'custom'
+    reset_current_directory()
     try:
         wlst.custom()
     except wlst.WLSTException, e:
@@ -1099,6 +1358,7 @@ def _cd_back(return_directory):
     :param return_directory: the directory to which to change
     """
     if return_directory is not None:
+        reset_current_directory()
         try:
             wlst.cd(return_directory)
         except (wlst.WLSTException, offlineWLSTException), ex:
@@ -1122,15 +1382,285 @@ def get_mbi(path=None):
     Get the MBeanInfo for the current or specifiec MBean location.
     :param path: optionally specify path to check
     :return: javax.management.modelmbean.ModelMBeanInfo instance for the current location
+    :raises: PyWLSTException: if a WLST error occurs
     """
     current_path = None
     if path is not None:
         current_path = get_pwd()
         cd(path)
 
-    result = wlst.getMBI()
+    _count_call('get_mbi')
+    try:
+        result = wlst.getMBI()
+    except wlst.WLSTException, e:
+        raise exception_helper.create_pywlst_exception('WLSDPLY-00084', get_pwd(), _get_exception_mode(e),
+                                                       _format_exception(e), error=e)
 
     if current_path is not None:
         cd(current_path)
 
-    return result
\ No newline at end of file
+    return result
+
+
+def _get_thread_calls():
+    """
+    Get the WLST calls of the current thread, registering them the first time the thread makes a call.
+    :return: the calls of the current thread
+    """
+    calls = _thread_calls.get()
+    if calls is None:
+        calls = _ThreadCalls()
+        _thread_calls_lock.acquire()
+        try:
+            _all_thread_calls.append(calls)
+        finally:
+            _thread_calls_lock.release()
+        _thread_calls.set(calls)
+    return calls
+
+
+def _count_call(call_type):
+    """
+    Count a WLST call of the current thread.
+    :param call_type: the call type, one of COUNTED_CALLS
+    """
+    _get_thread_calls().counts[call_type] += 1
+    return
+
+
+def _get_current_directory():
+    """
+    Get the current directory of the current thread, registering it the first time the thread uses it.
+    :return: the current directory of the current thread
+    """
+    directory = _current_directory.get()
+    if directory is None:
+        directory = _CurrentDirectory()
+        _current_directories_lock.acquire()
+        try:
+            _all_current_directories.append(directory)
+        finally:
+            _current_directories_lock.release()
+        _current_directory.set(directory)
+    return directory
+
+
+def _invalidate_session_cache():
+    """
+    Forget the cached results of the current thread, if it has a session cache.
+    """
+    cache = _session_cache.get()
+    if cache is not None:
+        cache.clear()
+    return
+
+
+def _get_cache_key(cache, path):
+    """
+    Get the cache key for the path.  Only absolute paths are cached.
+    :param cache: the session cache of the current thread, or None
+    :param path: the WLST path
+    :return: the path without a trailing slash, or None if the path is not cached
+    """
+    if cache is None or path is None or not path.startswith('/'):
+        return None
+    if len(path) > 1 and path.endswith('/'):
+        return path[:-1]
+    return path
+
+
+def _get_attributes_dict(result):
+    """
+    Put the attributes of a WLST ls map in a dictionary, stripping the trailing spaces of the string values and
+    converting the strings null and none into None.
+    :param result: the map returned by WLST
+    :return: the dictionary of attributes
+    """
+    make_dict = dict()
+    if result and len(result) > 0:
+        for entry in result.entrySet():
+            key = entry.getKey()
+            value = entry.getValue()
+            if value and type(value) is str:
+                new_value = value.rstrip()
+                if new_value == 'null' or new_value == 'none':
+                    make_dict[key] = None
+                else:
+                    make_dict[key] = new_value
+            else:
+                make_dict[key] = value
+    return make_dict
+
+
+def _copy_ls_result(ls_type, result):
+    if result is None:
+        return result
+    if ls_type == 'c':
+        return list(result)
+    if ls_type == 'a':
+        return dict(result)
+    return result
+
+
+class _SessionCache(object):
+    """
+    The results of the WLST read calls made by one thread, keyed by operation and absolute WLST path.
+    """
+    OPERATIONS = ['lsc', 'lsa', 'path_exists', 'get_singleton_name']
+
+    def __init__(self):
+        self.hits = dict()
+        self.misses = dict()
+        for operation in self.OPERATIONS:
+            self.hits[operation] = 0
+            self.misses[operation] = 0
+        self.clear()
+        return
+
+    def clear(self):
+        self._results = dict()
+        for operation in self.OPERATIONS:
+            self._results[operation] = dict()
+        return
+
+    def contains(self, operation, path):
+        if path in self._results[operation]:
+            self.hits[operation] += 1
+            return True
+        self.misses[operation] += 1
+        return False
+
+    def get(self, operation, path):
+        return self._results[operation][path]
+
+    def put(self, operation, path, result):
+        self._results[operation][path] = result
+        return
+
+    def get_hit_count(self):
+        count = 0
+        for operation in self.OPERATIONS:
+            count += self.hits[operation]
+        return count
+
+    def get_call_count(self):
+        count = 0
+        for operation in self.OPERATIONS:
+            count += self.hits[operation] + self.misses[operation]
+        return count
+
+
+class _ThreadCalls(object):
+    """
+    The WLST calls of one thread: the call counts by call type, and the profile of the calls, which is only
+    recorded when the calls are profiled.  Only the thread changes them, so they are changed without a lock.
+    """
+
+    def __init__(self):
+        self.counts = dict()
+        for call_type in COUNTED_CALLS:
+            self.counts[call_type] = 0
+        self.profile = wlst_profiler.ThreadProfile()
+        return
+
+
+class _CurrentDirectory(object):
+    """
+    The current WLST directory of one thread, as an absolute path, and the result of the cd that went there.
+    The path is None when it is not known, for example after a relative cd from an unknown directory.
+    """
+
+    def __init__(self):
+        self.requested_count = 0
+        self.skipped_count = 0
+        self.relative_count = 0
+        self.clear()
+        return
+
+    def clear(self):
+        self.path = None
+        self.result = None
+        return
+
+    def resolve(self, path):
+        """
+        Get the absolute path that a cd to the path goes to, without trailing slashes or . and .. folders.
+        Names with slashes are quoted in parentheses in WLST paths, so those paths are not split into folders.
+        :param path: the absolute or relative WLST path
+        :return: the absolute path, or None if it is not known
+        """
+        if path is None:
+            return None
+        if path.find('(') != -1:
+            if path.startswith('/') and path.find('/.') == -1:
+                return '/' + path.strip('/')
+            return None
+
+        if path.startswith('/'):
+            folders = list()
+        elif self.path is None or self.path.find('(') != -1:
+            return None
+        else:
+            folders = _split_wlst_path(self.path)
+        for folder in path.split('/'):
+            if folder == '..':
+                if len(folders) > 0:
+                    folders.pop()
+            elif folder != '' and folder != '.':
+                folders.append(folder)
+        return '/' + '/'.join(folders)
+
+    def get_relative_path(self, target_path):
+        """
+        Get the relative path from the current directory to the target path, if it goes through fewer folders
+        than the absolute path.
+        :param target_path: the absolute target path
+        :return: the relative path, or None if the absolute path should be used
+        """
+        if self.path is None or target_path is None or self.path.find('(') != -1 or target_path.find('(') != -1:
+            return None
+
+        current_folders = _split_wlst_path(self.path)
+        target_folders = _split_wlst_path(target_path)
+        common = 0
+        while common < len(current_folders) and common < len(target_folders) and \
+                current_folders[common] == target_folders[common]:
+            common += 1
+        moves = ['..'] * (len(current_folders) - common)
+        moves.extend(target_folders[common:])
+        if len(moves) == 0 or len(moves) >= len(target_folders):
+            return None
+        return '/'.join(moves)
+
+
+def _split_wlst_path(path):
+    """
+    Split an absolute WLST path into its folders.
+    :param path: the absolute path
+    :return: the list of folders, which is empty for the root
+    """
+    folders = list()
+    for folder in path.split('/'):
+        if folder != '':
+            folders.append(folder)
+    return folders
+
+
+def _get_profiled_path():
+    """
+    Get the current WLST directory of the current thread, for the WLST call profile.
+    :return: the absolute path, or None if it is not known
+    """
+    return _get_current_directory().path
+
+
+def _get_thread_profile():
+    """
+    Get the WLST call profile of the current thread.
+    :return: the wlst_profiler.ThreadProfile of the current thread
+    """
+    return _get_thread_calls().profile
+
+
+if wlst_profiler.is_enabled():
+    wlst_profiler.instrument(globals(), _get_profiled_path, _get_thread_profile, NOT_PROFILED)
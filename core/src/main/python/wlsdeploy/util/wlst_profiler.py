@@ -0,0 +1,311 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+The opt-in profile of the WLST calls made through wlst_helper.  When it is turned on, each public wlst_helper
+function is wrapped to record the call count and a latency histogram for each operation and for each top-level
+WLST folder, the calls slower than a threshold are logged with their WLST path, and the profile is added to the
+summary at the end of the tool.
+
+The folders are the WLST folders of the current directory, such as Servers or JDBCSystemResources, not the model
+folders.  The profile of each thread is kept by wlst_helper with the WLST call counts of the thread, so recording
+a call does not take a lock.
+"""
+import types
+
+from java.lang import Boolean
+from java.lang import System
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'wlst_profiler'
+_logger = PlatformLogger('wlsdeploy.wlst')
+
+# Set this system property to true (e.g., -Dwlsdeploy.wlst.profile=true in WLSDEPLOY_PROPERTIES)
+# to profile the WLST calls.
+PROFILE_PROPERTY = 'wlsdeploy.wlst.profile'
+# Set this system property to the number of milliseconds above which a profiled call is logged as slow.
+SLOW_CALL_PROPERTY = 'wlsdeploy.wlst.profile.slow.ms'
+DEFAULT_SLOW_CALL_MILLIS = 1000
+
+# the upper limits in milliseconds of the histogram buckets, the last bucket has the slower calls
+BUCKET_LIMITS = [1, 5, 10, 50, 100, 500, 1000, 5000]
+
+# the keys of the report entries
+OPERATIONS = 'operations'
+FOLDERS = 'folders'
+CALLS = 'calls'
+TOTAL = 'total_ms'
+MAX = 'max_ms'
+HISTOGRAM = 'histogram'
+
+# the folder name of the calls made when the current WLST directory is not known
+UNKNOWN_FOLDER = '?'
+
+_LINE_FORMAT = '%-36s %8s %10s %8s' + ' %6s' * (len(BUCKET_LIMITS) + 1)
+
+_enabled = Boolean.getBoolean(PROFILE_PROPERTY)
+_slow_call_millis = None
+
+
+def is_enabled():
+    """
+    Was the WLST call profile turned on with the system property?
+    :return: True if the WLST calls are profiled
+    """
+    return _enabled
+
+
+def instrument(namespace, get_path, get_thread_profile, excluded_names):
+    """
+    Replace the public functions of a module namespace with functions that profile their calls.  Only the
+    outermost profiled call of a thread is recorded, so the time of a function that calls other profiled
+    functions is counted once.
+    :param namespace: the module globals
+    :param get_path: the function that returns the current WLST path of the thread, or None if it is not known
+    :param get_thread_profile: the function that returns the ThreadProfile of the current thread
+    :param excluded_names: the names of the public functions that do not make WLST calls
+    """
+    _method_name = 'instrument'
+    _logger.info('WLSDPLY-00080', _get_slow_call_millis(), class_name=_class_name, method_name=_method_name)
+
+    module_name = namespace['__name__']
+    for name in namespace.keys():
+        function = namespace[name]
+        if name.startswith('_') or name in excluded_names or type(function) is not types.FunctionType:
+            continue
+        if function.__module__ == module_name:
+            namespace[name] = _get_profiled_function(name, function, get_path, get_thread_profile)
+    return
+
+
+def get_report(profiles):
+    """
+    Get the profile of the calls of the threads, by operation and by top-level WLST folder.
+    The operations and folders are sorted by their total time, the slowest first.  The threads may still be
+    recording calls, so the report may leave out the calls that are being recorded.
+    :param profiles: the ThreadProfile of each thread
+    :return: a dictionary with the operations and folders, each a dictionary of names to entries
+    """
+    operations = dict()
+    folders = dict()
+    for profile in profiles:
+        _add_latencies(operations, profile.operations)
+        _add_latencies(folders, profile.folders)
+
+    report = OrderedDict()
+    report[OPERATIONS] = _get_entries(operations)
+    report[FOLDERS] = _get_entries(folders)
+    return report
+
+
+def get_summary_lines(profiles):
+    """
+    Format the profile as the lines of a table, for the summary at the end of the tool.
+    :param profiles: the ThreadProfile of each thread
+    :return: the list of lines, or an empty list if nothing was recorded
+    """
+    report = get_report(profiles)
+    lines = list()
+    if len(report[OPERATIONS]) == 0:
+        return lines
+
+    header = ['', CALLS, TOTAL, MAX]
+    for limit in BUCKET_LIMITS:
+        header.append('<%s' % limit)
+    header.append('>=%s' % BUCKET_LIMITS[-1])
+    lines.append(_LINE_FORMAT % tuple(header))
+    for section in [OPERATIONS, FOLDERS]:
+        for name in report[section].keys():
+            entry = report[section][name]
+            line = ['%s:%s' % (section[:-1], name), entry[CALLS], entry[TOTAL], entry[MAX]]
+            line.extend(entry[HISTOGRAM])
+            lines.append(_LINE_FORMAT % tuple(line))
+    return lines
+
+
+def _get_profiled_function(name, function, get_path, get_thread_profile):
+    """
+    Get the function that profiles the calls of a function.
+    :param name: the operation name of the function
+    :param function: the function to profile
+    :param get_path: the function that returns the current WLST path of the thread
+    :param get_thread_profile: the function that returns the ThreadProfile of the current thread
+    :return: the profiling function
+    """
+    def profiled(*args, **kwargs):
+        profile = get_thread_profile()
+        if profile.depth > 0:
+            return function(*args, **kwargs)
+
+        profile.depth += 1
+        start_path = get_path()
+        start = System.nanoTime()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = (System.nanoTime() - start) / 1000000.0
+            profile.depth -= 1
+            # a cd is recorded in the folder it went to, and a call that lost the directory in the folder it started in
+            path = get_path()
+            if path is None:
+                path = start_path
+            _record(profile, name, path, elapsed)
+
+    return profiled
+
+
+def _record(profile, name, path, elapsed):
+    """
+    Record a call in the profile of the thread, and log it if it is slow.  Only the thread changes its profile,
+    so no lock is taken.
+    :param profile: the profile of the current thread
+    :param name: the operation name
+    :param path: the WLST path of the call, or None if it is not known
+    :param elapsed: the call time in milliseconds
+    """
+    _method_name = '_record'
+    _get_latency(profile.operations, name).add(elapsed)
+    _get_latency(profile.folders, _get_folder(path)).add(elapsed)
+
+    if elapsed > _get_slow_call_millis():
+        _logger.info('WLSDPLY-00081', name, int(elapsed), path, class_name=_class_name, method_name=_method_name)
+    return
+
+
+def _get_folder(path):
+    """
+    Get the top-level WLST folder of a WLST path, such as Servers for /Servers/ms1/SSL/ms1.  The WLST folder
+    names are not mapped to the model folder names, since wlst_helper does not know the aliases.
+    :param path: the absolute WLST path, or None if it is not known
+    :return: the WLST folder name, / for the root, or UNKNOWN_FOLDER
+    """
+    if path is None:
+        return UNKNOWN_FOLDER
+    for folder in path.split('/'):
+        if folder != '':
+            return folder
+    return '/'
+
+
+def _get_slow_call_millis():
+    """
+    Get the threshold of the slow calls from the system property, the first time it is used.
+    :return: the number of milliseconds above which a call is slow
+    """
+    _method_name = '_get_slow_call_millis'
+    global _slow_call_millis
+    if _slow_call_millis is None:
+        value = System.getProperty(SLOW_CALL_PROPERTY)
+        _slow_call_millis = DEFAULT_SLOW_CALL_MILLIS
+        if value is not None:
+            try:
+                _slow_call_millis = int(value)
+            except ValueError:
+                _logger.warning('WLSDPLY-00082', value, SLOW_CALL_PROPERTY, DEFAULT_SLOW_CALL_MILLIS,
+                                class_name=_class_name, method_name=_method_name)
+    return _slow_call_millis
+
+
+def _get_latency(latencies, name):
+    """
+    Get the named latency, adding it the first time.
+    :param latencies: the dictionary of latencies
+    :param name: the operation or folder name
+    :return: the latency
+    """
+    if name not in latencies:
+        latencies[name] = _Latency()
+    return latencies[name]
+
+
+def _add_latencies(totals, latencies):
+    """
+    Add the latencies of a thread to the totals.
+    :param totals: the dictionary of total latencies
+    :param latencies: the dictionary of latencies of the thread
+    """
+    # keys() is a copy, so the thread can add latencies while they are added up
+    for name in latencies.keys():
+        _get_latency(totals, name).add_latency(latencies[name])
+    return
+
+
+def _get_entries(latencies):
+    """
+    Get the report entries of the latencies, the slowest total first.
+    :param latencies: the dictionary of latencies
+    :return: the dictionary of names to entries
+    """
+    names = latencies.keys()
+    names.sort(lambda first, second: cmp(latencies[second].total, latencies[first].total))
+    entries = OrderedDict()
+    for name in names:
+        entries[name] = latencies[name].get_entry()
+    return entries
+
+
+class ThreadProfile(object):
+    """
+    The latencies of the calls of one thread, and the depth of its profiled calls.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.operations = dict()
+        self.folders = dict()
+        return
+
+
+class _Latency(object):
+    """
+    The call count, total and maximum time, and histogram of the calls of an operation or folder.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.histogram = [0] * (len(BUCKET_LIMITS) + 1)
+        return
+
+    def add(self, elapsed):
+        """
+        Add a call.
+        :param elapsed: the call time in milliseconds
+        """
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        bucket = 0
+        while bucket < len(BUCKET_LIMITS) and elapsed >= BUCKET_LIMITS[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+        return
+
+    def add_latency(self, latency):
+        """
+        Add the calls of another latency.
+        :param latency: the latency to add
+        """
+        self.count += latency.count
+        self.total += latency.total
+        if latency.max > self.max:
+            self.max = latency.max
+        for bucket in range(len(self.histogram)):
+            self.histogram[bucket] += latency.histogram[bucket]
+        return
+
+    def get_entry(self):
+        """
+        Get the report entry, with the times rounded to milliseconds.
+        :return: the report entry
+        """
+        entry = OrderedDict()
+        entry[CALLS] = self.count
+        entry[TOTAL] = int(self.total)
+        entry[MAX] = int(self.max)
+        entry[HISTOGRAM] = list(self.histogram)
+        return entry
@@ -98,9 +98,16 @@ class PythonToYaml(object):
     _indent_unit = '    '
     _requires_quotes_chars_regex = '[:{}\[\],&*#?|<>=!%@`-]'
 
-    def __init__(self, dictionary):
+    def __init__(self, dictionary, release_sections=False):
+        """
+        Create the writer.
+        :param dictionary: the Python dictionary to write
+        :param release_sections: if True, each top-level entry is removed from the dictionary once it is written,
+                                 so that its memory can be reclaimed while the rest of the dictionary is written
+        """
         # Fix error handling for None
         self._dictionary = dictionary
+        self._release_sections = release_sections
         self._logger = PlatformLogger('wlsdeploy.yaml')
         return
 
@@ -126,8 +133,9 @@ class PythonToYaml(object):
         writer = None
         try:
             fos = JFileOutputStream(yaml_file, False)
-            writer = JPrintWriter(fos, True)
-            self._write_dictionary_to_yaml_file(self._dictionary, writer)
+            # the writer is flushed by each section and when it is closed, not by each line
+            writer = JPrintWriter(fos, False)
+            self._write_dictionary_to_yaml_file(self._dictionary, writer, release=self._release_sections)
 
         except JFileNotFoundException, fnfe:
             yaml_ex = exception_helper.create_yaml_exception('WLSDPLY-18010', file_name,
@@ -146,19 +154,23 @@ class PythonToYaml(object):
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=yaml_file)
         return yaml_file
 
-    def _write_dictionary_to_yaml_file(self, dictionary, writer, indent=''):
+    def _write_dictionary_to_yaml_file(self, dictionary, writer, indent='', release=False):
         """
         Do the actual heavy lifting of converting a dictionary and writing it to the file.  This method is
         called recursively when a value of the dictionary entry is itself a dictionary.
         :param dictionary: the Python dictionarhy to converty
         :param writer: the java.io.PrintWriter for the output file
         :param indent: the amount of indent to use (based on the level of recursion)
+        :param release: if True, remove each entry from the dictionary once it is written
         :raises: IOException: if an error occurs while writing the output
         """
+        _method_name = '_write_dictionary_to_yaml_file'
+
         if dictionary is None:
             return
 
-        for key, value in dictionary.iteritems():
+        for key in dictionary.keys():
+            value = dictionary[key]
             quoted_key = self._quotify_string(key)
             if isinstance(value, dict):
                 writer.println(indent + quoted_key + ':')
@@ -166,6 +178,11 @@ class PythonToYaml(object):
             else:
                 writer.println(indent + quoted_key + ': ' + self._get_value_string(value))
 
+            if release:
+                writer.flush()
+                del dictionary[key]
+                self._logger.fine('WLSDPLY-18028', key, class_name=self._class_name, method_name=_method_name)
+
         return
 
     def _get_value_string(self, value):
@@ -1,5 +1,5 @@
 /*
- * Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
+ * Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
  * The Universal Permissive License (UPL), Version 1.0
  */
 package oracle.weblogic.deploy.aliases;
@@ -289,4 +289,34 @@ public class VersionUtilsTest {
         answer = VersionUtils.isVersionInRange(VERSION_18, RANGE_BETWEEN_1212_AND_12213);
         Assert.assertFalse("expected " + VERSION_18 + " to not be in range " + RANGE_BETWEEN_1212_AND_12213, answer);
     }
+
+    @Test
+    public void testVersionRangeResultsAreCached() throws Exception {
+        VersionUtils.clearVersionRangeCache();
+
+        for (int i = 0; i < 3; i++) {
+            Assert.assertTrue(VersionUtils.isVersionInRange(VERSION_12213, RANGE_BETWEEN_1212_AND_12213));
+            Assert.assertFalse(VersionUtils.isVersionInRange(VERSION_12213, RANGE_LESS_THAN_1212));
+            Assert.assertFalse(VersionUtils.isVersionInRange(VERSION_1213, RANGE_LESS_THAN_1212));
+        }
+        Assert.assertEquals(3, VersionUtils.getRangeDecisionMisses());
+        Assert.assertEquals(6, VersionUtils.getRangeDecisionHits());
+        Assert.assertEquals(2, VersionUtils.getCachedRangeCount());
+
+        String[] versions = VersionUtils.getLowerAndUpperVersionStrings(RANGE_LESS_THAN_1212);
+        versions[0] = "99";
+        Assert.assertTrue(VersionUtils.isVersionInRange(VERSION_1211, RANGE_LESS_THAN_1212));
+        Assert.assertEquals("10", VersionUtils.getLowerAndUpperVersionStrings(RANGE_LESS_THAN_1212)[0]);
+        Assert.assertEquals(2, VersionUtils.getCachedRangeCount());
+    }
+
+    @Test(expected = VersionException.class)
+    public void testInvalidVersionRangeIsNotCached() throws Exception {
+        VersionUtils.clearVersionRangeCache();
+        try {
+            VersionUtils.isVersionInRange(VERSION_12213, "not a range");
+        } finally {
+            Assert.assertEquals(0, VersionUtils.getCachedRangeCount());
+        }
+    }
 }
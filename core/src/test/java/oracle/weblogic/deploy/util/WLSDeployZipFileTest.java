@@ -1,5 +1,5 @@
 /*
- * Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
+ * Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
  * The Universal Permissive License (UPL), Version 1.0
  */
 package oracle.weblogic.deploy.util;
@@ -9,6 +9,7 @@ import java.io.FileInputStream;
 import java.io.FileOutputStream;
 import java.io.IOException;
 import java.io.InputStream;
+import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.Iterator;
 import java.util.List;
@@ -43,6 +44,9 @@ public class WLSDeployZipFileTest {
        "wlsdeploy/applications/get-listen-address-app.war", "wlsdeploy/applications/simpleear.ear" };
 
     private static final String ZIP_FILE_SIMPLE_APPS_MODEL_FILE3 = "sample-apps-archive3.zip";
+    private static final String ZIP_FILE_SIMPLE_APPS_MODEL_FILE4 = "sample-apps-archive4.zip";
+    private static final String ZIP_FILE_SIMPLE_APPS_MODEL_FILE5 = "sample-apps-archive5.zip";
+    private static final String ZIP_FILE_SIMPLE_APPS_MODEL_FILE6 = "sample-apps-archive6.zip";
     private static final String LOG_PROPERTIES_SOURCE_LOCATION =
         UNIT_TEST_SOURCE_DIR + File.separator + "log.properties";
 
@@ -77,6 +81,9 @@ public class WLSDeployZipFileTest {
         copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE);
         copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE, ZIP_FILE_SIMPLE_APPS_MODEL_FILE2);
         copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE, ZIP_FILE_SIMPLE_APPS_MODEL_FILE3);
+        copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE, ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
+        copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE, ZIP_FILE_SIMPLE_APPS_MODEL_FILE5);
+        copyFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE, ZIP_FILE_SIMPLE_APPS_MODEL_FILE6);
     }
 
     @Test
@@ -206,6 +213,67 @@ public class WLSDeployZipFileTest {
         zf.close();
     }
 
+    @Test
+    public void testBatchEntries() throws Exception {
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
+        WLSDeployZipFile zf = new WLSDeployZipFile(f);
+        zf.startBatch();
+        Assert.assertTrue("expected the batch to be open", zf.isBatchOpen());
+
+        File logPropertiesFile = new File(LOG_PROPERTIES_SOURCE_LOCATION);
+        String name = zf.addZipEntry("model/logging/log.properties", logPropertiesFile, true);
+        Assert.assertEquals("unexpected entry name", "model/logging/log.properties", name);
+        name = zf.addZipEntry("model/logging/log.properties", logPropertiesFile, true);
+        Assert.assertEquals("expected the collected entry to be reused", "model/logging/log.properties", name);
+        name = zf.addZipEntry("wlsdeploy/applications/simpleear.ear", logPropertiesFile, true);
+        Assert.assertEquals("expected the entry to be renamed", "wlsdeploy/applications/simpleear(1).ear", name);
+        Assert.assertEquals("expected no entries before the commit", 0, zf.getZipEntries("model/logging").size());
+
+        Assert.assertEquals("unexpected number of entries written", 2, zf.commitBatch());
+        Assert.assertFalse("expected the batch to be closed", zf.isBatchOpen());
+        Map<String, InputStream> map = zf.getZipEntries("model/logging");
+        Assert.assertEquals("expected 1 entry to be returned", 1, map.size());
+        Assert.assertTrue("expected log.properties to have more than 0 bytes available",
+            map.get("model/logging/log.properties").available() > 0);
+        Assert.assertEquals("expected the renamed entry to be written", 1,
+            zf.getZipEntries("wlsdeploy/applications/simpleear(1).ear").size());
+        zf.close();
+    }
+
+    @Test
+    public void testDiscardBatch() throws Exception {
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_SIMPLE_APPS_MODEL_FILE4);
+        long originalLength = f.length();
+        WLSDeployZipFile zf = new WLSDeployZipFile(f);
+        zf.startBatch();
+
+        File logPropertiesFile = new File(LOG_PROPERTIES_SOURCE_LOCATION);
+        zf.addZipEntry("model/logging/log.properties", logPropertiesFile, true);
+        zf.addZipEntry("wlsdeploy/applications/simpleear.ear", logPropertiesFile, true);
+
+        Assert.assertEquals("unexpected number of entries discarded", 2, zf.discardBatch());
+        Assert.assertFalse("expected the batch to be closed", zf.isBatchOpen());
+        Assert.assertEquals("expected nothing to be committed", 0, zf.commitBatch());
+        Assert.assertEquals("expected the zip file to be unchanged", originalLength, f.length());
+        Assert.assertEquals("expected no entries to be written", 0, zf.getZipEntries("model/logging").size());
+
+        // the discarded entry is not reused for the same source file
+        String name = zf.addZipEntry("model/logging/log.properties", logPropertiesFile, true);
+        Assert.assertEquals("unexpected entry name", "model/logging/log.properties", name);
+        Assert.assertEquals("expected the entry to be written", 1, zf.getZipEntries("model/logging").size());
+        zf.close();
+    }
+
+    @Test
+    public void testRepeatedSourceFile() throws Exception {
+        List<String> names = addRepeatedSourceFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE5, false);
+        Assert.assertEquals("unexpected entry names", Arrays.asList("model/logging/log.properties",
+            "model/logging/log.properties", "model/logging/log(1).properties", "model/logging/log(2).properties",
+            "model/logging/log.properties"), names);
+        Assert.assertEquals("expected the same entry names with a batch", names,
+            addRepeatedSourceFile(ZIP_FILE_SIMPLE_APPS_MODEL_FILE6, true));
+    }
+
     @Test
     public void testReallyMatches() throws Exception {
         File f = new File(UNIT_TEST_TARGET_DIR + File.separator + ZIP_FILE_EXISTING_EMPTY_FILE);
@@ -307,6 +375,30 @@ public class WLSDeployZipFileTest {
         }
     }
 
+    private static List<String> addRepeatedSourceFile(String zipFileName, boolean batch) throws Exception {
+        File f = new File(UNIT_TEST_TARGET_DIR + File.separator + zipFileName);
+        WLSDeployZipFile zf = new WLSDeployZipFile(f);
+        if (batch) {
+            zf.startBatch();
+        }
+        File logPropertiesFile = new File(LOG_PROPERTIES_SOURCE_LOCATION);
+        File firstOtherFile = new File(UNIT_TEST_SOURCE_DIR + File.separator + ZIP_FILE_EXISTING_FILE);
+        File secondOtherFile = new File(UNIT_TEST_SOURCE_DIR + File.separator + ZIP_FILE_EXISTING_EMPTY_FILE);
+        String entryName = "model/logging/log.properties";
+        List<String> names = new ArrayList<>();
+        names.add(zf.addZipEntry(entryName, logPropertiesFile, true));
+        names.add(zf.addZipEntry(entryName, logPropertiesFile, true));
+        names.add(zf.addZipEntry(entryName, firstOtherFile, true));
+        names.add(zf.addZipEntry(entryName, secondOtherFile, true));
+        names.add(zf.addZipEntry(entryName, logPropertiesFile, true));
+        if (batch) {
+            zf.commitBatch();
+        }
+        Assert.assertEquals("expected 3 entries to be written", 3, zf.getZipEntries("model/logging").size());
+        zf.close();
+        return names;
+    }
+
     public static void copyFile(String filename) throws IOException {
         copyFile(filename, filename);
     }
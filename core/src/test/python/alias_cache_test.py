@@ -0,0 +1,121 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import javaos as os
+import pickle
+import unittest
+
+from java.lang import System
+
+from wlsdeploy.aliases import alias_cache
+from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+
+
+class AliasCacheTestCase(unittest.TestCase):
+    _execution_dir = '../../unit-tests/'
+    _cache_dir = os.path.join(_execution_dir, 'alias-cache')
+
+    def setUp(self):
+        self.name = 'AliasCacheTestCase'
+        if not os.path.exists(self._cache_dir):
+            os.makedirs(self._cache_dir)
+        for file_name in os.listdir(self._cache_dir):
+            os.remove(os.path.join(self._cache_dir, file_name))
+        System.setProperty(alias_cache.CACHE_DIRECTORY_PROPERTY, self._cache_dir)
+
+    def tearDown(self):
+        System.clearProperty(alias_cache.CACHE_DIRECTORY_PROPERTY)
+        System.clearProperty(alias_cache.CACHE_DISABLED_PROPERTY)
+
+    def testCacheRoundTrip(self):
+        location = LocationContext().append_location('JDBCSystemResource')
+        location.add_name_token('DATASOURCE', 'my-datasource')
+
+        entries = AliasEntries(wls_version='12.2.1.3')
+        expected = entries.get_dictionary_for_location(location)
+        self.assertEqual(len(self._get_cache_files('JDBCSystemResource', 'OFFLINE')), 1)
+
+        cached_entries = AliasEntries(wls_version='12.2.1.3')
+        actual = cached_entries.get_dictionary_for_location(location)
+        self.assertEqual(actual, expected)
+        return
+
+    def testCacheKeyedByVersionAndMode(self):
+        location = LocationContext().append_location('Cluster')
+        location.add_name_token('CLUSTER', 'my-cluster')
+
+        AliasEntries(wls_version='12.2.1.3').get_dictionary_for_location(location)
+        AliasEntries(wls_version='12.1.3').get_dictionary_for_location(location)
+        AliasEntries(WlstModes.ONLINE, '12.2.1.3').get_dictionary_for_location(location)
+
+        self.assertEqual(len(self._get_cache_files('Cluster', 'OFFLINE')), 2)
+        self.assertEqual(len(self._get_cache_files('Cluster', 'ONLINE')), 1)
+        return
+
+    def testCorruptCacheFileIsReplaced(self):
+        location = LocationContext().append_location('Machine')
+        location.add_name_token('MACHINE', 'my-machine')
+
+        expected = AliasEntries(wls_version='12.2.1.3').get_dictionary_for_location(location)
+        cache_files = self._get_cache_files('Machine', 'OFFLINE')
+        self.assertEqual(len(cache_files), 1)
+
+        cache_file = open(os.path.join(self._cache_dir, cache_files[0]), 'w')
+        cache_file.write('not a cache entry')
+        cache_file.close()
+
+        actual = AliasEntries(wls_version='12.2.1.3').get_dictionary_for_location(location)
+        self.assertEqual(actual, expected)
+        self.assertEqual(len(self._get_cache_files('Machine', 'OFFLINE')), 1)
+        return
+
+    def testCacheDisabled(self):
+        location = LocationContext().append_location('Machine')
+        location.add_name_token('MACHINE', 'my-machine')
+
+        AliasEntries(wls_version='12.2.1.3', use_cache=False).get_dictionary_for_location(location)
+        self.assertEqual(len(self._get_cache_files('Machine', 'OFFLINE')), 0)
+
+        System.setProperty(alias_cache.CACHE_DISABLED_PROPERTY, 'true')
+        AliasEntries(wls_version='12.2.1.3').get_dictionary_for_location(location)
+        self.assertEqual(len(self._get_cache_files('Machine', 'OFFLINE')), 0)
+        return
+
+    def testCacheKeyedByToolVersion(self):
+        category_file = 'oracle/weblogic/deploy/aliases/category_modules/Machine.json'
+        cache = alias_cache.AliasCache(WlstModes.OFFLINE, '12.2.1.3', [category_file])
+        cache.store('Machine', {'key': 'value'}, None)
+        found, category, unresolved = cache.load('Machine')
+        self.assertEqual(found, True)
+        self.assertEqual(category, {'key': 'value'})
+
+        # an entry written by another version of the tool is not used
+        cache_file_name = os.path.join(self._cache_dir, self._get_cache_files('Machine', 'OFFLINE')[0])
+        cache_file = open(cache_file_name, 'rb')
+        cache_entry = pickle.load(cache_file)
+        cache_file.close()
+        cache_entry['tool_version'] = '0.0.0'
+        cache_file = open(cache_file_name, 'wb')
+        pickle.dump(cache_entry, cache_file, 1)
+        cache_file.close()
+
+        found, category, unresolved = cache.load('Machine')
+        self.assertEqual(found, False)
+        self.assertEqual(len(self._get_cache_files('Machine', 'OFFLINE')), 0)
+        return
+
+    def _get_cache_files(self, category_name, wlst_mode):
+        prefix = '%s_' % category_name
+        mode = '_%s_' % wlst_mode
+        result = []
+        for file_name in os.listdir(self._cache_dir):
+            if file_name.startswith(prefix) and mode in file_name and file_name.endswith('.cache'):
+                result.append(file_name)
+        return result
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,11 +7,15 @@ import os
 import pprint
 import unittest
 
+from java.lang import System
+
+from oracle.weblogic.deploy.aliases import VersionUtils
 from oracle.weblogic.deploy.json import JsonStreamTranslator
 from oracle.weblogic.deploy.util import FileUtils
 
 from wlsdeploy.aliases.alias_constants import ChildFoldersTypes
 from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.location_context import LocationContext
 from wlsdeploy.aliases.wlst_modes import WlstModes
 
 from wlsdeploy.aliases.alias_constants import ACCESS
@@ -161,6 +165,21 @@ class ListTestCase(unittest.TestCase):
         message = pprint.pformat(category_results)
         self.assertEqual(len(category_results), 0, message)
 
+    def testVersionRangeChecksAreCachedDuringLoad(self):
+        VersionUtils.clearVersionRangeCache()
+        start = System.currentTimeMillis()
+        alias_entries = AliasEntries(wls_version='12.1.3', use_cache=False)
+        for category_name in self.category_file_map.keys():
+            alias_entries.get_dictionary_for_location(LocationContext().append_location(category_name), False)
+        elapsed = System.currentTimeMillis() - start
+
+        hits = VersionUtils.getRangeDecisionHits()
+        misses = VersionUtils.getRangeDecisionMisses()
+        message = 'loaded %s categories in %s ms: %s range checks cached, %s computed, %s distinct ranges' % \
+                  (len(self.category_file_map), elapsed, hits, misses, VersionUtils.getCachedRangeCount())
+        self.assertEqual(hits > misses, True, message)
+        self.assertEqual(VersionUtils.getCachedRangeCount() <= misses, True, message)
+
     def _load_category_file(self, category_file_path):
         category_input_stream = FileUtils.getResourceAsStream(category_file_path)
         self.assertNotEquals(category_input_stream, None)
@@ -0,0 +1,82 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.aliases.alias_version_index import AliasVersionIndex
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+import wlsdeploy.aliases.model_constants as FOLDERS
+from wlsdeploy.aliases.validation_codes import ValidationCodes
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class AliasVersionIndexTestCase(unittest.TestCase):
+    """
+    Compare the answers from the alias version index with the aliases loaded for a single WLS version.
+    """
+    old_wls_version = '12.1.3'
+    new_wls_version = '12.2.1.3'
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+
+    model_context = ModelContext('test', arg_map)
+    index = AliasVersionIndex(WlstModes.OFFLINE)
+
+    def testFolderValidityMatchesAliases(self):
+        location = LocationContext()
+        for wls_version in [self.old_wls_version, self.new_wls_version]:
+            aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=wls_version)
+            for folder_name in [FOLDERS.PARTITION, FOLDERS.SERVER, FOLDERS.SERVER_TEMPLATE, 'NoSuchFolder']:
+                expected, message = aliases.is_valid_model_folder_name(location, folder_name)
+                result, version_range = self.index.is_valid_model_folder_name(location, folder_name, wls_version)
+                self.assertEqual(result, expected, '%s at %s' % (folder_name, wls_version))
+
+        result, version_range = self.index.is_valid_model_folder_name(location, FOLDERS.PARTITION,
+                                                                      self.old_wls_version)
+        self.assertEqual(result, ValidationCodes.VERSION_INVALID)
+        self.assertEqual(version_range, '[12.2.1,)')
+        return
+
+    def testAttributeValidityMatchesAliases(self):
+        location = LocationContext()
+        for wls_version in [self.old_wls_version, self.new_wls_version]:
+            aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=wls_version)
+            for attribute_name in ['AdministrationPort', 'ArchiveConfigurationCount', 'NoSuchAttribute']:
+                expected, message = aliases.is_valid_model_attribute_name(location, attribute_name)
+                result, version_range = self.index.is_valid_model_attribute_name(location, attribute_name,
+                                                                                 wls_version)
+                self.assertEqual(result, expected, '%s at %s' % (attribute_name, wls_version))
+
+            expected = aliases.get_model_attribute_names(location)
+            expected.sort()
+            result = self.index.get_model_attribute_names(location, wls_version)
+            result.sort()
+            self.assertEqual(result, expected)
+        return
+
+    def testSubfolderNamesMatchAliases(self):
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        location.add_name_token(Aliases(self.model_context).get_name_token(location), 'AdminServer')
+        for wls_version in [self.old_wls_version, self.new_wls_version]:
+            aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=wls_version)
+            expected = aliases.get_model_subfolder_names(location)
+            expected.sort()
+            result = self.index.get_model_subfolder_names(location, wls_version)
+            result.sort()
+            self.assertEqual(result, expected)
+
+            expected = aliases.get_wlst_attribute_name(location, 'ListenPort')
+            result = self.index.get_wlst_attribute_name(location, 'ListenPort', wls_version)
+            self.assertEqual(result, expected)
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
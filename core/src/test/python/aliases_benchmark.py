@@ -0,0 +1,264 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+
+Micro-benchmarks for the alias layer.  The benchmarks only use the alias JSON files and the tool classes,
+so they run with the same Jython class path as the unit tests and do not need a WebLogic installation:
+
+    jython aliases_benchmark.py [<results-json-file> [<iterations>]]
+
+Each benchmark runs in OFFLINE and ONLINE mode for several WLS versions.  A summary line for each
+benchmark is printed, and the results are written as JSON, keyed by WLST mode, WLS version and benchmark
+name, so that runs can be compared to find regressions.  This module is deliberately not named *_test.py
+so that the unit test run does not pick it up.
+"""
+import sys
+
+from java.lang import System
+
+from oracle.weblogic.deploy.aliases import AliasException
+
+from wlsdeploy.aliases import alias_entries as alias_entries_module
+from wlsdeploy.aliases import alias_utils
+from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+import wlsdeploy.aliases.model_constants as FOLDERS
+from wlsdeploy.aliases.validation_codes import ValidationCodes
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.json.json_translator import PythonToJson
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+WLS_VERSIONS = ['10.3.6', '12.1.3', '12.2.1.3']
+WLST_MODES = [WlstModes.OFFLINE, WlstModes.ONLINE]
+DEFAULT_ITERATIONS = 1000
+DEFAULT_RESULTS_FILE = 'aliases_benchmark.json'
+
+# (model folders, name tokens, model attribute name, model attribute value) used for the attribute conversions
+_ATTRIBUTE_SAMPLES = [
+    ([], {}, 'AdministrationPort', '9002'),
+    ([FOLDERS.SERVER], {'SERVER': 'AdminServer'}, 'ListenPort', '7001'),
+    ([FOLDERS.SERVER, FOLDERS.SSL], {'SERVER': 'AdminServer', 'SERVER_SSL': 'AdminServer'}, 'Enabled', 'true'),
+    ([FOLDERS.JDBC_SYSTEM_RESOURCE, FOLDERS.JDBC_RESOURCE, FOLDERS.JDBC_DRIVER_PARAMS],
+     {'DATASOURCE': 'MyDataSource'}, 'URL', 'jdbc:oracle:thin:@//localhost:1521/orcl')
+]
+
+_FOLDER_NAMES = [FOLDERS.SERVER, FOLDERS.SERVER_TEMPLATE, FOLDERS.PARTITION, 'NoSuchFolder']
+_SERVER_ATTRIBUTE_NAMES = ['ListenPort', 'ListenAddress', 'NoSuchAttribute']
+
+
+class AliasBenchmark(object):
+    """
+    Runs the alias benchmarks for one WLST mode and WLS version.
+    """
+
+    def __init__(self, model_context, wlst_mode, wls_version, iterations):
+        self._model_context = model_context
+        self._wlst_mode = wlst_mode
+        self._wls_version = wls_version
+        self._iterations = iterations
+        self._aliases = Aliases(model_context=model_context, wlst_mode=wlst_mode, wls_version=wls_version)
+        return
+
+    def run(self):
+        """
+        Run all of the benchmarks.
+        :return: a dictionary of the results, keyed by benchmark name
+        """
+        results = dict()
+        results['cold_construction'] = self.benchmark_construction(True)
+        results['warm_construction'] = self.benchmark_construction(False)
+        results['get_wlst_attribute_name_and_value'] = self.benchmark_wlst_attribute_conversion()
+        results['get_model_attribute_name_and_value'] = self.benchmark_model_attribute_conversion()
+        results['resolve_path_tokens'] = self.benchmark_resolve_path_tokens()
+        results['is_valid_model_folder_name'] = self.benchmark_is_valid_model_folder_name()
+        results['is_valid_model_attribute_name'] = self.benchmark_is_valid_model_attribute_name()
+        return results
+
+    def benchmark_construction(self, cold):
+        """
+        Time the construction of a new AliasEntries object and the loading of each category.  The cold
+        runs clear the parsed category files first, and neither run uses the persistent alias cache.
+        :param cold: whether the parsed category files should be cleared before each category is loaded
+        :return: a dictionary of the results, keyed by category name
+        """
+        results = dict()
+        category_names = AliasEntries(self._wlst_mode, self._wls_version, use_cache=False).get_model_category_names()
+        category_names.sort()
+        for category_name in category_names:
+            if cold:
+                alias_entries_module._raw_category_cache.clear()
+            start = System.nanoTime()
+            entries = AliasEntries(self._wlst_mode, self._wls_version, use_cache=False)
+            try:
+                entries.get_dictionary_for_location(_get_category_location(entries, category_name))
+            except AliasException, ae:
+                results[category_name] = {'error': ae.getLocalizedMessage()}
+                continue
+            results[category_name] = _get_result(1, System.nanoTime() - start)
+        return results
+
+    def benchmark_wlst_attribute_conversion(self):
+        """
+        Time the conversion of model attribute names and values to their WLST names and values.
+        :return: the results dictionary
+        """
+        samples = self.__get_attribute_samples()
+        start = System.nanoTime()
+        for i in range(self._iterations):
+            for location, name, value in samples:
+                self._aliases.get_wlst_attribute_name_and_value(location, name, value)
+        return _get_result(self._iterations * len(samples), System.nanoTime() - start)
+
+    def benchmark_model_attribute_conversion(self):
+        """
+        Time the conversion of WLST attribute names and values to their model names and values.
+        :return: the results dictionary
+        """
+        samples = list()
+        for location, name, value in self.__get_attribute_samples():
+            wlst_name, wlst_value = self._aliases.get_wlst_attribute_name_and_value(location, name, value)
+            if wlst_name is not None:
+                samples.append((location, wlst_name, wlst_value))
+
+        start = System.nanoTime()
+        for i in range(self._iterations):
+            for location, wlst_name, wlst_value in samples:
+                self._aliases.get_model_attribute_name_and_value(location, wlst_name, wlst_value)
+        return _get_result(self._iterations * len(samples), System.nanoTime() - start)
+
+    def benchmark_resolve_path_tokens(self):
+        """
+        Time the replacement of the path tokens in the WLST paths of the unresolved folder dictionaries.
+        :return: the results dictionary
+        """
+        entries = AliasEntries(self._wlst_mode, self._wls_version, use_cache=False)
+        samples = list()
+        for location, name, value in self.__get_attribute_samples():
+            folder_dict = entries.get_dictionary_for_location(location, False)
+            samples.append((location, location.get_folder_path(), folder_dict))
+
+        start = System.nanoTime()
+        for i in range(self._iterations):
+            for location, path_name, folder_dict in samples:
+                alias_utils.resolve_path_tokens(location, path_name, folder_dict)
+        return _get_result(self._iterations * len(samples), System.nanoTime() - start)
+
+    def benchmark_is_valid_model_folder_name(self):
+        """
+        Time the validation of valid, version-invalid and invalid top-level folder names.
+        :return: the results dictionary
+        """
+        location = LocationContext()
+        start = System.nanoTime()
+        for i in range(self._iterations):
+            for folder_name in _FOLDER_NAMES:
+                self._aliases.is_valid_model_folder_name(location, folder_name)
+        return _get_result(self._iterations * len(_FOLDER_NAMES), System.nanoTime() - start)
+
+    def benchmark_is_valid_model_attribute_name(self):
+        """
+        Time the validation of valid and invalid server attribute names.
+        :return: the results dictionary
+        """
+        location = _get_location([FOLDERS.SERVER], {'SERVER': 'AdminServer'})
+        start = System.nanoTime()
+        for i in range(self._iterations):
+            for attribute_name in _SERVER_ATTRIBUTE_NAMES:
+                self._aliases.is_valid_model_attribute_name(location, attribute_name)
+        return _get_result(self._iterations * len(_SERVER_ATTRIBUTE_NAMES), System.nanoTime() - start)
+
+    def __get_attribute_samples(self):
+        """
+        Get the attribute samples whose folders are valid for the WLST mode and WLS version.
+        :return: a list of (location, model attribute name, model attribute value) tuples
+        """
+        samples = list()
+        for folders, name_tokens, name, value in _ATTRIBUTE_SAMPLES:
+            location = _get_location(folders, name_tokens)
+            if len(folders) > 0:
+                parent_location = LocationContext(location)
+                parent_location.pop_location()
+                result, message = self._aliases.is_valid_model_folder_name(parent_location, folders[-1])
+                if result != ValidationCodes.VALID:
+                    continue
+            samples.append((location, name, value))
+        return samples
+
+
+def _get_location(folders, name_tokens):
+    location = LocationContext()
+    for folder in folders:
+        location.append_location(folder)
+    for token, value in name_tokens.iteritems():
+        location.add_name_token(token, value)
+    return location
+
+
+def _get_category_location(entries, category_name):
+    location = LocationContext()
+    if category_name != 'Domain':
+        location.append_location(category_name)
+        name_token = entries.get_name_token_for_location(location)
+        if name_token is not None:
+            location.add_name_token(name_token, 'benchmark')
+    return location
+
+
+def _get_result(count, elapsed_nanos):
+    result = dict()
+    result['count'] = count
+    result['total_ms'] = elapsed_nanos / 1000000.0
+    if count > 0:
+        result['mean_us'] = elapsed_nanos / 1000.0 / count
+    return result
+
+
+def _print_result(mode_name, wls_version, benchmark_name, result):
+    if 'total_ms' in result:
+        print '%-8s %-10s %-40s %10d %12.3f ms' % (mode_name, wls_version, benchmark_name, result['count'],
+                                                   result['total_ms'])
+    else:
+        total = 0.0
+        for category_result in result.values():
+            if 'total_ms' in category_result:
+                total += category_result['total_ms']
+        print '%-8s %-10s %-40s %10d %12.3f ms' % (mode_name, wls_version, benchmark_name, len(result), total)
+    return
+
+
+def main(args):
+    results_file = DEFAULT_RESULTS_FILE
+    iterations = DEFAULT_ITERATIONS
+    if len(args) > 1:
+        results_file = args[1]
+    if len(args) > 2:
+        iterations = int(args[2])
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+    model_context = ModelContext('aliases_benchmark', arg_map)
+
+    results = dict()
+    for wlst_mode in WLST_MODES:
+        mode_name = WlstModes.from_value(wlst_mode)
+        mode_results = dict()
+        results[mode_name] = mode_results
+        for wls_version in WLS_VERSIONS:
+            version_results = AliasBenchmark(model_context, wlst_mode, wls_version, iterations).run()
+            mode_results[wls_version] = version_results
+            benchmark_names = version_results.keys()
+            benchmark_names.sort()
+            for benchmark_name in benchmark_names:
+                _print_result(mode_name, wls_version, benchmark_name, version_results[benchmark_name])
+
+    PythonToJson(results).write_to_json_file(results_file)
+    print 'Wrote the benchmark results to %s' % results_file
+    return
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -2,7 +2,9 @@
 Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
+import copy
 from org.python.modules import jarray
+import pickle
 import unittest
 
 from java.lang import Boolean
@@ -12,6 +14,10 @@ from java.util import Properties
 from oracle.weblogic.deploy.aliases import AliasException
 from oracle.weblogic.deploy.aliases import TypeUtils
 
+from wlsdeploy.aliases.alias_constants import WLST_PATH
+from wlsdeploy.aliases import alias_constants
+from wlsdeploy.aliases import alias_entries as alias_entries_module
+from wlsdeploy.aliases.alias_entries import AliasEntries
 from wlsdeploy.aliases.aliases import Aliases
 from wlsdeploy.aliases.location_context import LocationContext
 import wlsdeploy.aliases.model_constants as FOLDERS
@@ -1346,6 +1352,149 @@ class AliasesTestCase(unittest.TestCase):
         online_path = self.online_aliases.get_wlst_mbean_name(location)
         self.assertEqual('mydomain', online_path)
 
+    def testAttributeEntriesAreSharedAndReadOnly(self):
+        alias_entries = AliasEntries(wls_version=self.wls_version)
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        location.add_name_token(self.aliases.get_name_token(location), 'AdminServer')
+
+        entries = alias_entries.get_alias_attribute_entries_by_location(location)
+        by_model_name = alias_entries.get_alias_attribute_entry_by_model_name(location, 'ListenPort')
+        by_wlst_name = alias_entries.get_alias_attribute_entry_by_wlst_name(location, 'ListenPort')
+        self.assertEqual(by_model_name is entries['ListenPort'], True)
+        self.assertEqual(by_wlst_name is by_model_name, True)
+        self.assertEqual(WLST_PATH in by_model_name, False)
+        self.assertEqual(entries is alias_entries.get_alias_attribute_entries_by_location(location), True)
+
+        self.assertRaises(AliasException, by_model_name.__setitem__, WLST_PATH, 'foo')
+        self.assertRaises(AliasException, by_model_name.__delitem__, 'wlst_name')
+        self.assertRaises(AliasException, entries.clear)
+
+        # a copy of a read-only entry is a regular dictionary
+        entry_copy = copy.deepcopy(by_model_name)
+        entry_copy[WLST_PATH] = 'foo'
+        self.assertEqual(WLST_PATH in by_model_name, False)
+
+    def testResolvedPathsAreCached(self):
+        aliases = Aliases(self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=self.wls_version)
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        location.add_name_token(aliases.get_name_token(location), 'AdminServer')
+
+        expected = aliases.get_wlst_attributes_path(location)
+        stats = aliases.get_resolved_cache_statistics()
+        self.assertEqual(aliases.get_wlst_attributes_path(location), expected)
+        self.assertEqual(aliases.get_resolved_cache_statistics()['hits'], stats['hits'] + 1)
+
+        # a different name token must not return the cached path
+        other_location = LocationContext().append_location(FOLDERS.SERVER)
+        other_location.add_name_token(aliases.get_name_token(other_location), 'ms1')
+        self.assertEqual(aliases.get_wlst_attributes_path(other_location), '/Server/ms1')
+
+    def testContainedCategoryFilesAreParsedOnce(self):
+        alias_entries = AliasEntries(wls_version=self.wls_version, use_cache=False)
+        rgt_location = LocationContext().append_location(FOLDERS.RESOURCE_GROUP_TEMPLATE)
+        alias_entries.get_dictionary_for_location(rgt_location, False)
+
+        # the JMS and JDBC modules contained in ResourceGroupTemplate are contained in ResourceGroup too
+        counts = dict(alias_entries_module._raw_category_parse_counts)
+        rg_location = LocationContext().append_location(FOLDERS.RESOURCE_GROUP)
+        alias_entries.get_dictionary_for_location(rg_location, False)
+        new_counts = alias_entries_module._raw_category_parse_counts
+        self.assertEqual(new_counts['reused'] > counts['reused'], True)
+
+        # each use gets its own clone so the contained folders resolve independently
+        rgt_jdbc = LocationContext(rgt_location).append_location(FOLDERS.JDBC_SYSTEM_RESOURCE)
+        rgt_jdbc.add_name_token('RESOURCEGROUPTEMPLATE', 'my-rgt')
+        rgt_jdbc.add_name_token('DATASOURCE', 'my-ds')
+        rg_jdbc = LocationContext(rg_location).append_location(FOLDERS.JDBC_SYSTEM_RESOURCE)
+        rg_jdbc.add_name_token('RESOURCEGROUP', 'my-rg')
+        rg_jdbc.add_name_token('DATASOURCE', 'my-ds')
+        self.assertEqual(alias_entries.get_wlst_attribute_path_for_location(rgt_jdbc),
+                         '/ResourceGroupTemplate/my-rgt/JDBCSystemResource/my-ds')
+        self.assertEqual(alias_entries.get_wlst_attribute_path_for_location(rg_jdbc),
+                         '/ResourceGroup/my-rg/JDBCSystemResource/my-ds')
+
+    def testSubfoldersAreResolvedOnFirstUse(self):
+        alias_entries = AliasEntries(wls_version=self.wls_version, use_cache=False)
+        location = LocationContext().append_location(FOLDERS.PARTITION)
+        partition_folders = alias_entries.get_dictionary_for_location(location, False)[alias_constants.FOLDERS]
+        self.assertEqual(isinstance(partition_folders, alias_entries_module.LazyFolderDictionary), True)
+
+        # listing and checking subfolder names does not resolve them
+        self.assertEqual(FOLDERS.RESOURCE_GROUP in partition_folders, True)
+        self.assertEqual(FOLDERS.RESOURCE_GROUP in alias_entries.get_model_subfolder_names_for_location(location),
+                         True)
+        raw_value = dict.__getitem__(partition_folders, FOLDERS.RESOURCE_GROUP)
+        self.assertEqual(isinstance(raw_value, alias_entries_module._UnresolvedFolder), True)
+
+        rg_location = LocationContext(location).append_location(FOLDERS.RESOURCE_GROUP)
+        rg_dict = alias_entries.get_dictionary_for_location(rg_location, False)
+        self.assertEqual(dict.__getitem__(partition_folders, FOLDERS.RESOURCE_GROUP) is rg_dict, True)
+        self.assertEqual(alias_constants.ATTRIBUTES in rg_dict, True)
+
+    def testPickledSubfoldersStayUnresolved(self):
+        resolved_paths = []
+
+        def resolver(path_name, raw_folder_dict, raw_parent_dict):
+            resolved_paths.append(path_name)
+            return {'resolved': path_name}
+
+        folders = alias_entries_module.LazyFolderDictionary(resolver)
+        folders.add_unresolved_folder('A', 'Top/A', {'raw': 'A'}, {})
+        folders.add_unresolved_folder('B', 'Top/B', {'raw': 'B'}, {})
+        self.assertEqual(folders['A'], {'resolved': 'Top/A'})
+
+        loaded = pickle.loads(pickle.dumps(folders, 1))
+        self.assertEqual(resolved_paths, ['Top/A'])
+        self.assertEqual(isinstance(loaded, alias_entries_module.LazyFolderDictionary), True)
+        self.assertEqual(isinstance(dict.__getitem__(loaded, 'B'), alias_entries_module._UnresolvedFolder), True)
+        self.assertEqual(dict.__getitem__(loaded, 'A'), {'resolved': 'Top/A'})
+
+        loaded.set_resolver(resolver)
+        self.assertEqual(loaded['B'], {'resolved': 'Top/B'})
+        self.assertEqual(resolved_paths, ['Top/A', 'Top/B'])
+
+    def testAttributeProfileMatchesAttributeQueries(self):
+        location = LocationContext().append_location(FOLDERS.JDBC_SYSTEM_RESOURCE)
+        location.add_name_token(self.aliases.get_name_token(location), 'my-datasource')
+        location.append_location(FOLDERS.JDBC_RESOURCE)
+        location.append_location(FOLDERS.JDBC_DRIVER_PARAMS)
+
+        profile = self.aliases.get_model_attribute_profile(location)
+        self.assertEqual(self.aliases.get_model_attribute_profile(location) is profile, True)
+
+        self.assertEqual(sorted(profile.attribute_names), sorted(self.aliases.get_model_attribute_names(location)))
+        self.assertEqual(dict(profile.attribute_types), self.aliases.get_model_attribute_names_and_types(location))
+        self.assertEqual(list(profile.password_attribute_names),
+                         self.aliases.get_model_password_type_attribute_names(location))
+        self.assertEqual(FOLDERS.PASSWORD_ENCRYPTED in profile.password_attribute_names, True)
+        self.assertEqual(list(profile.uses_path_tokens_attribute_names),
+                         self.aliases.get_model_uses_path_tokens_attribute_names(location))
+        self.assertEqual(list(profile.merge_required_attribute_names),
+                         self.aliases.get_model_merge_required_attribute_names(location))
+        self.assertRaises(AliasException, profile.attribute_types.__setitem__, 'Foo', 'string')
+
+        other = self.online_aliases.get_model_attribute_profile(location)
+        self.assertEqual(other is profile, False)
+
+    def testAttributeValuesAreEqual(self):
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        location.add_name_token(self.online_aliases.get_name_token(location), 'ms1')
+
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'ListenPort', 8001, '8001'), True)
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'ListenPort', '8001', 8001), True)
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'ListenPort', 8001, '7001'), False)
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'ListenPort', 8001, None), False)
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'ClientCertProxyEnabled',
+                                                                        'True', 'true'), True)
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'ListenAddress',
+                                                                        'host1', 'host2'), False)
+
+        # references to other MBeans are always set
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'Machine', 'm1', 'm1'), False)
+        # the lsa value of an attribute that must be read with get is not compared
+        self.assertEqual(self.online_aliases.attribute_values_are_equal(location, 'ExpectedToRun',
+                                                                        'true', 'true'), False)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,209 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.aliases import model_constants
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.discover.config_xml_reader import ConfigXmlReader
+from wlsdeploy.tool.discover.config_xml_reader import ConfigXmlWlstException
+from wlsdeploy.tool.discover.resources_discoverer import ResourcesDiscoverer
+from wlsdeploy.tool.discover.topology_discoverer import TopologyDiscoverer
+from wlsdeploy.util import wlst_helper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model import Model
+from wlsdeploy.util.model_context import ModelContext
+from wlsdeploy.util.model_translator import FileToPython
+
+
+class ConfigXmlReaderTestCase(unittest.TestCase):
+    """
+    Navigate a domain read from config.xml in the way that discovery navigates a domain read by WLST offline.
+    """
+    _resources_dir = '../../test-classes'
+    _domain_home = _resources_dir + '/config-xml-domain'
+    _expected_model_file = _resources_dir + '/config-xml-domain-model.yaml'
+
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+    model_context = ModelContext('test', arg_map)
+    aliases = Aliases(model_context, wlst_mode=WlstModes.OFFLINE, wls_version='12.2.1.3')
+
+    def setUp(self):
+        self.wlst = ConfigXmlReader(self._domain_home, self.aliases).read()
+
+    def testDomainAttributes(self):
+        self.wlst.cd('/')
+        self.assertEqual(self.wlst.pwd(), '/base_domain')
+        self.assertEqual(self.wlst.get('Name'), 'base_domain')
+        self.assertEqual(self.wlst.get('AdminServerName'), 'AdminServer')
+
+        folders = self.wlst.ls('c', returnMap='true', returnType='c')
+        self.assertEqual('Server' in folders, True)
+        self.assertEqual('JDBCSystemResource' in folders, True)
+
+    def testServers(self):
+        self.wlst.cd('/Server')
+        self.assertEqual(self.wlst.ls('c', returnMap='true', returnType='c'), ['AdminServer', 'm1'])
+
+        self.wlst.cd('m1')
+        self.assertEqual(self.wlst.pwd(), '/base_domain/Server/m1')
+        attributes = self.wlst.ls('a', returnMap='true', returnType='a')
+        self.assertEqual(attributes.get('ListenPort'), '8001')
+        self.assertEqual(attributes.get('Cluster'), 'mycluster')
+
+        self.wlst.cd('/Server/AdminServer/SSL/AdminServer')
+        self.assertEqual(self.wlst.get('Enabled'), 'true')
+
+    def testJdbcModule(self):
+        self.wlst.cd('/JDBCSystemResource/MyDataSource/JdbcResource/MyDataSource/JDBCDriverParams/NO_NAME_0')
+        self.assertEqual(self.wlst.get('DriverName'), 'oracle.jdbc.OracleDriver')
+
+        self.wlst.cd('Properties/NO_NAME_0/Property/user')
+        self.assertEqual(self.wlst.get('Value'), 'scott')
+
+        self.wlst.cd('/JDBCSystemResource/MyDataSource/JdbcResource/MyDataSource/JDBCDataSourceParams/NO_NAME_0')
+        self.assertEqual(self.wlst.get('JNDIName'), 'jdbc/first,jdbc/second')
+
+    def testJmsModule(self):
+        self.wlst.cd('/JMSSystemResource/MyJmsModule/JmsResource/NO_NAME_0/Queue')
+        self.assertEqual(self.wlst.ls('c', returnMap='true', returnType='c'), ['MyQueue'])
+
+        self.wlst.cd('MyQueue')
+        self.assertEqual(self.wlst.get('JNDIName'), 'jms/MyQueue')
+
+    def testCoherenceModule(self):
+        self.wlst.cd('/CoherenceClusterSystemResource/MyCoherenceCluster/CoherenceResource/MyCoherenceCluster/'
+                     'CoherenceClusterParams/NO_NAME_0')
+        self.assertEqual(self.wlst.get('ClusterListenPort'), '7574')
+
+    def testMatchesWlstOfflineDiscovery(self):
+        # config.xml only has the attributes that were set, so the WLST offline model can have more attributes,
+        # but every folder and attribute discovered from config.xml is discovered with the same value by WLST offline
+        model_context = ModelContext('test', {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH: self._domain_home
+        })
+        wlst_model = _discover_sections(model_context, self.aliases, self._domain_home, None)
+        config_model = _discover_sections(model_context, self.aliases, self._domain_home, self.wlst)
+
+        for section, wlst_section, config_section in \
+                [(model_constants.TOPOLOGY, wlst_model.get_model_topology(), config_model.get_model_topology()),
+                 (model_constants.RESOURCES, wlst_model.get_model_resources(), config_model.get_model_resources())]:
+            for folder_name in [model_constants.SERVER, model_constants.CLUSTER, model_constants.JDBC_SYSTEM_RESOURCE,
+                                model_constants.JMS_SYSTEM_RESOURCE, model_constants.COHERENCE_CLUSTER_SYSTEM_RESOURCE]:
+                if folder_name in wlst_section:
+                    self.assertEqual(folder_name in config_section, True)
+                    self.assertEqual(config_section[folder_name].keys(), wlst_section[folder_name].keys())
+            _assert_contained(self, config_section, wlst_section, section)
+
+    def testMatchesExpectedWlstOfflineModel(self):
+        model_context = ModelContext('test', {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH: self._domain_home
+        })
+        config_model = _discover_sections(model_context, self.aliases, self._domain_home, self.wlst)
+        expected_model = FileToPython(self._expected_model_file).parse()
+
+        for section, config_section in [(model_constants.TOPOLOGY, config_model.get_model_topology()),
+                                        (model_constants.RESOURCES, config_model.get_model_resources())]:
+            for folder_name in expected_model[section]:
+                self.assertEqual(folder_name in config_section, True, section + '/' + folder_name + ' is missing')
+                _assert_same(self, config_section[folder_name], expected_model[section][folder_name],
+                             section + '/' + folder_name)
+
+    def testSecurityProvider(self):
+        provider = self.wlst.cd('/SecurityConfiguration/base_domain/Realm/myrealm/AuthenticationProvider/'
+                                'DefaultAuthenticator')
+        interfaces = provider.getClass().getInterfaces()
+        self.assertEqual(interfaces, ['weblogic.security.providers.authentication.DefaultAuthenticatorMBean'])
+
+    def testFingerprints(self):
+        fingerprints = ConfigXmlReader(self._domain_home, self.aliases).read_fingerprints()
+        server_names = fingerprints['Server'].keys()
+        server_names.sort()
+        self.assertEqual(server_names, ['AdminServer', 'm1'])
+        self.assertEqual(fingerprints['Server']['AdminServer'] != fingerprints['Server']['m1'], True)
+        self.assertEqual(len(fingerprints['JDBCSystemResource']['MyDataSource']), 32)
+
+        again = ConfigXmlReader(self._domain_home, self.aliases).read_fingerprints()
+        self.assertEqual(again['JDBCSystemResource']['MyDataSource'],
+                         fingerprints['JDBCSystemResource']['MyDataSource'])
+
+    def testMissingPath(self):
+        self.wlst.cd('/Server/AdminServer')
+        self.assertRaises(ConfigXmlWlstException, self.wlst.cd, '/Server/NoSuchServer')
+        self.assertRaises(ConfigXmlWlstException, self.wlst.ls, 'NoSuchFolder')
+        self.assertEqual(self.wlst.pwd(), '/base_domain/Server/AdminServer')
+
+
+def _discover_sections(model_context, aliases, domain_home, config_wlst):
+    """
+    Discover the topology and resources sections of the fixture domain, read with WLST offline if config_wlst
+    is None, or from config.xml.
+    """
+    model = Model()
+    if config_wlst is None:
+        wlst_helper.read_domain(domain_home)
+    else:
+        wlst_helper.set_thread_wlst(config_wlst)
+    try:
+        base_location = LocationContext()
+        wlst_helper.cd('/')
+        base_location.add_name_token(aliases.get_name_token(base_location), wlst_helper.get(model_constants.NAME))
+        TopologyDiscoverer(model_context, model.get_model_topology(), base_location, wlst_mode=WlstModes.OFFLINE,
+                           aliases=aliases).discover()
+        ResourcesDiscoverer(model_context, model.get_model_resources(), base_location, wlst_mode=WlstModes.OFFLINE,
+                            aliases=aliases).discover()
+    finally:
+        if config_wlst is None:
+            wlst_helper.close_domain()
+        else:
+            wlst_helper.set_thread_wlst(None)
+    return model
+
+
+def _assert_contained(test_case, config_folder, wlst_folder, path):
+    """
+    Check that every folder and attribute of the config.xml model is in the WLST offline model, with the same value.
+    """
+    for key in config_folder:
+        key_path = path + '/' + key
+        test_case.assertEqual(key in wlst_folder, True, key_path + ' is not in the WLST offline model')
+        if isinstance(config_folder[key], dict):
+            _assert_contained(test_case, config_folder[key], wlst_folder[key], key_path)
+        else:
+            test_case.assertEqual(config_folder[key], wlst_folder[key], key_path)
+
+
+def _assert_same(test_case, config_folder, expected_folder, path):
+    """
+    Check that the config.xml model has the same folders and attributes as the expected model.  The values are
+    compared as text, since the YAML file and discovery do not use the same types for the values.
+    """
+    config_keys = config_folder.keys()
+    config_keys.sort()
+    expected_keys = expected_folder.keys()
+    expected_keys.sort()
+    test_case.assertEqual(config_keys, expected_keys, path)
+    for key in expected_folder:
+        key_path = path + '/' + key
+        if isinstance(expected_folder[key], dict):
+            _assert_same(test_case, config_folder[key], expected_folder[key], key_path)
+        else:
+            test_case.assertEqual(_to_text(config_folder[key]), _to_text(expected_folder[key]), key_path)
+
+
+def _to_text(value):
+    if isinstance(value, list):
+        return ','.join(map(_to_text, value))
+    return str(value).lower()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.tool.discover import discover_timer
+from wlsdeploy.util import wlst_helper
+
+
+class DiscoverTimerTestCase(unittest.TestCase):
+    """
+    Check the MBeans and WLST calls recorded for the phases and top-level folders of the timing report.
+    """
+
+    def setUp(self):
+        discover_timer.reset()
+
+    def testFoldersAndPhases(self):
+        discover_timer.start_phase('sections')
+        discover_timer.enter_folder('Server')
+        discover_timer.count_mbean()
+        discover_timer.count_mbean()
+        wlst_helper._count_call('cd')
+        wlst_helper._count_call('lsa')
+        discover_timer.enter_folder('Server')
+        discover_timer.count_mbean()
+        discover_timer.enter_folder('Cluster')
+        discover_timer.count_mbean()
+        wlst_helper._count_call('lsc')
+        discover_timer.end_phase('sections')
+
+        report = discover_timer.get_report()
+        self.assertEqual(report[discover_timer.FOLDERS].keys(), ['Server', 'Cluster'])
+        server = report[discover_timer.FOLDERS]['Server']
+        self.assertEqual(server[discover_timer.MBEANS], 3)
+        self.assertEqual(server[discover_timer.WLST_CALLS]['cd'], 1)
+        self.assertEqual(server[discover_timer.WLST_CALLS]['lsa'], 1)
+        self.assertEqual(server[discover_timer.WLST_CALLS]['lsc'], 0)
+
+        cluster = report[discover_timer.FOLDERS]['Cluster']
+        self.assertEqual(cluster[discover_timer.MBEANS], 1)
+        self.assertEqual(cluster[discover_timer.WLST_CALLS]['lsc'], 1)
+
+        phase = report[discover_timer.PHASES]['sections']
+        self.assertEqual(phase[discover_timer.MBEANS], 4)
+        self.assertEqual(phase[discover_timer.WLST_CALLS]['cd'], 1)
+        self.assertEqual(phase[discover_timer.WLST_CALLS]['lsa'], 1)
+        self.assertEqual(phase[discover_timer.WLST_CALLS]['lsc'], 1)
+
+    def testFolderAddedUp(self):
+        discover_timer.enter_folder('JDBCSystemResource')
+        discover_timer.count_mbean()
+        discover_timer.enter_folder('Server')
+        discover_timer.enter_folder('JDBCSystemResource')
+        discover_timer.count_mbean()
+        discover_timer.end_folder()
+
+        report = discover_timer.get_report()
+        self.assertEqual(report[discover_timer.FOLDERS]['JDBCSystemResource'][discover_timer.MBEANS], 2)
+        self.assertEqual(report[discover_timer.FOLDERS]['Server'][discover_timer.MBEANS], 0)
+
+    def testSummaryLines(self):
+        self.assertEqual(discover_timer.get_summary_lines(), [])
+
+        discover_timer.start_phase('connect')
+        discover_timer.end_phase('connect')
+        discover_timer.enter_folder('Server')
+        discover_timer.end_folder()
+
+        lines = discover_timer.get_summary_lines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[1].startswith('phase:connect'), True)
+        self.assertEqual(lines[2].startswith('folder:Server'), True)
+
+
+if __name__ == '__main__':
+    unittest.main()
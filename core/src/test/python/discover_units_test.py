@@ -0,0 +1,101 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.tool.discover import discover_units
+from wlsdeploy.tool.discover.discover_units import UnitFilter
+from wlsdeploy.util.model import Model
+
+_MS1 = ('Server', 'SERVER', 'ms1')
+_MS2 = ('Server', 'SERVER', 'ms2')
+_DATASOURCE = ('JDBCSystemResource', 'DATASOURCE', 'ds1')
+
+
+class DiscoverUnitsTestCase(unittest.TestCase):
+    """
+    Check the unit filters and the merge of the units discovered apart.
+    """
+
+    def testIncludedUnits(self):
+        unit_filter = UnitFilter([_MS1, _DATASOURCE], True)
+        self.assertEqual(unit_filter.includes_location(_get_location(_MS1)), True)
+        self.assertEqual(unit_filter.includes_location(_get_location(_MS1).append_location('SSL')), True)
+        self.assertEqual(unit_filter.includes_location(_get_location(_MS2)), False)
+        self.assertEqual(unit_filter.includes_location(_get_location(_DATASOURCE)), True)
+        self.assertEqual(unit_filter.includes_location(_get_location(('Cluster', 'CLUSTER', 'c1'))), False)
+        # listing the instances of a folder is always allowed
+        self.assertEqual(unit_filter.includes_location(LocationContext().append_location('Server')), True)
+
+        server_folder = LocationContext().append_location('Server')
+        self.assertEqual(unit_filter.filter_names(server_folder, ['ms1', 'ms2']), ['ms1'])
+        cluster_folder = LocationContext().append_location('Cluster')
+        self.assertEqual(unit_filter.filter_names(cluster_folder, ['c1']), ['c1'])
+
+    def testExcludedUnits(self):
+        unit_filter = UnitFilter([_MS1], False)
+        self.assertEqual(unit_filter.includes_location(_get_location(_MS1)), False)
+        self.assertEqual(unit_filter.includes_location(_get_location(_MS1).append_location('SSL')), False)
+        self.assertEqual(unit_filter.includes_location(_get_location(_MS2)), True)
+        self.assertEqual(unit_filter.includes_location(_get_location(_DATASOURCE)), True)
+        # the excluded instances keep their names, so the model has them in the order of a full discovery
+        server_folder = LocationContext().append_location('Server')
+        self.assertEqual(unit_filter.filter_names(server_folder, ['ms1', 'ms2']), ['ms1', 'ms2'])
+
+    def testCombinedFilters(self):
+        first_filter = UnitFilter([_MS1, _MS2], True)
+        second_filter = UnitFilter([_MS2], False)
+        self.assertEqual(discover_units.combine_filters(None, second_filter), second_filter)
+        self.assertEqual(discover_units.combine_filters(first_filter, None), first_filter)
+
+        combined = discover_units.combine_filters(first_filter, second_filter)
+        self.assertEqual(combined.includes_location(_get_location(_MS1)), True)
+        self.assertEqual(combined.includes_location(_get_location(_MS2)), False)
+        self.assertEqual(combined.includes_location(_get_location(('Server', 'SERVER', 'ms3'))), False)
+
+    def testMergeUnits(self):
+        model = Model()
+        servers = OrderedDict()
+        servers['ms1'] = OrderedDict()
+        servers['ms2'] = OrderedDict()
+        servers['ms3'] = _get_server(8003)
+        model.get_model_topology()['Server'] = servers
+        data_sources = OrderedDict()
+        data_sources['ds1'] = OrderedDict()
+        model.get_model_resources()['JDBCSystemResource'] = data_sources
+
+        unit_model = Model()
+        unit_servers = OrderedDict()
+        unit_servers['ms2'] = _get_server(8002)
+        unit_servers['ms1'] = _get_server(8001)
+        unit_model.get_model_topology()['Server'] = unit_servers
+
+        discover_units.merge_units(model, unit_model, [_MS1, _MS2, _DATASOURCE])
+
+        servers = model.get_model_topology()['Server']
+        # the order of the model is kept
+        self.assertEqual(servers.keys(), ['ms1', 'ms2', 'ms3'])
+        self.assertEqual(servers['ms1']['ListenPort'], 8001)
+        self.assertEqual(servers['ms2']['ListenPort'], 8002)
+        self.assertEqual(servers['ms3']['ListenPort'], 8003)
+        # a unit missing from the unit model is removed, and so is its emptied folder
+        self.assertEqual('JDBCSystemResource' in model.get_model_resources(), False)
+
+
+def _get_location(unit):
+    location = LocationContext().append_location(unit[discover_units.FOLDER])
+    return location.add_name_token(unit[discover_units.NAME_TOKEN], unit[discover_units.INSTANCE])
+
+
+def _get_server(port):
+    server = OrderedDict()
+    server['ListenPort'] = port
+    return server
+
+
+if __name__ == '__main__':
+    unittest.main()
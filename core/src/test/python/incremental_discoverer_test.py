@@ -0,0 +1,131 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import javaos as os
+import unittest
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover import incremental_discoverer
+from wlsdeploy.tool.discover.incremental_discoverer import IncrementalDiscoverer
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model import Model
+from wlsdeploy.util.model_context import ModelContext
+
+_MS1 = ('Server', 'SERVER', 'ms1')
+_APP = ('Application', 'APPDEPLOYMENT', 'app1')
+
+
+class IncrementalDiscovererTestCase(unittest.TestCase):
+    """
+    Check which units of a previous discovery are reused.
+    """
+    _wls_version = '12.2.1.3'
+    _execution_dir = '../../unit-tests/'
+    _discovery_file = os.path.join(_execution_dir, 'previous-discovery.yaml')
+
+    def setUp(self):
+        arg_map = {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH: '',
+            CommandLineArgUtil.PREVIOUS_DISCOVERY_SWITCH: self._discovery_file
+        }
+        self.model_context = ModelContext('test', arg_map)
+        self.aliases = Aliases(self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=self._wls_version)
+        self.discoverer = IncrementalDiscoverer(self.model_context, LocationContext(), self.aliases,
+                                                WlstModes.OFFLINE, None)
+
+        topology = OrderedDict()
+        topology['Server'] = OrderedDict()
+        topology['Server']['ms1'] = OrderedDict()
+        topology['Server']['ms1']['ListenPort'] = 8001
+        deployments = OrderedDict()
+        deployments['Application'] = OrderedDict()
+        deployments['Application']['app1'] = OrderedDict()
+        deployments['Application']['app1']['SourcePath'] = 'wlsdeploy/applications/app1.ear'
+        model_dict = OrderedDict()
+        model_dict['topology'] = topology
+        model_dict['appDeployments'] = deployments
+        self.previous_model = Model(model_dict)
+        self.previous_fingerprints = {'Server': {'ms1': 'aaaa'}, 'Application': {'app1': 'bbbb'}}
+
+    def testUnchangedUnitIsReused(self):
+        fingerprints = {'Server': {'ms1': 'aaaa'}}
+        self.assertEqual(self.__is_unchanged(_MS1, fingerprints), True)
+
+    def testChangedUnitIsDiscovered(self):
+        self.assertEqual(self.__is_unchanged(_MS1, {'Server': {'ms1': 'cccc'}}), False)
+        # a unit without a fingerprint is always discovered
+        self.assertEqual(self.__is_unchanged(_MS1, dict()), False)
+        # so is a unit that is not in the previous discovery
+        self.assertEqual(self.__is_unchanged(('Server', 'SERVER', 'ms2'), {'Server': {'ms2': 'aaaa'}}), False)
+
+    def testUnitWithArchivePathIsDiscovered(self):
+        fingerprints = {'Application': {'app1': 'bbbb'}}
+        self.assertEqual(self.__is_unchanged(_APP, fingerprints), False)
+
+    def testHasArchivePath(self):
+        self.assertEqual(incremental_discoverer._has_archive_path('wlsdeploy/applications/app1.ear'), True)
+        self.assertEqual(incremental_discoverer._has_archive_path('/apps/app1.ear'), False)
+        self.assertEqual(incremental_discoverer._has_archive_path(7001), False)
+        self.assertEqual(incremental_discoverer._has_archive_path(['a.jar', 'wlsdeploy/classpathLibraries/b.jar']),
+                         True)
+        nested = {'SSL': {'ms1': {'ServerPrivateKeyFileName': 'wlsdeploy/servers/ms1/identity.jks'}}}
+        self.assertEqual(incremental_discoverer._has_archive_path(nested), True)
+        self.assertEqual(incremental_discoverer._has_archive_path({'SSL': {'ms1': {'Enabled': True}}}), False)
+
+    def testDiscoverPathsSkipPreviousDiscovery(self):
+        if not os.path.exists(self._execution_dir):
+            os.makedirs(self._execution_dir)
+        discovery_file = open(self._discovery_file, 'w')
+        discovery_file.write('# not a previous discovery\n')
+        discovery_file.close()
+
+        discovered = list()
+
+        def discover_ms1(model, model_context, base_location, aliases):
+            discovered.append(discoverer.get_discover_filter())
+            model.get_model_topology()['Server'] = OrderedDict()
+            model.get_model_topology()['Server']['ms1'] = {'SSL': {'ms1': {'Enabled': True}}}
+
+        path_filter = _StubPathFilter()
+        discoverer.set_discover_filter(path_filter)
+        try:
+            model = Model()
+            IncrementalDiscoverer(self.model_context, LocationContext(), self.aliases, WlstModes.OFFLINE,
+                                  discover_ms1).discover(model)
+        finally:
+            discoverer.set_discover_filter(None)
+
+        # the units were not looked up or merged, and the filtered model was not saved as a previous discovery
+        self.assertEqual(discovered, [path_filter])
+        self.assertEqual(model.get_model_topology()['Server']['ms1'], {'SSL': {'ms1': {'Enabled': True}}})
+        discovery_file = open(self._discovery_file, 'r')
+        self.assertEqual(discovery_file.read(), '# not a previous discovery\n')
+        discovery_file.close()
+        os.remove(self._discovery_file)
+
+    def __is_unchanged(self, unit, fingerprints):
+        return self.discoverer._IncrementalDiscoverer__is_unchanged(unit, fingerprints, self.previous_model,
+                                                                     self.previous_fingerprints)
+
+
+class _StubPathFilter(object):
+    """
+    The filter of a discovery limited to the SSL folder of server ms1, with -discover_paths topology:/Server/ms1/SSL.
+    """
+
+    def includes_location(self, location):
+        return True
+
+    def filter_names(self, location, names):
+        return names
+
+
+if __name__ == '__main__':
+    unittest.main()
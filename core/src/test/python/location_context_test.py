@@ -0,0 +1,69 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.aliases.location_context import LocationContext
+
+
+class LocationContextTestCase(unittest.TestCase):
+
+    def testAppendAndPop(self):
+        location = LocationContext().append_location('JDBCSystemResource', 'JdbcResource')
+        self.assertEqual(location.get_folder_path(), '/JDBCSystemResource/JdbcResource')
+        self.assertEqual(location.get_parent_folder_path(), '/JDBCSystemResource')
+        self.assertEqual(location.get_current_model_folder(), 'JdbcResource')
+        self.assertEqual(len(location), 2)
+
+        self.assertEqual(location.pop_location(), 'JdbcResource')
+        self.assertEqual(location.get_folder_path(), '/JDBCSystemResource')
+        self.assertEqual(location.get_parent_folder_path(), '/')
+
+        location.append_location('JdbcResource', 'JDBCDriverParams')
+        self.assertEqual(location.pop_location(0), 'JDBCSystemResource')
+        self.assertEqual(location.get_model_folders(), ['JdbcResource', 'JDBCDriverParams'])
+
+        location.pop_location()
+        location.pop_location()
+        self.assertEqual(location.is_empty(), True)
+        self.assertEqual(location.get_folder_path(), '/')
+        self.assertEqual(location.get_current_model_folder(), 'Domain')
+        self.assertRaises(IndexError, location.pop_location)
+
+    def testCopiesAreIndependent(self):
+        location = LocationContext().append_location('Server')
+        location.add_name_token('SERVER', 'AdminServer')
+
+        copy = LocationContext(location)
+        copy.append_location('SSL')
+        copy.add_name_token('SERVER', 'ms1')
+
+        self.assertEqual(location.get_model_folders(), ['Server'])
+        self.assertEqual(location.get_name_for_token('SERVER'), 'AdminServer')
+        self.assertEqual(copy.get_model_folders(), ['Server', 'SSL'])
+        self.assertEqual(copy.get_name_for_token('SERVER'), 'ms1')
+
+    def testEqualityAndHash(self):
+        first = LocationContext().append_location('Server', 'SSL')
+        first.add_name_token('SERVER', 'AdminServer')
+        second = LocationContext().append_location('Server')
+        second.add_name_token('SERVER', 'AdminServer')
+        second.append_location('SSL')
+
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(first.get_folder_path() is second.get_folder_path(), True)
+
+        cache = dict()
+        cache[LocationContext(first)] = 'ssl'
+        self.assertEqual(cache[second], 'ssl')
+
+        second.add_name_token('SERVER', 'ms1')
+        self.assertNotEqual(first, second)
+        self.assertEqual(second in cache, False)
+        self.assertNotEqual(first.get_cache_key(), second.get_cache_key())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.util.lru_cache import LruCache
+
+
+class LruCacheTestCase(unittest.TestCase):
+
+    def testGetAndPut(self):
+        cache = LruCache(3)
+        cache.put('a', 1)
+        cache.put('b', None)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('b', 'missing'), None)
+        self.assertEqual(cache.get('c', 'missing'), 'missing')
+
+        stats = cache.get_statistics()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['max_size'], 3)
+
+    def testEvictsLeastRecentlyUsed(self):
+        cache = LruCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        # touch a so that b becomes the least recently used
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertEqual('a' in cache, True)
+        self.assertEqual('b' in cache, False)
+        self.assertEqual('c' in cache, True)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_statistics()['evictions'], 1)
+
+    def testReplaceAndClear(self):
+        cache = LruCache(2)
+        cache.put(('x', ()), 1)
+        cache.put(('x', ()), 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get(('x', ())), 2)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get(('x', ())), None)
+        cache.put('y', 3)
+        self.assertEqual(cache.get('y'), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from java.lang import Boolean
+from javax.management import MBeanServerFactory
+from javax.management import ObjectName
+from javax.management.timer import Timer
+
+from wlsdeploy.util import mbean_attributes
+from wlsdeploy.util import wlst_helper
+
+
+class MBeanAttributesTestCase(unittest.TestCase):
+    """
+    Read and set the attributes of MBeans registered in an in-JVM MBean server, which stands in for the
+    admin server connection, and look up the ObjectName of the current MBean through a stub WLST.
+    """
+    _delegate_name = ObjectName('JMImplementation:type=MBeanServerDelegate')
+    _timer_name = ObjectName('test:type=Timer')
+    _missing_name = ObjectName('test:type=NoSuchMBean')
+
+    def setUp(self):
+        self.server = MBeanServerFactory.newMBeanServer()
+        self.server.registerMBean(Timer(), self._timer_name)
+
+    def tearDown(self):
+        wlst_helper.set_thread_wlst(None)
+
+    def testReadAttributes(self):
+        names = ['MBeanServerId', 'ImplementationName', 'SpecificationVersion']
+        values, failed_names = mbean_attributes.read_attributes(self.server, self._delegate_name, names)
+
+        self.assertEqual(len(failed_names), 0)
+        for name in names:
+            self.assertEqual(values[name], self.server.getAttribute(self._delegate_name, name))
+
+    def testFailedReadsAreReturned(self):
+        names = ['MBeanServerId', 'NoSuchAttribute']
+        values, failed_names = mbean_attributes.read_attributes(self.server, self._delegate_name, names)
+
+        self.assertEqual(values.keys(), ['MBeanServerId'])
+        self.assertEqual(failed_names, ['NoSuchAttribute'])
+
+    def testReadMissingMBeanFailsAllAttributes(self):
+        names = ['MBeanServerId', 'ImplementationName']
+        values, failed_names = mbean_attributes.read_attributes(self.server, self._missing_name, names)
+
+        self.assertEqual(len(values), 0)
+        self.assertEqual(failed_names, names)
+
+    def testWriteAttributes(self):
+        attributes = [('SendPastNotifications', Boolean.TRUE)]
+        failed_names = mbean_attributes.write_attributes(self.server, self._timer_name, attributes)
+
+        self.assertEqual(failed_names, [])
+        self.assertEqual(self.server.getAttribute(self._timer_name, 'SendPastNotifications'), Boolean.TRUE)
+
+    def testFailedWritesAreReturned(self):
+        attributes = [('SendPastNotifications', Boolean.TRUE), ('NoSuchAttribute', 'value'),
+                      ('NbNotifications', Boolean.TRUE)]
+        failed_names = mbean_attributes.write_attributes(self.server, self._timer_name, attributes)
+
+        self.assertEqual(failed_names, ['NoSuchAttribute', 'NbNotifications'])
+        self.assertEqual(self.server.getAttribute(self._timer_name, 'SendPastNotifications'), Boolean.TRUE)
+
+    def testWriteMissingMBeanFailsAllAttributes(self):
+        attributes = [('SendPastNotifications', Boolean.TRUE), ('Name', 'value')]
+        failed_names = mbean_attributes.write_attributes(self.server, self._missing_name, attributes)
+
+        self.assertEqual(failed_names, ['SendPastNotifications', 'Name'])
+
+    def testGetObjectName(self):
+        wlst = _StubWlst()
+        wlst_helper.set_thread_wlst(wlst)
+        wlst.cmo = _StubMBean(self._timer_name)
+        self.assertEqual(mbean_attributes.get_object_name(), self._timer_name)
+
+        wlst.cmo = None
+        self.assertEqual(mbean_attributes.get_object_name(), None)
+
+
+class _StubWlstException(Exception):
+    pass
+
+
+class _StubWlst(object):
+    """
+    The WLST of a connected session, with the current MBean that the test sets.
+    """
+    WLSTException = _StubWlstException
+
+    def __init__(self):
+        self.connected = 'true'
+        self.cmo = None
+
+    def pwd(self):
+        return 'edit:/Servers/ms1'
+
+
+class _StubMBean(object):
+    def __init__(self, object_name):
+        self._object_name = object_name
+
+    def getObjectName(self):
+        return self._object_name
+
+
+if __name__ == '__main__':
+    unittest.main()
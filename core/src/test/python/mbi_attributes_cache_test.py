@@ -0,0 +1,131 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from javax.management import ObjectName
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.util import wlst_helper
+
+_AUTHENTICATOR_TYPE = 'weblogic.security.providers.authentication.DefaultAuthenticator'
+
+
+class MbiAttributesCacheTestCase(unittest.TestCase):
+    """
+    Read the MBeanInfo attribute names through a stub WLST, and check that they are read once for each MBean type.
+    """
+
+    def setUp(self):
+        discoverer.clear_mbi_attributes_cache()
+        self.wlst = _StubWlst()
+        wlst_helper.set_thread_wlst(self.wlst)
+        self.location = LocationContext().append_location('Server').add_name_token('SERVER', 'ms1')
+
+    def tearDown(self):
+        wlst_helper.set_thread_wlst(None)
+        discoverer.clear_mbi_attributes_cache()
+
+    def testAttributesAreReadOncePerType(self):
+        self.wlst.mbean_info = _StubMBeanInfo(['ListenPort', 'Machine'])
+        server_name = ObjectName('com.bea:Name=ms1,Type=Server')
+        attribute_list, attribute_names = discoverer._get_mbi_attributes(self.location, None, server_name)
+        self.assertEqual(attribute_list, ['ListenPort', 'Machine'])
+        self.assertEqual('Machine' in attribute_names, True)
+
+        self.wlst.mbean_info = _StubMBeanInfo(['Other'])
+        other_name = ObjectName('com.bea:Name=ms2,Type=Server')
+        attribute_list, attribute_names = discoverer._get_mbi_attributes(self.location, None, other_name)
+        self.assertEqual(attribute_list, ['ListenPort', 'Machine'])
+        self.assertEqual(self.wlst.mbi_calls, 1)
+
+    def testTypesSharingFolderAreCachedApart(self):
+        self.wlst.mbean_info = _StubMBeanInfo(['ListenPort'])
+        discoverer._get_mbi_attributes(self.location, None, ObjectName('com.bea:Name=ms1,Type=Server'))
+
+        self.wlst.mbean_info = _StubMBeanInfo(['ControlFlag', 'PasswordDigestEnabled'])
+        provider_name = ObjectName('Security:Name=myrealmDefaultAuthenticator,Type=' + _AUTHENTICATOR_TYPE)
+        attribute_list, attribute_names = discoverer._get_mbi_attributes(self.location, None, provider_name)
+        self.assertEqual(attribute_list, ['ControlFlag', 'PasswordDigestEnabled'])
+        self.assertEqual(self.wlst.mbi_calls, 2)
+
+    def testFailureIsNotCached(self):
+        server_name = ObjectName('com.bea:Name=ms1,Type=Server')
+        self.wlst.mbean_info = None
+        self.assertEqual(discoverer._get_mbi_attributes(self.location, None, server_name), ([], {}))
+
+        self.wlst.fail = True
+        self.assertEqual(discoverer._get_mbi_attributes(self.location, None, server_name), ([], {}))
+
+        self.wlst.fail = False
+        self.wlst.mbean_info = _StubMBeanInfo(['ListenPort'])
+        attribute_list, attribute_names = discoverer._get_mbi_attributes(self.location, None, server_name)
+        self.assertEqual(attribute_list, ['ListenPort'])
+        self.assertEqual(self.wlst.mbi_calls, 3)
+
+    def testFolderPathWithoutObjectName(self):
+        self.wlst.mbean_info = _StubMBeanInfo(['ListenPort'])
+        discoverer._get_mbi_attributes(self.location, None, None)
+        discoverer._get_mbi_attributes(self.location, None, None)
+        self.assertEqual(self.wlst.mbi_calls, 1)
+
+
+class _StubWlstException(Exception):
+    pass
+
+
+class _StubWlst(object):
+    """
+    The WLST of a connected session, which returns the MBeanInfo that the test sets.
+    """
+    WLSTException = _StubWlstException
+
+    def __init__(self):
+        self.connected = 'true'
+        self.mbean_info = None
+        self.fail = False
+        self.mbi_calls = 0
+
+    def pwd(self):
+        return 'serverConfig:/Servers/ms1'
+
+    def getMBI(self):
+        self.mbi_calls += 1
+        if self.fail:
+            raise _StubWlstException('no MBeanInfo')
+        return self.mbean_info
+
+
+class _StubMBeanInfo(object):
+    def __init__(self, names):
+        self._attributes = list()
+        for name in names:
+            self._attributes.append(_StubAttributeInfo(name))
+
+    def getAttributes(self):
+        return self._attributes
+
+
+class _StubAttributeInfo(object):
+    def __init__(self, name):
+        self._name = name
+
+    def getName(self):
+        return self._name
+
+    def isWritable(self):
+        return True
+
+    def getDescriptor(self):
+        return self
+
+    def getFieldValue(self, field_name):
+        if field_name == 'descriptorType':
+            return 'Attribute'
+        return None
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.deploy.model_diff import ModelDiff
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class ModelDiffTestCase(unittest.TestCase):
+    """
+    Check the differences found between two models, and the parts of the new model that are deployed.
+    """
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+    model_context = ModelContext('test', arg_map)
+    aliases = Aliases(model_context, wlst_mode=WlstModes.OFFLINE, wls_version='12.2.1.3')
+
+    def setUp(self):
+        self.previous = {
+            'domainInfo': {'AdminUserName': 'weblogic'},
+            'topology': {
+                'Name': 'base_domain',
+                'AdminServerName': 'AdminServer',
+                'Server': {
+                    'AdminServer': {'ListenPort': 7001},
+                    'ms1': {'ListenPort': 8001, 'SSL': {'Enabled': 'false'}},
+                    'ms2': {'ListenPort': 8002}
+                }
+            },
+            'resources': {
+                'JDBCSystemResource': {
+                    'ds1': {'Target': 'ms1', 'JdbcResource': {'JDBCDriverParams': {'URL': 'jdbc:one'}}},
+                    'ds2': {'Target': 'ms2'}
+                }
+            },
+            'appDeployments': {
+                'Application': {
+                    'app1': {'SourcePath': 'wlsdeploy/applications/app1.war', 'Target': 'ms1'},
+                    'app2': {'SourcePath': '/opt/apps/app2.war', 'Target': 'ms1'}
+                }
+            }
+        }
+        self.new = {
+            'domainInfo': {'AdminUserName': 'weblogic'},
+            'topology': {
+                'Name': 'base_domain',
+                'AdminServerName': 'AdminServer',
+                'Server': {
+                    'AdminServer': {'ListenPort': 7001},
+                    'ms1': {'ListenPort': 8001, 'SSL': {'Enabled': 'true'}},
+                    'ms2': {'ListenPort': 8002},
+                    'ms3': {'ListenPort': 8003}
+                }
+            },
+            'resources': {
+                'JDBCSystemResource': {
+                    'ds1': {'Target': 'ms1', 'JdbcResource': {'JDBCDriverParams': {'URL': 'jdbc:one'}}}
+                }
+            },
+            'appDeployments': {
+                'Application': {
+                    'app1': {'SourcePath': 'wlsdeploy/applications/app1.war', 'Target': 'ms1'},
+                    'app2': {'SourcePath': '/opt/apps/app2.war', 'Target': 'ms1'}
+                }
+            }
+        }
+
+    def testDifferences(self):
+        model_diff = ModelDiff(self.previous, self.new)
+        self.assertEqual(model_diff.get_added(), ['topology:/Server/ms3'])
+        self.assertEqual(model_diff.get_changed(), ['topology:/Server/ms1/SSL/Enabled'])
+        self.assertEqual(model_diff.get_removed(), ['resources:/JDBCSystemResource/ds2'])
+
+        self.assertEqual(model_diff.has_changes('topology', ['Server']), True)
+        self.assertEqual(model_diff.has_changes('topology', ['Server', 'ms1']), True)
+        self.assertEqual(model_diff.has_changes('topology', ['Server', 'ms2']), False)
+        self.assertEqual(model_diff.has_changes('resources', ['JDBCSystemResource']), False)
+
+    def testChangedModel(self):
+        model_diff = ModelDiff(self.previous, self.new)
+        changed = model_diff.get_changed_model(self.new, self.model_context, self.aliases)
+
+        self.assertEqual(changed['domainInfo'], self.new['domainInfo'])
+        self.assertEqual(changed['topology'].keys(), ['Server'])
+        servers = changed['topology']['Server'].keys()
+        servers.sort()
+        self.assertEqual(servers, ['ms1', 'ms3'])
+        self.assertEqual('resources' in changed, False)
+
+        # the application from the archive is deployed so that its hash is checked
+        self.assertEqual(changed['appDeployments']['Application'].keys(), ['app1'])
+
+    def testNoChanges(self):
+        model_diff = ModelDiff(self.new, self.new)
+        self.assertEqual(model_diff.get_added(), [])
+        self.assertEqual(model_diff.get_changed(), [])
+        self.assertEqual(model_diff.get_removed(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import threading
+import time
+import unittest
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.tool.discover import discover_units
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover import parallel_discoverer
+from wlsdeploy.tool.discover.parallel_discoverer import ParallelDiscoverer
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model import Model
+from wlsdeploy.util.model_context import ModelContext
+
+_SERVERS = ['ms1', 'ms2', 'ms3']
+_UNITS = [('Server', 'SERVER', 'ms1'), ('Server', 'SERVER', 'ms2'), ('Server', 'SERVER', 'ms3')]
+
+
+class ParallelDiscovererTestCase(unittest.TestCase):
+    """
+    Run the parallel discovery with a stub discover function and a stub WLST for the worker connections.
+    The stub discover function lists the servers like the topology discoverer, and records the thread that
+    discovered each server.
+    """
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+
+    def setUp(self):
+        self.model_context = ModelContext('test', self.arg_map)
+        self.base_location = LocationContext()
+        self._find_units = discover_units.find_units
+        discover_units.find_units = _find_units
+
+    def tearDown(self):
+        discover_units.find_units = self._find_units
+        discoverer.set_discover_filter(None)
+
+    def testWorkerResultsAreMerged(self):
+        model = Model()
+        parallel = ParallelDiscoverer(self.model_context, self.base_location, None, 2, _discover_servers,
+                                      wlst_factory=_StubWlst)
+        parallel.discover(model)
+
+        servers = model.get_model_topology()['Server']
+        self.assertEqual(servers.keys(), _SERVERS)
+        self.assertEqual(servers['ms1']['Thread'], threading.currentThread().getName())
+        self.assertEqual(servers['ms2']['Thread'], 'wdt-discover-1')
+        self.assertEqual(servers['ms3']['Thread'], threading.currentThread().getName())
+        for name in _SERVERS:
+            self.assertEqual(servers[name]['ListenPort'], _get_port(name))
+        self.assertEqual(discoverer.get_discover_filter(), None)
+
+    def testFailedWorkerIsRediscovered(self):
+        model = Model()
+        parallel = ParallelDiscoverer(self.model_context, self.base_location, None, 2, _discover_servers,
+                                      wlst_factory=_FailingWlst)
+        parallel.discover(model)
+
+        servers = model.get_model_topology()['Server']
+        self.assertEqual(servers.keys(), _SERVERS)
+        for name in _SERVERS:
+            self.assertEqual(servers[name]['Thread'], threading.currentThread().getName())
+            self.assertEqual(servers[name]['ListenPort'], _get_port(name))
+
+    def testSynchronizedArchive(self):
+        archive = _StubArchive()
+        synchronized = parallel_discoverer._SynchronizedArchive(archive)
+        self.assertEqual(synchronized.name, 'archive.zip')
+
+        threads = list()
+        for index in range(4):
+            thread = threading.Thread(target=synchronized.addServerKeyStoreFile, args=('ms%s' % index,))
+            threads.append(thread)
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(archive.added), 4)
+        self.assertEqual(archive.max_callers, 1)
+
+
+def _find_units(model_context, base_location, aliases, wlst_mode):
+    return list(_UNITS)
+
+
+def _get_port(name):
+    return 8000 + _SERVERS.index(name)
+
+
+def _discover_servers(model, model_context, base_location, aliases):
+    """
+    List the servers and discover the ones that the filter of the thread includes.  The excluded servers
+    get an empty entry, like the excluded instances in the section discoverers.
+    """
+    discover_filter = discoverer.get_discover_filter()
+    folder_location = LocationContext(base_location).append_location('Server')
+    names = _SERVERS
+    if discover_filter is not None:
+        names = discover_filter.filter_names(folder_location, names)
+
+    servers = OrderedDict()
+    for name in names:
+        location = LocationContext(folder_location).add_name_token('SERVER', name)
+        entry = OrderedDict()
+        if discover_filter is None or discover_filter.includes_location(location):
+            entry['ListenPort'] = _get_port(name)
+            entry['Thread'] = threading.currentThread().getName()
+        servers[name] = entry
+    if len(servers) > 0:
+        model.get_model_topology()['Server'] = servers
+
+
+class _StubWlstException(Exception):
+    pass
+
+
+class _StubWlst(object):
+    """
+    The WLST of a worker thread, which connects without a server.
+    """
+    WLSTException = _StubWlstException
+
+    def connect(self, username=None, password=None, url=None):
+        return
+
+    def disconnect(self):
+        return
+
+
+class _FailingWlst(_StubWlst):
+    """
+    The WLST of a worker thread that cannot connect to the admin server.
+    """
+
+    def connect(self, username=None, password=None, url=None):
+        raise _StubWlstException('connection refused')
+
+
+class _StubArchive(object):
+    """
+    An archive that records the largest number of threads that called it at the same time.
+    """
+
+    def __init__(self):
+        self.name = 'archive.zip'
+        self.added = list()
+        self.callers = 0
+        self.max_callers = 0
+
+    def addServerKeyStoreFile(self, server_name):
+        self.callers += 1
+        self.max_callers = max(self.max_callers, self.callers)
+        time.sleep(0.01)
+        self.added.append(server_name)
+        self.callers -= 1
+        return server_name
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from oracle.weblogic.deploy.discover import DiscoverException
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.discover.path_filter import PathFilter
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class PathFilterTestCase(unittest.TestCase):
+    """
+    Check which locations and names are discovered for the -discover_paths argument.
+    """
+    arg_map = {
+        CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+        CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+    }
+    model_context = ModelContext('test', arg_map)
+    aliases = Aliases(model_context, wlst_mode=WlstModes.OFFLINE, wls_version='12.2.1.3')
+
+    def setUp(self):
+        self.base_location = LocationContext()
+        self.base_location.add_name_token(self.aliases.get_name_token(self.base_location), 'base_domain')
+        self.filter = PathFilter(['resources:/JDBCSystemResource', 'topology:/Server/ms*'], self.base_location,
+                                 self.aliases)
+
+    def testSections(self):
+        self.assertEqual(self.filter.includes_section('resources'), True)
+        self.assertEqual(self.filter.includes_section('topology'), True)
+        self.assertEqual(self.filter.includes_section('appDeployments'), False)
+        self.assertEqual(self.filter.includes_section('domainInfo'), False)
+
+    def testTopLevelFolders(self):
+        self.assertEqual(self.filter.includes_location(self.base_location), False)
+        self.assertEqual(self.filter.includes_location(self.__get_location('JDBCSystemResource')), True)
+        self.assertEqual(self.filter.includes_location(self.__get_location('Server')), True)
+        self.assertEqual(self.filter.includes_location(self.__get_location('Cluster')), False)
+        self.assertEqual(self.filter.includes_location(self.__get_location('JMSSystemResource')), False)
+
+    def testNames(self):
+        location = self.__get_location('Server')
+        self.assertEqual(self.filter.filter_names(location, ['AdminServer', 'ms1', 'ms2']), ['ms1', 'ms2'])
+
+        location = self.__get_location('JDBCSystemResource')
+        self.assertEqual(self.filter.filter_names(location, ['ds1', 'ds2']), ['ds1', 'ds2'])
+
+    def testSubfolders(self):
+        location = self.__get_location('Server')
+        location.add_name_token(self.aliases.get_name_token(location), 'ms1')
+        location.append_location('SSL')
+        self.assertEqual(self.filter.includes_location(location), True)
+
+        location = self.__get_location('Server')
+        location.add_name_token(self.aliases.get_name_token(location), 'AdminServer')
+        self.assertEqual(self.filter.includes_location(location), False)
+        location.append_location('SSL')
+        self.assertEqual(self.filter.includes_location(location), False)
+
+    def testWholeSection(self):
+        path_filter = PathFilter(['topology:/'], self.base_location, self.aliases)
+        self.assertEqual(path_filter.includes_location(self.base_location), True)
+        self.assertEqual(path_filter.includes_location(self.__get_location('Machine')), True)
+        self.assertEqual(path_filter.includes_location(self.__get_location('JDBCSystemResource')), False)
+
+    def testInvalidPaths(self):
+        self.assertRaises(DiscoverException, PathFilter, ['topology:/JDBCSystemResource'], self.base_location,
+                          self.aliases)
+        self.assertRaises(DiscoverException, PathFilter, ['topology:/Server/ms1/NoSuchFolder'], self.base_location,
+                          self.aliases)
+
+    def __get_location(self, folder_name):
+        location = LocationContext(self.base_location)
+        location.append_location(folder_name)
+        return location
+
+
+if __name__ == '__main__':
+    unittest.main()
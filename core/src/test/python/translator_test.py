@@ -1,10 +1,11 @@
 """
-Copyright (c) 2017, 2018, Oracle and/or its affiliates. All rights reserved.
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
 The Universal Permissive License (UPL), Version 1.0
 """
 import javaos as os
 import unittest
 
+from wlsdeploy.util.model import Model
 from wlsdeploy.util.model_translator import FileToPython, PythonToFile
 
 class TranslatorTestCase(unittest.TestCase):
@@ -90,3 +91,34 @@ class TranslatorTestCase(unittest.TestCase):
         self.assertEqual(quotedValue, 'test "legal" yaml')
         quotedValue = newPythonDict['baz']
         self.assertEqual(quotedValue, 'test \'legal\' yaml')
+
+    def testReleaseSections(self):
+        for target_file in [self._target_json_file, self._target_yaml_file]:
+            pythonDict = dict()
+            pythonDict['topology'] = {'Name': 'base_domain', 'Server': {'AdminServer': {'ListenPort': 7001}}}
+            pythonDict['resources'] = {'JDBCSystemResource': {'MyDataSource': {'Target': 'AdminServer'}}}
+
+            translator = PythonToFile(pythonDict, True)
+            translator.write_to_file(target_file)
+            self.assertEqual(len(pythonDict), 0)
+
+            translator = FileToPython(target_file, use_ordering=True)
+            newPythonDict = translator.parse()
+            self.assertEqual(newPythonDict['topology']['Server']['AdminServer']['ListenPort'], 7001)
+            self.assertEqual(newPythonDict['resources']['JDBCSystemResource']['MyDataSource']['Target'],
+                             'AdminServer')
+
+    def testReleaseModelSections(self):
+        model = Model({'topology': {'Name': 'base_domain'}, 'resources': {'JDBCSystemResource': {}},
+                       'appDeployments': {'Application': {'app1': {'SourcePath': '/apps/app1.ear'}}}})
+        model_dict = model.release_model()
+        self.assertEqual(model_dict.keys(), ['topology', 'resources', 'appDeployments'])
+        # the model holds no section, so the writer has the only references to them
+        self.assertEqual(model.get_model(), {})
+        self.assertEqual(model.get_model_topology(), {})
+        self.assertEqual(model.get_model_app_deployments(), {})
+
+        PythonToFile(model_dict, True).write_to_file(self._target_yaml_file)
+        self.assertEqual(len(model_dict), 0)
+        newPythonDict = FileToPython(self._target_yaml_file, use_ordering=True).parse()
+        self.assertEqual(newPythonDict['appDeployments']['Application']['app1']['SourcePath'], '/apps/app1.ear')
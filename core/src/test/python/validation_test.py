@@ -182,6 +182,20 @@ class ValidationTestCase(unittest.TestCase):
     #
     #     return
 
+    def testSeveralTargetVersions(self):
+        # Partition is only valid in 12.2.1, so its attribute is an error for 12.2.1.3 whichever version is first
+        model_dictionary = {'resources': {'Partition': {'p1': {'NoSuchAttribute': 1}}}}
+        for target_versions in ['12.2.1.3,10.3.6', '10.3.6,12.2.1.3']:
+            args = {
+                '-oracle_home': os.environ['MW_HOME'],
+                '-target_version': target_versions
+            }
+            model_context = ModelContext(self._program_name, args)
+            model_validator = Validator(model_context)
+            results = model_validator.validate_in_standalone_mode(model_dictionary)
+            self.assertEqual(results.get_errors_count(), 1)
+            self.assertEqual(results.get_warnings_count(), 1)
+
     def testIsCompatibleDataType(self):
         _method_name = 'testIsCompatibleDataType'
 
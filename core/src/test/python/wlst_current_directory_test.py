@@ -0,0 +1,47 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from wlsdeploy.util import wlst_helper
+
+
+class WlstCurrentDirectoryTestCase(unittest.TestCase):
+    """
+    Check the paths that the tracked current directory resolves and the relative moves that cd makes.
+    """
+
+    def setUp(self):
+        self.directory = wlst_helper._CurrentDirectory()
+        self.directory.path = '/Servers/ms1/SSL/ms1'
+
+    def testResolve(self):
+        self.assertEqual(self.directory.resolve('/Servers/ms1/'), '/Servers/ms1')
+        self.assertEqual(self.directory.resolve('/'), '/')
+        self.assertEqual(self.directory.resolve('..'), '/Servers/ms1/SSL')
+        self.assertEqual(self.directory.resolve('../../Log/ms1'), '/Servers/ms1/Log/ms1')
+        self.assertEqual(self.directory.resolve('.'), '/Servers/ms1/SSL/ms1')
+        self.assertEqual(self.directory.resolve('/JMSSystemResources/(jms/module)/'),
+                         '/JMSSystemResources/(jms/module)')
+        self.assertEqual(self.directory.resolve('(jms/module)'), None)
+
+        self.directory.clear()
+        self.assertEqual(self.directory.resolve('/Servers'), '/Servers')
+        self.assertEqual(self.directory.resolve('..'), None)
+
+    def testRelativePath(self):
+        self.assertEqual(self.directory.get_relative_path('/Servers/ms1/SSL/ms2'), '../ms2')
+        self.assertEqual(self.directory.get_relative_path('/Servers/ms1/SSL'), '..')
+        self.assertEqual(self.directory.get_relative_path('/Servers/ms1/SSL/ms1/Child/c1'), 'Child/c1')
+        self.assertEqual(self.directory.get_relative_path('/Servers/ms1/Log/ms1'), None)
+        self.assertEqual(self.directory.get_relative_path('/Clusters/c1'), None)
+        self.assertEqual(self.directory.get_relative_path('/Servers/ms1/SSL/ms1'), None)
+        self.assertEqual(self.directory.get_relative_path('/JMSSystemResources/(jms/module)/JmsResource'), None)
+
+        self.directory.clear()
+        self.assertEqual(self.directory.get_relative_path('/Servers/ms1'), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
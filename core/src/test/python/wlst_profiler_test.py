@@ -0,0 +1,116 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import threading
+import unittest
+
+from java.lang import ThreadLocal
+
+from wlsdeploy.util import wlst_profiler
+
+# the current WLST path of the fake wlst_helper functions
+_state = dict()
+
+# the profile of each thread, like the thread calls of wlst_helper
+_thread_profile = ThreadLocal()
+
+
+class WlstProfilerTestCase(unittest.TestCase):
+    """
+    Profile the functions of a namespace that stands in for wlst_helper, with a fake current WLST path.
+    """
+
+    def setUp(self):
+        self.profile = wlst_profiler.ThreadProfile()
+        _thread_profile.set(self.profile)
+        _state['path'] = None
+        self.namespace = {
+            '__name__': __name__,
+            'cd': _cd,
+            'get_pwd': _get_pwd,
+            'lsa': _lsa,
+            'log_counts': _log_counts
+        }
+        _state['namespace'] = self.namespace
+        wlst_profiler.instrument(self.namespace, _get_pwd, _thread_profile.get, ['log_counts'])
+
+    def testCallsAreRecorded(self):
+        self.namespace['cd']('/Servers/ms1')
+        self.namespace['cd']('/Clusters/c1')
+        self.namespace['get_pwd']()
+        self.namespace['log_counts']()
+
+        report = wlst_profiler.get_report([self.profile])
+        operations = report[wlst_profiler.OPERATIONS]
+        names = operations.keys()
+        names.sort()
+        self.assertEqual(names, ['cd', 'get_pwd'])
+        self.assertEqual(operations['cd'][wlst_profiler.CALLS], 2)
+        # the nested get_pwd calls of cd are only counted in the cd calls
+        self.assertEqual(operations['get_pwd'][wlst_profiler.CALLS], 1)
+        histogram_calls = 0
+        for count in operations['cd'][wlst_profiler.HISTOGRAM]:
+            histogram_calls += count
+        self.assertEqual(histogram_calls, 2)
+
+        folders = report[wlst_profiler.FOLDERS]
+        self.assertEqual(folders['Servers'][wlst_profiler.CALLS], 1)
+        self.assertEqual(folders['Clusters'][wlst_profiler.CALLS], 2)
+
+    def testFailedCallsAreRecorded(self):
+        self.assertRaises(ValueError, self.namespace['cd'], None)
+        report = wlst_profiler.get_report([self.profile])
+        self.assertEqual(report[wlst_profiler.OPERATIONS]['cd'][wlst_profiler.CALLS], 1)
+        self.assertEqual(report[wlst_profiler.FOLDERS].keys(), [wlst_profiler.UNKNOWN_FOLDER])
+
+    def testThreadsRecordInTheirProfiles(self):
+        profiles = [self.profile]
+        thread = threading.Thread(target=_call_in_thread, args=(self.namespace, profiles))
+        thread.start()
+        thread.join()
+        self.namespace['cd']('/Servers/ms1')
+
+        self.assertEqual(profiles[1].operations.keys(), ['lsa'])
+        self.assertEqual(self.profile.operations.keys(), ['cd'])
+        report = wlst_profiler.get_report(profiles)
+        self.assertEqual(report[wlst_profiler.OPERATIONS]['lsa'][wlst_profiler.CALLS], 1)
+        self.assertEqual(report[wlst_profiler.OPERATIONS]['cd'][wlst_profiler.CALLS], 1)
+
+    def testSummaryLines(self):
+        self.assertEqual(wlst_profiler.get_summary_lines([self.profile]), [])
+        self.namespace['cd']('/')
+        lines = wlst_profiler.get_summary_lines([self.profile])
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[1].startswith('operation:cd '), True)
+        self.assertEqual(lines[2].startswith('folder:/ '), True)
+
+
+def _cd(path):
+    if path is None:
+        raise ValueError('no path')
+    _state['path'] = path
+    _state['namespace']['get_pwd']()
+
+
+def _get_pwd():
+    return _state['path']
+
+
+def _log_counts():
+    return
+
+
+def _lsa():
+    return dict()
+
+
+def _call_in_thread(namespace, profiles):
+    profile = wlst_profiler.ThreadProfile()
+    _thread_profile.set(profile)
+    profiles.append(profile)
+    namespace['lsa']()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Copyright (c) 2017, 2019, Oracle and/or its affiliates. All rights reserved.
+The Universal Permissive License (UPL), Version 1.0
+"""
+import unittest
+
+from java.util import TreeMap
+
+from wlsdeploy.util import wlst_helper
+
+_SERVER_PATH = '/Servers/ms1'
+
+
+class WlstSessionCacheTestCase(unittest.TestCase):
+    """
+    Read through the session cache with a stub WLST, and check that the cached results are not changed by the
+    callers that change what they get.
+    """
+
+    def setUp(self):
+        self.wlst = _StubWlst()
+        wlst_helper.set_thread_wlst(self.wlst)
+        wlst_helper.start_session_cache()
+
+    def tearDown(self):
+        wlst_helper.end_session_cache()
+        wlst_helper.set_thread_wlst(None)
+
+    def testAttributesAreCopied(self):
+        attributes = wlst_helper.lsa(_SERVER_PATH)
+        self.assertEqual(attributes, {'ListenPort': 7001, 'Notes': None, 'Machine': 'm1'})
+        del attributes['ListenPort']
+        attributes['Extra'] = 'x'
+
+        attributes = wlst_helper.lsa(_SERVER_PATH)
+        self.assertEqual(attributes, {'ListenPort': 7001, 'Notes': None, 'Machine': 'm1'})
+        self.assertEqual(self.wlst.ls_calls['a'], 1)
+
+    def testFoldersAreCopied(self):
+        folders = wlst_helper.lsc(_SERVER_PATH)
+        self.assertEqual(folders, ['Log', 'SSL'])
+        folders.remove('Log')
+
+        self.assertEqual(wlst_helper.lsc(_SERVER_PATH), ['Log', 'SSL'])
+        self.assertEqual(self.wlst.ls_calls['c'], 1)
+
+    def testPathsAreCachedWithoutTrailingSlash(self):
+        self.assertEqual(wlst_helper.path_exists(_SERVER_PATH), True)
+        self.assertEqual(wlst_helper.path_exists(_SERVER_PATH + '/'), True)
+        self.assertEqual(self.wlst.ls_calls['path'], 1)
+
+    def testEndedCacheCallsWlst(self):
+        wlst_helper.lsa(_SERVER_PATH)
+        wlst_helper.end_session_cache()
+        wlst_helper.lsa(_SERVER_PATH)
+        self.assertEqual(self.wlst.ls_calls['a'], 2)
+
+
+class _StubWlstException(Exception):
+    pass
+
+
+class _StubWlst(object):
+    """
+    The WLST of a session that has the same attributes and folders at every path.
+    """
+    WLSTException = _StubWlstException
+
+    def __init__(self):
+        self.path = '/'
+        self.ls_calls = {'a': 0, 'c': 0, 'path': 0}
+
+    def pwd(self):
+        return '/mydomain' + self.path
+
+    def cd(self, path):
+        if path.startswith('/'):
+            self.path = path
+        return None
+
+    def ls(self, ls_type=None, returnMap=None, returnType=None):
+        if returnType is None:
+            self.ls_calls['path'] += 1
+            return None
+
+        self.ls_calls[returnType] += 1
+        if returnType == 'c':
+            return ['Log', 'SSL']
+        result = TreeMap()
+        result.put('ListenPort', 7001)
+        result.put('Notes', 'null')
+        result.put('Machine', 'm1  ')
+        return result
+
+
+if __name__ == '__main__':
+    unittest.main()
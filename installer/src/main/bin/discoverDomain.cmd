@@ -325,8 +325,13 @@ ECHO              -archive_file ^<archive-file^>
 ECHO              [-model_file ^<model-file^>]
 ECHO              [-domain_type ^<domain-type^>]
 ECHO              [-wlst_path ^<wlst-path^>]
+ECHO              [-use_config_xml]
+ECHO              [-previous_discovery ^<previous-discovery-file^>]
+ECHO              [-discover_paths ^<model-paths^>]
+ECHO              [-timing_report_file ^<timing-report-file^>]
 ECHO              [-admin_url ^<admin-url^>
 ECHO               -admin_user ^<admin-user^>
+ECHO               [-discover_connections ^<connection-count^>]
 ECHO              ]
 ECHO.
 ECHO     where:
@@ -345,10 +350,37 @@ ECHO.
 ECHO         wlst-path      - the Oracle Home subdirectory of the wlst.cmd
 ECHO                          script to use (e.g., ^<ORACLE_HOME^>\soa)
 ECHO.
+ECHO         use_config_xml - read an offline domain directly from config.xml and
+ECHO                          its module descriptors instead of with WLST offline.
+ECHO                          The model leaves out the attributes that were not
+ECHO                          set in config.xml but that WLST offline computes.
+ECHO                          It cannot be used with -admin_url.
+ECHO.
+ECHO         previous-discovery-file - the YAML file that holds the result of the
+ECHO                          previous discovery.  The servers, resources and
+ECHO                          applications that have not changed are copied
+ECHO                          from it, and it is rewritten after discovery.
+ECHO                          It cannot be used with -admin_url, and it is
+ECHO                          not used with -discover_paths.
+ECHO.
+ECHO         model-paths    - a comma-separated list of the model paths to discover,
+ECHO                          such as resources:/JDBCSystemResource or
+ECHO                          topology:/Server/ms*.  Only the folders on the way
+ECHO                          to these paths and below them are discovered
+ECHO.
+ECHO         timing-report-file - the JSON file to which the time, WLST calls and
+ECHO                          MBeans of each discovery phase and top-level folder
+ECHO                          are written.  The same report is always displayed
+ECHO                          in the summary at the end of the tool
+ECHO.
 ECHO         admin-url      - the admin server URL (used for online discovery)
 ECHO.
 ECHO         admin-user     - the admin username (used for online discovery)
 ECHO.
+ECHO         connection-count - the number of connections to the admin server used
+ECHO                          to discover the domain in parallel (used for online
+ECHO                          discovery, the default is 1)
+ECHO.
 
 :exit_script
 IF DEFINED USE_CMD_EXIT (
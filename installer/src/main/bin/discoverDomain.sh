@@ -57,8 +57,13 @@ usage() {
   echo "          [-model_file <model-file>]"
   echo "          [-domain_type <domain-type>]"
   echo "          [-wlst_path <wlst-path>]"
+  echo "          [-use_config_xml]"
+  echo "          [-previous_discovery <previous-discovery-file>]"
+  echo "          [-discover_paths <model-paths>]"
+  echo "          [-timing_report_file <timing-report-file>]"
   echo "          [-admin_url <admin-url>"
   echo "           -admin_user <admin-user>"
+  echo "           [-discover_connections <connection-count>]"
   echo "          ]"
   echo ""
   echo "    where:"
@@ -77,10 +82,37 @@ usage() {
   echo "        wlst-path       - the Oracle Home subdirectory of the wlst.cmd"
   echo "                          script to use (e.g., <ORACLE_HOME>/soa)"
   echo ""
+  echo "        use_config_xml  - read an offline domain directly from config.xml and"
+  echo "                          its module descriptors instead of with WLST offline."
+  echo "                          The model leaves out the attributes that were not"
+  echo "                          set in config.xml but that WLST offline computes."
+  echo "                          It cannot be used with -admin_url."
+  echo ""
+  echo "        previous-discovery-file - the YAML file that holds the result of the"
+  echo "                          previous discovery.  The servers, resources and"
+  echo "                          applications that have not changed are copied"
+  echo "                          from it, and it is rewritten after discovery."
+  echo "                          It cannot be used with -admin_url, and it is"
+  echo "                          not used with -discover_paths."
+  echo ""
+  echo "        model-paths     - a comma-separated list of the model paths to discover,"
+  echo "                          such as resources:/JDBCSystemResource or"
+  echo "                          topology:/Server/ms*.  Only the folders on the way"
+  echo "                          to these paths and below them are discovered"
+  echo ""
+  echo "        timing-report-file - the JSON file to which the time, WLST calls and"
+  echo "                          MBeans of each discovery phase and top-level folder"
+  echo "                          are written.  The same report is always displayed"
+  echo "                          in the summary at the end of the tool"
+  echo ""
   echo "        admin-url       - the admin server URL (used for online deploy)"
   echo ""
   echo "        admin-user      - the admin username (used for online deploy)"
   echo ""
+  echo "        connection-count - the number of connections to the admin server used"
+  echo "                          to discover the domain in parallel (used for online"
+  echo "                          discovery, the default is 1)"
+  echo ""
 }
 
 umask 27
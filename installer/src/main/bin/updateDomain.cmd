@@ -364,9 +364,9 @@ ECHO                           the default is to get the model from the archive
 ECHO.
 ECHO         prev-model-file - the location of the previous model file.
 ECHO.
-ECHO                           This is used to remove apps and resources that
-ECHO                           were previously deployed in addition to
-ECHO                           (re)deploying the current apps and resources
+ECHO                           Only the parts of the model that changed since
+ECHO                           the previous model was deployed are deployed,
+ECHO                           and nothing is removed from the domain
 ECHO.
 ECHO         variable-file   - the location of the property file containing
 ECHO                           the variable values for all variables used in
@@ -74,9 +74,9 @@ usage() {
   echo ""
   echo "        prev-model-file - the location of the previous model file."
   echo ""
-  echo "                          This is used to remove apps and resources that"
-  echo "                          were previously deployed in addition to"
-  echo "                          (re)deploy the current apps and resources"
+  echo "                          Only the parts of the model that changed since"
+  echo "                          the previous model was deployed are deployed,"
+  echo "                          and nothing is removed from the domain"
   echo ""
   echo "        variable-file   - the location of the property file containing"
   echo "                          the variable values for all variables used in"
@@ -354,6 +354,10 @@ ECHO                           version number can be different than the version
 ECHO                           being used to run the tool.  If not specified, the
 ECHO                           tool will validate against the version being used
 ECHO                           to run the tool.
+ECHO                           A comma-separated list of versions may be
+ECHO                           specified to check the model against several
+ECHO                           versions in one pass.  Each version is validated
+ECHO                           with the same rules and gets its own results.
 ECHO.
 ECHO         target-mode     - the target WLST mode that the tool should use to
 ECHO                           validate the model content.  The only valid values
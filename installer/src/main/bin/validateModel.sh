@@ -91,6 +91,10 @@ usage() {
   echo "                          being used to run the tool.  If not specified, the"
   echo "                          tool will validate against the version being used"
   echo "                          to run the tool."
+  echo "                          A comma-separated list of versions may be"
+  echo "                          specified to check the model against several"
+  echo "                          versions in one pass.  Each version is validated"
+  echo "                          with the same rules and gets its own results."
   echo ""
   echo "        target-mode     - the target WLST mode that the tool should use to"
   echo "                          validate the model content.  The only valid values"